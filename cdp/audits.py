@@ -6,18 +6,20 @@
 # CDP domain: Audits (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import dom
-from . import network
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+    from . import runtime
+else:
+    lazy_import(globals(), 'dom', 'network', 'page', 'runtime')
 
 
-@dataclass
+@slotted_dataclass
 class AffectedCookie:
     r'''
     Information about a cookie that is affected by an inspector issue.
@@ -45,7 +47,7 @@ class AffectedCookie:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AffectedRequest:
     r'''
     Information about a request that is affected by an inspector issue.
@@ -70,7 +72,7 @@ class AffectedRequest:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AffectedFrame:
     r'''
     Information about the frame affected by an inspector issue.
@@ -105,7 +107,13 @@ class CookieExclusionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExclusionReason:
-        return cls(json)
+        try:
+            return _COOKIE_EXCLUSION_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_EXCLUSION_REASON_MEMBERS: typing.Dict[str, CookieExclusionReason] = {member.value: member for member in CookieExclusionReason}
 
 
 class CookieWarningReason(enum.Enum):
@@ -129,7 +137,13 @@ class CookieWarningReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieWarningReason:
-        return cls(json)
+        try:
+            return _COOKIE_WARNING_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_WARNING_REASON_MEMBERS: typing.Dict[str, CookieWarningReason] = {member.value: member for member in CookieWarningReason}
 
 
 class CookieOperation(enum.Enum):
@@ -141,7 +155,13 @@ class CookieOperation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieOperation:
-        return cls(json)
+        try:
+            return _COOKIE_OPERATION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_OPERATION_MEMBERS: typing.Dict[str, CookieOperation] = {member.value: member for member in CookieOperation}
 
 
 class InsightType(enum.Enum):
@@ -157,10 +177,16 @@ class InsightType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InsightType:
-        return cls(json)
+        try:
+            return _INSIGHT_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_INSIGHT_TYPE_MEMBERS: typing.Dict[str, InsightType] = {member.value: member for member in InsightType}
 
 
-@dataclass
+@slotted_dataclass
 class CookieIssueInsight:
     r'''
     Information about the suggested solution to a cookie issue.
@@ -185,7 +211,7 @@ class CookieIssueInsight:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CookieIssueDetails:
     r'''
     This information is currently necessary, as the front-end has a difficult
@@ -259,10 +285,16 @@ class PerformanceIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PerformanceIssueType:
-        return cls(json)
+        try:
+            return _PERFORMANCE_ISSUE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PERFORMANCE_ISSUE_TYPE_MEMBERS: typing.Dict[str, PerformanceIssueType] = {member.value: member for member in PerformanceIssueType}
 
 
-@dataclass
+@slotted_dataclass
 class PerformanceIssueDetails:
     r'''
     Details for a performance issue.
@@ -296,7 +328,13 @@ class MixedContentResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResolutionStatus:
-        return cls(json)
+        try:
+            return _MIXED_CONTENT_RESOLUTION_STATUS_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_MIXED_CONTENT_RESOLUTION_STATUS_MEMBERS: typing.Dict[str, MixedContentResolutionStatus] = {member.value: member for member in MixedContentResolutionStatus}
 
 
 class MixedContentResourceType(enum.Enum):
@@ -335,10 +373,16 @@ class MixedContentResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MixedContentResourceType:
-        return cls(json)
+        try:
+            return _MIXED_CONTENT_RESOURCE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_MIXED_CONTENT_RESOURCE_TYPE_MEMBERS: typing.Dict[str, MixedContentResourceType] = {member.value: member for member in MixedContentResourceType}
+
+
+@slotted_dataclass
 class MixedContentIssueDetails:
     #: The way the mixed content issue is being resolved.
     resolution_status: MixedContentResolutionStatus
@@ -406,10 +450,16 @@ class BlockedByResponseReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedByResponseReason:
-        return cls(json)
+        try:
+            return _BLOCKED_BY_RESPONSE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_BLOCKED_BY_RESPONSE_REASON_MEMBERS: typing.Dict[str, BlockedByResponseReason] = {member.value: member for member in BlockedByResponseReason}
+
+
+@slotted_dataclass
 class BlockedByResponseIssueDetails:
     r'''
     Details for a request that has been blocked with the BLOCKED_BY_RESPONSE
@@ -453,7 +503,13 @@ class HeavyAdResolutionStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdResolutionStatus:
-        return cls(json)
+        try:
+            return _HEAVY_AD_RESOLUTION_STATUS_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_HEAVY_AD_RESOLUTION_STATUS_MEMBERS: typing.Dict[str, HeavyAdResolutionStatus] = {member.value: member for member in HeavyAdResolutionStatus}
 
 
 class HeavyAdReason(enum.Enum):
@@ -466,10 +522,16 @@ class HeavyAdReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> HeavyAdReason:
-        return cls(json)
+        try:
+            return _HEAVY_AD_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_HEAVY_AD_REASON_MEMBERS: typing.Dict[str, HeavyAdReason] = {member.value: member for member in HeavyAdReason}
 
-@dataclass
+
+@slotted_dataclass
 class HeavyAdIssueDetails:
     #: The resolution status, either blocking the content or warning.
     resolution: HeavyAdResolutionStatus
@@ -510,10 +572,16 @@ class ContentSecurityPolicyViolationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicyViolationType:
-        return cls(json)
+        try:
+            return _CONTENT_SECURITY_POLICY_VIOLATION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CONTENT_SECURITY_POLICY_VIOLATION_TYPE_MEMBERS: typing.Dict[str, ContentSecurityPolicyViolationType] = {member.value: member for member in ContentSecurityPolicyViolationType}
 
 
-@dataclass
+@slotted_dataclass
 class SourceCodeLocation:
     url: str
 
@@ -542,7 +610,7 @@ class SourceCodeLocation:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ContentSecurityPolicyIssueDetails:
     #: Specific directive that is violated, causing the CSP issue.
     violated_directive: str
@@ -597,10 +665,16 @@ class SharedArrayBufferIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedArrayBufferIssueType:
-        return cls(json)
+        try:
+            return _SHARED_ARRAY_BUFFER_ISSUE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_SHARED_ARRAY_BUFFER_ISSUE_TYPE_MEMBERS: typing.Dict[str, SharedArrayBufferIssueType] = {member.value: member for member in SharedArrayBufferIssueType}
 
-@dataclass
+
+@slotted_dataclass
 class SharedArrayBufferIssueDetails:
     r'''
     Details for a issue arising from an SAB being instantiated in, or
@@ -628,7 +702,7 @@ class SharedArrayBufferIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CorsIssueDetails:
     r'''
     Details for a CORS related issue, e.g. a warning or error related to
@@ -704,7 +778,13 @@ class AttributionReportingIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AttributionReportingIssueType:
-        return cls(json)
+        try:
+            return _ATTRIBUTION_REPORTING_ISSUE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_ATTRIBUTION_REPORTING_ISSUE_TYPE_MEMBERS: typing.Dict[str, AttributionReportingIssueType] = {member.value: member for member in AttributionReportingIssueType}
 
 
 class SharedDictionaryError(enum.Enum):
@@ -739,7 +819,13 @@ class SharedDictionaryError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SharedDictionaryError:
-        return cls(json)
+        try:
+            return _SHARED_DICTIONARY_ERROR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SHARED_DICTIONARY_ERROR_MEMBERS: typing.Dict[str, SharedDictionaryError] = {member.value: member for member in SharedDictionaryError}
 
 
 class SRIMessageSignatureError(enum.Enum):
@@ -770,7 +856,13 @@ class SRIMessageSignatureError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SRIMessageSignatureError:
-        return cls(json)
+        try:
+            return _SRI_MESSAGE_SIGNATURE_ERROR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SRI_MESSAGE_SIGNATURE_ERROR_MEMBERS: typing.Dict[str, SRIMessageSignatureError] = {member.value: member for member in SRIMessageSignatureError}
 
 
 class UnencodedDigestError(enum.Enum):
@@ -784,7 +876,13 @@ class UnencodedDigestError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> UnencodedDigestError:
-        return cls(json)
+        try:
+            return _UNENCODED_DIGEST_ERROR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_UNENCODED_DIGEST_ERROR_MEMBERS: typing.Dict[str, UnencodedDigestError] = {member.value: member for member in UnencodedDigestError}
 
 
 class ConnectionAllowlistError(enum.Enum):
@@ -800,10 +898,16 @@ class ConnectionAllowlistError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionAllowlistError:
-        return cls(json)
+        try:
+            return _CONNECTION_ALLOWLIST_ERROR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CONNECTION_ALLOWLIST_ERROR_MEMBERS: typing.Dict[str, ConnectionAllowlistError] = {member.value: member for member in ConnectionAllowlistError}
 
 
-@dataclass
+@slotted_dataclass
 class AttributionReportingIssueDetails:
     r'''
     Details for issues around "Attribution Reporting API" usage.
@@ -838,7 +942,7 @@ class AttributionReportingIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class QuirksModeIssueDetails:
     r'''
     Details for issues about documents in Quirks Mode
@@ -876,7 +980,7 @@ class QuirksModeIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class NavigatorUserAgentIssueDetails:
     url: str
 
@@ -897,7 +1001,7 @@ class NavigatorUserAgentIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SharedDictionaryIssueDetails:
     shared_dictionary_error: SharedDictionaryError
 
@@ -917,7 +1021,7 @@ class SharedDictionaryIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SRIMessageSignatureIssueDetails:
     error: SRIMessageSignatureError
 
@@ -945,7 +1049,7 @@ class SRIMessageSignatureIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class UnencodedDigestIssueDetails:
     error: UnencodedDigestError
 
@@ -965,7 +1069,7 @@ class UnencodedDigestIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ConnectionAllowlistIssueDetails:
     error: ConnectionAllowlistError
 
@@ -1008,10 +1112,16 @@ class GenericIssueErrorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GenericIssueErrorType:
-        return cls(json)
+        try:
+            return _GENERIC_ISSUE_ERROR_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_GENERIC_ISSUE_ERROR_TYPE_MEMBERS: typing.Dict[str, GenericIssueErrorType] = {member.value: member for member in GenericIssueErrorType}
 
-@dataclass
+
+@slotted_dataclass
 class GenericIssueDetails:
     r'''
     Depending on the concrete errorType, different properties are set.
@@ -1051,7 +1161,7 @@ class GenericIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeprecationIssueDetails:
     r'''
     This issue tracks information needed to print a deprecation message.
@@ -1081,7 +1191,7 @@ class DeprecationIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class BounceTrackingIssueDetails:
     r'''
     This issue warns about sites in the redirect chain of a finished navigation
@@ -1104,7 +1214,7 @@ class BounceTrackingIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CookieDeprecationMetadataIssueDetails:
     r'''
     This issue warns about third-party sites that are accessing cookies on the
@@ -1148,10 +1258,16 @@ class ClientHintIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientHintIssueReason:
-        return cls(json)
+        try:
+            return _CLIENT_HINT_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_CLIENT_HINT_ISSUE_REASON_MEMBERS: typing.Dict[str, ClientHintIssueReason] = {member.value: member for member in ClientHintIssueReason}
+
+
+@slotted_dataclass
 class FederatedAuthRequestIssueDetails:
     federated_auth_request_issue_reason: FederatedAuthRequestIssueReason
 
@@ -1222,10 +1338,16 @@ class FederatedAuthRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthRequestIssueReason:
-        return cls(json)
+        try:
+            return _FEDERATED_AUTH_REQUEST_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_FEDERATED_AUTH_REQUEST_ISSUE_REASON_MEMBERS: typing.Dict[str, FederatedAuthRequestIssueReason] = {member.value: member for member in FederatedAuthRequestIssueReason}
+
+
+@slotted_dataclass
 class FederatedAuthUserInfoRequestIssueDetails:
     federated_auth_user_info_request_issue_reason: FederatedAuthUserInfoRequestIssueReason
 
@@ -1262,10 +1384,16 @@ class FederatedAuthUserInfoRequestIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> FederatedAuthUserInfoRequestIssueReason:
-        return cls(json)
+        try:
+            return _FEDERATED_AUTH_USER_INFO_REQUEST_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_FEDERATED_AUTH_USER_INFO_REQUEST_ISSUE_REASON_MEMBERS: typing.Dict[str, FederatedAuthUserInfoRequestIssueReason] = {member.value: member for member in FederatedAuthUserInfoRequestIssueReason}
 
-@dataclass
+
+@slotted_dataclass
 class ClientHintIssueDetails:
     r'''
     This issue tracks client hints related issues. It's used to deprecate old
@@ -1289,7 +1417,7 @@ class ClientHintIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FailedRequestInfo:
     #: The URL that failed to load.
     url: str
@@ -1325,10 +1453,16 @@ class PartitioningBlobURLInfo(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PartitioningBlobURLInfo:
-        return cls(json)
+        try:
+            return _PARTITIONING_BLOB_URL_INFO_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PARTITIONING_BLOB_URL_INFO_MEMBERS: typing.Dict[str, PartitioningBlobURLInfo] = {member.value: member for member in PartitioningBlobURLInfo}
 
 
-@dataclass
+@slotted_dataclass
 class PartitioningBlobURLIssueDetails:
     #: The BlobURL that failed to load.
     url: str
@@ -1363,10 +1497,16 @@ class ElementAccessibilityIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ElementAccessibilityIssueReason:
-        return cls(json)
+        try:
+            return _ELEMENT_ACCESSIBILITY_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_ELEMENT_ACCESSIBILITY_ISSUE_REASON_MEMBERS: typing.Dict[str, ElementAccessibilityIssueReason] = {member.value: member for member in ElementAccessibilityIssueReason}
 
-@dataclass
+
+@slotted_dataclass
 class ElementAccessibilityIssueDetails:
     r'''
     This issue warns about errors in the select or summary element content model.
@@ -1402,10 +1542,16 @@ class StyleSheetLoadingIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetLoadingIssueReason:
-        return cls(json)
+        try:
+            return _STYLE_SHEET_LOADING_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_STYLE_SHEET_LOADING_ISSUE_REASON_MEMBERS: typing.Dict[str, StyleSheetLoadingIssueReason] = {member.value: member for member in StyleSheetLoadingIssueReason}
+
+
+@slotted_dataclass
 class StylesheetLoadingIssueDetails:
     r'''
     This issue warns when a referenced stylesheet couldn't be loaded.
@@ -1447,10 +1593,16 @@ class PropertyRuleIssueReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PropertyRuleIssueReason:
-        return cls(json)
+        try:
+            return _PROPERTY_RULE_ISSUE_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_PROPERTY_RULE_ISSUE_REASON_MEMBERS: typing.Dict[str, PropertyRuleIssueReason] = {member.value: member for member in PropertyRuleIssueReason}
+
+
+@slotted_dataclass
 class PropertyRuleIssueDetails:
     r'''
     This issue warns about errors in property rules that lead to property
@@ -1492,10 +1644,16 @@ class UserReidentificationIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> UserReidentificationIssueType:
-        return cls(json)
+        try:
+            return _USER_REIDENTIFICATION_ISSUE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_USER_REIDENTIFICATION_ISSUE_TYPE_MEMBERS: typing.Dict[str, UserReidentificationIssueType] = {member.value: member for member in UserReidentificationIssueType}
 
-@dataclass
+
+@slotted_dataclass
 class UserReidentificationIssueDetails:
     r'''
     This issue warns about uses of APIs that may be considered misuse to
@@ -1555,10 +1713,16 @@ class PermissionElementIssueType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionElementIssueType:
-        return cls(json)
+        try:
+            return _PERMISSION_ELEMENT_ISSUE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_PERMISSION_ELEMENT_ISSUE_TYPE_MEMBERS: typing.Dict[str, PermissionElementIssueType] = {member.value: member for member in PermissionElementIssueType}
 
-@dataclass
+
+@slotted_dataclass
 class PermissionElementIssueDetails:
     r'''
     This issue warns about improper usage of the <permission> element.
@@ -1620,7 +1784,7 @@ class PermissionElementIssueDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SelectivePermissionsInterventionIssueDetails:
     r'''
     The issue warns about blocked calls to privacy sensitive APIs via the
@@ -1693,10 +1857,16 @@ class InspectorIssueCode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectorIssueCode:
-        return cls(json)
+        try:
+            return _INSPECTOR_ISSUE_CODE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_INSPECTOR_ISSUE_CODE_MEMBERS: typing.Dict[str, InspectorIssueCode] = {member.value: member for member in InspectorIssueCode}
 
 
-@dataclass
+@slotted_dataclass
 class InspectorIssueDetails:
     r'''
     This struct holds a list of optional fields with additional information
@@ -1874,7 +2044,7 @@ class IssueId(str):
         return 'IssueId({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class InspectorIssue:
     r'''
     An inspector issue reported from the back-end.
@@ -1904,6 +2074,22 @@ class InspectorIssue:
         )
 
 
+def _get_encoded_response_params(
+        request_id: network.RequestId,
+        encoding: str,
+        quality: typing.Optional[float] = None,
+        size_only: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    params['encoding'] = encoding
+    if quality is not None:
+        params['quality'] = quality
+    if size_only is not None:
+        params['sizeOnly'] = size_only
+    return params
+
+
 def get_encoded_response(
         request_id: network.RequestId,
         encoding: str,
@@ -1924,16 +2110,9 @@ def get_encoded_response(
         1. **originalSize** - Size before re-encoding.
         2. **encodedSize** - Size after re-encoding.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['encoding'] = encoding
-    if quality is not None:
-        params['quality'] = quality
-    if size_only is not None:
-        params['sizeOnly'] = size_only
     cmd_dict: T_JSON_DICT = {
         'method': 'Audits.getEncodedResponse',
-        'params': params,
+        'params': _get_encoded_response_params(request_id, encoding, quality, size_only),
     }
     json = yield cmd_dict
     return (
@@ -1943,6 +2122,18 @@ def get_encoded_response(
     )
 
 
+get_encoded_response_command = Command(
+    'Audits.getEncodedResponse',
+    get_encoded_response,
+    _get_encoded_response_params,
+    lambda json: (
+        str(json['body']) if 'body' in json else None,
+        int(json['originalSize']),
+        int(json['encodedSize'])
+    ),
+)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables issues domain, prevents further issues from being reported to the client.
@@ -1953,6 +2144,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('Audits.disable', disable)
+
+
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Enables issues domain, sends the issues collected so far to the client by means of the
@@ -1964,6 +2158,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+enable_command = Command('Audits.enable', enable)
+
+
 def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[GenericIssueDetails]]:
     r'''
     Runs the form issues check for the target page. Found issues are reported
@@ -1978,8 +2175,16 @@ def check_forms_issues() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List
     return [GenericIssueDetails.from_json(i) for i in json['formIssues']]
 
 
+check_forms_issues_command = Command(
+    'Audits.checkFormsIssues',
+    check_forms_issues,
+    None,
+    lambda json: [GenericIssueDetails.from_json(i) for i in json['formIssues']],
+)
+
+
 @event_class('Audits.issueAdded')
-@dataclass
+@slotted_dataclass
 class IssueAdded:
     issue: InspectorIssue
 
@@ -0,0 +1,6 @@
+"""
+CDP Benchmarks
+
+Micro-benchmarks for the I/O layer. Each module can be run on its own, e.g.
+``python -m cdp.bench.codec``. None of them need a browser.
+"""
@@ -0,0 +1,161 @@
+"""
+Benchmark runner: run the benchmark suites and store the results as JSON.
+
+Usage::
+
+    python -m cdp.bench [--quick] [--only SUITE ...] [--output FILE] [--compare FILE]
+
+Suites:
+
+- **execute**: ``execute()`` overhead per command against an in-memory
+  transport, with generators and with command descriptors
+  (``cdp.bench.execute``)
+- **events**: events per second through ``_receive_loop`` and peak memory per
+  100k queued events (``cdp.bench.events``)
+- **types**: ``from_json``/``to_json`` throughput and memory of the largest generated
+  types (``cdp.bench.types``)
+- **codec**: frames per second of each installed JSON codec
+  (``cdp.bench.codec``)
+- **imports**: time and memory to import ``cdp``, the connection and a domain
+  (``cdp.bench.imports``)
+
+The results, with the Python version, platform and git commit they were
+measured on, are written as JSON to ``--output`` or standard output.
+Progress goes to standard error. To compare two commits::
+
+    git checkout main && python -m cdp.bench --output main.json
+    git checkout feature && python -m cdp.bench --compare main.json
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import datetime
+import json
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+import typing
+
+from cdp.bench import codec, events, execute, imports, types
+
+
+Results = typing.Dict[str, typing.Any]
+
+
+def _execute(quick: bool) -> Results:
+    count, repeat = (1_000, 2) if quick else (5_000, 5)
+    results: Results = asyncio.run(execute.bench_overhead(count, repeat))
+    results['descriptors'] = asyncio.run(execute.bench_overhead(count, repeat, descriptors=True))
+    return results
+
+
+def _events(quick: bool) -> Results:
+    return asyncio.run(events.run(20_000 if quick else 100_000, 1 if quick else 3))
+
+
+def _types(quick: bool) -> Results:
+    return types.run(300 if quick else 2_000, 2 if quick else 5)
+
+
+def _codec(quick: bool) -> Results:
+    return codec.run(10_000 if quick else 100_000)
+
+
+def _imports(quick: bool) -> Results:
+    return imports.run(3 if quick else 10)
+
+
+SUITES: typing.Dict[str, typing.Callable[[bool], Results]] = {
+    'execute': _execute,
+    'events': _events,
+    'types': _types,
+    'codec': _codec,
+    'imports': _imports,
+}
+
+
+def _git_commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'],
+            cwd=pathlib.Path(__file__).parent, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(suites: typing.Iterable[str] = SUITES, quick: bool = False) -> Results:
+    """Run benchmark suites and return their results with metadata."""
+    results = {}
+    for name in suites:
+        print(f"Running {name}...", file=sys.stderr, flush=True)
+        start = time.perf_counter()
+        results[name] = SUITES[name](quick)
+        print(f"  done in {time.perf_counter() - start:.1f}s", file=sys.stderr, flush=True)
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+
+def flatten(results: Results, prefix: str = '') -> typing.Dict[str, float]:
+    """Flatten nested results into ``{'suite.key.metric': value}``."""
+    flat = {}
+    for key, value in results.items():
+        name = f'{prefix}.{key}' if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(old: Results, new: Results) -> typing.List[typing.Tuple[str, float, float, float]]:
+    """Return ``(metric, old, new, new / old)`` for metrics present in both runs."""
+    old_flat = flatten(old['results'])
+    new_flat = flatten(new['results'])
+    return [
+        (name, old_flat[name], value, value / old_flat[name] if old_flat[name] else float('nan'))
+        for name, value in new_flat.items()
+        if name in old_flat
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', nargs='+', choices=list(SUITES), default=list(SUITES),
+        metavar='SUITE', help=f"Suites to run: {', '.join(SUITES)}")
+    parser.add_argument('--quick', action='store_true',
+        help='Smaller measurements, for a fast and noisier run')
+    parser.add_argument('--output', '-o', type=pathlib.Path,
+        help='Write the JSON results to this file instead of standard output')
+    parser.add_argument('--compare', type=pathlib.Path, metavar='FILE',
+        help='Print the change relative to an earlier JSON result file')
+    args = parser.parse_args()
+
+    results = run(args.only, args.quick)
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + '\n')
+
+    if args.compare is not None:
+        old = json.loads(args.compare.read_text())
+        print(f"\n{'metric':<58}{'old':>14}{'new':>14}{'ratio':>8}", file=sys.stderr)
+        for name, before, after, ratio in compare(old, results):
+            print(f"{name:<58}{before:>14,.2f}{after:>14,.2f}{ratio:>8.2f}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Codec benchmark: frames per second for each installed JSON codec.
+
+Usage::
+
+    python -m cdp.bench.codec [--frames N]
+
+Two directions are measured for every codec:
+
+- **decode**: parsing a captured ``Network.requestWillBeSent`` event frame,
+  which is what ``CDPConnection._receive_loop`` spends most of its time on.
+- **encode**: serializing a ``Runtime.callFunctionOn`` request, both as the
+  codec's native output and as the ``str`` that is sent in text frames.
+"""
+
+from __future__ import annotations
+import argparse
+import time
+import typing
+
+from cdp.codec import Codec, available_codecs, get_codec
+
+
+#: A representative event frame, as captured from Chrome.
+EVENT_FRAME = (
+    '{"method":"Network.requestWillBeSent","params":{"requestId":"1000.42",'
+    '"loaderId":"8A3F1C0E6B6D4B8E9B0C2D7E5F1A3C4B","documentURL":'
+    '"https://example.com/","request":{"url":"https://example.com/static/app.js",'
+    '"method":"GET","headers":{"Referer":"https://example.com/","User-Agent":'
+    '"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+    'Chrome/120.0.0.0 Safari/537.36","sec-ch-ua":"\\"Chromium\\";v=\\"120\\"",'
+    '"sec-ch-ua-mobile":"?0","sec-ch-ua-platform":"\\"Linux\\""},'
+    '"initialPriority":"High","referrerPolicy":"strict-origin-when-cross-origin",'
+    '"isSameSite":true},"timestamp":81234.567891,"wallTime":1700000000.123456,'
+    '"initiator":{"type":"parser","url":"https://example.com/","lineNumber":12,'
+    '"columnNumber":40},"redirectHasExtraInfo":false,"type":"Script",'
+    '"frameId":"D1E6F0A7C2B34F5E8A9B0C1D2E3F4A5B","hasUserGesture":false}}'
+)
+
+#: A representative command request.
+COMMAND = {
+    'id': 1234,
+    'method': 'Runtime.callFunctionOn',
+    'params': {
+        'functionDeclaration': 'function() { return this.innerText; }',
+        'objectId': '{"injectedScriptId":1,"id":42}',
+        'returnByValue': True,
+        'awaitPromise': False,
+    },
+}
+
+
+def _rate(fn: typing.Callable[[], typing.Any], frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return frames / (time.perf_counter() - start)
+
+
+def bench_codec(codec: Codec, frames: int) -> typing.Dict[str, float]:
+    """
+    Measure one codec.
+
+    Returns:
+        Frames per second for ``decode``, ``encode`` and ``encode_text``.
+    """
+    event_bytes = EVENT_FRAME.encode('utf-8')
+
+    def encode_text() -> str:
+        frame = codec.encode(COMMAND)
+        return frame.decode('utf-8') if isinstance(frame, bytes) else frame
+
+    return {
+        'decode': _rate(lambda: codec.decode(EVENT_FRAME), frames),
+        'decode_bytes': _rate(lambda: codec.decode(event_bytes), frames),
+        'encode': _rate(lambda: codec.encode(COMMAND), frames),
+        'encode_text': _rate(encode_text, frames),
+    }
+
+
+def run(frames: int = 100_000) -> typing.Dict[str, typing.Dict[str, float]]:
+    """Benchmark every available codec."""
+    return {name: bench_codec(get_codec(name), frames) for name in available_codecs()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--frames', type=int, default=100_000,
+        help='Number of frames per measurement')
+    args = parser.parse_args()
+
+    results = run(args.frames)
+    columns = ['decode', 'decode_bytes', 'encode', 'encode_text']
+    print(f"{'codec':<10}" + ''.join(f'{c:>15}' for c in columns) + '   (frames/s)')
+    for name, rates in results.items():
+        print(f'{name:<10}' + ''.join(f'{rates[c]:>15,.0f}' for c in columns))
+
+
+if __name__ == '__main__':
+    main()
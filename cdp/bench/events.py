@@ -0,0 +1,75 @@
+"""
+Events benchmark: event throughput and memory of the receive loop.
+
+Usage::
+
+    python -m cdp.bench.events [--events N]
+
+A synthetic recording of ``Network.requestWillBeSent`` events (see
+``cdp.bench.replay``) is played into a ``CDPConnection`` as fast as possible.
+Every event goes through ``_receive_loop``: it is decoded, parsed into an
+event object and queued.
+
+- **throughput**: events per second, median of ``--repeat`` replays.
+- **memory**: peak Python memory allocated while ``--events`` events are
+  received and kept in an unbounded queue, measured with ``tracemalloc`` and
+  scaled to 100,000 events.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import tempfile
+import tracemalloc
+import typing
+
+from cdp.bench import replay
+from cdp.connection import CDPConnection
+from cdp.recording import ReplayTransport
+
+
+async def peak_memory(path: str) -> int:
+    """Return the peak bytes allocated while receiving and queueing a recording."""
+    transport = ReplayTransport(path, speed=None, follow_sends=False)
+    conn = CDPConnection(transport=transport, max_queue_size=0)
+    tracemalloc.start()
+    try:
+        await conn.connect()
+        await transport.finished.wait()  # type: ignore[union-attr]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    await conn.close()
+    return peak
+
+
+async def run(events: int = 100_000, repeat: int = 3) -> typing.Dict[str, float]:
+    """Measure throughput and memory for ``events`` synthetic events."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.jsonl.gz')
+        replay.write_synthetic_recording(path, events)
+        throughput = await replay.run(path, repeat=repeat)
+        with replay.quiet_logging():
+            peak = await peak_memory(path)
+    return {
+        'events_per_s': throughput['frames_per_s'],
+        'peak_mb_per_100k_events': peak / 1e6 * 100_000 / events,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=100_000,
+        help='Number of events per measurement')
+    parser.add_argument('--repeat', type=int, default=3,
+        help='Number of replays for the throughput; the median is reported')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.events, args.repeat))
+    print(f"{results['events_per_s']:,.0f} events/s, "
+          f"{results['peak_mb_per_100k_events']:.1f} MB peak per 100k queued events")
+
+
+if __name__ == '__main__':
+    main()
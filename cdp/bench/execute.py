@@ -0,0 +1,178 @@
+"""
+Execute benchmark: per-command overhead and batch latency.
+
+Usage::
+
+    python -m cdp.bench.execute [--commands N] [--repeat N] [--rtt MS]
+
+**Overhead** is measured against an in-memory transport that answers every
+request immediately, so only the connection's own bookkeeping is timed:
+framing, the pending command table, timeouts and response dispatch. It is
+reported in microseconds per command, for one command at a time and for
+``--commands`` commands in flight at once, without and with ``metrics=True``,
+and with requests built by a command descriptor instead of generators.
+
+**Batch latency** is measured against a local WebSocket server, which answers
+every request with an empty result. With ``--rtt`` the server holds each
+response for the given number of milliseconds, to model the round trip to a
+remote or busy browser; the server answers concurrently, like Chrome does
+for independent commands.
+
+For each batch size the same ``Input.dispatchMouseEvent`` commands are sent
+once per command with ``execute()`` and once as a single pipelined
+``execute_many()`` batch. Reported numbers are the median batch latency.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import typing
+
+import websockets
+
+from cdp import input_
+from cdp.connection import CDPConnection
+from cdp.transport import Transport
+
+
+BATCH_SIZES = (3, 10, 100)
+
+
+async def serve(websocket: typing.Any, rtt: float) -> None:
+    """Answer every request with an empty result after ``rtt`` seconds."""
+    async def reply(request_id: int) -> None:
+        if rtt:
+            await asyncio.sleep(rtt)
+        await websocket.send(json.dumps({'id': request_id, 'result': {}}))
+
+    tasks = set()
+    async for message in websocket:
+        task = asyncio.ensure_future(reply(json.loads(message)['id']))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+
+def commands(count: int, descriptors: bool = False) -> list:
+    command: typing.Callable[..., typing.Any] = (
+        input_.dispatch_mouse_event_command if descriptors else input_.dispatch_mouse_event
+    )
+    return [command(type_='mouseMoved', x=float(i), y=float(i)) for i in range(count)]
+
+
+class LoopbackTransport(Transport):
+    """An in-memory transport that answers every request immediately."""
+
+    def __init__(self) -> None:
+        self._responses: asyncio.Queue = asyncio.Queue()
+
+    async def open(self) -> None:
+        pass
+
+    async def send(self, frame: typing.Union[str, bytes]) -> None:
+        request_id = json.loads(frame)['id']
+        self._responses.put_nowait(f'{{"id":{request_id},"result":{{}}}}')
+
+    async def recv(self) -> str:
+        return await self._responses.get()
+
+    async def close(self) -> None:
+        pass
+
+
+async def bench_overhead(
+    commands_in_flight: int,
+    repeat: int,
+    metrics: bool = False,
+    descriptors: bool = False,
+) -> typing.Dict[str, float]:
+    """Return the best time in microseconds per command of each pattern."""
+    conn = CDPConnection(transport=LoopbackTransport(), codec='json', metrics=metrics)
+    await conn.connect()
+    sequential = []
+    concurrent = []
+    try:
+        for _ in range(repeat):
+            cmds = commands(commands_in_flight, descriptors)
+            start = time.perf_counter()
+            for cmd in cmds:
+                await conn.execute(cmd)
+            sequential.append(time.perf_counter() - start)
+
+            cmds = commands(commands_in_flight, descriptors)
+            start = time.perf_counter()
+            await asyncio.gather(*(conn.execute(cmd) for cmd in cmds))
+            concurrent.append(time.perf_counter() - start)
+    finally:
+        await conn.close()
+    return {
+        'sequential_us': min(sequential) / commands_in_flight * 1e6,
+        'concurrent_us': min(concurrent) / commands_in_flight * 1e6,
+    }
+
+
+async def bench_batch(conn: CDPConnection, size: int, repeat: int) -> typing.Dict[str, float]:
+    """Return the median latency in milliseconds of each strategy."""
+    sequential = []
+    pipelined = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for cmd in commands(size):
+            await conn.execute(cmd)
+        sequential.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await conn.execute_many(commands(size))
+        pipelined.append(time.perf_counter() - start)
+    return {
+        'sequential_ms': statistics.median(sequential) * 1e3,
+        'execute_many_ms': statistics.median(pipelined) * 1e3,
+    }
+
+
+async def run_batches(repeat: int = 50, rtt: float = 0.0) -> typing.Dict[int, typing.Dict[str, float]]:
+    """Benchmark every batch size against a local server."""
+    server = await websockets.serve(lambda ws, *_: serve(ws, rtt), '127.0.0.1', 0)
+    port = next(iter(server.sockets)).getsockname()[1]
+    try:
+        async with CDPConnection(f'ws://127.0.0.1:{port}') as conn:
+            return {size: await bench_batch(conn, size, repeat) for size in BATCH_SIZES}
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--commands', type=int, default=5_000,
+        help='Number of commands in flight for the overhead measurement')
+    parser.add_argument('--repeat', type=int, default=20,
+        help='Number of repetitions per measurement')
+    parser.add_argument('--rtt', type=float, default=0.0,
+        help='Simulated round trip time in milliseconds')
+    args = parser.parse_args()
+
+    print(f"{'overhead':<24}{'one at a time':>16}{f'{args.commands} in flight':>20}   (us/command)")
+    for label, metrics, descriptors in (
+        ('execute()', False, False),
+        ('execute(), metrics', True, False),
+        ('execute(), descriptors', False, True),
+    ):
+        overhead = asyncio.run(bench_overhead(
+            args.commands, max(args.repeat // 4, 1), metrics, descriptors
+        ))
+        print(f"{label:<24}{overhead['sequential_us']:>16.2f}{overhead['concurrent_us']:>20.2f}")
+    print()
+
+    results = asyncio.run(run_batches(args.repeat, args.rtt / 1e3))
+    print(f"{'commands':<10}{'execute()':>14}{'execute_many()':>16}{'speedup':>10}   (ms/batch)")
+    for size, times in results.items():
+        speedup = times['sequential_ms'] / times['execute_many_ms']
+        print(f"{size:<10}{times['sequential_ms']:>14.2f}"
+            f"{times['execute_many_ms']:>16.2f}{speedup:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
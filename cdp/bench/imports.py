@@ -0,0 +1,113 @@
+"""
+Import benchmark: time and memory to import the cdp package.
+
+Usage::
+
+    python -m cdp.bench.imports [--repeat N] [--module NAME ...]
+
+Every measurement imports a module in a fresh interpreter, so nothing is
+cached in ``sys.modules``. Reported for each module are the median wall time
+of the ``import`` statement itself, without interpreter startup, the growth
+of the resident set size (RSS) it caused, and how many ``cdp`` modules it
+loaded. By default it measures ``import cdp``, importing the connection, and
+importing ``cdp.web_mcp``, a small domain that refers to several large ones.
+RSS is not measured on platforms without the ``resource`` module (Windows).
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import typing
+
+
+#: Modules measured by default.
+MODULES = ('cdp', 'cdp.connection', 'cdp.web_mcp')
+
+SCRIPT = '''
+import json, os, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    # Peak RSS, in bytes on macOS. On Linux, ru_maxrss (in kilobytes) is
+    # inherited from the parent process, hence /proc above.
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+before = rss()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+after = rss()
+print(json.dumps({{
+    'seconds': elapsed,
+    'rss': None if before is None else after - before,
+    'modules': sum(1 for name in sys.modules if name == 'cdp' or name.startswith('cdp.')),
+}}))
+'''
+
+
+def measure_import(module: str = 'cdp') -> typing.Dict[str, typing.Any]:
+    """Import ``module`` in a new interpreter and return the seconds it took,
+    the RSS growth in bytes (or ``None``) and the number of ``cdp`` modules
+    loaded."""
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(module=module)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def import_time(module: str = 'cdp') -> float:
+    """Import ``module`` in a new interpreter and return the seconds it took."""
+    return measure_import(module)['seconds']
+
+
+def run(
+    repeat: int = 10,
+    modules: typing.Iterable[str] = MODULES,
+) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """Measure the import time and memory of each of ``modules``."""
+    results = {}
+    for module in modules:
+        samples = [measure_import(module) for _ in range(repeat)]
+        times = [sample['seconds'] for sample in samples]
+        rss = [sample['rss'] for sample in samples if sample['rss'] is not None]
+        results[module] = {
+            'import_ms': statistics.median(times) * 1e3,
+            'min_ms': min(times) * 1e3,
+            'rss_mb': statistics.median(rss) / 2**20 if rss else None,
+            'modules': samples[-1]['modules'],
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10,
+        help='Number of interpreters to start per module; the median is reported')
+    parser.add_argument('--module', nargs='+', default=list(MODULES), metavar='NAME',
+        help='Modules to import')
+    args = parser.parse_args()
+
+    for module, result in run(args.repeat, args.module).items():
+        rss = 'n/a' if result['rss_mb'] is None else f"{result['rss_mb']:.1f} MB"
+        print(f"import {module}: {result['import_ms']:.1f} ms "
+              f"(min {result['min_ms']:.1f} ms), RSS +{rss}, "
+              f"{result['modules']} cdp modules")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Replay benchmark: decode and dispatch throughput of recorded traffic.
+
+Usage::
+
+    python -m cdp.bench.replay [RECORDING] [--repeat N]
+
+Plays a recording made with ``cdp.recording.RecordingTransport`` into a
+``CDPConnection`` as fast as possible, so every frame is decoded and every
+event is parsed and queued, and reports frames and megabytes per second.
+Without ``RECORDING``, a synthetic recording of ``--events``
+``Network.requestWillBeSent`` events is used.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import gzip
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+import typing
+
+from cdp.connection import CDPConnection
+from cdp.recording import FORMAT, VERSION, ReplayTransport, load_recording
+
+
+def request_will_be_sent(i: int) -> typing.Dict[str, typing.Any]:
+    return {
+        'method': 'Network.requestWillBeSent',
+        'params': {
+            'requestId': f'1000.{i}',
+            'loaderId': 'D5C9A2B8F1E3',
+            'documentURL': 'https://example.com/',
+            'request': {
+                'url': f'https://example.com/assets/{i}.js',
+                'method': 'GET',
+                'headers': {'Accept': '*/*', 'User-Agent': 'Mozilla/5.0'},
+                'initialPriority': 'High',
+                'referrerPolicy': 'strict-origin-when-cross-origin',
+            },
+            'timestamp': 1000.0 + i / 1000,
+            'wallTime': 1700000000.0 + i / 1000,
+            'initiator': {'type': 'parser', 'url': 'https://example.com/'},
+            'redirectHasExtraInfo': False,
+            'type': 'Script',
+            'frameId': 'F1E3D5C9A2B8',
+        },
+    }
+
+
+def write_synthetic_recording(path: str, events: int) -> None:
+    """Write a recording of ``events`` received ``Network.requestWillBeSent`` events."""
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps({'format': FORMAT, 'version': VERSION, 'transport': 'synthetic'}) + '\n')
+        for i in range(events):
+            frame = json.dumps(request_will_be_sent(i))
+            f.write(json.dumps({'t': i / 1000, 'dir': 'recv', 'frame': frame}) + '\n')
+
+
+@contextlib.contextmanager
+def quiet_logging() -> typing.Iterator[None]:
+    # Replayed responses have no pending command, and the end of the
+    # recording looks like a dropped connection; neither is worth logging.
+    logger = logging.getLogger('cdp')
+    level = logger.level
+    logger.setLevel(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logger.setLevel(level)
+
+
+async def replay(path: str) -> float:
+    """Play a recording as fast as possible and return the elapsed seconds."""
+    transport = ReplayTransport(path, speed=None, follow_sends=False)
+    conn = CDPConnection(transport=transport)
+    start = time.perf_counter()
+    await conn.connect()
+    await transport.finished.wait()  # type: ignore[union-attr]
+    elapsed = time.perf_counter() - start
+    await conn.close()
+    return elapsed
+
+
+async def run(
+    path: typing.Optional[str] = None,
+    events: int = 20_000,
+    repeat: int = 5,
+) -> typing.Dict[str, float]:
+    """Benchmark replaying a recording, or a synthetic one if ``path`` is not given."""
+    with contextlib.ExitStack() as stack:
+        if path is None:
+            directory = stack.enter_context(tempfile.TemporaryDirectory())
+            path = os.path.join(directory, 'synthetic.jsonl.gz')
+            write_synthetic_recording(path, events)
+        received = [e['frame'] for e in load_recording(path) if e['dir'] == 'recv']
+        size = sum(len(frame) for frame in received)
+        stack.enter_context(quiet_logging())
+        elapsed = statistics.median([await replay(path) for _ in range(repeat)])
+    return {
+        'frames': len(received),
+        'frames_per_s': len(received) / elapsed,
+        'mb_per_s': size / elapsed / 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('recording', nargs='?',
+        help='Recording to replay (default: synthetic events)')
+    parser.add_argument('--events', type=int, default=20_000,
+        help='Number of events in the synthetic recording')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='Number of replays; the median is reported')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.recording, args.events, args.repeat))
+    print(f"{results['frames']:,} frames: {results['frames_per_s']:,.0f} frames/s, "
+          f"{results['mb_per_s']:.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
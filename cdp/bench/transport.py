@@ -0,0 +1,141 @@
+"""
+Transport benchmark: pipe versus loopback WebSocket.
+
+Usage::
+
+    python -m cdp.bench.transport [--commands N] [--payload BYTES]
+
+Both transports talk to a child Python process that answers every request
+with a result carrying ``--payload`` bytes of data, so each side pays for a
+real process boundary, like with a browser:
+
+- **pipe**: NUL-terminated messages on fds 3/4 (``--remote-debugging-pipe``).
+- **websocket**: a ``websockets`` server on 127.0.0.1
+  (``--remote-debugging-port``).
+
+Reported are the median round trip of one command at a time and the
+throughput of ``--commands`` commands sent as one ``execute_many()`` batch.
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+from cdp import input_
+from cdp.connection import CDPConnection
+from cdp.transport import PipeTransport, Transport, WebSocketTransport
+
+
+PIPE_SERVER = r'''
+import json, os, sys
+payload = 'x' * int(sys.argv[1])
+buffer = b''
+while True:
+    chunk = os.read(3, 1 << 20)
+    if not chunk:
+        break
+    buffer += chunk
+    *messages, buffer = buffer.split(b'\0')
+    out = b''.join(
+        json.dumps({'id': json.loads(m)['id'], 'result': {'data': payload}}).encode() + b'\0'
+        for m in messages
+    )
+    os.write(4, out)
+'''
+
+WEBSOCKET_SERVER = r'''
+import asyncio, json, sys
+import websockets
+payload = 'x' * int(sys.argv[1])
+
+async def handler(ws, *_):
+    async for message in ws:
+        await ws.send(json.dumps({'id': json.loads(message)['id'], 'result': {'data': payload}}))
+
+async def main():
+    async with websockets.serve(handler, '127.0.0.1', 0, max_size=None) as server:
+        print(server.sockets[0].getsockname()[1], flush=True)
+        await asyncio.Future()
+
+asyncio.run(main())
+'''
+
+
+def commands(count: int) -> list:
+    return [
+        input_.dispatch_mouse_event(type_='mouseMoved', x=float(i), y=float(i))
+        for i in range(count)
+    ]
+
+
+async def bench_transport(
+    transport: Transport,
+    commands_per_batch: int,
+    repeat: int,
+) -> typing.Dict[str, float]:
+    round_trips = []
+    batches = []
+    async with CDPConnection(transport=transport) as conn:
+        for _ in range(repeat):
+            for cmd in commands(50):
+                start = time.perf_counter()
+                await conn.execute(cmd)
+                round_trips.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            await conn.execute_many(commands(commands_per_batch))
+            batches.append(time.perf_counter() - start)
+    return {
+        'round_trip_us': statistics.median(round_trips) * 1e6,
+        'commands_per_s': commands_per_batch / statistics.median(batches),
+    }
+
+
+async def run(
+    commands_per_batch: int = 2_000,
+    payload: int = 100,
+    repeat: int = 10,
+) -> typing.Dict[str, typing.Dict[str, float]]:
+    """Benchmark both transports."""
+    results = {}
+    transport: Transport = PipeTransport.launch(
+        [sys.executable, '-c', PIPE_SERVER, str(payload)]
+    )
+    results['pipe'] = await bench_transport(transport, commands_per_batch, repeat)
+
+    server = subprocess.Popen(
+        [sys.executable, '-c', WEBSOCKET_SERVER, str(payload)],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        port = int(server.stdout.readline())  # type: ignore[union-attr]
+        transport = WebSocketTransport(f'ws://127.0.0.1:{port}')
+        results['websocket'] = await bench_transport(transport, commands_per_batch, repeat)
+    finally:
+        server.terminate()
+        server.wait()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--commands', type=int, default=2_000,
+        help='Number of commands per execute_many() batch')
+    parser.add_argument('--payload', type=int, default=100,
+        help='Size of each response payload in bytes')
+    parser.add_argument('--repeat', type=int, default=10,
+        help='Number of repetitions per measurement')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.commands, args.payload, args.repeat))
+    print(f"{'transport':<12}{'round trip (us)':>18}{'commands/s':>14}")
+    for name, stats in results.items():
+        print(f"{name:<12}{stats['round_trip_us']:>18.1f}{stats['commands_per_s']:>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Types benchmark: from_json/to_json throughput of generated types.
+
+Usage::
+
+    python -m cdp.bench.types [--objects N] [--all]
+
+Each type is fed a synthetic JSON object built from the protocol schema by
+``cdp.mock_server.SchemaValues``, with every optional property filled in up
+to three levels deep, so nested types are populated as well. Reported are
+objects per second for ``from_json()`` and ``to_json()``, best of
+``--repeat`` runs, and the memory taken by holding parsed objects (including
+their nested objects, but not the strings they share with the JSON), in MB
+per million objects.
+
+``--all`` instead times ``from_json()`` for every object type and event in
+the schema (those whose domain module exists) and reports the sum of the
+per-object times, to compare generator options such as ``--fast-decode``
+across the whole protocol. It does so twice: with every optional property
+filled in (*dense*, two levels deep) and with required properties only
+(*sparse*, closer to what Chrome usually sends).
+"""
+
+from __future__ import annotations
+import argparse
+import builtins
+import importlib
+import re
+import time
+import tracemalloc
+import typing
+
+from cdp import css, dom, network, page
+from cdp.mock_server import SchemaValues
+
+
+#: The largest generated types, by schema name.
+LARGEST_TYPES: typing.Dict[str, typing.Any] = {
+    'Network.Response': network.Response,
+    'DOM.Node': dom.Node,
+    'CSS.CSSStyle': css.CSSStyle,
+    'Page.FrameResourceTree': page.FrameResourceTree,
+}
+
+
+def _rate(fn: typing.Callable[[], typing.Any], objects: int, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(objects):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return objects / best
+
+
+def object_memory(cls: typing.Any, data: typing.Dict[str, typing.Any], objects: int) -> float:
+    """Return the bytes allocated per object while ``objects`` parsed objects are held."""
+    tracemalloc.start()
+    try:
+        held = [cls.from_json(data) for _ in range(objects)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del held
+    return size / objects
+
+
+def bench_type(
+    cls: typing.Any,
+    data: typing.Dict[str, typing.Any],
+    objects: int,
+    repeat: int,
+) -> typing.Dict[str, float]:
+    """Return objects per second for ``from_json`` and ``to_json``, and MB per 1M objects."""
+    obj = cls.from_json(data)
+    return {
+        'from_json': _rate(lambda: cls.from_json(data), objects, repeat),
+        'to_json': _rate(obj.to_json, objects, repeat),
+        'mb_per_1m_objects': object_memory(cls, data, objects),
+    }
+
+
+def module_name(domain: str) -> str:
+    """Return the name of a domain's module, as the generator derives it."""
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', domain)
+    name = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', name).lower()
+    return name + '_' if hasattr(builtins, name) else name
+
+
+def schema_classes(
+    schema: SchemaValues,
+) -> typing.Dict[str, typing.Tuple[typing.Any, typing.Dict[str, typing.Any]]]:
+    """Return ``{name: (class, synthetic JSON)}`` for every object type and event."""
+    def load(name: str) -> typing.Any:
+        domain, _, member = name.partition('.')
+        try:
+            module = importlib.import_module(f'cdp.{module_name(domain)}')
+        except ImportError:
+            return None
+        return getattr(module, member[0].upper() + member[1:], None)
+
+    classes = {}
+    for name, spec in schema.types.items():
+        cls = load(name) if 'properties' in spec else None
+        if cls is not None:
+            classes[name] = (cls, schema.type_value(name))
+    for method in schema.events:
+        cls = load(method)
+        if cls is not None:
+            classes[method] = (cls, schema.event_params(method))
+    return classes
+
+
+def run_all(objects: int = 200, repeat: int = 3) -> typing.Dict[str, typing.Any]:
+    """Time ``from_json`` for every object type and event in the schema."""
+    results: typing.Dict[str, typing.Any] = {}
+    for style, include_optional in (('dense', True), ('sparse', False)):
+        schema = SchemaValues.load(include_optional=include_optional, max_depth=2)
+        per_class = {
+            name: 1e6 / _rate(lambda: cls.from_json(data), objects, repeat)
+            for name, (cls, data) in schema_classes(schema).items()
+        }
+        results[style] = {
+            'classes': len(per_class),
+            'from_json_total_us': sum(per_class.values()),
+            'per_class_us': per_class,
+        }
+    return results
+
+
+def run(
+    objects: int = 2_000,
+    repeat: int = 5,
+    types: typing.Optional[typing.Dict[str, typing.Any]] = None,
+) -> typing.Dict[str, typing.Dict[str, float]]:
+    """Benchmark ``types`` (by default :data:`LARGEST_TYPES`)."""
+    schema = SchemaValues.load(include_optional=True, max_depth=3)
+    return {
+        name: bench_type(cls, schema.type_value(name), objects, repeat)
+        for name, cls in (types or LARGEST_TYPES).items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--objects', type=int, default=2_000,
+        help='Number of objects per measurement')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='Number of repetitions; the best is reported')
+    parser.add_argument('--all', action='store_true',
+        help='Time from_json() of every object type and event instead')
+    args = parser.parse_args()
+
+    if args.all:
+        for style, totals in run_all(args.objects, args.repeat).items():
+            print(f"{style}: {totals['classes']} classes, from_json() total "
+                  f"{totals['from_json_total_us']:,.1f} us for one object of each")
+            slowest = sorted(totals['per_class_us'].items(), key=lambda item: -item[1])
+            for name, us in slowest[:5]:
+                print(f"  {name:<48}{us:>10.2f} us")
+        return
+
+    results = run(args.objects, args.repeat)
+    print(f"{'type':<26}{'from_json/s':>14}{'to_json/s':>14}{'MB per 1M':>12}")
+    for name, rates in results.items():
+        print(f"{name:<26}{rates['from_json']:>14,.0f}{rates['to_json']:>14,.0f}"
+              f"{rates['mb_per_1m_objects']:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
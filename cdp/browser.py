@@ -6,13 +6,15 @@
 # CDP domain: Browser
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import page
-from . import target
+if typing.TYPE_CHECKING:
+    from . import page
+    from . import target
+else:
+    lazy_import(globals(), 'page', 'target')
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -54,10 +56,16 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return _WINDOW_STATE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_WINDOW_STATE_MEMBERS: typing.Dict[str, WindowState] = {member.value: member for member in WindowState}
 
 
-@dataclass
+@slotted_dataclass
 class Bounds:
     r'''
     Browser window bounds information
@@ -148,7 +156,13 @@ class PermissionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionType:
-        return cls(json)
+        try:
+            return _PERMISSION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PERMISSION_TYPE_MEMBERS: typing.Dict[str, PermissionType] = {member.value: member for member in PermissionType}
 
 
 class PermissionSetting(enum.Enum):
@@ -161,10 +175,16 @@ class PermissionSetting(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionSetting:
-        return cls(json)
+        try:
+            return _PERMISSION_SETTING_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PERMISSION_SETTING_MEMBERS: typing.Dict[str, PermissionSetting] = {member.value: member for member in PermissionSetting}
 
 
-@dataclass
+@slotted_dataclass
 class PermissionDescriptor:
     r'''
     Definition of PermissionDescriptor defined in the Permissions API:
@@ -230,10 +250,16 @@ class BrowserCommandId(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BrowserCommandId:
-        return cls(json)
+        try:
+            return _BROWSER_COMMAND_ID_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_BROWSER_COMMAND_ID_MEMBERS: typing.Dict[str, BrowserCommandId] = {member.value: member for member in BrowserCommandId}
 
-@dataclass
+
+@slotted_dataclass
 class Bucket:
     r'''
     Chrome histogram bucket.
@@ -263,7 +289,7 @@ class Bucket:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Histogram:
     r'''
     Chrome histogram.
@@ -307,7 +333,32 @@ class PrivacySandboxAPI(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PrivacySandboxAPI:
-        return cls(json)
+        try:
+            return _PRIVACY_SANDBOX_API_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PRIVACY_SANDBOX_API_MEMBERS: typing.Dict[str, PrivacySandboxAPI] = {member.value: member for member in PrivacySandboxAPI}
+
+
+def _set_permission_params(
+        permission: PermissionDescriptor,
+        setting: PermissionSetting,
+        origin: typing.Optional[str] = None,
+        embedded_origin: typing.Optional[str] = None,
+        browser_context_id: typing.Optional[BrowserContextID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['permission'] = permission.to_json()
+    params['setting'] = setting.to_json()
+    if origin is not None:
+        params['origin'] = origin
+    if embedded_origin is not None:
+        params['embeddedOrigin'] = embedded_origin
+    if browser_context_id is not None:
+        params['browserContextId'] = browser_context_id.to_json()
+    return params
 
 
 def set_permission(
@@ -328,20 +379,32 @@ def set_permission(
     :param embedded_origin: *(Optional)* Embedded origin the permission applies to. It is ignored unless the embedding origin is present and valid. If the embedding origin is provided but the embedded origin isn't, the embedding origin is used as the embedded origin.
     :param browser_context_id: *(Optional)* Context to override. When omitted, default browser context is used.
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'Browser.setPermission',
+        'params': _set_permission_params(permission, setting, origin, embedded_origin, browser_context_id),
+    }
+    json = yield cmd_dict
+
+
+set_permission_command = Command(
+    'Browser.setPermission',
+    set_permission,
+    _set_permission_params,
+)
+
+
+def _grant_permissions_params(
+        permissions: typing.List[PermissionType],
+        origin: typing.Optional[str] = None,
+        browser_context_id: typing.Optional[BrowserContextID] = None
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
-    params['permission'] = permission.to_json()
-    params['setting'] = setting.to_json()
+    params['permissions'] = [i.to_json() for i in permissions]
     if origin is not None:
         params['origin'] = origin
-    if embedded_origin is not None:
-        params['embeddedOrigin'] = embedded_origin
     if browser_context_id is not None:
         params['browserContextId'] = browser_context_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Browser.setPermission',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return params
 
 
 @deprecated(version="1.3")
@@ -362,19 +425,30 @@ def grant_permissions(
     :param origin: *(Optional)* Origin the permission applies to, all origins if not specified.
     :param browser_context_id: *(Optional)* BrowserContext to override permissions. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['permissions'] = [i.to_json() for i in permissions]
-    if origin is not None:
-        params['origin'] = origin
-    if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.grantPermissions',
-        'params': params,
+        'params': _grant_permissions_params(permissions, origin, browser_context_id),
     }
     json = yield cmd_dict
 
 
+grant_permissions_command = Command(
+    'Browser.grantPermissions',
+    grant_permissions,
+    _grant_permissions_params,
+    deprecated='1.3',
+)
+
+
+def _reset_permissions_params(
+        browser_context_id: typing.Optional[BrowserContextID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if browser_context_id is not None:
+        params['browserContextId'] = browser_context_id.to_json()
+    return params
+
+
 def reset_permissions(
         browser_context_id: typing.Optional[BrowserContextID] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -383,16 +457,37 @@ def reset_permissions(
 
     :param browser_context_id: *(Optional)* BrowserContext to reset permissions. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.resetPermissions',
-        'params': params,
+        'params': _reset_permissions_params(browser_context_id),
     }
     json = yield cmd_dict
 
 
+reset_permissions_command = Command(
+    'Browser.resetPermissions',
+    reset_permissions,
+    _reset_permissions_params,
+)
+
+
+def _set_download_behavior_params(
+        behavior: str,
+        browser_context_id: typing.Optional[BrowserContextID] = None,
+        download_path: typing.Optional[str] = None,
+        events_enabled: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['behavior'] = behavior
+    if browser_context_id is not None:
+        params['browserContextId'] = browser_context_id.to_json()
+    if download_path is not None:
+        params['downloadPath'] = download_path
+    if events_enabled is not None:
+        params['eventsEnabled'] = events_enabled
+    return params
+
+
 def set_download_behavior(
         behavior: str,
         browser_context_id: typing.Optional[BrowserContextID] = None,
@@ -409,21 +504,31 @@ def set_download_behavior(
     :param download_path: *(Optional)* The default path to save downloaded files to. This is required if behavior is set to 'allow' or 'allowAndName'.
     :param events_enabled: *(Optional)* Whether to emit download events (defaults to false).
     '''
-    params: T_JSON_DICT = dict()
-    params['behavior'] = behavior
-    if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
-    if download_path is not None:
-        params['downloadPath'] = download_path
-    if events_enabled is not None:
-        params['eventsEnabled'] = events_enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.setDownloadBehavior',
-        'params': params,
+        'params': _set_download_behavior_params(behavior, browser_context_id, download_path, events_enabled),
     }
     json = yield cmd_dict
 
 
+set_download_behavior_command = Command(
+    'Browser.setDownloadBehavior',
+    set_download_behavior,
+    _set_download_behavior_params,
+)
+
+
+def _cancel_download_params(
+        guid: str,
+        browser_context_id: typing.Optional[BrowserContextID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['guid'] = guid
+    if browser_context_id is not None:
+        params['browserContextId'] = browser_context_id.to_json()
+    return params
+
+
 def cancel_download(
         guid: str,
         browser_context_id: typing.Optional[BrowserContextID] = None
@@ -436,17 +541,20 @@ def cancel_download(
     :param guid: Global unique identifier of the download.
     :param browser_context_id: *(Optional)* BrowserContext to perform the action in. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['guid'] = guid
-    if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.cancelDownload',
-        'params': params,
+        'params': _cancel_download_params(guid, browser_context_id),
     }
     json = yield cmd_dict
 
 
+cancel_download_command = Command(
+    'Browser.cancelDownload',
+    cancel_download,
+    _cancel_download_params,
+)
+
+
 def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Close browser gracefully.
@@ -457,6 +565,9 @@ def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+close_command = Command('Browser.close', close)
+
+
 def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Crashes browser on the main thread.
@@ -469,6 +580,9 @@ def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+crash_command = Command('Browser.crash', crash)
+
+
 def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Crashes GPU process.
@@ -481,6 +595,9 @@ def crash_gpu_process() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+crash_gpu_process_command = Command('Browser.crashGpuProcess', crash_gpu_process)
+
+
 def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, str, str, str, str]]:
     r'''
     Returns version information.
@@ -506,6 +623,20 @@ def get_version() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str,
     )
 
 
+get_version_command = Command(
+    'Browser.getVersion',
+    get_version,
+    None,
+    lambda json: (
+        str(json['protocolVersion']),
+        str(json['product']),
+        str(json['revision']),
+        str(json['userAgent']),
+        str(json['jsVersion'])
+    ),
+)
+
+
 def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
     r'''
     Returns the command line switches for the browser process if, and only if
@@ -522,6 +653,26 @@ def get_browser_command_line() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
     return [str(i) for i in json['arguments']]
 
 
+get_browser_command_line_command = Command(
+    'Browser.getBrowserCommandLine',
+    get_browser_command_line,
+    None,
+    lambda json: [str(i) for i in json['arguments']],
+)
+
+
+def _get_histograms_params(
+        query: typing.Optional[str] = None,
+        delta: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if query is not None:
+        params['query'] = query
+    if delta is not None:
+        params['delta'] = delta
+    return params
+
+
 def get_histograms(
         query: typing.Optional[str] = None,
         delta: typing.Optional[bool] = None
@@ -535,19 +686,33 @@ def get_histograms(
     :param delta: *(Optional)* If true, retrieve delta since last delta call.
     :returns: Histograms.
     '''
-    params: T_JSON_DICT = dict()
-    if query is not None:
-        params['query'] = query
-    if delta is not None:
-        params['delta'] = delta
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.getHistograms',
-        'params': params,
+        'params': _get_histograms_params(query, delta),
     }
     json = yield cmd_dict
     return [Histogram.from_json(i) for i in json['histograms']]
 
 
+get_histograms_command = Command(
+    'Browser.getHistograms',
+    get_histograms,
+    _get_histograms_params,
+    lambda json: [Histogram.from_json(i) for i in json['histograms']],
+)
+
+
+def _get_histogram_params(
+        name: str,
+        delta: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['name'] = name
+    if delta is not None:
+        params['delta'] = delta
+    return params
+
+
 def get_histogram(
         name: str,
         delta: typing.Optional[bool] = None
@@ -561,18 +726,30 @@ def get_histogram(
     :param delta: *(Optional)* If true, retrieve delta since last delta call.
     :returns: Histogram.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
-    if delta is not None:
-        params['delta'] = delta
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.getHistogram',
-        'params': params,
+        'params': _get_histogram_params(name, delta),
     }
     json = yield cmd_dict
     return Histogram.from_json(json['histogram'])
 
 
+get_histogram_command = Command(
+    'Browser.getHistogram',
+    get_histogram,
+    _get_histogram_params,
+    lambda json: Histogram.from_json(json['histogram']),
+)
+
+
+def _get_window_bounds_params(
+        window_id: WindowID
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['windowId'] = window_id.to_json()
+    return params
+
+
 def get_window_bounds(
         window_id: WindowID
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Bounds]:
@@ -584,16 +761,31 @@ def get_window_bounds(
     :param window_id: Browser window id.
     :returns: Bounds information of the window. When window state is 'minimized', the restored window position and size are returned.
     '''
-    params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.getWindowBounds',
-        'params': params,
+        'params': _get_window_bounds_params(window_id),
     }
     json = yield cmd_dict
     return Bounds.from_json(json['bounds'])
 
 
+get_window_bounds_command = Command(
+    'Browser.getWindowBounds',
+    get_window_bounds,
+    _get_window_bounds_params,
+    lambda json: Bounds.from_json(json['bounds']),
+)
+
+
+def _get_window_for_target_params(
+        target_id: typing.Optional[target.TargetID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if target_id is not None:
+        params['targetId'] = target_id.to_json()
+    return params
+
+
 def get_window_for_target(
         target_id: typing.Optional[target.TargetID] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[WindowID, Bounds]]:
@@ -608,12 +800,9 @@ def get_window_for_target(
         0. **windowId** - Browser window id.
         1. **bounds** - Bounds information of the window. When window state is 'minimized', the restored window position and size are returned.
     '''
-    params: T_JSON_DICT = dict()
-    if target_id is not None:
-        params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.getWindowForTarget',
-        'params': params,
+        'params': _get_window_for_target_params(target_id),
     }
     json = yield cmd_dict
     return (
@@ -622,6 +811,27 @@ def get_window_for_target(
     )
 
 
+get_window_for_target_command = Command(
+    'Browser.getWindowForTarget',
+    get_window_for_target,
+    _get_window_for_target_params,
+    lambda json: (
+        WindowID.from_json(json['windowId']),
+        Bounds.from_json(json['bounds'])
+    ),
+)
+
+
+def _set_window_bounds_params(
+        window_id: WindowID,
+        bounds: Bounds
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['windowId'] = window_id.to_json()
+    params['bounds'] = bounds.to_json()
+    return params
+
+
 def set_window_bounds(
         window_id: WindowID,
         bounds: Bounds
@@ -634,16 +844,34 @@ def set_window_bounds(
     :param window_id: Browser window id.
     :param bounds: New window bounds. The 'minimized', 'maximized' and 'fullscreen' states cannot be combined with 'left', 'top', 'width' or 'height'. Leaves unspecified fields unchanged.
     '''
-    params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
-    params['bounds'] = bounds.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.setWindowBounds',
-        'params': params,
+        'params': _set_window_bounds_params(window_id, bounds),
     }
     json = yield cmd_dict
 
 
+set_window_bounds_command = Command(
+    'Browser.setWindowBounds',
+    set_window_bounds,
+    _set_window_bounds_params,
+)
+
+
+def _set_contents_size_params(
+        window_id: WindowID,
+        width: typing.Optional[int] = None,
+        height: typing.Optional[int] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['windowId'] = window_id.to_json()
+    if width is not None:
+        params['width'] = width
+    if height is not None:
+        params['height'] = height
+    return params
+
+
 def set_contents_size(
         window_id: WindowID,
         width: typing.Optional[int] = None,
@@ -658,19 +886,32 @@ def set_contents_size(
     :param width: *(Optional)* The window contents width in DIP. Assumes current width if omitted. Must be specified if 'height' is omitted.
     :param height: *(Optional)* The window contents height in DIP. Assumes current height if omitted. Must be specified if 'width' is omitted.
     '''
-    params: T_JSON_DICT = dict()
-    params['windowId'] = window_id.to_json()
-    if width is not None:
-        params['width'] = width
-    if height is not None:
-        params['height'] = height
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.setContentsSize',
-        'params': params,
+        'params': _set_contents_size_params(window_id, width, height),
     }
     json = yield cmd_dict
 
 
+set_contents_size_command = Command(
+    'Browser.setContentsSize',
+    set_contents_size,
+    _set_contents_size_params,
+)
+
+
+def _set_dock_tile_params(
+        badge_label: typing.Optional[str] = None,
+        image: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if badge_label is not None:
+        params['badgeLabel'] = badge_label
+    if image is not None:
+        params['image'] = image
+    return params
+
+
 def set_dock_tile(
         badge_label: typing.Optional[str] = None,
         image: typing.Optional[str] = None
@@ -683,18 +924,28 @@ def set_dock_tile(
     :param badge_label: *(Optional)*
     :param image: *(Optional)* Png encoded image. (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    if badge_label is not None:
-        params['badgeLabel'] = badge_label
-    if image is not None:
-        params['image'] = image
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.setDockTile',
-        'params': params,
+        'params': _set_dock_tile_params(badge_label, image),
     }
     json = yield cmd_dict
 
 
+set_dock_tile_command = Command(
+    'Browser.setDockTile',
+    set_dock_tile,
+    _set_dock_tile_params,
+)
+
+
+def _execute_browser_command_params(
+        command_id: BrowserCommandId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['commandId'] = command_id.to_json()
+    return params
+
+
 def execute_browser_command(
         command_id: BrowserCommandId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -705,15 +956,28 @@ def execute_browser_command(
 
     :param command_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['commandId'] = command_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.executeBrowserCommand',
-        'params': params,
+        'params': _execute_browser_command_params(command_id),
     }
     json = yield cmd_dict
 
 
+execute_browser_command_command = Command(
+    'Browser.executeBrowserCommand',
+    execute_browser_command,
+    _execute_browser_command_params,
+)
+
+
+def _add_privacy_sandbox_enrollment_override_params(
+        url: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['url'] = url
+    return params
+
+
 def add_privacy_sandbox_enrollment_override(
         url: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -723,15 +987,35 @@ def add_privacy_sandbox_enrollment_override(
 
     :param url:
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.addPrivacySandboxEnrollmentOverride',
-        'params': params,
+        'params': _add_privacy_sandbox_enrollment_override_params(url),
     }
     json = yield cmd_dict
 
 
+add_privacy_sandbox_enrollment_override_command = Command(
+    'Browser.addPrivacySandboxEnrollmentOverride',
+    add_privacy_sandbox_enrollment_override,
+    _add_privacy_sandbox_enrollment_override_params,
+)
+
+
+def _add_privacy_sandbox_coordinator_key_config_params(
+        api: PrivacySandboxAPI,
+        coordinator_origin: str,
+        key_config: str,
+        browser_context_id: typing.Optional[BrowserContextID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['api'] = api.to_json()
+    params['coordinatorOrigin'] = coordinator_origin
+    params['keyConfig'] = key_config
+    if browser_context_id is not None:
+        params['browserContextId'] = browser_context_id.to_json()
+    return params
+
+
 def add_privacy_sandbox_coordinator_key_config(
         api: PrivacySandboxAPI,
         coordinator_origin: str,
@@ -749,21 +1033,22 @@ def add_privacy_sandbox_coordinator_key_config(
     :param key_config:
     :param browser_context_id: *(Optional)* BrowserContext to perform the action in. When omitted, default browser context is used.
     '''
-    params: T_JSON_DICT = dict()
-    params['api'] = api.to_json()
-    params['coordinatorOrigin'] = coordinator_origin
-    params['keyConfig'] = key_config
-    if browser_context_id is not None:
-        params['browserContextId'] = browser_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Browser.addPrivacySandboxCoordinatorKeyConfig',
-        'params': params,
+        'params': _add_privacy_sandbox_coordinator_key_config_params(api, coordinator_origin, key_config, browser_context_id),
     }
     json = yield cmd_dict
 
 
+add_privacy_sandbox_coordinator_key_config_command = Command(
+    'Browser.addPrivacySandboxCoordinatorKeyConfig',
+    add_privacy_sandbox_coordinator_key_config,
+    _add_privacy_sandbox_coordinator_key_config_params,
+)
+
+
 @event_class('Browser.downloadWillBegin')
-@dataclass
+@slotted_dataclass
 class DownloadWillBegin:
     r'''
     **EXPERIMENTAL**
@@ -790,7 +1075,7 @@ class DownloadWillBegin:
 
 
 @event_class('Browser.downloadProgress')
-@dataclass
+@slotted_dataclass
 class DownloadProgress:
     r'''
     **EXPERIMENTAL**
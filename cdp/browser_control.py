@@ -41,7 +41,7 @@ import json as _json
 import typing
 
 from cdp import dom, input_, page, runtime
-from cdp.connection import CDPConnection, CDPConnectionError
+from cdp.connection import CDPConnection
 
 __all__ = [
     # Navigation
@@ -89,6 +89,16 @@ async def _get_document_node(conn: CDPConnection) -> dom.NodeId:
     return document.node_id
 
 
+async def _execute_all(
+    conn: CDPConnection,
+    cmds: typing.List[typing.Generator[typing.Any, typing.Any, typing.Any]],
+) -> None:
+    """Send *cmds* as one pipelined batch and raise the first error."""
+    for result in await conn.execute_many(cmds):
+        if isinstance(result, Exception):
+            raise result
+
+
 async def _resolve_node_center(
     conn: CDPConnection, node_id: dom.NodeId
 ) -> typing.Tuple[float, float]:
@@ -242,16 +252,16 @@ async def click(
     await conn.execute(dom.scroll_into_view_if_needed(node_id=node))
     cx, cy = await _resolve_node_center(conn, node)
     _btn = input_.MouseButton(button)
-    for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
-        await conn.execute(
-            input_.dispatch_mouse_event(
-                type_=event_type,
-                x=cx,
-                y=cy,
-                button=_btn,
-                click_count=click_count,
-            )
+    await _execute_all(conn, [
+        input_.dispatch_mouse_event(
+            type_=event_type,
+            x=cx,
+            y=cy,
+            button=_btn,
+            click_count=click_count,
         )
+        for event_type in ("mouseMoved", "mousePressed", "mouseReleased")
+    ])
 
 
 async def double_click(
@@ -301,15 +311,20 @@ async def type_text(
     :param delay: Optional delay in seconds between keystrokes.
     """
     await focus(conn, selector_or_node)
+
+    def key_events(char: str) -> list:
+        return [
+            input_.dispatch_key_event(type_="keyDown", text=char, key=char),
+            input_.dispatch_key_event(type_="keyUp", text=char, key=char),
+        ]
+
+    if delay <= 0:
+        # Without a delay the whole text is sent as one pipelined batch.
+        await _execute_all(conn, [cmd for char in text for cmd in key_events(char)])
+        return
     for char in text:
-        await conn.execute(
-            input_.dispatch_key_event(type_="keyDown", text=char, key=char)
-        )
-        await conn.execute(
-            input_.dispatch_key_event(type_="keyUp", text=char, key=char)
-        )
-        if delay > 0:
-            await asyncio.sleep(delay)
+        await _execute_all(conn, key_events(char))
+        await asyncio.sleep(delay)
 
 
 async def clear_and_type(
@@ -369,14 +384,14 @@ async def press_key(
     :param modifiers: Bit-field of modifier keys
         (Alt=1, Ctrl=2, Meta=4, Shift=8).
     """
-    for event_type in ("keyDown", "keyUp"):
-        await conn.execute(
-            input_.dispatch_key_event(
-                type_=event_type,
-                key=key,
-                modifiers=modifiers,
-            )
+    await _execute_all(conn, [
+        input_.dispatch_key_event(
+            type_=event_type,
+            key=key,
+            modifiers=modifiers,
         )
+        for event_type in ("keyDown", "keyUp")
+    ])
 
 
 async def focus(
@@ -717,24 +732,26 @@ async def wait_for_event(
     conn: CDPConnection,
     event_type: typing.Type[_T_Event],
     timeout: float = 30.0,
+    predicate: typing.Optional[typing.Callable[[_T_Event], bool]] = None,
 ) -> _T_Event:
     """Wait for a specific CDP event type to be received.
 
+    The wait is registered as a one-shot waiter on the connection, so it does
+    not consume events from :meth:`~cdp.connection.CDPConnection.listen` and
+    any number of waits can run concurrently.
+
     :param conn: An open :class:`~cdp.connection.CDPConnection`.
     :param event_type: The CDP event class to wait for, e.g.
         :class:`~cdp.page.LoadEventFired`.
     :param timeout: Maximum seconds to wait.
+    :param predicate: Optional function that must return ``True`` for an event
+        to match, e.g. ``lambda e: e.frame_id == frame_id``.
     :returns: The received event instance.
     :raises asyncio.TimeoutError: If the event is not received within *timeout*.
+    :raises cdp.connection.CDPConnectionError: If the connection closes first.
     """
-    async def _wait() -> _T_Event:
-        async for event in conn.listen():
-            if isinstance(event, event_type):
-                return event  # type: ignore[return-value]
-        raise CDPConnectionError("Connection closed before event arrived")
-
     try:
-        return await asyncio.wait_for(_wait(), timeout=timeout)
+        return await conn.wait_for_event(event_type, predicate, timeout=timeout)
     except asyncio.TimeoutError:
         raise asyncio.TimeoutError(
             f"Timed out waiting for event {event_type.__name__} ({timeout}s)"
@@ -0,0 +1,206 @@
+"""
+CDP Result Cache
+
+Event-invalidated caching of command results for ``CDPConnection(cache=...)``.
+Some results stay valid until the browser says otherwise: the root node from
+``DOM.getDocument`` until ``DOM.documentUpdated``, the frame tree from
+``Page.getFrameTree`` until a frame is attached, detached or navigated.
+
+A :class:`CacheRule` per command method lists the events (or commands) that
+invalidate its results, and optionally a domain that must be enabled for
+those events to be sent at all. A result is only stored if nothing
+invalidated it while the command was in flight. The connection and each
+session have their own :class:`ResultCache`, bounded by a least recently used
+eviction, with hit, miss, eviction and invalidation counters.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import typing
+
+from cdp.util import T_JSON_DICT
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """When the cached result of one command method stops being valid."""
+
+    #: Event and command methods that invalidate the result.
+    invalidated_by: typing.FrozenSet[str]
+    #: Domain whose invalidating events are only sent while it is enabled.
+    #: Results are only cached after ``<requires>.enable`` succeeded, and
+    #: dropped by ``<requires>.disable``.
+    requires: typing.Optional[str] = None
+
+
+_DOM_CHANGES = frozenset({
+    'DOM.documentUpdated',
+    'DOM.childNodeInserted',
+    'DOM.childNodeRemoved',
+    'DOM.childNodeCountUpdated',
+    'DOM.attributeModified',
+    'DOM.attributeRemoved',
+    'DOM.characterDataModified',
+    'DOM.shadowRootPushed',
+    'DOM.shadowRootPopped',
+    'DOM.pseudoElementAdded',
+    'DOM.pseudoElementRemoved',
+    'DOM.disable',
+    # Chrome discards every node ID it handed out when the document is
+    # requested again, whatever the depth.
+    'DOM.getDocument',
+    'DOM.getFlattenedDocument',
+})
+
+_FRAME_CHANGES = frozenset({
+    'Page.frameAttached',
+    'Page.frameDetached',
+    'Page.frameNavigated',
+    'Page.navigatedWithinDocument',
+    'Page.documentOpened',
+})
+
+#: Rules used by ``CDPConnection(cache=True)``.
+DEFAULT_RULES: typing.Dict[str, CacheRule] = {
+    # Requesting the document implicitly enables DOM events. The mutation
+    # events only concern nodes already sent, i.e. those in the result.
+    'DOM.getDocument': CacheRule(_DOM_CHANGES),
+    'Page.getFrameTree': CacheRule(_FRAME_CHANGES, requires='Page'),
+    'Page.getNavigationHistory': CacheRule(
+        _FRAME_CHANGES | {'Page.navigateToHistoryEntry', 'Page.resetNavigationHistory'},
+        requires='Page',
+    ),
+    'Browser.getVersion': CacheRule(frozenset()),
+}
+
+
+_Key = typing.Tuple[str, str]
+
+
+class ResultCache:
+    """
+    Least recently used cache of command results, invalidated by events.
+
+    Args:
+        rules: Cacheable command methods and what invalidates their results
+        max_entries: Number of results kept before the least recently used
+            one is evicted
+    """
+
+    def __init__(
+        self,
+        rules: typing.Mapping[str, CacheRule] = DEFAULT_RULES,
+        max_entries: int = 256,
+    ):
+        self.rules = dict(rules)
+        self.max_entries = max_entries
+        #: Lookups answered from the cache.
+        self.hits = 0
+        #: Lookups of cacheable methods that had to be sent.
+        self.misses = 0
+        #: Results dropped to stay within ``max_entries``.
+        self.evictions = 0
+        #: Results dropped because of an event or command.
+        self.invalidations = 0
+        # Bumped when a method's results are invalidated. A result is only
+        # stored if its method's generation did not change while in flight.
+        self._generations: typing.Dict[str, int] = dict.fromkeys(self.rules, 0)
+        self._entries: OrderedDict[_Key, T_JSON_DICT] = OrderedDict()
+        self._keys: typing.Dict[str, typing.Set[_Key]] = {method: set() for method in rules}
+        self._enabled: typing.Set[str] = set()
+        # Invalidating method -> cached methods it invalidates
+        self._invalidates: typing.Dict[str, typing.Set[str]] = {}
+        for method, rule in self.rules.items():
+            triggers = set(rule.invalidated_by)
+            if rule.requires is not None:
+                triggers.add(f'{rule.requires}.disable')
+            for trigger in triggers:
+                self._invalidates.setdefault(trigger, set()).add(method)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(method: str, params: typing.Optional[T_JSON_DICT]) -> _Key:
+        return method, json.dumps(params, sort_keys=True, separators=(',', ':'))
+
+    def get(self, method: str, params: typing.Optional[T_JSON_DICT]) -> typing.Optional[T_JSON_DICT]:
+        """Return the cached result of a command, or ``None``."""
+        if method not in self.rules:
+            return None
+        key = self._key(method, params)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return result
+
+    def command_sent(self, method: str) -> int:
+        """
+        Invalidate what a command changes before it is sent.
+
+        Returns:
+            The generation to pass to :meth:`command_completed`
+        """
+        domain, _, name = method.partition('.')
+        if name == 'disable':
+            self._enabled.discard(domain)
+        if method in self._invalidates:
+            self.invalidate(method)
+        return self._generations.get(method, 0)
+
+    def command_completed(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT],
+        result: T_JSON_DICT,
+        generation: int,
+    ) -> None:
+        """Record a successful command, caching its result if it is still valid."""
+        domain, _, name = method.partition('.')
+        if name == 'enable':
+            self._enabled.add(domain)
+            return
+        rule = self.rules.get(method)
+        if rule is None or generation != self._generations[method]:
+            return
+        if rule.requires is not None and rule.requires not in self._enabled:
+            return
+        key = self._key(method, params)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        self._keys[method].add(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._keys[evicted[0]].discard(evicted)
+            self.evictions += 1
+
+    def event_received(self, method: str) -> None:
+        """Invalidate the results an event makes stale."""
+        if method in self._invalidates:
+            self.invalidate(method)
+
+    def invalidate(self, method: str) -> None:
+        """Drop the results invalidated by an event or command method."""
+        for cached in self._invalidates.get(method, ()):
+            self._generations[cached] += 1
+            keys = self._keys[cached]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            keys.clear()
+
+    def clear(self) -> None:
+        """Drop every result, e.g. after reconnecting."""
+        self._entries.clear()
+        for method, keys in self._keys.items():
+            self._generations[method] += 1
+            keys.clear()
+
+    def new(self) -> ResultCache:
+        """Return an empty cache with the same rules and size, for a session."""
+        return ResultCache(self.rules, self.max_entries)
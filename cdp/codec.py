@@ -0,0 +1,191 @@
+"""
+CDP JSON Codecs
+
+This module provides the JSON encoders and decoders used by ``CDPConnection``
+to serialize outgoing requests and parse incoming frames. The standard
+library ``json`` module always works; faster third-party libraries (orjson,
+msgspec, ujson) are used automatically when they are installed.
+"""
+
+from __future__ import annotations
+import json
+import typing
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec  # type: ignore[import-not-found]
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import ujson  # type: ignore[import-not-found,import-untyped]
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+from cdp.util import T_JSON_DICT
+
+
+#: A raw WebSocket/pipe frame, either text or UTF-8 encoded bytes.
+Frame = typing.Union[str, bytes]
+
+
+class Codec:
+    """
+    Base class for JSON codecs.
+
+    A codec turns outgoing messages into frames and incoming frames back into
+    dictionaries. ``encode`` may return either ``str`` or ``bytes``; codecs
+    that natively produce UTF-8 bytes should return them as-is so that the
+    transport can decide whether an intermediate ``str`` is needed at all.
+
+    ``decode`` must accept both ``str`` and ``bytes`` and raise ``ValueError``
+    for malformed input.
+    """
+
+    #: Short name used for auto-detection and benchmarks.
+    name: str = ''
+
+    def encode(self, message: T_JSON_DICT) -> Frame:
+        """Serialize a message to a frame."""
+        raise NotImplementedError
+
+    def decode(self, frame: Frame) -> T_JSON_DICT:
+        """Parse a frame into a message."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+
+class JsonCodec(Codec):
+    """Codec backed by the standard library ``json`` module."""
+
+    name = 'json'
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(separators=(',', ':'))
+        self._decoder = json.JSONDecoder()
+
+    def encode(self, message: T_JSON_DICT) -> Frame:
+        return self._encoder.encode(message)
+
+    def decode(self, frame: Frame) -> T_JSON_DICT:
+        if isinstance(frame, bytes):
+            frame = frame.decode('utf-8')
+        return self._decoder.decode(frame)
+
+
+class OrjsonCodec(Codec):
+    """Codec backed by ``orjson``. Encodes directly to UTF-8 bytes."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise ImportError(
+                "orjson is required for OrjsonCodec. "
+                "Install it with: pip install orjson"
+            )
+
+    def encode(self, message: T_JSON_DICT) -> Frame:
+        return orjson.dumps(message)
+
+    def decode(self, frame: Frame) -> T_JSON_DICT:
+        # orjson.JSONDecodeError is a subclass of ValueError.
+        return orjson.loads(frame)
+
+
+class MsgspecCodec(Codec):
+    """Codec backed by ``msgspec.json``. Encodes directly to UTF-8 bytes."""
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError(
+                "msgspec is required for MsgspecCodec. "
+                "Install it with: pip install msgspec"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, message: T_JSON_DICT) -> Frame:
+        return self._encoder.encode(message)
+
+    def decode(self, frame: Frame) -> T_JSON_DICT:
+        try:
+            return self._decoder.decode(frame)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+class UjsonCodec(Codec):
+    """Codec backed by ``ujson``."""
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        if not UJSON_AVAILABLE:
+            raise ImportError(
+                "ujson is required for UjsonCodec. "
+                "Install it with: pip install ujson"
+            )
+
+    def encode(self, message: T_JSON_DICT) -> Frame:
+        return ujson.dumps(message, ensure_ascii=False)
+
+    def decode(self, frame: Frame) -> T_JSON_DICT:
+        # ujson.JSONDecodeError is a subclass of ValueError.
+        return ujson.loads(frame)
+
+
+# Auto-detection order, fastest first.
+_CODECS: typing.Dict[str, typing.Tuple[typing.Type[Codec], bool]] = {
+    'orjson': (OrjsonCodec, ORJSON_AVAILABLE),
+    'msgspec': (MsgspecCodec, MSGSPEC_AVAILABLE),
+    'ujson': (UjsonCodec, UJSON_AVAILABLE),
+    'json': (JsonCodec, True),
+}
+
+
+def available_codecs() -> typing.List[str]:
+    """
+    List the names of codecs that can be used in this environment.
+
+    Returns:
+        Codec names, fastest first. ``'json'`` is always included.
+    """
+    return [name for name, (_, available) in _CODECS.items() if available]
+
+
+def get_codec(name: typing.Optional[str] = None) -> Codec:
+    """
+    Create a codec by name, or auto-detect the fastest available one.
+
+    Args:
+        name: One of ``'orjson'``, ``'msgspec'``, ``'ujson'`` or ``'json'``.
+            If omitted, the fastest installed library is used.
+
+    Returns:
+        A codec instance
+
+    Raises:
+        ValueError: If the name is not a known codec
+        ImportError: If the named codec's library is not installed
+    """
+    if name is None:
+        name = available_codecs()[0]
+    try:
+        codec_cls, _ = _CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown codec {name!r}, expected one of: {', '.join(_CODECS)}"
+        )
+    return codec_cls()
@@ -2,33 +2,36 @@
 CDP Connection Module
 
 This module provides I/O and multiplexing support for Chrome DevTools Protocol.
-It handles WebSocket connections, JSON-RPC message framing, command multiplexing,
-and event dispatching.
+It handles connections (over WebSocket or a pipe, see :mod:`cdp.transport`),
+JSON-RPC message framing, command multiplexing, and event dispatching.
 """
 
 from __future__ import annotations
 import asyncio
-import json
+import functools
+import heapq
 import logging
+import time
 import typing
 from dataclasses import dataclass, field
 
-try:
-    import websockets
-    try:
-        from websockets.client import WebSocketClientProtocol  # type: ignore[attr-defined]
-    except Exception:
-        WebSocketClientProtocol = typing.Any  # type: ignore
-    WEBSOCKETS_AVAILABLE = True
-except ImportError:
-    WEBSOCKETS_AVAILABLE = False
-    WebSocketClientProtocol = typing.Any  # type: ignore
-
-from cdp.util import parse_json_event, T_JSON_DICT
+from cdp.cache import ResultCache
+from cdp.codec import Codec, get_codec
+from cdp.event_bus import EventBus, EventPredicate, EventSpec, OverflowPolicy
+from cdp.metrics import ConnectionMetrics
+from cdp.reconnect import DomainState, ReconnectPolicy
+from cdp.registry import SIDE_EFFECT_FREE_COMMANDS
+from cdp import target
+from cdp.transport import DEFAULT_MAX_SIZE, MessageTooBigError, Transport, WebSocketTransport
+from cdp.util import CommandRequest, T_JSON_DICT
 
 
 logger = logging.getLogger(__name__)
 
+#: A command to execute: the generator returned by a command function, or a
+#: request built by a command descriptor (see :class:`cdp.util.Command`).
+T_COMMAND = typing.Union[typing.Generator[T_JSON_DICT, T_JSON_DICT, typing.Any], CommandRequest]
+
 
 class CDPError(Exception):
     """Base exception for CDP errors."""
@@ -40,6 +43,12 @@ class CDPConnectionError(CDPError):
     pass
 
 
+class CDPMessageTooBigError(CDPConnectionError):
+    """Raised when the connection closed because a message exceeded its
+    ``max_size``. It is not reconnected, as the message would be resent."""
+    pass
+
+
 class CDPCommandError(CDPError):
     """Raised when a command returns an error."""
     
@@ -56,9 +65,217 @@ class PendingCommand:
     future: asyncio.Future
     method: str
     params: T_JSON_DICT
+    session_id: typing.Optional[str] = None
+    #: Event loop time when the command was sent.
+    started: float = 0.0
+    #: Event loop time after which the command times out, if any.
+    deadline: typing.Optional[float] = None
+
+
+def _raw_command(
+    method: str,
+    params: typing.Optional[T_JSON_DICT],
+) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, T_JSON_DICT]:
+    """A command generator for a method that is only known by name."""
+    request: T_JSON_DICT = {'method': method}
+    if params is not None:
+        request['params'] = params
+    return (yield request)
+
+
+def _passthrough(
+    cmd: T_COMMAND,
+) -> typing.Generator[T_JSON_DICT, T_JSON_DICT, T_JSON_DICT]:
+    """Send a command's request but return its result undecoded."""
+    request = _start(cmd)
+    if not isinstance(cmd, CommandRequest):
+        cmd.close()
+    return (yield request)
+
 
+def _start(cmd: T_COMMAND) -> T_JSON_DICT:
+    """Return the request of a command."""
+    if isinstance(cmd, CommandRequest):
+        return cmd.request()
+    return cmd.send(None)  # type: ignore[arg-type]
 
-class CDPConnection:
+
+def _mark_completed(completed: typing.List[int], index: int, future: asyncio.Future) -> None:
+    """Record that the command at ``index`` of a batch has completed."""
+    completed.append(index)
+
+
+class _EventSource:
+    """Event listening methods shared by connections and sessions."""
+    
+    _events: EventBus
+    
+    def listen(
+        self,
+        *event_types: EventSpec,
+        raw: bool = False,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Listen for events from the browser.
+        
+        This is an async iterator that yields CDP events as they arrive.
+        
+        Without arguments it consumes the connection's shared event queue,
+        which buffers every event (or every subscribed event, see
+        :meth:`subscribe`) from the moment the connection opens. Concurrent
+        consumers of the shared queue each see a different subset of events.
+        
+        With event types, it yields only those types from a private queue that
+        exists while the iterator is running. Any number of these listeners can
+        run concurrently and each receives every matching event.
+        
+        With ``raw=True``, it yields the event messages as decoded JSON
+        (``{"method": ..., "params": ...}``) without parsing them into event
+        objects, from a private queue that receives the given event types, or
+        every event if none are given. Events that only raw listeners consume
+        are not parsed at all, unless the shared queue receives them too (see
+        :meth:`subscribe`).
+        
+        Args:
+            event_types: Event classes or CDP method strings to listen for
+            raw: Yield message dicts instead of event objects
+        
+        Yields:
+            CDP event objects (type depends on the event), or message dicts
+        
+        Example:
+            async for event in conn.listen():
+                if isinstance(event, page.LoadEventFired):
+                    print("Page loaded!")
+            
+            async for event in conn.listen(network.ResponseReceived):
+                print(event.response.url)
+        """
+        return self._events.listen(*event_types, raw=raw)
+    
+    def expect_event(
+        self,
+        event_type: EventSpec,
+        predicate: typing.Optional[EventPredicate] = None,
+    ) -> asyncio.Future:
+        """
+        Register a one-shot waiter for the next matching event.
+        
+        The waiter is resolved as soon as a matching event is received,
+        without going through any queue. It is registered immediately, so
+        create it *before* sending the command that triggers the event.
+        
+        Args:
+            event_type: Event class or CDP method string to wait for
+            predicate: Optional function that must return ``True`` for the
+                event to match
+        
+        Returns:
+            A future that resolves to the matching event
+        
+        Example:
+            loaded = conn.expect_event(page.FrameStoppedLoading,
+                lambda e: e.frame_id == frame_id)
+            await conn.execute(page.reload())
+            await asyncio.wait_for(loaded, timeout=10)
+        """
+        return self._events.expect(event_type, predicate)
+    
+    async def wait_for_event(
+        self,
+        event_type: EventSpec,
+        predicate: typing.Optional[EventPredicate] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Any:
+        """
+        Wait for the next matching event.
+        
+        Only events received after this call are considered; use
+        :meth:`expect_event` to avoid missing an event triggered by a command
+        you are about to send.
+        
+        Args:
+            event_type: Event class or CDP method string to wait for
+            predicate: Optional function that must return ``True`` for the
+                event to match
+            timeout: Maximum seconds to wait, or ``None`` to wait forever
+        
+        Returns:
+            The matching event
+        
+        Raises:
+            asyncio.TimeoutError: If no matching event arrives in time
+            CDPConnectionError: If the connection closes first
+        """
+        return await self._events.wait_for(event_type, predicate, timeout)
+    
+    def get_event_nowait(self) -> typing.Optional[typing.Any]:
+        """
+        Get an event from the queue without waiting.
+        
+        Returns:
+            A CDP event object, or None if no events are available
+        """
+        return self._events.get_nowait()
+    
+    def subscribe(self, *events: EventSpec) -> None:
+        """
+        Register interest in one or more event types.
+        
+        While at least one subscription is registered, the shared queue only
+        receives subscribed events. Events that have no subscriber, listener
+        or waiter are counted in :attr:`skipped_event_counts` and discarded
+        before they are parsed, so no dataclasses are built for them. With no
+        subscriptions, every event is delivered to the shared queue (the
+        default).
+        
+        Subscriptions are reference counted: subscribing to the same event
+        twice requires unsubscribing twice.
+        
+        Args:
+            events: CDP method strings (``"Network.responseReceived"``) or
+                event classes (``network.ResponseReceived``)
+        
+        Example:
+            conn.subscribe(page.LoadEventFired, "Network.responseReceived")
+        """
+        self._events.subscribe(*events)
+    
+    def unsubscribe(self, *events: EventSpec) -> None:
+        """
+        Remove interest in one or more event types.
+        
+        Args:
+            events: CDP method strings or event classes previously passed to
+                :meth:`subscribe`
+        
+        Raises:
+            ValueError: If an event type is not subscribed
+        """
+        self._events.unsubscribe(*events)
+    
+    @property
+    def subscriptions(self) -> typing.FrozenSet[str]:
+        """The CDP methods of all subscribed event types."""
+        return self._events.subscriptions
+    
+    @property
+    def skipped_event_counts(self) -> typing.Dict[str, int]:
+        """Number of events discarded without parsing, by CDP method."""
+        return self._events.skipped_event_counts
+    
+    @property
+    def dropped_event_count(self) -> int:
+        """Number of events discarded because an event queue was full."""
+        return self._events.dropped_event_count
+    
+    @property
+    def coalesced_event_count(self) -> int:
+        """Number of queued events replaced by a newer event of the same method."""
+        return self._events.coalesced_event_count
+
+
+class CDPConnection(_EventSource):
     """
     Manages a WebSocket connection to Chrome DevTools Protocol.
     
@@ -79,48 +296,165 @@ class CDPConnection:
                 print(event)
     """
     
-    def __init__(self, url: str, timeout: float = 30.0):
+    def __init__(
+        self,
+        url: typing.Optional[str] = None,
+        timeout: float = 30.0,
+        codec: typing.Union[Codec, str, None] = None,
+        binary_frames: bool = False,
+        max_queue_size: int = 10_000,
+        overflow_policy: typing.Union[OverflowPolicy, str] = OverflowPolicy.DROP_OLDEST,
+        transport: typing.Optional[Transport] = None,
+        metrics: typing.Union[ConnectionMetrics, bool, None] = None,
+        reconnect: typing.Union[ReconnectPolicy, bool, None] = None,
+        max_size: typing.Optional[int] = DEFAULT_MAX_SIZE,
+        read_limit: int = 2**20,
+        write_limit: int = 2**16,
+        ping_interval: typing.Optional[float] = 20.0,
+        ping_timeout: typing.Optional[float] = 20.0,
+        compression: bool = False,
+        coalesce: typing.Union[bool, typing.Iterable[str]] = False,
+        cache: typing.Union[ResultCache, bool, None] = None,
+    ):
         """
         Initialize a CDP connection.
         
         Args:
-            url: WebSocket URL for the CDP endpoint
+            url: WebSocket URL for the CDP endpoint. Required unless
+                ``transport`` is given.
             timeout: Default timeout for commands in seconds
+            codec: JSON codec used for both directions, either a
+                :class:`~cdp.codec.Codec` instance or a codec name. By default
+                the fastest installed library (orjson, msgspec, ujson) is
+                used, falling back to the standard library.
+            binary_frames: Send frames produced as ``bytes`` by the codec
+                directly as binary WebSocket frames instead of decoding them
+                to ``str`` first. Chrome's DevTools socket only accepts text
+                frames, so leave this off unless the endpoint accepts binary
+                frames (e.g. a proxy or test server).
+            max_queue_size: Maximum number of events buffered for
+                ``listen()`` (and for each typed listener) before
+                ``overflow_policy`` applies; ``0`` means unbounded
+            overflow_policy: What to do with events that arrive while a queue
+                is full: ``'drop_oldest'`` (default), ``'drop_newest'``,
+                ``'coalesce'`` (keep only the newest event per method) or
+                ``'block'`` (pause the receive loop until there is room; this
+                also delays command responses)
+            transport: Transport to use instead of a WebSocket to ``url``,
+                e.g. a :class:`~cdp.transport.PipeTransport`. The WebSocket
+                options below are ignored then.
+            metrics: ``True`` or a :class:`~cdp.metrics.ConnectionMetrics`
+                instance to record per-method metrics, available as
+                :attr:`metrics`. Off by default.
+            reconnect: ``True`` or a :class:`~cdp.reconnect.ReconnectPolicy`
+                to reopen the transport when it drops and restore enabled
+                domains, added scripts and sessions. Off by default.
+            max_size: Largest WebSocket message accepted, in bytes (256 MiB
+                by default), or ``None`` for no limit
+            read_limit: High-water mark of the WebSocket receive buffer
+            write_limit: High-water mark of the WebSocket send buffer
+            ping_interval: Seconds between WebSocket keepalive pings, or
+                ``None`` to disable them
+            ping_timeout: Seconds to wait for a pong before giving up
+            compression: Offer permessage-deflate compression (off by
+                default, see the docs for when it pays off)
+            coalesce: Share one request between identical concurrent calls
+                of side-effect-free commands: ``True`` for the commands in
+                :data:`cdp.registry.SIDE_EFFECT_FREE_COMMANDS`, or an
+                iterable of method names. Off by default.
+            cache: ``True`` or a :class:`~cdp.cache.ResultCache` to reuse
+                results (e.g. of ``DOM.getDocument``) until an event
+                invalidates them, available as :attr:`cache`. Each session
+                gets its own. Off by default.
+        
+        Raises:
+            ValueError: If neither ``url`` nor ``transport`` is given
+            ImportError: If ``url`` is given but websockets is not installed
         """
-        if not WEBSOCKETS_AVAILABLE:
-            raise ImportError(
-                "websockets library is required for CDPConnection. "
-                "Install it with: pip install websockets"
+        if transport is None:
+            if url is None:
+                raise ValueError("Either url or transport is required")
+            transport = WebSocketTransport(
+                url, binary_frames, max_size, read_limit, write_limit,
+                ping_interval, ping_timeout, compression,
             )
         
         self.url = url
         self.timeout = timeout
-        self._ws: typing.Optional[WebSocketClientProtocol] = None
+        self.codec = codec if isinstance(codec, Codec) else get_codec(codec)
+        self.transport = transport
+        if metrics is True:
+            metrics = ConnectionMetrics()
+        self.metrics: typing.Optional[ConnectionMetrics] = metrics or None
+        if reconnect is True:
+            reconnect = ReconnectPolicy()
+        self.reconnect_policy: typing.Optional[ReconnectPolicy] = reconnect or None
+        #: Number of times the connection was re-established.
+        self.reconnect_count = 0
+        # Reconnect attempts since the connection was last up for
+        # ReconnectPolicy.stable_after seconds, and when it came back.
+        self._reconnect_attempts = 0
+        self._reconnected_at: typing.Optional[float] = None
+        if coalesce is True:
+            coalesce = SIDE_EFFECT_FREE_COMMANDS
+        self._coalesce: typing.FrozenSet[str] = frozenset(coalesce or ())
+        # Futures of in-flight coalescable commands, by (session, method, params).
+        self._in_flight: typing.Dict[typing.Tuple[typing.Any, ...], asyncio.Future] = {}
+        #: Number of calls that shared an in-flight request instead of sending one.
+        self.coalesced_command_count = 0
+        if cache is True:
+            cache = ResultCache()
+        # Not ``cache or None``: an empty cache is falsy.
+        self.cache = cache if isinstance(cache, ResultCache) else None
+        # Recorded browser-level state, only while reconnecting is enabled.
+        self._state = DomainState() if self.reconnect_policy else None
+        # Cleared while reconnecting; commands wait for it before sending.
+        self._online: typing.Optional[asyncio.Event] = None
+        self._reconnect_task: typing.Optional[asyncio.Task] = None
+        self._connected = False
         self._next_command_id = 1
         self._pending_commands: typing.Dict[int, PendingCommand] = {}
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        # Heap of (deadline, command ID), served by a single timer. Entries
+        # of commands that already completed are discarded lazily.
+        self._deadlines: typing.List[typing.Tuple[float, int]] = []
+        self._deadline_timer: typing.Optional[asyncio.TimerHandle] = None
+        self._events = EventBus(max_queue_size, overflow_policy, self.metrics)
+        self._sessions: typing.Dict[str, CDPSession] = {}
         self._recv_task: typing.Optional[asyncio.Task] = None
         self._closed = False
     
     async def connect(self) -> None:
-        """Establish the WebSocket connection."""
-        if self._ws is not None:
+        """Open the transport and start receiving messages."""
+        if self._connected:
             raise CDPConnectionError("Already connected")
         
         try:
-            self._ws = await websockets.connect(self.url)  # type: ignore
+            await self.transport.open()
+            self._connected = True
+            self._online = asyncio.Event()
+            self._online.set()
             self._recv_task = asyncio.create_task(self._receive_loop())
-            logger.info(f"Connected to {self.url}")
+            logger.info(f"Connected to {self.transport!r}")
         except Exception as e:
-            raise CDPConnectionError(f"Failed to connect to {self.url}: {e}")
+            raise CDPConnectionError(f"Failed to connect to {self.url or self.transport!r}: {e}")
     
     async def close(self) -> None:
-        """Close the WebSocket connection."""
+        """Close the connection."""
         if self._closed:
             return
         
         self._closed = True
         
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+        if self._online is not None:
+            # Release commands waiting for a reconnect; they fail as closed.
+            self._online.set()
+        
         # Cancel the receive task
         if self._recv_task:
             self._recv_task.cancel()
@@ -134,11 +468,21 @@ class CDPConnection:
             if not pending.future.done():
                 pending.future.cancel()
         self._pending_commands.clear()
+        self._deadlines.clear()
+        if self._deadline_timer is not None:
+            self._deadline_timer.cancel()
+            self._deadline_timer = None
         
-        # Close the WebSocket
-        if self._ws:
-            await self._ws.close()
-            self._ws = None
+        # Wake up event listeners and fail event waiters
+        self._events.close(CDPConnectionError("Connection closed"))
+        for session in self._sessions.values():
+            session._events.close(CDPConnectionError("Connection closed"))
+        self._sessions.clear()
+        
+        # Close the transport
+        if self._connected:
+            await self.transport.close()
+            self._connected = False
         
         logger.info("Connection closed")
     
@@ -153,7 +497,7 @@ class CDPConnection:
     
     async def _receive_loop(self) -> None:
         """
-        Main receive loop that processes incoming WebSocket messages.
+        Main receive loop that processes incoming messages.
         
         This loop:
         - Receives messages from the WebSocket
@@ -161,10 +505,18 @@ class CDPConnection:
         - Dispatches events to the event queue
         """
         try:
-            while not self._closed and self._ws:
+            while not self._closed and self._connected:
                 try:
-                    message = await self._ws.recv()
-                    data = json.loads(message)
+                    message = await self.transport.recv()
+                    if self.metrics is not None:
+                        start = time.perf_counter()
+                    try:
+                        data = self.codec.decode(message)
+                    except ValueError as e:
+                        logger.error(f"Failed to decode JSON: {e}")
+                        continue
+                    if self.metrics is not None:
+                        self._record_received(data, len(message), time.perf_counter() - start)
                     
                     if 'id' in data:
                         # This is a command response
@@ -175,8 +527,6 @@ class CDPConnection:
                     else:
                         logger.warning(f"Received unexpected message: {data}")
                 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON: {e}")
                 except Exception as e:
                     logger.error(f"Error in receive loop: {e}")
                     if not self._closed:
@@ -185,10 +535,186 @@ class CDPConnection:
             logger.debug("Receive loop cancelled")
         except Exception as e:
             logger.error(f"Fatal error in receive loop: {e}")
-            # Cancel all pending commands with this error
-            for pending in self._pending_commands.values():
+            if isinstance(e, MessageTooBigError):
+                exc: CDPConnectionError = CDPMessageTooBigError(f"Connection error: {e}")
+                exc.__cause__ = e
+                self._fail_all(exc)
+            elif self._can_reconnect():
+                typing.cast(asyncio.Event, self._online).clear()
+                self._reconnect_task = asyncio.create_task(self._reconnect(e))
+            else:
+                self._fail_all(CDPConnectionError(f"Connection error: {e}"))
+    
+    def _fail_all(self, exc: Exception) -> None:
+        """Fail all pending commands and close every event bus."""
+        for pending in self._pending_commands.values():
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+        self._events.close(exc)
+        for session in self._sessions.values():
+            session._events.close(exc)
+    
+    def _can_reconnect(self) -> bool:
+        return (
+            self.reconnect_policy is not None
+            and not self._closed
+            and self.transport.reopenable
+        )
+    
+    async def _reconnect(self, error: Exception) -> None:
+        """
+        Reopen the transport after it dropped, restore the recorded state and
+        resend idempotent in-flight commands.
+        
+        Commands executed meanwhile wait until this is done. Event queues stay
+        open, so listeners keep running across the reconnect.
+        """
+        policy = typing.cast(ReconnectPolicy, self.reconnect_policy)
+        retry = []
+        for cmd_id, pending in list(self._pending_commands.items()):
+            if policy.is_idempotent(pending.method):
+                retry.append(cmd_id)
+            else:
+                del self._pending_commands[cmd_id]
                 if not pending.future.done():
-                    pending.future.set_exception(CDPConnectionError(f"Connection error: {e}"))
+                    pending.future.set_exception(CDPConnectionError(
+                        f"Connection lost before {pending.method} completed: {error}"
+                    ))
+        
+        try:
+            await self.transport.close()
+        except Exception:
+            pass
+        loop = asyncio.get_running_loop()
+        if (self._reconnected_at is None
+                or loop.time() - self._reconnected_at >= policy.stable_after):
+            self._reconnect_attempts = 0
+        # A connection that drops right after reopening continues the
+        # backoff where the previous reconnect left it.
+        first = attempt = self._reconnect_attempts
+        for attempt, delay in enumerate(policy.delays(first), first + 1):
+            await asyncio.sleep(delay)
+            try:
+                await self.transport.open()
+                break
+            except Exception as e:
+                logger.warning(f"Reconnect attempt {attempt} failed: {e}")
+        else:
+            logger.error(f"Giving up reconnecting after {attempt} attempts")
+            self._connected = False
+            self._fail_all(CDPConnectionError(
+                f"Connection error: {error} (reconnect failed after {attempt} attempts)"
+            ))
+            typing.cast(asyncio.Event, self._online).set()
+            return
+        
+        logger.info(f"Reconnected to {self.transport!r} after {attempt - first} attempts")
+        self._reconnect_attempts = attempt
+        self._reconnected_at = loop.time()
+        self._recv_task = asyncio.create_task(self._receive_loop())
+        # Node IDs and the like from before the drop are not valid anymore.
+        if self.cache is not None:
+            self.cache.clear()
+            for session in self._sessions.values():
+                typing.cast(ResultCache, session.cache).clear()
+        renamed = await self._restore()
+        if self._reconnect_task is not asyncio.current_task():
+            # The connection dropped again while restoring; a newer
+            # reconnect has taken over.
+            return
+        
+        for cmd_id in retry:
+            resend = self._pending_commands.get(cmd_id)
+            if resend is None or resend.future.done():
+                continue
+            request = {'id': cmd_id, 'method': resend.method, 'params': resend.params}
+            if resend.session_id is not None:
+                # Commands of sessions that could not be re-attached were
+                # already failed by _detach_session.
+                session_id = renamed.get(resend.session_id)
+                if session_id is None:
+                    continue
+                resend.session_id = request['sessionId'] = session_id
+            try:
+                await self._send(request)
+            except Exception as e:
+                self._pending_commands.pop(cmd_id, None)
+                resend.future.set_exception(e)
+        
+        self.reconnect_count += 1
+        typing.cast(asyncio.Event, self._online).set()
+        if policy.on_reconnect is not None:
+            try:
+                await policy.on_reconnect(self)
+            except Exception:
+                logger.exception("on_reconnect callback failed")
+    
+    async def _restore(self) -> typing.Dict[str, str]:
+        """
+        Replay the recorded browser state, then re-attach every session and
+        replay its state.
+        
+        Returns:
+            New session IDs, by old session ID
+        """
+        await self._replay(typing.cast(DomainState, self._state), None)
+        renamed = {}
+        for old_id, session in list(self._sessions.items()):
+            try:
+                new_id = await self._execute(
+                    target.attach_to_target(session.target_id, flatten=True),
+                    internal=True,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to re-attach to target {session.target_id}: {e}")
+                self._detach_session(old_id)
+                continue
+            del self._sessions[old_id]
+            session.session_id = new_id
+            self._sessions[new_id] = session
+            renamed[old_id] = new_id
+            await self._replay(typing.cast(DomainState, session._state), new_id)
+        return renamed
+    
+    async def _replay(self, state: DomainState, session_id: typing.Optional[str]) -> None:
+        for method, params, script in state.replay():
+            try:
+                result = await self._execute(
+                    _raw_command(method, params), session_id=session_id, internal=True
+                )
+            except Exception as e:
+                logger.warning(f"Failed to restore {method} after reconnecting: {e}")
+                continue
+            if script is not None:
+                state.script_replayed(script, result['identifier'])
+    
+    def _record_state(
+        self,
+        session_id: typing.Optional[str],
+        request: T_JSON_DICT,
+        result: T_JSON_DICT,
+    ) -> None:
+        """Record a successful command that must be replayed after reconnecting."""
+        if session_id is None:
+            state = self._state
+        else:
+            session = self._sessions.get(session_id)
+            state = session._state if session is not None else None
+        if state is not None:
+            state.record(request['method'], request.get('params', {}), result)
+    
+    def _record_received(self, data: T_JSON_DICT, size: int, decode_time: float) -> None:
+        """Record metrics for an incoming message before it is handled."""
+        metrics = typing.cast(ConnectionMetrics, self.metrics)
+        if 'id' in data:
+            pending = self._pending_commands.get(data['id'])
+            if pending is not None:
+                latency = asyncio.get_running_loop().time() - pending.started
+                metrics.command_completed(
+                    pending.method, latency, size, decode_time, 'error' in data
+                )
+        elif 'method' in data:
+            metrics.event_received(data['method'], size, decode_time)
     
     async def _handle_response(self, data: T_JSON_DICT) -> None:
         """Handle a command response."""
@@ -214,16 +740,55 @@ class CDPConnection:
     
     async def _handle_event(self, data: T_JSON_DICT) -> None:
         """Handle an event notification."""
+        session_id = data.get('sessionId')
+        if session_id is None:
+            if data['method'] == 'Target.detachedFromTarget':
+                self._detach_session(data['params']['sessionId'])
+            if self.cache is not None:
+                self.cache.event_received(data['method'])
+            await self._events.dispatch(data)
+            return
+        session = self._sessions.get(session_id)
+        if session is None:
+            logger.debug(f"Dropping {data['method']} for unknown session {session_id}")
+            return
+        if session.cache is not None:
+            session.cache.event_received(data['method'])
+        await session._events.dispatch(data)
+    
+    def _detach_session(self, session_id: str) -> None:
+        """Forget a session and fail everything still waiting on it."""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        exc = CDPConnectionError(f"Session {session_id} detached")
+        for cmd_id, pending in list(self._pending_commands.items()):
+            if pending.session_id == session_id:
+                del self._pending_commands[cmd_id]
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+        session._events.close(exc)
+    
+    async def _send(self, message: T_JSON_DICT) -> None:
+        """Encode a message with the codec and write it to the transport."""
         try:
-            event = parse_json_event(data)
-            await self._event_queue.put(event)
-        except Exception as e:
-            logger.error(f"Failed to parse event: {e}")
+            if self.metrics is None:
+                await self.transport.send(self.codec.encode(message))
+            else:
+                start = time.perf_counter()
+                frame = self.codec.encode(message)
+                self.metrics.command_sent(
+                    message['method'], len(frame), time.perf_counter() - start
+                )
+                await self.transport.send(frame)
+        except ConnectionError as e:
+            raise CDPConnectionError(f"Failed to send {message['method']}: {e}") from e
     
     async def execute(
         self,
-        cmd: typing.Generator[T_JSON_DICT, T_JSON_DICT, typing.Any],
-        timeout: typing.Optional[float] = None
+        cmd: T_COMMAND,
+        timeout: typing.Optional[float] = None,
+        raw: bool = False,
     ) -> typing.Any:
         """
         Execute a CDP command.
@@ -235,8 +800,14 @@ class CDPConnection:
         - Returns the parsed result
         
         Args:
-            cmd: A CDP command generator (from any CDP domain module)
+            cmd: A CDP command generator (from any CDP domain module), or
+                a request built by a command descriptor, which can be
+                executed again (e.g. ``page.navigate_command(url=...)``)
             timeout: Optional timeout override for this command
+            raw: Return the ``result`` object of the response as decoded JSON
+                instead of parsing it into the command's return type. The
+                dict may be shared with coalesced callers and the result
+                cache, so don't modify it.
         
         Returns:
             The command result (type depends on the command)
@@ -250,96 +821,546 @@ class CDPConnection:
             from cdp import page
             result = await conn.execute(page.navigate(url="https://example.com"))
         """
-        if self._ws is None:
-            raise CDPConnectionError("Not connected")
+        return await self._execute(_passthrough(cmd) if raw else cmd, timeout)
+    
+    async def execute_raw(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> T_JSON_DICT:
+        """
+        Execute a CDP command given by name, and return its result undecoded.
         
-        if self._closed:
-            raise CDPConnectionError("Connection closed")
+        The command goes through the same ID multiplexing, timeouts, error
+        mapping, coalescing and caching as :meth:`execute`. Useful for
+        commands that are not in this package's protocol version, and for
+        forwarding results as JSON without building objects first.
         
-        # Get the command request from the generator
-        request = cmd.send(None)  # type: ignore[arg-type]
+        Args:
+            method: CDP method, e.g. ``"DOM.getDocument"``
+            params: Command parameters as JSON
+            timeout: Optional timeout override for this command
         
-        # Assign a unique ID
-        cmd_id = self._next_command_id
-        self._next_command_id += 1
-        request['id'] = cmd_id
+        Returns:
+            The ``result`` object of the response (see ``raw`` in
+            :meth:`execute`)
         
-        # Create a future to track this command
-        future: asyncio.Future = asyncio.Future()
-        self._pending_commands[cmd_id] = PendingCommand(
-            future=future,
-            method=request['method'],
-            params=request.get('params', {})
-        )
+        Raises:
+            CDPCommandError: If the command returns an error
+            asyncio.TimeoutError: If the command times out
+            CDPConnectionError: If there's a connection error
+        
+        Example:
+            tree = await conn.execute_raw("DOM.getDocument", {"depth": -1})
+        """
+        return await self._execute(_raw_command(method, params), timeout)
+    
+    async def _execute(
+        self,
+        cmd: T_COMMAND,
+        timeout: typing.Optional[float] = None,
+        session_id: typing.Optional[str] = None,
+        internal: bool = False,
+    ) -> typing.Any:
+        """
+        Execute a command, optionally on a flattened target session.
+        
+        ``internal`` commands are sent while reconnecting and are not recorded
+        for replay.
+        """
+        self._check_open()
+        if not internal and not self._online.is_set():  # type: ignore[union-attr]
+            await self._wait_online()
+        request = _start(cmd)
+        if self.cache is not None and not internal:
+            return await self._cached(cmd, request, session_id, timeout)
+        if request['method'] in self._coalesce and not internal:
+            return self._finish(cmd, await self._coalesced(request, session_id, timeout))
+        request, future = self._track(request, session_id, timeout)
+        cmd_id = request['id']
         
         try:
             # Send the command
-            await self._ws.send(json.dumps(request))
+            await self._send(request)
             logger.debug(f"Sent command {cmd_id}: {request['method']}")
             
-            # Wait for the response
-            timeout_val = timeout if timeout is not None else self.timeout
-            result = await asyncio.wait_for(future, timeout=timeout_val)
+            # Wait for the response; timeouts are failed by _expire_commands
+            result = await future
+            if self._state is not None and not internal:
+                self._record_state(session_id, request, result)
             
             # Send the result back to the generator
-            try:
-                cmd.send(result)
-            except StopIteration as e:
-                return e.value
-            
-            raise CDPError("Command generator did not stop")
-            
-        except asyncio.TimeoutError:
-            # Clean up the pending command
+            return self._finish(cmd, result)
+        finally:
+            # Clean up the pending command on error or cancellation
             self._pending_commands.pop(cmd_id, None)
-            raise asyncio.TimeoutError(f"Command {request['method']} timed out")
-        except Exception:
-            # Clean up the pending command on error
-            self._pending_commands.pop(cmd_id, None)
-            raise
     
-    async def listen(self) -> typing.AsyncIterator[typing.Any]:
+    async def _cached(
+        self,
+        cmd: T_COMMAND,
+        request: T_JSON_DICT,
+        session_id: typing.Optional[str],
+        timeout: typing.Optional[float],
+    ) -> typing.Any:
+        """Execute a command through the result cache of its session."""
+        cache = self._cache_for(session_id)
+        method = request['method']
+        params = request.get('params')
+        result = cache.get(method, params)
+        if result is not None:
+            return self._finish(cmd, result)
+        
+        generation = cache.command_sent(method)
+        if method in self._coalesce:
+            result = await self._coalesced(request, session_id, timeout)
+        else:
+            request, future = self._track(request, session_id, timeout)
+            try:
+                await self._send(request)
+                result = await future
+            finally:
+                self._pending_commands.pop(request['id'], None)
+            if self._state is not None:
+                self._record_state(session_id, request, result)
+        cache.command_completed(method, params, result, generation)
+        return self._finish(cmd, result)
+    
+    def _cache_for(self, session_id: typing.Optional[str]) -> ResultCache:
+        """Return the result cache of the connection or of a session."""
+        if session_id is not None:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                return typing.cast(ResultCache, session.cache)
+        return typing.cast(ResultCache, self.cache)
+    
+    async def _coalesced(
+        self,
+        request: T_JSON_DICT,
+        session_id: typing.Optional[str],
+        timeout: typing.Optional[float],
+    ) -> T_JSON_DICT:
         """
-        Listen for events from the browser.
+        Send a side-effect-free command, or join an identical one in flight.
         
-        This is an async iterator that yields CDP events as they arrive.
+        Every caller awaits the same ``PendingCommand`` future and gets the
+        same raw result, so callers share the first caller's deadline. The
+        future outlives a cancelled caller: the request stays in flight for
+        the others and is cleaned up when its response arrives or it times
+        out.
+        """
+        # Omitted and empty params are the same request to the browser.
+        key = (session_id, request['method'], self.codec.encode(request.get('params', {})))
+        future = self._in_flight.get(key)
+        if future is not None and not future.done():
+            self.coalesced_command_count += 1
+            return await asyncio.shield(future)
         
-        Yields:
-            CDP event objects (type depends on the event)
+        request, future = self._track(request, session_id, timeout)
+        self._in_flight[key] = future
+        future.add_done_callback(
+            lambda done: self._in_flight.pop(key) if self._in_flight.get(key) is done else None
+        )
+        try:
+            await self._send(request)
+        except Exception as e:
+            self._pending_commands.pop(request['id'], None)
+            if not future.done():
+                future.set_exception(e)
+        logger.debug(f"Sent command {request['id']}: {request['method']}")
+        return await asyncio.shield(future)
+    
+    async def execute_many(
+        self,
+        cmds: typing.Iterable[T_COMMAND],
+        timeout: typing.Optional[float] = None,
+        ordered: bool = True,
+    ) -> typing.List[typing.Any]:
+        """
+        Execute a batch of CDP commands with a single round trip.
+        
+        All requests are encoded and written back-to-back before any response
+        is awaited, so the batch costs roughly one round trip instead of one
+        per command. The browser still processes the commands of a target in
+        the order they were sent, so dependent commands (e.g. mouse press
+        then release) keep their order.
+        
+        Errors are captured per command: a failed command puts its exception
+        (``CDPCommandError``, ``asyncio.TimeoutError``, ...) in its slot of
+        the result list instead of raising, and the other commands are
+        unaffected.
+        
+        Args:
+            cmds: CDP command generators (from any CDP domain module) or
+                requests built by command descriptors
+            timeout: Optional timeout override for each command in the batch
+            ordered: If ``True``, return results in the order of ``cmds``.
+                If ``False``, return ``(index, result)`` pairs in the order
+                the responses arrived.
+        
+        Returns:
+            One result or exception per command
+        
+        Raises:
+            CDPConnectionError: If the connection is not open
         
         Example:
-            async for event in conn.listen():
-                if isinstance(event, page.LoadEventFired):
-                    print("Page loaded!")
+            results = await conn.execute_many([
+                input_.dispatch_mouse_event(type_="mousePressed", x=x, y=y),
+                input_.dispatch_mouse_event(type_="mouseReleased", x=x, y=y),
+            ])
         """
-        while not self._closed:
-            try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                yield event
-            except asyncio.TimeoutError:
-                # Check if connection is still alive
-                if self._closed:
+        return await self._execute_many(cmds, timeout, ordered)
+    
+    async def _execute_many(
+        self,
+        cmds: typing.Iterable[T_COMMAND],
+        timeout: typing.Optional[float] = None,
+        ordered: bool = True,
+        session_id: typing.Optional[str] = None,
+    ) -> typing.List[typing.Any]:
+        """Execute a batch of commands, optionally on a flattened target session."""
+        self._check_open()
+        if not self._online.is_set():  # type: ignore[union-attr]
+            await self._wait_online()
+        cmds = list(cmds)
+        batch: typing.List[typing.Tuple[T_JSON_DICT, asyncio.Future]] = []
+        completed: typing.List[int] = []
+        try:
+            # Registered inside the try, so that the commands registered
+            # before one that fails to start are cleaned up too.
+            for index, cmd in enumerate(cmds):
+                request, future = self._register(cmd, session_id, timeout)
+                batch.append((request, future))
+                future.add_done_callback(functools.partial(_mark_completed, completed, index))
+            if self.cache is not None:
+                # Batches are not answered from the cache, but still invalidate it.
+                cache = self._cache_for(session_id)
+                generations = [cache.command_sent(request['method']) for request, _ in batch]
+            
+            for index, (request, future) in enumerate(batch):
+                try:
+                    await self._send(request)
+                except Exception as e:
+                    # Nothing after a failed write reaches the browser.
+                    for _, unsent in batch[index:]:
+                        # Unless _expire_commands has failed it already
+                        if not unsent.done():
+                            unsent.set_exception(e)
                     break
+            logger.debug(f"Sent {len(batch)} pipelined commands")
+            
+            # Timed out commands are failed by _expire_commands
+            if batch:
+                await asyncio.wait([future for _, future in batch])
+        finally:
+            for request, future in batch:
+                self._pending_commands.pop(request['id'], None)
+        
+        results: typing.List[typing.Any] = []
+        for index, (cmd, (request, future)) in enumerate(zip(cmds, batch)):
+            try:
+                result = future.result()
+                if self._state is not None:
+                    self._record_state(session_id, request, result)
+                if self.cache is not None:
+                    cache.command_completed(
+                        request['method'], request.get('params'), result, generations[index]
+                    )
+                results.append(self._finish(cmd, result))
+            except Exception as e:
+                results.append(e)
+        if ordered:
+            return results
+        return [(index, results[index]) for index in completed]
+    
+    def _check_open(self) -> None:
+        if not self._connected:
+            raise CDPConnectionError("Not connected")
+        
+        if self._closed:
+            raise CDPConnectionError("Connection closed")
+    
+    async def _wait_online(self) -> None:
+        """Wait until a reconnect has finished, then check the connection again."""
+        await typing.cast(asyncio.Event, self._online).wait()
+        self._check_open()
+    
+    def _register(
+        self,
+        cmd: T_COMMAND,
+        session_id: typing.Optional[str],
+        timeout: typing.Optional[float],
+    ) -> typing.Tuple[T_JSON_DICT, asyncio.Future]:
+        """Get a command's request, assign it an ID and track its response."""
+        return self._track(_start(cmd), session_id, timeout)
+    
+    def _track(
+        self,
+        request: T_JSON_DICT,
+        session_id: typing.Optional[str],
+        timeout: typing.Optional[float],
+    ) -> typing.Tuple[T_JSON_DICT, asyncio.Future]:
+        """Assign a request an ID and track its response."""
+        # Assign a unique ID
+        cmd_id = self._next_command_id
+        self._next_command_id += 1
+        request['id'] = cmd_id
+        if session_id is not None:
+            request['sessionId'] = session_id
+        if self._state is not None and 'params' in request:
+            session = self._sessions.get(session_id) if session_id is not None else None
+            state = session._state if session is not None else self._state
+            request['params'] = state.translate(  # type: ignore[union-attr]
+                request['method'], request['params']
+            )
+        
+        # Create a future to track this command
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        started = loop.time()
+        timeout_val = timeout if timeout is not None else self.timeout
+        deadline = started + timeout_val if timeout_val is not None else None
+        self._pending_commands[cmd_id] = PendingCommand(
+            future=future,
+            method=request['method'],
+            params=request.get('params', {}),
+            session_id=session_id,
+            started=started,
+            deadline=deadline,
+        )
+        if deadline is not None:
+            self._add_deadline(loop, deadline, cmd_id)
+        return request, future
+    
+    def _add_deadline(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        deadline: float,
+        cmd_id: int,
+    ) -> None:
+        """Track a command deadline, moving the timer earlier if needed."""
+        if len(self._deadlines) > 2 * len(self._pending_commands) + 1024:
+            # Mostly completed commands: rebuild instead of growing.
+            self._deadlines = [
+                (pending.deadline, pending_id)
+                for pending_id, pending in self._pending_commands.items()
+                if pending.deadline is not None
+            ]
+            heapq.heapify(self._deadlines)
+        heapq.heappush(self._deadlines, (deadline, cmd_id))
+        timer = self._deadline_timer
+        if timer is None or deadline < timer.when():
+            if timer is not None:
+                timer.cancel()
+            self._deadline_timer = loop.call_at(deadline, self._expire_commands)
+    
+    def _expire_commands(self) -> None:
+        """Fail every pending command whose deadline has passed."""
+        self._deadline_timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadlines = self._deadlines
+        while deadlines:
+            deadline, cmd_id = deadlines[0]
+            pending = self._pending_commands.get(cmd_id)
+            if pending is not None and deadline > now:
+                self._deadline_timer = loop.call_at(deadline, self._expire_commands)
+                break
+            heapq.heappop(deadlines)
+            if pending is None:
+                # Already completed
                 continue
+            del self._pending_commands[cmd_id]
+            elapsed = now - pending.started
+            if self.metrics is not None:
+                self.metrics.command_timed_out(pending.method, elapsed)
+            if not pending.future.done():
+                pending.future.set_exception(asyncio.TimeoutError(
+                    f"Command {pending.method} timed out after {elapsed:.3f}s"
+                ))
     
-    def get_event_nowait(self) -> typing.Optional[typing.Any]:
+    @staticmethod
+    def _finish(
+        cmd: T_COMMAND,
+        result: T_JSON_DICT,
+    ) -> typing.Any:
+        """Decode a command's result: send it back to a command generator and
+        return its value."""
+        if isinstance(cmd, CommandRequest):
+            return cmd.decode(result)
+        try:
+            cmd.send(result)
+        except StopIteration as e:
+            return e.value
+        
+        raise CDPError("Command generator did not stop")
+    
+    async def attach(
+        self,
+        target_id: target.TargetID,
+        timeout: typing.Optional[float] = None,
+    ) -> CDPSession:
         """
-        Get an event from the queue without waiting.
+        Attach to a target and return a session for it.
+        
+        The session uses flattened mode (``flatten=True``): its commands and
+        events travel over this connection, tagged with the session ID, so a
+        single browser connection can drive many targets.
+        
+        Args:
+            target_id: The target to attach to, e.g. from
+                ``target.create_target()`` or ``target.get_targets()``
+            timeout: Optional timeout override for the attach command
         
         Returns:
-            A CDP event object, or None if no events are available
+            A :class:`CDPSession` for the target
+        
+        Example:
+            target_id = await conn.execute(target.create_target("about:blank"))
+            session = await conn.attach(target_id)
+            await session.execute(page.navigate(url="https://example.com"))
         """
-        try:
-            return self._event_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            return None
+        session_id = await self.execute(
+            target.attach_to_target(target_id, flatten=True), timeout
+        )
+        session = CDPSession(self, session_id, target_id)
+        self._sessions[session_id] = session
+        return session
+    
+    @property
+    def sessions(self) -> typing.Dict[str, CDPSession]:
+        """Attached sessions, by session ID."""
+        return dict(self._sessions)
     
     @property
     def is_connected(self) -> bool:
         """Check if the connection is open."""
-        return self._ws is not None and not self._closed
+        return self._connected and not self._closed
     
     @property
     def pending_command_count(self) -> int:
         """Get the number of pending commands (for debugging/monitoring)."""
         return len(self._pending_commands)
+
+
+class CDPSession(_EventSource):
+    """
+    A flattened session with one target, multiplexed over a
+    :class:`CDPConnection`.
+    
+    Create sessions with :meth:`CDPConnection.attach`. Commands sent through
+    a session carry its ``sessionId``; events tagged with that ID are routed
+    to the session's own event queues, so ``listen()`` on a session only
+    yields that target's events. Buffering limits and the overflow policy
+    are inherited from the connection.
+    
+    Example:
+        session = await conn.attach(target_id)
+        await session.execute(page.enable())
+        async for event in session.listen(page.LoadEventFired):
+            break
+        await session.detach()
+    """
+    
+    def __init__(
+        self,
+        connection: CDPConnection,
+        session_id: target.SessionID,
+        target_id: target.TargetID,
+    ):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+        events = connection._events
+        self._events = EventBus(
+            events.max_queue_size, events.overflow_policy, connection.metrics
+        )
+        # Recorded state, only while the connection reconnects.
+        self._state = DomainState() if connection.reconnect_policy else None
+        #: This session's result cache, if the connection has one.
+        self.cache = connection.cache.new() if connection.cache is not None else None
+    
+    async def execute(
+        self,
+        cmd: T_COMMAND,
+        timeout: typing.Optional[float] = None,
+        raw: bool = False,
+    ) -> typing.Any:
+        """
+        Execute a CDP command in this session.
+        
+        Args:
+            cmd: A CDP command generator (from any CDP domain module), or
+                a request built by a command descriptor, which can be
+                executed again (e.g. ``page.navigate_command(url=...)``)
+            timeout: Optional timeout override for this command
+            raw: Return the result undecoded, see
+                :meth:`CDPConnection.execute`
+        
+        Returns:
+            The command result (type depends on the command)
+        
+        Raises:
+            CDPCommandError: If the command returns an error
+            asyncio.TimeoutError: If the command times out
+            CDPConnectionError: If the connection is closed or the session
+                has been detached
+        """
+        if not self.is_attached:
+            raise CDPConnectionError(f"Session {self.session_id} is detached")
+        return await self.connection._execute(
+            _passthrough(cmd) if raw else cmd, timeout, self.session_id
+        )
+    
+    async def execute_raw(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> T_JSON_DICT:
+        """
+        Execute a CDP command given by name in this session, and return its
+        result undecoded. See :meth:`CDPConnection.execute_raw`.
+        """
+        if not self.is_attached:
+            raise CDPConnectionError(f"Session {self.session_id} is detached")
+        return await self.connection._execute(
+            _raw_command(method, params), timeout, self.session_id
+        )
+    
+    async def execute_many(
+        self,
+        cmds: typing.Iterable[T_COMMAND],
+        timeout: typing.Optional[float] = None,
+        ordered: bool = True,
+    ) -> typing.List[typing.Any]:
+        """
+        Execute a batch of CDP commands in this session with a single round
+        trip. See :meth:`CDPConnection.execute_many`.
+        """
+        if not self.is_attached:
+            raise CDPConnectionError(f"Session {self.session_id} is detached")
+        return await self.connection._execute_many(cmds, timeout, ordered, self.session_id)
+    
+    async def detach(self) -> None:
+        """Detach from the target. Pending commands and waiters fail."""
+        if not self.is_attached:
+            return
+        try:
+            await self.connection.execute(
+                target.detach_from_target(session_id=self.session_id)
+            )
+        finally:
+            self.connection._detach_session(self.session_id)
+    
+    @property
+    def is_attached(self) -> bool:
+        """Whether the session is still attached and its connection open."""
+        return (
+            self.connection.is_connected
+            and self.connection._sessions.get(self.session_id) is self
+        )
+    
+    def __repr__(self) -> str:
+        return f'CDPSession(session_id={self.session_id!r}, target_id={self.target_id!r})'
@@ -6,13 +6,15 @@
 # CDP domain: CSS (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import dom
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+else:
+    lazy_import(globals(), 'dom', 'page')
 
 
 class StyleSheetOrigin(enum.Enum):
@@ -31,10 +33,16 @@ class StyleSheetOrigin(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StyleSheetOrigin:
-        return cls(json)
+        try:
+            return _STYLE_SHEET_ORIGIN_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_STYLE_SHEET_ORIGIN_MEMBERS: typing.Dict[str, StyleSheetOrigin] = {member.value: member for member in StyleSheetOrigin}
+
+
+@slotted_dataclass
 class PseudoElementMatches:
     r'''
     CSS rule collection for a single pseudo style.
@@ -65,7 +73,7 @@ class PseudoElementMatches:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSAnimationStyle:
     r'''
     CSS style coming from animations with the name of the animation.
@@ -91,7 +99,7 @@ class CSSAnimationStyle:
         )
 
 
-@dataclass
+@slotted_dataclass
 class InheritedStyleEntry:
     r'''
     Inherited CSS rule collection from ancestor node.
@@ -117,7 +125,7 @@ class InheritedStyleEntry:
         )
 
 
-@dataclass
+@slotted_dataclass
 class InheritedAnimatedStyleEntry:
     r'''
     Inherited CSS style collection for animated styles from ancestor node.
@@ -144,7 +152,7 @@ class InheritedAnimatedStyleEntry:
         )
 
 
-@dataclass
+@slotted_dataclass
 class InheritedPseudoElementMatches:
     r'''
     Inherited pseudo element matches from pseudos of an ancestor node.
@@ -164,7 +172,7 @@ class InheritedPseudoElementMatches:
         )
 
 
-@dataclass
+@slotted_dataclass
 class RuleMatch:
     r'''
     Match data for a CSS rule.
@@ -189,7 +197,7 @@ class RuleMatch:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Value:
     r'''
     Data for a simple selector (these are delimited by commas in a selector list).
@@ -221,7 +229,7 @@ class Value:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Specificity:
     r'''
     Specificity:
@@ -253,7 +261,7 @@ class Specificity:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SelectorList:
     r'''
     Selector list data.
@@ -278,7 +286,7 @@ class SelectorList:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSStyleSheetHeader:
     r'''
     CSS stylesheet metainformation.
@@ -394,7 +402,7 @@ class CSSStyleSheetHeader:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSRule:
     r'''
     CSS rule representation.
@@ -517,10 +525,16 @@ class CSSRuleType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CSSRuleType:
-        return cls(json)
+        try:
+            return _CSS_RULE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CSS_RULE_TYPE_MEMBERS: typing.Dict[str, CSSRuleType] = {member.value: member for member in CSSRuleType}
 
 
-@dataclass
+@slotted_dataclass
 class RuleUsage:
     r'''
     CSS coverage information.
@@ -556,7 +570,7 @@ class RuleUsage:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SourceRange:
     r'''
     Text range within a resource. All numbers are zero-based.
@@ -591,7 +605,7 @@ class SourceRange:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ShorthandEntry:
     #: Shorthand name.
     name: str
@@ -619,7 +633,7 @@ class ShorthandEntry:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSComputedStyleProperty:
     #: Computed style property name.
     name: str
@@ -641,7 +655,7 @@ class CSSComputedStyleProperty:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ComputedStyleExtraFields:
     #: Returns whether or not this node is being rendered with base appearance,
     #: which happens when it has its appearance property set to base/base-select
@@ -660,7 +674,7 @@ class ComputedStyleExtraFields:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSStyle:
     r'''
     CSS style representation.
@@ -704,7 +718,7 @@ class CSSStyle:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSProperty:
     r'''
     CSS property declaration data.
@@ -772,7 +786,7 @@ class CSSProperty:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSMedia:
     r'''
     CSS media rule descriptor.
@@ -825,7 +839,7 @@ class CSSMedia:
         )
 
 
-@dataclass
+@slotted_dataclass
 class MediaQuery:
     r'''
     Media query descriptor.
@@ -850,7 +864,7 @@ class MediaQuery:
         )
 
 
-@dataclass
+@slotted_dataclass
 class MediaQueryExpression:
     r'''
     Media query expression descriptor.
@@ -892,7 +906,7 @@ class MediaQueryExpression:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSContainerQuery:
     r'''
     CSS container query rule descriptor.
@@ -955,7 +969,7 @@ class CSSContainerQuery:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSSupports:
     r'''
     CSS Supports at-rule descriptor.
@@ -993,7 +1007,7 @@ class CSSSupports:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSNavigation:
     r'''
     CSS Navigation at-rule descriptor.
@@ -1032,7 +1046,7 @@ class CSSNavigation:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSScope:
     r'''
     CSS Scope at-rule descriptor.
@@ -1065,7 +1079,7 @@ class CSSScope:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSLayer:
     r'''
     CSS Layer at-rule descriptor.
@@ -1098,7 +1112,7 @@ class CSSLayer:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSStartingStyle:
     r'''
     CSS Starting Style at-rule descriptor.
@@ -1126,7 +1140,7 @@ class CSSStartingStyle:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSLayerData:
     r'''
     CSS Layer data.
@@ -1158,7 +1172,7 @@ class CSSLayerData:
         )
 
 
-@dataclass
+@slotted_dataclass
 class PlatformFontUsage:
     r'''
     Information about amount of glyphs that were rendered with given font.
@@ -1193,7 +1207,7 @@ class PlatformFontUsage:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FontVariationAxis:
     r'''
     Information about font variation axes for variable fonts
@@ -1233,7 +1247,7 @@ class FontVariationAxis:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FontFace:
     r'''
     Properties of a web font: https://www.w3.org/TR/2008/REC-CSS2-20080411/fonts.html#font-descriptions
@@ -1300,7 +1314,7 @@ class FontFace:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSTryRule:
     r'''
     CSS try rule representation.
@@ -1332,7 +1346,7 @@ class CSSTryRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSPositionTryRule:
     r'''
     CSS @position-try rule representation.
@@ -1373,7 +1387,7 @@ class CSSPositionTryRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSKeyframesRule:
     r'''
     CSS keyframes rule representation.
@@ -1398,7 +1412,7 @@ class CSSKeyframesRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSPropertyRegistration:
     r'''
     Representation of a custom property registration through CSS.registerProperty
@@ -1430,7 +1444,7 @@ class CSSPropertyRegistration:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSAtRule:
     r'''
     CSS generic @rule representation.
@@ -1480,7 +1494,7 @@ class CSSAtRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSPropertyRule:
     r'''
     CSS property at-rule representation.
@@ -1517,7 +1531,7 @@ class CSSPropertyRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSFunctionParameter:
     r'''
     CSS function argument representation.
@@ -1542,7 +1556,7 @@ class CSSFunctionParameter:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSFunctionConditionNode:
     r'''
     CSS function conditional block representation.
@@ -1591,7 +1605,7 @@ class CSSFunctionConditionNode:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSFunctionNode:
     r'''
     Section of the body of a CSS function rule.
@@ -1618,7 +1632,7 @@ class CSSFunctionNode:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSFunctionRule:
     r'''
     CSS function at-rule representation.
@@ -1660,7 +1674,7 @@ class CSSFunctionRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSKeyframeRule:
     r'''
     CSS keyframe rule representation.
@@ -1697,7 +1711,7 @@ class CSSKeyframeRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class StyleDeclarationEdit:
     r'''
     A descriptor of operation to mutate style declaration text.
@@ -1727,6 +1741,21 @@ class StyleDeclarationEdit:
         )
 
 
+def _add_rule_params(
+        style_sheet_id: dom.StyleSheetId,
+        rule_text: str,
+        location: SourceRange,
+        node_for_property_syntax_validation: typing.Optional[dom.NodeId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['ruleText'] = rule_text
+    params['location'] = location.to_json()
+    if node_for_property_syntax_validation is not None:
+        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
+    return params
+
+
 def add_rule(
         style_sheet_id: dom.StyleSheetId,
         rule_text: str,
@@ -1743,20 +1772,30 @@ def add_rule(
     :param node_for_property_syntax_validation: **(EXPERIMENTAL)** *(Optional)* NodeId for the DOM node in whose context custom property declarations for registered properties should be validated. If omitted, declarations in the new rule text can only be validated statically, which may produce incorrect results if the declaration contains a var() for example.
     :returns: The newly created rule.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['ruleText'] = rule_text
-    params['location'] = location.to_json()
-    if node_for_property_syntax_validation is not None:
-        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.addRule',
-        'params': params,
+        'params': _add_rule_params(style_sheet_id, rule_text, location, node_for_property_syntax_validation),
     }
     json = yield cmd_dict
     return CSSRule.from_json(json['rule'])
 
 
+add_rule_command = Command(
+    'CSS.addRule',
+    add_rule,
+    _add_rule_params,
+    lambda json: CSSRule.from_json(json['rule']),
+)
+
+
+def _collect_class_names_params(
+        style_sheet_id: dom.StyleSheetId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    return params
+
+
 def collect_class_names(
         style_sheet_id: dom.StyleSheetId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -1766,16 +1805,33 @@ def collect_class_names(
     :param style_sheet_id:
     :returns: Class name list.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.collectClassNames',
-        'params': params,
+        'params': _collect_class_names_params(style_sheet_id),
     }
     json = yield cmd_dict
     return [str(i) for i in json['classNames']]
 
 
+collect_class_names_command = Command(
+    'CSS.collectClassNames',
+    collect_class_names,
+    _collect_class_names_params,
+    lambda json: [str(i) for i in json['classNames']],
+)
+
+
+def _create_style_sheet_params(
+        frame_id: page.FrameId,
+        force: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    if force is not None:
+        params['force'] = force
+    return params
+
+
 def create_style_sheet(
         frame_id: page.FrameId,
         force: typing.Optional[bool] = None
@@ -1787,18 +1843,22 @@ def create_style_sheet(
     :param force: *(Optional)* If true, creates a new stylesheet for every call. If false, returns a stylesheet previously created by a call with force=false for the frame's document if it exists or creates a new stylesheet (default: false).
     :returns: Identifier of the created "via-inspector" stylesheet.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    if force is not None:
-        params['force'] = force
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.createStyleSheet',
-        'params': params,
+        'params': _create_style_sheet_params(frame_id, force),
     }
     json = yield cmd_dict
     return dom.StyleSheetId.from_json(json['styleSheetId'])
 
 
+create_style_sheet_command = Command(
+    'CSS.createStyleSheet',
+    create_style_sheet,
+    _create_style_sheet_params,
+    lambda json: dom.StyleSheetId.from_json(json['styleSheetId']),
+)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables the CSS agent for the given page.
@@ -1809,6 +1869,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('CSS.disable', disable)
+
+
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Enables the CSS agent for the given page. Clients should not assume that the CSS agent has been
@@ -1820,6 +1883,19 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+enable_command = Command('CSS.enable', enable)
+
+
+def _force_pseudo_state_params(
+        node_id: dom.NodeId,
+        forced_pseudo_classes: typing.List[str]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['forcedPseudoClasses'] = [i for i in forced_pseudo_classes]
+    return params
+
+
 def force_pseudo_state(
         node_id: dom.NodeId,
         forced_pseudo_classes: typing.List[str]
@@ -1831,16 +1907,30 @@ def force_pseudo_state(
     :param node_id: The element id for which to force the pseudo state.
     :param forced_pseudo_classes: Element pseudo classes to force when computing the element's style.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['forcedPseudoClasses'] = [i for i in forced_pseudo_classes]
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.forcePseudoState',
-        'params': params,
+        'params': _force_pseudo_state_params(node_id, forced_pseudo_classes),
     }
     json = yield cmd_dict
 
 
+force_pseudo_state_command = Command(
+    'CSS.forcePseudoState',
+    force_pseudo_state,
+    _force_pseudo_state_params,
+)
+
+
+def _force_starting_style_params(
+        node_id: dom.NodeId,
+        forced: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['forced'] = forced
+    return params
+
+
 def force_starting_style(
         node_id: dom.NodeId,
         forced: bool
@@ -1851,16 +1941,28 @@ def force_starting_style(
     :param node_id: The element id for which to force the starting-style state.
     :param forced: Boolean indicating if this is on or off.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['forced'] = forced
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.forceStartingStyle',
-        'params': params,
+        'params': _force_starting_style_params(node_id, forced),
     }
     json = yield cmd_dict
 
 
+force_starting_style_command = Command(
+    'CSS.forceStartingStyle',
+    force_starting_style,
+    _force_starting_style_params,
+)
+
+
+def _get_background_colors_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_background_colors(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[str]], typing.Optional[str], typing.Optional[str]]]:
@@ -1872,11 +1974,9 @@ def get_background_colors(
         1. **computedFontSize** - *(Optional)* The computed font size for this node, as a CSS computed value string (e.g. '12px').
         2. **computedFontWeight** - *(Optional)* The computed font weight for this node, as a CSS computed value string (e.g. 'normal' or '100').
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getBackgroundColors',
-        'params': params,
+        'params': _get_background_colors_params(node_id),
     }
     json = yield cmd_dict
     return (
@@ -1886,6 +1986,26 @@ def get_background_colors(
     )
 
 
+get_background_colors_command = Command(
+    'CSS.getBackgroundColors',
+    get_background_colors,
+    _get_background_colors_params,
+    lambda json: (
+        [str(i) for i in json['backgroundColors']] if 'backgroundColors' in json else None,
+        str(json['computedFontSize']) if 'computedFontSize' in json else None,
+        str(json['computedFontWeight']) if 'computedFontWeight' in json else None
+    ),
+)
+
+
+def _get_computed_style_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_computed_style_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[CSSComputedStyleProperty], ComputedStyleExtraFields]]:
@@ -1898,11 +2018,9 @@ def get_computed_style_for_node(
         0. **computedStyle** - Computed style for the specified DOM node.
         1. **extraFields** - A list of non-standard "extra fields" which blink stores alongside each computed style.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getComputedStyleForNode',
-        'params': params,
+        'params': _get_computed_style_for_node_params(node_id),
     }
     json = yield cmd_dict
     return (
@@ -1911,6 +2029,36 @@ def get_computed_style_for_node(
     )
 
 
+get_computed_style_for_node_command = Command(
+    'CSS.getComputedStyleForNode',
+    get_computed_style_for_node,
+    _get_computed_style_for_node_params,
+    lambda json: (
+        [CSSComputedStyleProperty.from_json(i) for i in json['computedStyle']],
+        ComputedStyleExtraFields.from_json(json['extraFields'])
+    ),
+)
+
+
+def _resolve_values_params(
+        values: typing.List[str],
+        node_id: dom.NodeId,
+        property_name: typing.Optional[str] = None,
+        pseudo_type: typing.Optional[dom.PseudoType] = None,
+        pseudo_identifier: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['values'] = [i for i in values]
+    params['nodeId'] = node_id.to_json()
+    if property_name is not None:
+        params['propertyName'] = property_name
+    if pseudo_type is not None:
+        params['pseudoType'] = pseudo_type.to_json()
+    if pseudo_identifier is not None:
+        params['pseudoIdentifier'] = pseudo_identifier
+    return params
+
+
 def resolve_values(
         values: typing.List[str],
         node_id: dom.NodeId,
@@ -1940,23 +2088,32 @@ def resolve_values(
     :param pseudo_identifier: *(Optional)* Pseudo element custom ident.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['values'] = [i for i in values]
-    params['nodeId'] = node_id.to_json()
-    if property_name is not None:
-        params['propertyName'] = property_name
-    if pseudo_type is not None:
-        params['pseudoType'] = pseudo_type.to_json()
-    if pseudo_identifier is not None:
-        params['pseudoIdentifier'] = pseudo_identifier
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.resolveValues',
-        'params': params,
+        'params': _resolve_values_params(values, node_id, property_name, pseudo_type, pseudo_identifier),
     }
     json = yield cmd_dict
     return [str(i) for i in json['results']]
 
 
+resolve_values_command = Command(
+    'CSS.resolveValues',
+    resolve_values,
+    _resolve_values_params,
+    lambda json: [str(i) for i in json['results']],
+)
+
+
+def _get_longhand_properties_params(
+        shorthand_name: str,
+        value: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['shorthandName'] = shorthand_name
+    params['value'] = value
+    return params
+
+
 def get_longhand_properties(
         shorthand_name: str,
         value: str
@@ -1970,17 +2127,30 @@ def get_longhand_properties(
     :param value:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['shorthandName'] = shorthand_name
-    params['value'] = value
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getLonghandProperties',
-        'params': params,
+        'params': _get_longhand_properties_params(shorthand_name, value),
     }
     json = yield cmd_dict
     return [CSSProperty.from_json(i) for i in json['longhandProperties']]
 
 
+get_longhand_properties_command = Command(
+    'CSS.getLonghandProperties',
+    get_longhand_properties,
+    _get_longhand_properties_params,
+    lambda json: [CSSProperty.from_json(i) for i in json['longhandProperties']],
+)
+
+
+def _get_inline_styles_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_inline_styles_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle]]]:
@@ -1994,11 +2164,9 @@ def get_inline_styles_for_node(
         0. **inlineStyle** - *(Optional)* Inline style for the specified DOM node.
         1. **attributesStyle** - *(Optional)* Attribute-defined element style (e.g. resulting from "width=20 height=100%").
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getInlineStylesForNode',
-        'params': params,
+        'params': _get_inline_styles_for_node_params(node_id),
     }
     json = yield cmd_dict
     return (
@@ -2007,6 +2175,25 @@ def get_inline_styles_for_node(
     )
 
 
+get_inline_styles_for_node_command = Command(
+    'CSS.getInlineStylesForNode',
+    get_inline_styles_for_node,
+    _get_inline_styles_for_node_params,
+    lambda json: (
+        CSSStyle.from_json(json['inlineStyle']) if 'inlineStyle' in json else None,
+        CSSStyle.from_json(json['attributesStyle']) if 'attributesStyle' in json else None
+    ),
+)
+
+
+def _get_animated_styles_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_animated_styles_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[typing.List[CSSAnimationStyle]], typing.Optional[CSSStyle], typing.Optional[typing.List[InheritedAnimatedStyleEntry]]]]:
@@ -2023,11 +2210,9 @@ def get_animated_styles_for_node(
         1. **transitionsStyle** - *(Optional)* Style coming from transitions.
         2. **inherited** - *(Optional)* Inherited style entries for animationsStyle and transitionsStyle from the inheritance chain of the element.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getAnimatedStylesForNode',
-        'params': params,
+        'params': _get_animated_styles_for_node_params(node_id),
     }
     json = yield cmd_dict
     return (
@@ -2037,6 +2222,26 @@ def get_animated_styles_for_node(
     )
 
 
+get_animated_styles_for_node_command = Command(
+    'CSS.getAnimatedStylesForNode',
+    get_animated_styles_for_node,
+    _get_animated_styles_for_node_params,
+    lambda json: (
+        [CSSAnimationStyle.from_json(i) for i in json['animationStyles']] if 'animationStyles' in json else None,
+        CSSStyle.from_json(json['transitionsStyle']) if 'transitionsStyle' in json else None,
+        [InheritedAnimatedStyleEntry.from_json(i) for i in json['inherited']] if 'inherited' in json else None
+    ),
+)
+
+
+def _get_matched_styles_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_matched_styles_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[CSSStyle], typing.Optional[CSSStyle], typing.Optional[typing.List[RuleMatch]], typing.Optional[typing.List[PseudoElementMatches]], typing.Optional[typing.List[InheritedStyleEntry]], typing.Optional[typing.List[InheritedPseudoElementMatches]], typing.Optional[typing.List[CSSKeyframesRule]], typing.Optional[typing.List[CSSPositionTryRule]], typing.Optional[int], typing.Optional[typing.List[CSSPropertyRule]], typing.Optional[typing.List[CSSPropertyRegistration]], typing.Optional[typing.List[CSSAtRule]], typing.Optional[dom.NodeId], typing.Optional[typing.List[CSSFunctionRule]]]]:
@@ -2061,11 +2266,9 @@ def get_matched_styles_for_node(
         12. **parentLayoutNodeId** - *(Optional)* Id of the first parent element that does not have display: contents.
         13. **cssFunctionRules** - *(Optional)* A list of CSS at-function rules referenced by styles of this node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getMatchedStylesForNode',
-        'params': params,
+        'params': _get_matched_styles_for_node_params(node_id),
     }
     json = yield cmd_dict
     return (
@@ -2086,6 +2289,29 @@ def get_matched_styles_for_node(
     )
 
 
+get_matched_styles_for_node_command = Command(
+    'CSS.getMatchedStylesForNode',
+    get_matched_styles_for_node,
+    _get_matched_styles_for_node_params,
+    lambda json: (
+        CSSStyle.from_json(json['inlineStyle']) if 'inlineStyle' in json else None,
+        CSSStyle.from_json(json['attributesStyle']) if 'attributesStyle' in json else None,
+        [RuleMatch.from_json(i) for i in json['matchedCSSRules']] if 'matchedCSSRules' in json else None,
+        [PseudoElementMatches.from_json(i) for i in json['pseudoElements']] if 'pseudoElements' in json else None,
+        [InheritedStyleEntry.from_json(i) for i in json['inherited']] if 'inherited' in json else None,
+        [InheritedPseudoElementMatches.from_json(i) for i in json['inheritedPseudoElements']] if 'inheritedPseudoElements' in json else None,
+        [CSSKeyframesRule.from_json(i) for i in json['cssKeyframesRules']] if 'cssKeyframesRules' in json else None,
+        [CSSPositionTryRule.from_json(i) for i in json['cssPositionTryRules']] if 'cssPositionTryRules' in json else None,
+        int(json['activePositionFallbackIndex']) if 'activePositionFallbackIndex' in json else None,
+        [CSSPropertyRule.from_json(i) for i in json['cssPropertyRules']] if 'cssPropertyRules' in json else None,
+        [CSSPropertyRegistration.from_json(i) for i in json['cssPropertyRegistrations']] if 'cssPropertyRegistrations' in json else None,
+        [CSSAtRule.from_json(i) for i in json['cssAtRules']] if 'cssAtRules' in json else None,
+        dom.NodeId.from_json(json['parentLayoutNodeId']) if 'parentLayoutNodeId' in json else None,
+        [CSSFunctionRule.from_json(i) for i in json['cssFunctionRules']] if 'cssFunctionRules' in json else None
+    ),
+)
+
+
 def get_environment_variables() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
     r'''
     Returns the values of the default UA-defined environment variables used in env()
@@ -2101,6 +2327,14 @@ def get_environment_variables() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict
     return dict(json['environmentVariables'])
 
 
+get_environment_variables_command = Command(
+    'CSS.getEnvironmentVariables',
+    get_environment_variables,
+    None,
+    lambda json: dict(json['environmentVariables']),
+)
+
+
 def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[CSSMedia]]:
     r'''
     Returns all media queries parsed by the rendering engine.
@@ -2114,6 +2348,22 @@ def get_media_queries() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[
     return [CSSMedia.from_json(i) for i in json['medias']]
 
 
+get_media_queries_command = Command(
+    'CSS.getMediaQueries',
+    get_media_queries,
+    None,
+    lambda json: [CSSMedia.from_json(i) for i in json['medias']],
+)
+
+
+def _get_platform_fonts_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_platform_fonts_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PlatformFontUsage]]:
@@ -2124,16 +2374,30 @@ def get_platform_fonts_for_node(
     :param node_id:
     :returns: Usage statistics for every employed platform font.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getPlatformFontsForNode',
-        'params': params,
+        'params': _get_platform_fonts_for_node_params(node_id),
     }
     json = yield cmd_dict
     return [PlatformFontUsage.from_json(i) for i in json['fonts']]
 
 
+get_platform_fonts_for_node_command = Command(
+    'CSS.getPlatformFontsForNode',
+    get_platform_fonts_for_node,
+    _get_platform_fonts_for_node_params,
+    lambda json: [PlatformFontUsage.from_json(i) for i in json['fonts']],
+)
+
+
+def _get_style_sheet_text_params(
+        style_sheet_id: dom.StyleSheetId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    return params
+
+
 def get_style_sheet_text(
         style_sheet_id: dom.StyleSheetId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -2143,16 +2407,30 @@ def get_style_sheet_text(
     :param style_sheet_id:
     :returns: The stylesheet text.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getStyleSheetText',
-        'params': params,
+        'params': _get_style_sheet_text_params(style_sheet_id),
     }
     json = yield cmd_dict
     return str(json['text'])
 
 
+get_style_sheet_text_command = Command(
+    'CSS.getStyleSheetText',
+    get_style_sheet_text,
+    _get_style_sheet_text_params,
+    lambda json: str(json['text']),
+)
+
+
+def _get_layers_for_node_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_layers_for_node(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,CSSLayerData]:
@@ -2167,16 +2445,32 @@ def get_layers_for_node(
     :param node_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getLayersForNode',
-        'params': params,
+        'params': _get_layers_for_node_params(node_id),
     }
     json = yield cmd_dict
     return CSSLayerData.from_json(json['rootLayer'])
 
 
+get_layers_for_node_command = Command(
+    'CSS.getLayersForNode',
+    get_layers_for_node,
+    _get_layers_for_node_params,
+    lambda json: CSSLayerData.from_json(json['rootLayer']),
+)
+
+
+def _get_location_for_selector_params(
+        style_sheet_id: dom.StyleSheetId,
+        selector_text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['selectorText'] = selector_text
+    return params
+
+
 def get_location_for_selector(
         style_sheet_id: dom.StyleSheetId,
         selector_text: str
@@ -2191,17 +2485,31 @@ def get_location_for_selector(
     :param selector_text:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['selectorText'] = selector_text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.getLocationForSelector',
-        'params': params,
+        'params': _get_location_for_selector_params(style_sheet_id, selector_text),
     }
     json = yield cmd_dict
     return [SourceRange.from_json(i) for i in json['ranges']]
 
 
+get_location_for_selector_command = Command(
+    'CSS.getLocationForSelector',
+    get_location_for_selector,
+    _get_location_for_selector_params,
+    lambda json: [SourceRange.from_json(i) for i in json['ranges']],
+)
+
+
+def _track_computed_style_updates_for_node_params(
+        node_id: typing.Optional[dom.NodeId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    return params
+
+
 def track_computed_style_updates_for_node(
         node_id: typing.Optional[dom.NodeId] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2217,16 +2525,28 @@ def track_computed_style_updates_for_node(
 
     :param node_id: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.trackComputedStyleUpdatesForNode',
-        'params': params,
+        'params': _track_computed_style_updates_for_node_params(node_id),
     }
     json = yield cmd_dict
 
 
+track_computed_style_updates_for_node_command = Command(
+    'CSS.trackComputedStyleUpdatesForNode',
+    track_computed_style_updates_for_node,
+    _track_computed_style_updates_for_node_params,
+)
+
+
+def _track_computed_style_updates_params(
+        properties_to_track: typing.List[CSSComputedStyleProperty]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['propertiesToTrack'] = [i.to_json() for i in properties_to_track]
+    return params
+
+
 def track_computed_style_updates(
         properties_to_track: typing.List[CSSComputedStyleProperty]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2242,15 +2562,20 @@ def track_computed_style_updates(
 
     :param properties_to_track:
     '''
-    params: T_JSON_DICT = dict()
-    params['propertiesToTrack'] = [i.to_json() for i in properties_to_track]
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.trackComputedStyleUpdates',
-        'params': params,
+        'params': _track_computed_style_updates_params(properties_to_track),
     }
     json = yield cmd_dict
 
 
+track_computed_style_updates_command = Command(
+    'CSS.trackComputedStyleUpdates',
+    track_computed_style_updates,
+    _track_computed_style_updates_params,
+)
+
+
 def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[dom.NodeId]]:
     r'''
     Polls the next batch of computed style updates.
@@ -2266,6 +2591,26 @@ def take_computed_style_updates() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,ty
     return [dom.NodeId.from_json(i) for i in json['nodeIds']]
 
 
+take_computed_style_updates_command = Command(
+    'CSS.takeComputedStyleUpdates',
+    take_computed_style_updates,
+    None,
+    lambda json: [dom.NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
+def _set_effective_property_value_for_node_params(
+        node_id: dom.NodeId,
+        property_name: str,
+        value: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['propertyName'] = property_name
+    params['value'] = value
+    return params
+
+
 def set_effective_property_value_for_node(
         node_id: dom.NodeId,
         property_name: str,
@@ -2279,17 +2624,32 @@ def set_effective_property_value_for_node(
     :param property_name:
     :param value:
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['propertyName'] = property_name
-    params['value'] = value
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setEffectivePropertyValueForNode',
-        'params': params,
+        'params': _set_effective_property_value_for_node_params(node_id, property_name, value),
     }
     json = yield cmd_dict
 
 
+set_effective_property_value_for_node_command = Command(
+    'CSS.setEffectivePropertyValueForNode',
+    set_effective_property_value_for_node,
+    _set_effective_property_value_for_node_params,
+)
+
+
+def _set_property_rule_property_name_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        property_name: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['propertyName'] = property_name
+    return params
+
+
 def set_property_rule_property_name(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2303,18 +2663,34 @@ def set_property_rule_property_name(
     :param property_name:
     :returns: The resulting key text after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['propertyName'] = property_name
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setPropertyRulePropertyName',
-        'params': params,
+        'params': _set_property_rule_property_name_params(style_sheet_id, range_, property_name),
     }
     json = yield cmd_dict
     return Value.from_json(json['propertyName'])
 
 
+set_property_rule_property_name_command = Command(
+    'CSS.setPropertyRulePropertyName',
+    set_property_rule_property_name,
+    _set_property_rule_property_name_params,
+    lambda json: Value.from_json(json['propertyName']),
+)
+
+
+def _set_keyframe_key_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        key_text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['keyText'] = key_text
+    return params
+
+
 def set_keyframe_key(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2328,18 +2704,34 @@ def set_keyframe_key(
     :param key_text:
     :returns: The resulting key text after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['keyText'] = key_text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setKeyframeKey',
-        'params': params,
+        'params': _set_keyframe_key_params(style_sheet_id, range_, key_text),
     }
     json = yield cmd_dict
     return Value.from_json(json['keyText'])
 
 
+set_keyframe_key_command = Command(
+    'CSS.setKeyframeKey',
+    set_keyframe_key,
+    _set_keyframe_key_params,
+    lambda json: Value.from_json(json['keyText']),
+)
+
+
+def _set_media_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['text'] = text
+    return params
+
+
 def set_media_text(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2353,18 +2745,34 @@ def set_media_text(
     :param text:
     :returns: The resulting CSS media rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setMediaText',
-        'params': params,
+        'params': _set_media_text_params(style_sheet_id, range_, text),
     }
     json = yield cmd_dict
     return CSSMedia.from_json(json['media'])
 
 
+set_media_text_command = Command(
+    'CSS.setMediaText',
+    set_media_text,
+    _set_media_text_params,
+    lambda json: CSSMedia.from_json(json['media']),
+)
+
+
+def _set_container_query_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['text'] = text
+    return params
+
+
 def set_container_query_text(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2380,18 +2788,34 @@ def set_container_query_text(
     :param text:
     :returns: The resulting CSS container query rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setContainerQueryText',
-        'params': params,
+        'params': _set_container_query_text_params(style_sheet_id, range_, text),
     }
     json = yield cmd_dict
     return CSSContainerQuery.from_json(json['containerQuery'])
 
 
+set_container_query_text_command = Command(
+    'CSS.setContainerQueryText',
+    set_container_query_text,
+    _set_container_query_text_params,
+    lambda json: CSSContainerQuery.from_json(json['containerQuery']),
+)
+
+
+def _set_supports_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['text'] = text
+    return params
+
+
 def set_supports_text(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2407,18 +2831,34 @@ def set_supports_text(
     :param text:
     :returns: The resulting CSS Supports rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setSupportsText',
-        'params': params,
+        'params': _set_supports_text_params(style_sheet_id, range_, text),
     }
     json = yield cmd_dict
     return CSSSupports.from_json(json['supports'])
 
 
+set_supports_text_command = Command(
+    'CSS.setSupportsText',
+    set_supports_text,
+    _set_supports_text_params,
+    lambda json: CSSSupports.from_json(json['supports']),
+)
+
+
+def _set_navigation_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['text'] = text
+    return params
+
+
 def set_navigation_text(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2434,18 +2874,34 @@ def set_navigation_text(
     :param text:
     :returns: The resulting CSS Navigation rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setNavigationText',
-        'params': params,
+        'params': _set_navigation_text_params(style_sheet_id, range_, text),
     }
     json = yield cmd_dict
     return CSSNavigation.from_json(json['navigation'])
 
 
+set_navigation_text_command = Command(
+    'CSS.setNavigationText',
+    set_navigation_text,
+    _set_navigation_text_params,
+    lambda json: CSSNavigation.from_json(json['navigation']),
+)
+
+
+def _set_scope_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['text'] = text
+    return params
+
+
 def set_scope_text(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2461,18 +2917,34 @@ def set_scope_text(
     :param text:
     :returns: The resulting CSS Scope rule after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setScopeText',
-        'params': params,
+        'params': _set_scope_text_params(style_sheet_id, range_, text),
     }
     json = yield cmd_dict
     return CSSScope.from_json(json['scope'])
 
 
+set_scope_text_command = Command(
+    'CSS.setScopeText',
+    set_scope_text,
+    _set_scope_text_params,
+    lambda json: CSSScope.from_json(json['scope']),
+)
+
+
+def _set_rule_selector_params(
+        style_sheet_id: dom.StyleSheetId,
+        range_: SourceRange,
+        selector: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['range'] = range_.to_json()
+    params['selector'] = selector
+    return params
+
+
 def set_rule_selector(
         style_sheet_id: dom.StyleSheetId,
         range_: SourceRange,
@@ -2486,18 +2958,32 @@ def set_rule_selector(
     :param selector:
     :returns: The resulting selector list after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['range'] = range_.to_json()
-    params['selector'] = selector
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setRuleSelector',
-        'params': params,
+        'params': _set_rule_selector_params(style_sheet_id, range_, selector),
     }
     json = yield cmd_dict
     return SelectorList.from_json(json['selectorList'])
 
 
+set_rule_selector_command = Command(
+    'CSS.setRuleSelector',
+    set_rule_selector,
+    _set_rule_selector_params,
+    lambda json: SelectorList.from_json(json['selectorList']),
+)
+
+
+def _set_style_sheet_text_params(
+        style_sheet_id: dom.StyleSheetId,
+        text: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['styleSheetId'] = style_sheet_id.to_json()
+    params['text'] = text
+    return params
+
+
 def set_style_sheet_text(
         style_sheet_id: dom.StyleSheetId,
         text: str
@@ -2509,17 +2995,33 @@ def set_style_sheet_text(
     :param text:
     :returns: *(Optional)* URL of source map associated with script (if any).
     '''
-    params: T_JSON_DICT = dict()
-    params['styleSheetId'] = style_sheet_id.to_json()
-    params['text'] = text
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setStyleSheetText',
-        'params': params,
+        'params': _set_style_sheet_text_params(style_sheet_id, text),
     }
     json = yield cmd_dict
     return str(json['sourceMapURL']) if 'sourceMapURL' in json else None
 
 
+set_style_sheet_text_command = Command(
+    'CSS.setStyleSheetText',
+    set_style_sheet_text,
+    _set_style_sheet_text_params,
+    lambda json: str(json['sourceMapURL']) if 'sourceMapURL' in json else None,
+)
+
+
+def _set_style_texts_params(
+        edits: typing.List[StyleDeclarationEdit],
+        node_for_property_syntax_validation: typing.Optional[dom.NodeId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['edits'] = [i.to_json() for i in edits]
+    if node_for_property_syntax_validation is not None:
+        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
+    return params
+
+
 def set_style_texts(
         edits: typing.List[StyleDeclarationEdit],
         node_for_property_syntax_validation: typing.Optional[dom.NodeId] = None
@@ -2531,18 +3033,22 @@ def set_style_texts(
     :param node_for_property_syntax_validation: **(EXPERIMENTAL)** *(Optional)* NodeId for the DOM node in whose context custom property declarations for registered properties should be validated. If omitted, declarations in the new rule text can only be validated statically, which may produce incorrect results if the declaration contains a var() for example.
     :returns: The resulting styles after modification.
     '''
-    params: T_JSON_DICT = dict()
-    params['edits'] = [i.to_json() for i in edits]
-    if node_for_property_syntax_validation is not None:
-        params['nodeForPropertySyntaxValidation'] = node_for_property_syntax_validation.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setStyleTexts',
-        'params': params,
+        'params': _set_style_texts_params(edits, node_for_property_syntax_validation),
     }
     json = yield cmd_dict
     return [CSSStyle.from_json(i) for i in json['styles']]
 
 
+set_style_texts_command = Command(
+    'CSS.setStyleTexts',
+    set_style_texts,
+    _set_style_texts_params,
+    lambda json: [CSSStyle.from_json(i) for i in json['styles']],
+)
+
+
 def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Enables the selector recording.
@@ -2553,6 +3059,9 @@ def start_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None
     json = yield cmd_dict
 
 
+start_rule_usage_tracking_command = Command('CSS.startRuleUsageTracking', start_rule_usage_tracking)
+
+
 def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[RuleUsage]]:
     r'''
     Stop tracking rule usage and return the list of rules that were used since last call to
@@ -2567,6 +3076,14 @@ def stop_rule_usage_tracking() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typin
     return [RuleUsage.from_json(i) for i in json['ruleUsage']]
 
 
+stop_rule_usage_tracking_command = Command(
+    'CSS.stopRuleUsageTracking',
+    stop_rule_usage_tracking,
+    None,
+    lambda json: [RuleUsage.from_json(i) for i in json['ruleUsage']],
+)
+
+
 def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[RuleUsage], float]]:
     r'''
     Obtain list of rules that became used since last call to this method (or since start of coverage
@@ -2587,6 +3104,25 @@ def take_coverage_delta() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tup
     )
 
 
+take_coverage_delta_command = Command(
+    'CSS.takeCoverageDelta',
+    take_coverage_delta,
+    None,
+    lambda json: (
+        [RuleUsage.from_json(i) for i in json['coverage']],
+        float(json['timestamp'])
+    ),
+)
+
+
+def _set_local_fonts_enabled_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_local_fonts_enabled(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2597,17 +3133,22 @@ def set_local_fonts_enabled(
 
     :param enabled: Whether rendering of local fonts is enabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'CSS.setLocalFontsEnabled',
-        'params': params,
+        'params': _set_local_fonts_enabled_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_local_fonts_enabled_command = Command(
+    'CSS.setLocalFontsEnabled',
+    set_local_fonts_enabled,
+    _set_local_fonts_enabled_params,
+)
+
+
 @event_class('CSS.fontsUpdated')
-@dataclass
+@slotted_dataclass
 class FontsUpdated:
     r'''
     Fires whenever a web font is updated.  A non-empty font parameter indicates a successfully loaded
@@ -2624,7 +3165,7 @@ class FontsUpdated:
 
 
 @event_class('CSS.mediaQueryResultChanged')
-@dataclass
+@slotted_dataclass
 class MediaQueryResultChanged:
     r'''
     Fires whenever a MediaQuery result changes (for example, after a browser window has been
@@ -2640,7 +3181,7 @@ class MediaQueryResultChanged:
 
 
 @event_class('CSS.styleSheetAdded')
-@dataclass
+@slotted_dataclass
 class StyleSheetAdded:
     r'''
     Fired whenever an active document stylesheet is added.
@@ -2656,7 +3197,7 @@ class StyleSheetAdded:
 
 
 @event_class('CSS.styleSheetChanged')
-@dataclass
+@slotted_dataclass
 class StyleSheetChanged:
     r'''
     Fired whenever a stylesheet is changed as a result of the client operation.
@@ -2671,7 +3212,7 @@ class StyleSheetChanged:
 
 
 @event_class('CSS.styleSheetRemoved')
-@dataclass
+@slotted_dataclass
 class StyleSheetRemoved:
     r'''
     Fired whenever an active document stylesheet is removed.
@@ -2687,7 +3228,7 @@ class StyleSheetRemoved:
 
 
 @event_class('CSS.computedStyleUpdated')
-@dataclass
+@slotted_dataclass
 class ComputedStyleUpdated:
     r'''
     **EXPERIMENTAL**
@@ -6,13 +6,15 @@
 # CDP domain: DOM
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import page
+    from . import runtime
+else:
+    lazy_import(globals(), 'page', 'runtime')
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -62,7 +64,7 @@ class StyleSheetId(str):
         return 'StyleSheetId({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class BackendNode:
     r'''
     Backend node with a friendly name.
@@ -141,7 +143,13 @@ class PseudoType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PseudoType:
-        return cls(json)
+        try:
+            return _PSEUDO_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PSEUDO_TYPE_MEMBERS: typing.Dict[str, PseudoType] = {member.value: member for member in PseudoType}
 
 
 class ShadowRootType(enum.Enum):
@@ -157,7 +165,13 @@ class ShadowRootType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ShadowRootType:
-        return cls(json)
+        try:
+            return _SHADOW_ROOT_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SHADOW_ROOT_TYPE_MEMBERS: typing.Dict[str, ShadowRootType] = {member.value: member for member in ShadowRootType}
 
 
 class CompatibilityMode(enum.Enum):
@@ -173,7 +187,13 @@ class CompatibilityMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CompatibilityMode:
-        return cls(json)
+        try:
+            return _COMPATIBILITY_MODE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COMPATIBILITY_MODE_MEMBERS: typing.Dict[str, CompatibilityMode] = {member.value: member for member in CompatibilityMode}
 
 
 class PhysicalAxes(enum.Enum):
@@ -189,7 +209,13 @@ class PhysicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PhysicalAxes:
-        return cls(json)
+        try:
+            return _PHYSICAL_AXES_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PHYSICAL_AXES_MEMBERS: typing.Dict[str, PhysicalAxes] = {member.value: member for member in PhysicalAxes}
 
 
 class LogicalAxes(enum.Enum):
@@ -205,7 +231,13 @@ class LogicalAxes(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LogicalAxes:
-        return cls(json)
+        try:
+            return _LOGICAL_AXES_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_LOGICAL_AXES_MEMBERS: typing.Dict[str, LogicalAxes] = {member.value: member for member in LogicalAxes}
 
 
 class ScrollOrientation(enum.Enum):
@@ -220,10 +252,16 @@ class ScrollOrientation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ScrollOrientation:
-        return cls(json)
+        try:
+            return _SCROLL_ORIENTATION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_SCROLL_ORIENTATION_MEMBERS: typing.Dict[str, ScrollOrientation] = {member.value: member for member in ScrollOrientation}
+
+
+@slotted_dataclass
 class Node:
     r'''
     DOM interaction is implemented in terms of mirror objects that represent the actual DOM nodes.
@@ -442,7 +480,7 @@ class Node:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DetachedElementInfo:
     r'''
     A structure to hold the top-level node of a detached tree and an array of its retained descendants.
@@ -465,7 +503,7 @@ class DetachedElementInfo:
         )
 
 
-@dataclass
+@slotted_dataclass
 class RGBA:
     r'''
     A structure holding an RGBA color.
@@ -516,7 +554,7 @@ class Quad(list):
         return 'Quad({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class BoxModel:
     r'''
     Box model.
@@ -567,7 +605,7 @@ class BoxModel:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ShapeOutsideInfo:
     r'''
     CSS Shape Outside details.
@@ -597,7 +635,7 @@ class ShapeOutsideInfo:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Rect:
     r'''
     Rectangle.
@@ -632,7 +670,7 @@ class Rect:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CSSComputedStyleProperty:
     #: Computed style property name.
     name: str
@@ -654,6 +692,14 @@ class CSSComputedStyleProperty:
         )
 
 
+def _collect_class_names_from_subtree_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def collect_class_names_from_subtree(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -665,16 +711,35 @@ def collect_class_names_from_subtree(
     :param node_id: Id of the node to collect class names.
     :returns: Class name list.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.collectClassNamesFromSubtree',
-        'params': params,
+        'params': _collect_class_names_from_subtree_params(node_id),
     }
     json = yield cmd_dict
     return [str(i) for i in json['classNames']]
 
 
+collect_class_names_from_subtree_command = Command(
+    'DOM.collectClassNamesFromSubtree',
+    collect_class_names_from_subtree,
+    _collect_class_names_from_subtree_params,
+    lambda json: [str(i) for i in json['classNames']],
+)
+
+
+def _copy_to_params(
+        node_id: NodeId,
+        target_node_id: NodeId,
+        insert_before_node_id: typing.Optional[NodeId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['targetNodeId'] = target_node_id.to_json()
+    if insert_before_node_id is not None:
+        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
+    return params
+
+
 def copy_to(
         node_id: NodeId,
         target_node_id: NodeId,
@@ -691,19 +756,43 @@ def copy_to(
     :param insert_before_node_id: *(Optional)* Drop the copy before this node (if absent, the copy becomes the last child of ```targetNodeId```).
     :returns: Id of the node clone.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
-    if insert_before_node_id is not None:
-        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.copyTo',
-        'params': params,
+        'params': _copy_to_params(node_id, target_node_id, insert_before_node_id),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+copy_to_command = Command(
+    'DOM.copyTo',
+    copy_to,
+    _copy_to_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _describe_node_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None,
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    return params
+
+
 def describe_node(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
@@ -722,6 +811,28 @@ def describe_node(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the subtree (default is false).
     :returns: Node description.
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'DOM.describeNode',
+        'params': _describe_node_params(node_id, backend_node_id, object_id, depth, pierce),
+    }
+    json = yield cmd_dict
+    return Node.from_json(json['node'])
+
+
+describe_node_command = Command(
+    'DOM.describeNode',
+    describe_node,
+    _describe_node_params,
+    lambda json: Node.from_json(json['node']),
+)
+
+
+def _scroll_into_view_if_needed_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None,
+        rect: typing.Optional[Rect] = None
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if node_id is not None:
         params['nodeId'] = node_id.to_json()
@@ -729,16 +840,9 @@ def describe_node(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    if depth is not None:
-        params['depth'] = depth
-    if pierce is not None:
-        params['pierce'] = pierce
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.describeNode',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return Node.from_json(json['node'])
+    if rect is not None:
+        params['rect'] = rect.to_json()
+    return params
 
 
 def scroll_into_view_if_needed(
@@ -757,22 +861,20 @@ def scroll_into_view_if_needed(
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     :param rect: *(Optional)* The rect to be scrolled into view, relative to the node's border box, in CSS pixels. When omitted, center of the node will be used, similar to Element.scrollIntoView.
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    if rect is not None:
-        params['rect'] = rect.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.scrollIntoViewIfNeeded',
-        'params': params,
+        'params': _scroll_into_view_if_needed_params(node_id, backend_node_id, object_id, rect),
     }
     json = yield cmd_dict
 
 
+scroll_into_view_if_needed_command = Command(
+    'DOM.scrollIntoViewIfNeeded',
+    scroll_into_view_if_needed,
+    _scroll_into_view_if_needed_params,
+)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables DOM agent for the given page.
@@ -783,6 +885,17 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('DOM.disable', disable)
+
+
+def _discard_search_results_params(
+        search_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['searchId'] = search_id
+    return params
+
+
 def discard_search_results(
         search_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -794,15 +907,29 @@ def discard_search_results(
 
     :param search_id: Unique search session identifier.
     '''
-    params: T_JSON_DICT = dict()
-    params['searchId'] = search_id
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.discardSearchResults',
-        'params': params,
+        'params': _discard_search_results_params(search_id),
     }
     json = yield cmd_dict
 
 
+discard_search_results_command = Command(
+    'DOM.discardSearchResults',
+    discard_search_results,
+    _discard_search_results_params,
+)
+
+
+def _enable_params(
+        include_whitespace: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if include_whitespace is not None:
+        params['includeWhitespace'] = include_whitespace
+    return params
+
+
 def enable(
         include_whitespace: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -811,16 +938,35 @@ def enable(
 
     :param include_whitespace: **(EXPERIMENTAL)** *(Optional)* Whether to include whitespaces in the children array of returned Nodes.
     '''
-    params: T_JSON_DICT = dict()
-    if include_whitespace is not None:
-        params['includeWhitespace'] = include_whitespace
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.enable',
-        'params': params,
+        'params': _enable_params(include_whitespace),
     }
     json = yield cmd_dict
 
 
+enable_command = Command(
+    'DOM.enable',
+    enable,
+    _enable_params,
+)
+
+
+def _focus_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    return params
+
+
 def focus(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
@@ -833,20 +979,28 @@ def focus(
     :param backend_node_id: *(Optional)* Identifier of the backend node.
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.focus',
-        'params': params,
+        'params': _focus_params(node_id, backend_node_id, object_id),
     }
     json = yield cmd_dict
 
 
+focus_command = Command(
+    'DOM.focus',
+    focus,
+    _focus_params,
+)
+
+
+def _get_attributes_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_attributes(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -856,16 +1010,37 @@ def get_attributes(
     :param node_id: Id of the node to retrieve attributes for.
     :returns: An interleaved array of node attribute names and values.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getAttributes',
-        'params': params,
+        'params': _get_attributes_params(node_id),
     }
     json = yield cmd_dict
     return [str(i) for i in json['attributes']]
 
 
+get_attributes_command = Command(
+    'DOM.getAttributes',
+    get_attributes,
+    _get_attributes_params,
+    lambda json: [str(i) for i in json['attributes']],
+)
+
+
+def _get_box_model_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    return params
+
+
 def get_box_model(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
@@ -879,6 +1054,27 @@ def get_box_model(
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     :returns: Box model for the node.
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'DOM.getBoxModel',
+        'params': _get_box_model_params(node_id, backend_node_id, object_id),
+    }
+    json = yield cmd_dict
+    return BoxModel.from_json(json['model'])
+
+
+get_box_model_command = Command(
+    'DOM.getBoxModel',
+    get_box_model,
+    _get_box_model_params,
+    lambda json: BoxModel.from_json(json['model']),
+)
+
+
+def _get_content_quads_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if node_id is not None:
         params['nodeId'] = node_id.to_json()
@@ -886,12 +1082,7 @@ def get_box_model(
         params['backendNodeId'] = backend_node_id.to_json()
     if object_id is not None:
         params['objectId'] = object_id.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'DOM.getBoxModel',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return BoxModel.from_json(json['model'])
+    return params
 
 
 def get_content_quads(
@@ -910,21 +1101,34 @@ def get_content_quads(
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     :returns: Quads that describe node layout relative to viewport.
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getContentQuads',
-        'params': params,
+        'params': _get_content_quads_params(node_id, backend_node_id, object_id),
     }
     json = yield cmd_dict
     return [Quad.from_json(i) for i in json['quads']]
 
 
+get_content_quads_command = Command(
+    'DOM.getContentQuads',
+    get_content_quads,
+    _get_content_quads_params,
+    lambda json: [Quad.from_json(i) for i in json['quads']],
+)
+
+
+def _get_document_params(
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    return params
+
+
 def get_document(
         depth: typing.Optional[int] = None,
         pierce: typing.Optional[bool] = None
@@ -937,19 +1141,34 @@ def get_document(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the subtree (default is false).
     :returns: Resulting node.
     '''
-    params: T_JSON_DICT = dict()
-    if depth is not None:
-        params['depth'] = depth
-    if pierce is not None:
-        params['pierce'] = pierce
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getDocument',
-        'params': params,
+        'params': _get_document_params(depth, pierce),
     }
     json = yield cmd_dict
     return Node.from_json(json['root'])
 
 
+get_document_command = Command(
+    'DOM.getDocument',
+    get_document,
+    _get_document_params,
+    lambda json: Node.from_json(json['root']),
+)
+
+
+def _get_flattened_document_params(
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    return params
+
+
 @deprecated(version="1.3")
 def get_flattened_document(
         depth: typing.Optional[int] = None,
@@ -966,19 +1185,36 @@ def get_flattened_document(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the subtree (default is false).
     :returns: Resulting node.
     '''
-    params: T_JSON_DICT = dict()
-    if depth is not None:
-        params['depth'] = depth
-    if pierce is not None:
-        params['pierce'] = pierce
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getFlattenedDocument',
-        'params': params,
+        'params': _get_flattened_document_params(depth, pierce),
     }
     json = yield cmd_dict
     return [Node.from_json(i) for i in json['nodes']]
 
 
+get_flattened_document_command = Command(
+    'DOM.getFlattenedDocument',
+    get_flattened_document,
+    _get_flattened_document_params,
+    lambda json: [Node.from_json(i) for i in json['nodes']],
+    deprecated='1.3',
+)
+
+
+def _get_nodes_for_subtree_by_style_params(
+        node_id: NodeId,
+        computed_styles: typing.List[CSSComputedStyleProperty],
+        pierce: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['computedStyles'] = [i.to_json() for i in computed_styles]
+    if pierce is not None:
+        params['pierce'] = pierce
+    return params
+
+
 def get_nodes_for_subtree_by_style(
         node_id: NodeId,
         computed_styles: typing.List[CSSComputedStyleProperty],
@@ -994,19 +1230,38 @@ def get_nodes_for_subtree_by_style(
     :param pierce: *(Optional)* Whether or not iframes and shadow roots in the same target should be traversed when returning the results (default is false).
     :returns: Resulting nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['computedStyles'] = [i.to_json() for i in computed_styles]
-    if pierce is not None:
-        params['pierce'] = pierce
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getNodesForSubtreeByStyle',
-        'params': params,
+        'params': _get_nodes_for_subtree_by_style_params(node_id, computed_styles, pierce),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+get_nodes_for_subtree_by_style_command = Command(
+    'DOM.getNodesForSubtreeByStyle',
+    get_nodes_for_subtree_by_style,
+    _get_nodes_for_subtree_by_style_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
+def _get_node_for_location_params(
+        x: int,
+        y: int,
+        include_user_agent_shadow_dom: typing.Optional[bool] = None,
+        ignore_pointer_events_none: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['x'] = x
+    params['y'] = y
+    if include_user_agent_shadow_dom is not None:
+        params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
+    if ignore_pointer_events_none is not None:
+        params['ignorePointerEventsNone'] = ignore_pointer_events_none
+    return params
+
+
 def get_node_for_location(
         x: int,
         y: int,
@@ -1027,16 +1282,9 @@ def get_node_for_location(
         1. **frameId** - Frame this node belongs to.
         2. **nodeId** - *(Optional)* Id of the node at given coordinates, only when enabled and requested document.
     '''
-    params: T_JSON_DICT = dict()
-    params['x'] = x
-    params['y'] = y
-    if include_user_agent_shadow_dom is not None:
-        params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
-    if ignore_pointer_events_none is not None:
-        params['ignorePointerEventsNone'] = ignore_pointer_events_none
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getNodeForLocation',
-        'params': params,
+        'params': _get_node_for_location_params(x, y, include_user_agent_shadow_dom, ignore_pointer_events_none),
     }
     json = yield cmd_dict
     return (
@@ -1046,6 +1294,36 @@ def get_node_for_location(
     )
 
 
+get_node_for_location_command = Command(
+    'DOM.getNodeForLocation',
+    get_node_for_location,
+    _get_node_for_location_params,
+    lambda json: (
+        BackendNodeId.from_json(json['backendNodeId']),
+        page.FrameId.from_json(json['frameId']),
+        NodeId.from_json(json['nodeId']) if 'nodeId' in json else None
+    ),
+)
+
+
+def _get_outer_html_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None,
+        include_shadow_dom: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    if include_shadow_dom is not None:
+        params['includeShadowDOM'] = include_shadow_dom
+    return params
+
+
 def get_outer_html(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
@@ -1061,23 +1339,30 @@ def get_outer_html(
     :param include_shadow_dom: **(EXPERIMENTAL)** *(Optional)* Include all shadow roots. Equals to false if not specified.
     :returns: Outer HTML markup.
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    if include_shadow_dom is not None:
-        params['includeShadowDOM'] = include_shadow_dom
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getOuterHTML',
-        'params': params,
+        'params': _get_outer_html_params(node_id, backend_node_id, object_id, include_shadow_dom),
     }
     json = yield cmd_dict
     return str(json['outerHTML'])
 
 
+get_outer_html_command = Command(
+    'DOM.getOuterHTML',
+    get_outer_html,
+    _get_outer_html_params,
+    lambda json: str(json['outerHTML']),
+)
+
+
+def _get_relayout_boundary_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_relayout_boundary(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
@@ -1089,16 +1374,34 @@ def get_relayout_boundary(
     :param node_id: Id of the node.
     :returns: Relayout boundary node id for the given node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getRelayoutBoundary',
-        'params': params,
+        'params': _get_relayout_boundary_params(node_id),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+get_relayout_boundary_command = Command(
+    'DOM.getRelayoutBoundary',
+    get_relayout_boundary,
+    _get_relayout_boundary_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _get_search_results_params(
+        search_id: str,
+        from_index: int,
+        to_index: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['searchId'] = search_id
+    params['fromIndex'] = from_index
+    params['toIndex'] = to_index
+    return params
+
+
 def get_search_results(
         search_id: str,
         from_index: int,
@@ -1115,18 +1418,22 @@ def get_search_results(
     :param to_index: End index of the search result to be returned.
     :returns: Ids of the search result nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['searchId'] = search_id
-    params['fromIndex'] = from_index
-    params['toIndex'] = to_index
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getSearchResults',
-        'params': params,
+        'params': _get_search_results_params(search_id, from_index, to_index),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+get_search_results_command = Command(
+    'DOM.getSearchResults',
+    get_search_results,
+    _get_search_results_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Hides any highlight.
@@ -1137,6 +1444,9 @@ def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+hide_highlight_command = Command('DOM.hideHighlight', hide_highlight)
+
+
 def highlight_node() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Highlights DOM node.
@@ -1147,6 +1457,9 @@ def highlight_node() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+highlight_node_command = Command('DOM.highlightNode', highlight_node)
+
+
 def highlight_rect() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Highlights given rectangle.
@@ -1157,6 +1470,9 @@ def highlight_rect() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+highlight_rect_command = Command('DOM.highlightRect', highlight_rect)
+
+
 def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Marks last undoable state.
@@ -1169,6 +1485,22 @@ def mark_undoable_state() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+mark_undoable_state_command = Command('DOM.markUndoableState', mark_undoable_state)
+
+
+def _move_to_params(
+        node_id: NodeId,
+        target_node_id: NodeId,
+        insert_before_node_id: typing.Optional[NodeId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['targetNodeId'] = target_node_id.to_json()
+    if insert_before_node_id is not None:
+        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
+    return params
+
+
 def move_to(
         node_id: NodeId,
         target_node_id: NodeId,
@@ -1182,19 +1514,33 @@ def move_to(
     :param insert_before_node_id: *(Optional)* Drop node before this one (if absent, the moved node becomes the last child of ```targetNodeId```).
     :returns: New id of the moved node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['targetNodeId'] = target_node_id.to_json()
-    if insert_before_node_id is not None:
-        params['insertBeforeNodeId'] = insert_before_node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.moveTo',
-        'params': params,
+        'params': _move_to_params(node_id, target_node_id, insert_before_node_id),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+move_to_command = Command(
+    'DOM.moveTo',
+    move_to,
+    _move_to_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _perform_search_params(
+        query: str,
+        include_user_agent_shadow_dom: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['query'] = query
+    if include_user_agent_shadow_dom is not None:
+        params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
+    return params
+
+
 def perform_search(
         query: str,
         include_user_agent_shadow_dom: typing.Optional[bool] = None
@@ -1212,13 +1558,9 @@ def perform_search(
         0. **searchId** - Unique search session identifier.
         1. **resultCount** - Number of search results.
     '''
-    params: T_JSON_DICT = dict()
-    params['query'] = query
-    if include_user_agent_shadow_dom is not None:
-        params['includeUserAgentShadowDOM'] = include_user_agent_shadow_dom
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.performSearch',
-        'params': params,
+        'params': _perform_search_params(query, include_user_agent_shadow_dom),
     }
     json = yield cmd_dict
     return (
@@ -1227,6 +1569,25 @@ def perform_search(
     )
 
 
+perform_search_command = Command(
+    'DOM.performSearch',
+    perform_search,
+    _perform_search_params,
+    lambda json: (
+        str(json['searchId']),
+        int(json['resultCount'])
+    ),
+)
+
+
+def _push_node_by_path_to_frontend_params(
+        path: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['path'] = path
+    return params
+
+
 def push_node_by_path_to_frontend(
         path: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
@@ -1238,16 +1599,30 @@ def push_node_by_path_to_frontend(
     :param path: Path to node in the proprietary format.
     :returns: Id of the node for given path.
     '''
-    params: T_JSON_DICT = dict()
-    params['path'] = path
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.pushNodeByPathToFrontend',
-        'params': params,
+        'params': _push_node_by_path_to_frontend_params(path),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+push_node_by_path_to_frontend_command = Command(
+    'DOM.pushNodeByPathToFrontend',
+    push_node_by_path_to_frontend,
+    _push_node_by_path_to_frontend_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _push_nodes_by_backend_ids_to_frontend_params(
+        backend_node_ids: typing.List[BackendNodeId]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['backendNodeIds'] = [i.to_json() for i in backend_node_ids]
+    return params
+
+
 def push_nodes_by_backend_ids_to_frontend(
         backend_node_ids: typing.List[BackendNodeId]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
@@ -1259,16 +1634,32 @@ def push_nodes_by_backend_ids_to_frontend(
     :param backend_node_ids: The array of backend node ids.
     :returns: The array of ids of pushed nodes that correspond to the backend ids specified in backendNodeIds.
     '''
-    params: T_JSON_DICT = dict()
-    params['backendNodeIds'] = [i.to_json() for i in backend_node_ids]
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.pushNodesByBackendIdsToFrontend',
-        'params': params,
+        'params': _push_nodes_by_backend_ids_to_frontend_params(backend_node_ids),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+push_nodes_by_backend_ids_to_frontend_command = Command(
+    'DOM.pushNodesByBackendIdsToFrontend',
+    push_nodes_by_backend_ids_to_frontend,
+    _push_nodes_by_backend_ids_to_frontend_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
+def _query_selector_params(
+        node_id: NodeId,
+        selector: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['selector'] = selector
+    return params
+
+
 def query_selector(
         node_id: NodeId,
         selector: str
@@ -1280,17 +1671,32 @@ def query_selector(
     :param selector: Selector string.
     :returns: Query selector result.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['selector'] = selector
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.querySelector',
-        'params': params,
+        'params': _query_selector_params(node_id, selector),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+query_selector_command = Command(
+    'DOM.querySelector',
+    query_selector,
+    _query_selector_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _query_selector_all_params(
+        node_id: NodeId,
+        selector: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['selector'] = selector
+    return params
+
+
 def query_selector_all(
         node_id: NodeId,
         selector: str
@@ -1302,17 +1708,22 @@ def query_selector_all(
     :param selector: Selector string.
     :returns: Query selector result.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['selector'] = selector
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.querySelectorAll',
-        'params': params,
+        'params': _query_selector_all_params(node_id, selector),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+query_selector_all_command = Command(
+    'DOM.querySelectorAll',
+    query_selector_all,
+    _query_selector_all_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
 def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
     r'''
     Returns NodeIds of current top layer elements.
@@ -1330,6 +1741,24 @@ def get_top_layer_elements() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+get_top_layer_elements_command = Command(
+    'DOM.getTopLayerElements',
+    get_top_layer_elements,
+    None,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
+def _get_element_by_relation_params(
+        node_id: NodeId,
+        relation: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['relation'] = relation
+    return params
+
+
 def get_element_by_relation(
         node_id: NodeId,
         relation: str
@@ -1343,17 +1772,22 @@ def get_element_by_relation(
     :param relation: Type of relation to get.
     :returns: NodeId of the element matching the queried relation.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['relation'] = relation
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getElementByRelation',
-        'params': params,
+        'params': _get_element_by_relation_params(node_id, relation),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+get_element_by_relation_command = Command(
+    'DOM.getElementByRelation',
+    get_element_by_relation,
+    _get_element_by_relation_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
 def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Re-does the last undone action.
@@ -1366,6 +1800,19 @@ def redo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+redo_command = Command('DOM.redo', redo)
+
+
+def _remove_attribute_params(
+        node_id: NodeId,
+        name: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['name'] = name
+    return params
+
+
 def remove_attribute(
         node_id: NodeId,
         name: str
@@ -1376,16 +1823,28 @@ def remove_attribute(
     :param node_id: Id of the element to remove attribute from.
     :param name: Name of the attribute to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.removeAttribute',
-        'params': params,
+        'params': _remove_attribute_params(node_id, name),
     }
     json = yield cmd_dict
 
 
+remove_attribute_command = Command(
+    'DOM.removeAttribute',
+    remove_attribute,
+    _remove_attribute_params,
+)
+
+
+def _remove_node_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def remove_node(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1394,15 +1853,34 @@ def remove_node(
 
     :param node_id: Id of the node to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.removeNode',
-        'params': params,
+        'params': _remove_node_params(node_id),
     }
     json = yield cmd_dict
 
 
+remove_node_command = Command(
+    'DOM.removeNode',
+    remove_node,
+    _remove_node_params,
+)
+
+
+def _request_child_nodes_params(
+        node_id: NodeId,
+        depth: typing.Optional[int] = None,
+        pierce: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    return params
+
+
 def request_child_nodes(
         node_id: NodeId,
         depth: typing.Optional[int] = None,
@@ -1417,19 +1895,28 @@ def request_child_nodes(
     :param depth: *(Optional)* The maximum depth at which children should be retrieved, defaults to 1. Use -1 for the entire subtree or provide an integer larger than 0.
     :param pierce: *(Optional)* Whether or not iframes and shadow roots should be traversed when returning the sub-tree (default is false).
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    if depth is not None:
-        params['depth'] = depth
-    if pierce is not None:
-        params['pierce'] = pierce
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.requestChildNodes',
-        'params': params,
+        'params': _request_child_nodes_params(node_id, depth, pierce),
     }
     json = yield cmd_dict
 
 
+request_child_nodes_command = Command(
+    'DOM.requestChildNodes',
+    request_child_nodes,
+    _request_child_nodes_params,
+)
+
+
+def _request_node_params(
+        object_id: runtime.RemoteObjectId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['objectId'] = object_id.to_json()
+    return params
+
+
 def request_node(
         object_id: runtime.RemoteObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,NodeId]:
@@ -1441,16 +1928,40 @@ def request_node(
     :param object_id: JavaScript object id to convert into node.
     :returns: Node id for given object.
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.requestNode',
-        'params': params,
+        'params': _request_node_params(object_id),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+request_node_command = Command(
+    'DOM.requestNode',
+    request_node,
+    _request_node_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _resolve_node_params(
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_group: typing.Optional[str] = None,
+        execution_context_id: typing.Optional[runtime.ExecutionContextId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_group is not None:
+        params['objectGroup'] = object_group
+    if execution_context_id is not None:
+        params['executionContextId'] = execution_context_id.to_json()
+    return params
+
+
 def resolve_node(
         node_id: typing.Optional[NodeId] = None,
         backend_node_id: typing.Optional[BackendNodeId] = None,
@@ -1466,23 +1977,34 @@ def resolve_node(
     :param execution_context_id: *(Optional)* Execution context in which to resolve the node.
     :returns: JavaScript object wrapper for given node.
     '''
-    params: T_JSON_DICT = dict()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_group is not None:
-        params['objectGroup'] = object_group
-    if execution_context_id is not None:
-        params['executionContextId'] = execution_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.resolveNode',
-        'params': params,
+        'params': _resolve_node_params(node_id, backend_node_id, object_group, execution_context_id),
     }
     json = yield cmd_dict
     return runtime.RemoteObject.from_json(json['object'])
 
 
+resolve_node_command = Command(
+    'DOM.resolveNode',
+    resolve_node,
+    _resolve_node_params,
+    lambda json: runtime.RemoteObject.from_json(json['object']),
+)
+
+
+def _set_attribute_value_params(
+        node_id: NodeId,
+        name: str,
+        value: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['name'] = name
+    params['value'] = value
+    return params
+
+
 def set_attribute_value(
         node_id: NodeId,
         name: str,
@@ -1495,17 +2017,33 @@ def set_attribute_value(
     :param name: Attribute name.
     :param value: Attribute value.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
-    params['value'] = value
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setAttributeValue',
-        'params': params,
+        'params': _set_attribute_value_params(node_id, name, value),
     }
     json = yield cmd_dict
 
 
+set_attribute_value_command = Command(
+    'DOM.setAttributeValue',
+    set_attribute_value,
+    _set_attribute_value_params,
+)
+
+
+def _set_attributes_as_text_params(
+        node_id: NodeId,
+        text: str,
+        name: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['text'] = text
+    if name is not None:
+        params['name'] = name
+    return params
+
+
 def set_attributes_as_text(
         node_id: NodeId,
         text: str,
@@ -1519,18 +2057,37 @@ def set_attributes_as_text(
     :param text: Text with a number of attributes. Will parse this text using HTML parser.
     :param name: *(Optional)* Attribute name to replace with new attributes derived from text in case text parsed successfully.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['text'] = text
-    if name is not None:
-        params['name'] = name
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setAttributesAsText',
-        'params': params,
+        'params': _set_attributes_as_text_params(node_id, text, name),
     }
     json = yield cmd_dict
 
 
+set_attributes_as_text_command = Command(
+    'DOM.setAttributesAsText',
+    set_attributes_as_text,
+    _set_attributes_as_text_params,
+)
+
+
+def _set_file_input_files_params(
+        files: typing.List[str],
+        node_id: typing.Optional[NodeId] = None,
+        backend_node_id: typing.Optional[BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['files'] = [i for i in files]
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    return params
+
+
 def set_file_input_files(
         files: typing.List[str],
         node_id: typing.Optional[NodeId] = None,
@@ -1545,21 +2102,28 @@ def set_file_input_files(
     :param backend_node_id: *(Optional)* Identifier of the backend node.
     :param object_id: *(Optional)* JavaScript object id of the node wrapper.
     '''
-    params: T_JSON_DICT = dict()
-    params['files'] = [i for i in files]
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setFileInputFiles',
-        'params': params,
+        'params': _set_file_input_files_params(files, node_id, backend_node_id, object_id),
     }
     json = yield cmd_dict
 
 
+set_file_input_files_command = Command(
+    'DOM.setFileInputFiles',
+    set_file_input_files,
+    _set_file_input_files_params,
+)
+
+
+def _set_node_stack_traces_enabled_params(
+        enable: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enable'] = enable
+    return params
+
+
 def set_node_stack_traces_enabled(
         enable: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1570,15 +2134,28 @@ def set_node_stack_traces_enabled(
 
     :param enable: Enable or disable.
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setNodeStackTracesEnabled',
-        'params': params,
+        'params': _set_node_stack_traces_enabled_params(enable),
     }
     json = yield cmd_dict
 
 
+set_node_stack_traces_enabled_command = Command(
+    'DOM.setNodeStackTracesEnabled',
+    set_node_stack_traces_enabled,
+    _set_node_stack_traces_enabled_params,
+)
+
+
+def _get_node_stack_traces_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_node_stack_traces(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[runtime.StackTrace]]:
@@ -1590,16 +2167,30 @@ def get_node_stack_traces(
     :param node_id: Id of the node to get stack traces for.
     :returns: *(Optional)* Creation stack trace, if available.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getNodeStackTraces',
-        'params': params,
+        'params': _get_node_stack_traces_params(node_id),
     }
     json = yield cmd_dict
     return runtime.StackTrace.from_json(json['creation']) if 'creation' in json else None
 
 
+get_node_stack_traces_command = Command(
+    'DOM.getNodeStackTraces',
+    get_node_stack_traces,
+    _get_node_stack_traces_params,
+    lambda json: runtime.StackTrace.from_json(json['creation']) if 'creation' in json else None,
+)
+
+
+def _get_file_info_params(
+        object_id: runtime.RemoteObjectId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['objectId'] = object_id.to_json()
+    return params
+
+
 def get_file_info(
         object_id: runtime.RemoteObjectId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -1612,16 +2203,22 @@ def get_file_info(
     :param object_id: JavaScript object id of the node wrapper.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getFileInfo',
-        'params': params,
+        'params': _get_file_info_params(object_id),
     }
     json = yield cmd_dict
     return str(json['path'])
 
 
+get_file_info_command = Command(
+    'DOM.getFileInfo',
+    get_file_info,
+    _get_file_info_params,
+    lambda json: str(json['path']),
+)
+
+
 def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[DetachedElementInfo]]:
     r'''
     Returns list of detached nodes
@@ -1637,6 +2234,22 @@ def get_detached_dom_nodes() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
     return [DetachedElementInfo.from_json(i) for i in json['detachedNodes']]
 
 
+get_detached_dom_nodes_command = Command(
+    'DOM.getDetachedDomNodes',
+    get_detached_dom_nodes,
+    None,
+    lambda json: [DetachedElementInfo.from_json(i) for i in json['detachedNodes']],
+)
+
+
+def _set_inspected_node_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def set_inspected_node(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1648,15 +2261,30 @@ def set_inspected_node(
 
     :param node_id: DOM node id to be accessible by means of $x command line API.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setInspectedNode',
-        'params': params,
+        'params': _set_inspected_node_params(node_id),
     }
     json = yield cmd_dict
 
 
+set_inspected_node_command = Command(
+    'DOM.setInspectedNode',
+    set_inspected_node,
+    _set_inspected_node_params,
+)
+
+
+def _set_node_name_params(
+        node_id: NodeId,
+        name: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['name'] = name
+    return params
+
+
 def set_node_name(
         node_id: NodeId,
         name: str
@@ -1668,17 +2296,32 @@ def set_node_name(
     :param name: New node's name.
     :returns: New node's id.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['name'] = name
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setNodeName',
-        'params': params,
+        'params': _set_node_name_params(node_id, name),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+set_node_name_command = Command(
+    'DOM.setNodeName',
+    set_node_name,
+    _set_node_name_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _set_node_value_params(
+        node_id: NodeId,
+        value: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['value'] = value
+    return params
+
+
 def set_node_value(
         node_id: NodeId,
         value: str
@@ -1689,16 +2332,30 @@ def set_node_value(
     :param node_id: Id of the node to set value for.
     :param value: New node's value.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['value'] = value
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setNodeValue',
-        'params': params,
+        'params': _set_node_value_params(node_id, value),
     }
     json = yield cmd_dict
 
 
+set_node_value_command = Command(
+    'DOM.setNodeValue',
+    set_node_value,
+    _set_node_value_params,
+)
+
+
+def _set_outer_html_params(
+        node_id: NodeId,
+        outer_html: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['outerHTML'] = outer_html
+    return params
+
+
 def set_outer_html(
         node_id: NodeId,
         outer_html: str
@@ -1709,16 +2366,20 @@ def set_outer_html(
     :param node_id: Id of the node to set markup for.
     :param outer_html: Outer HTML markup to set.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['outerHTML'] = outer_html
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.setOuterHTML',
-        'params': params,
+        'params': _set_outer_html_params(node_id, outer_html),
     }
     json = yield cmd_dict
 
 
+set_outer_html_command = Command(
+    'DOM.setOuterHTML',
+    set_outer_html,
+    _set_outer_html_params,
+)
+
+
 def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Undoes the last performed action.
@@ -1731,6 +2392,17 @@ def undo() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+undo_command = Command('DOM.undo', undo)
+
+
+def _get_frame_owner_params(
+        frame_id: page.FrameId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    return params
+
+
 def get_frame_owner(
         frame_id: page.FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[BackendNodeId, typing.Optional[NodeId]]]:
@@ -1745,11 +2417,9 @@ def get_frame_owner(
         0. **backendNodeId** - Resulting node.
         1. **nodeId** - *(Optional)* Id of the node at given coordinates, only when enabled and requested document.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getFrameOwner',
-        'params': params,
+        'params': _get_frame_owner_params(frame_id),
     }
     json = yield cmd_dict
     return (
@@ -1758,6 +2428,40 @@ def get_frame_owner(
     )
 
 
+get_frame_owner_command = Command(
+    'DOM.getFrameOwner',
+    get_frame_owner,
+    _get_frame_owner_params,
+    lambda json: (
+        BackendNodeId.from_json(json['backendNodeId']),
+        NodeId.from_json(json['nodeId']) if 'nodeId' in json else None
+    ),
+)
+
+
+def _get_container_for_node_params(
+        node_id: NodeId,
+        container_name: typing.Optional[str] = None,
+        physical_axes: typing.Optional[PhysicalAxes] = None,
+        logical_axes: typing.Optional[LogicalAxes] = None,
+        queries_scroll_state: typing.Optional[bool] = None,
+        queries_anchored: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    if container_name is not None:
+        params['containerName'] = container_name
+    if physical_axes is not None:
+        params['physicalAxes'] = physical_axes.to_json()
+    if logical_axes is not None:
+        params['logicalAxes'] = logical_axes.to_json()
+    if queries_scroll_state is not None:
+        params['queriesScrollState'] = queries_scroll_state
+    if queries_anchored is not None:
+        params['queriesAnchored'] = queries_anchored
+    return params
+
+
 def get_container_for_node(
         node_id: NodeId,
         container_name: typing.Optional[str] = None,
@@ -1783,26 +2487,30 @@ def get_container_for_node(
     :param queries_anchored: *(Optional)*
     :returns: *(Optional)* The container node for the given node, or null if not found.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    if container_name is not None:
-        params['containerName'] = container_name
-    if physical_axes is not None:
-        params['physicalAxes'] = physical_axes.to_json()
-    if logical_axes is not None:
-        params['logicalAxes'] = logical_axes.to_json()
-    if queries_scroll_state is not None:
-        params['queriesScrollState'] = queries_scroll_state
-    if queries_anchored is not None:
-        params['queriesAnchored'] = queries_anchored
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getContainerForNode',
-        'params': params,
+        'params': _get_container_for_node_params(node_id, container_name, physical_axes, logical_axes, queries_scroll_state, queries_anchored),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId']) if 'nodeId' in json else None
 
 
+get_container_for_node_command = Command(
+    'DOM.getContainerForNode',
+    get_container_for_node,
+    _get_container_for_node_params,
+    lambda json: NodeId.from_json(json['nodeId']) if 'nodeId' in json else None,
+)
+
+
+def _get_querying_descendants_for_container_params(
+        node_id: NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_querying_descendants_for_container(
         node_id: NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[NodeId]]:
@@ -1815,16 +2523,33 @@ def get_querying_descendants_for_container(
     :param node_id: Id of the container node to find querying descendants from.
     :returns: Descendant nodes with container queries against the given container.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getQueryingDescendantsForContainer',
-        'params': params,
+        'params': _get_querying_descendants_for_container_params(node_id),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+get_querying_descendants_for_container_command = Command(
+    'DOM.getQueryingDescendantsForContainer',
+    get_querying_descendants_for_container,
+    _get_querying_descendants_for_container_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
+def _get_anchor_element_params(
+        node_id: NodeId,
+        anchor_specifier: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    if anchor_specifier is not None:
+        params['anchorSpecifier'] = anchor_specifier
+    return params
+
+
 def get_anchor_element(
         node_id: NodeId,
         anchor_specifier: typing.Optional[str] = None
@@ -1839,18 +2564,32 @@ def get_anchor_element(
     :param anchor_specifier: *(Optional)* An optional anchor specifier, as defined in https://www.w3.org/TR/css-anchor-position-1/#anchor-specifier. If not provided, it will return the implicit anchor element for the given positioned element.
     :returns: The anchor element of the given anchor query.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    if anchor_specifier is not None:
-        params['anchorSpecifier'] = anchor_specifier
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.getAnchorElement',
-        'params': params,
+        'params': _get_anchor_element_params(node_id, anchor_specifier),
     }
     json = yield cmd_dict
     return NodeId.from_json(json['nodeId'])
 
 
+get_anchor_element_command = Command(
+    'DOM.getAnchorElement',
+    get_anchor_element,
+    _get_anchor_element_params,
+    lambda json: NodeId.from_json(json['nodeId']),
+)
+
+
+def _force_show_popover_params(
+        node_id: NodeId,
+        enable: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    params['enable'] = enable
+    return params
+
+
 def force_show_popover(
         node_id: NodeId,
         enable: bool
@@ -1865,19 +2604,24 @@ def force_show_popover(
     :param enable: If true, opens the popover and keeps it open. If false, closes the popover if it was previously force-opened.
     :returns: List of popovers that were closed in order to respect popover stacking order.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    params['enable'] = enable
     cmd_dict: T_JSON_DICT = {
         'method': 'DOM.forceShowPopover',
-        'params': params,
+        'params': _force_show_popover_params(node_id, enable),
     }
     json = yield cmd_dict
     return [NodeId.from_json(i) for i in json['nodeIds']]
 
 
+force_show_popover_command = Command(
+    'DOM.forceShowPopover',
+    force_show_popover,
+    _force_show_popover_params,
+    lambda json: [NodeId.from_json(i) for i in json['nodeIds']],
+)
+
+
 @event_class('DOM.attributeModified')
-@dataclass
+@slotted_dataclass
 class AttributeModified:
     r'''
     Fired when ``Element``'s attribute is modified.
@@ -1899,7 +2643,7 @@ class AttributeModified:
 
 
 @event_class('DOM.adoptedStyleSheetsModified')
-@dataclass
+@slotted_dataclass
 class AdoptedStyleSheetsModified:
     r'''
     **EXPERIMENTAL**
@@ -1920,7 +2664,7 @@ class AdoptedStyleSheetsModified:
 
 
 @event_class('DOM.attributeRemoved')
-@dataclass
+@slotted_dataclass
 class AttributeRemoved:
     r'''
     Fired when ``Element``'s attribute is removed.
@@ -1939,7 +2683,7 @@ class AttributeRemoved:
 
 
 @event_class('DOM.characterDataModified')
-@dataclass
+@slotted_dataclass
 class CharacterDataModified:
     r'''
     Mirrors ``DOMCharacterDataModified`` event.
@@ -1958,7 +2702,7 @@ class CharacterDataModified:
 
 
 @event_class('DOM.childNodeCountUpdated')
-@dataclass
+@slotted_dataclass
 class ChildNodeCountUpdated:
     r'''
     Fired when ``Container``'s child node count has changed.
@@ -1977,7 +2721,7 @@ class ChildNodeCountUpdated:
 
 
 @event_class('DOM.childNodeInserted')
-@dataclass
+@slotted_dataclass
 class ChildNodeInserted:
     r'''
     Mirrors ``DOMNodeInserted`` event.
@@ -1999,7 +2743,7 @@ class ChildNodeInserted:
 
 
 @event_class('DOM.childNodeRemoved')
-@dataclass
+@slotted_dataclass
 class ChildNodeRemoved:
     r'''
     Mirrors ``DOMNodeRemoved`` event.
@@ -2018,7 +2762,7 @@ class ChildNodeRemoved:
 
 
 @event_class('DOM.distributedNodesUpdated')
-@dataclass
+@slotted_dataclass
 class DistributedNodesUpdated:
     r'''
     **EXPERIMENTAL**
@@ -2039,7 +2783,7 @@ class DistributedNodesUpdated:
 
 
 @event_class('DOM.documentUpdated')
-@dataclass
+@slotted_dataclass
 class DocumentUpdated:
     r'''
     Fired when ``Document`` has been totally updated. Node ids are no longer valid.
@@ -2054,7 +2798,7 @@ class DocumentUpdated:
 
 
 @event_class('DOM.inlineStyleInvalidated')
-@dataclass
+@slotted_dataclass
 class InlineStyleInvalidated:
     r'''
     **EXPERIMENTAL**
@@ -2072,7 +2816,7 @@ class InlineStyleInvalidated:
 
 
 @event_class('DOM.pseudoElementAdded')
-@dataclass
+@slotted_dataclass
 class PseudoElementAdded:
     r'''
     **EXPERIMENTAL**
@@ -2093,7 +2837,7 @@ class PseudoElementAdded:
 
 
 @event_class('DOM.topLayerElementsUpdated')
-@dataclass
+@slotted_dataclass
 class TopLayerElementsUpdated:
     r'''
     **EXPERIMENTAL**
@@ -2110,7 +2854,7 @@ class TopLayerElementsUpdated:
 
 
 @event_class('DOM.scrollableFlagUpdated')
-@dataclass
+@slotted_dataclass
 class ScrollableFlagUpdated:
     r'''
     **EXPERIMENTAL**
@@ -2131,7 +2875,7 @@ class ScrollableFlagUpdated:
 
 
 @event_class('DOM.adRelatedStateUpdated')
-@dataclass
+@slotted_dataclass
 class AdRelatedStateUpdated:
     r'''
     **EXPERIMENTAL**
@@ -2152,7 +2896,7 @@ class AdRelatedStateUpdated:
 
 
 @event_class('DOM.affectedByStartingStylesFlagUpdated')
-@dataclass
+@slotted_dataclass
 class AffectedByStartingStylesFlagUpdated:
     r'''
     **EXPERIMENTAL**
@@ -2173,7 +2917,7 @@ class AffectedByStartingStylesFlagUpdated:
 
 
 @event_class('DOM.pseudoElementRemoved')
-@dataclass
+@slotted_dataclass
 class PseudoElementRemoved:
     r'''
     **EXPERIMENTAL**
@@ -2194,7 +2938,7 @@ class PseudoElementRemoved:
 
 
 @event_class('DOM.setChildNodes')
-@dataclass
+@slotted_dataclass
 class SetChildNodes:
     r'''
     Fired when backend wants to provide client with the missing DOM structure. This happens upon
@@ -2214,7 +2958,7 @@ class SetChildNodes:
 
 
 @event_class('DOM.shadowRootPopped')
-@dataclass
+@slotted_dataclass
 class ShadowRootPopped:
     r'''
     **EXPERIMENTAL**
@@ -2235,7 +2979,7 @@ class ShadowRootPopped:
 
 
 @event_class('DOM.shadowRootPushed')
-@dataclass
+@slotted_dataclass
 class ShadowRootPushed:
     r'''
     **EXPERIMENTAL**
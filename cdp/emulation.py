@@ -6,18 +6,20 @@
 # CDP domain: Emulation
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import dom
-from . import network
-from . import page
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import network
+    from . import page
+else:
+    lazy_import(globals(), 'dom', 'network', 'page')
 from deprecated.sphinx import deprecated # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class SafeAreaInsets:
     #: Overrides safe-area-inset-top.
     top: typing.Optional[int] = None
@@ -77,7 +79,7 @@ class SafeAreaInsets:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScreenOrientation:
     r'''
     Screen orientation.
@@ -102,7 +104,7 @@ class ScreenOrientation:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DisplayFeature:
     #: Orientation of a display feature in relation to screen
     orientation: str
@@ -132,7 +134,7 @@ class DisplayFeature:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DevicePosture:
     #: Current posture of the device
     type_: str
@@ -149,7 +151,7 @@ class DevicePosture:
         )
 
 
-@dataclass
+@slotted_dataclass
 class MediaFeature:
     name: str
 
@@ -185,10 +187,16 @@ class VirtualTimePolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> VirtualTimePolicy:
-        return cls(json)
+        try:
+            return _VIRTUAL_TIME_POLICY_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_VIRTUAL_TIME_POLICY_MEMBERS: typing.Dict[str, VirtualTimePolicy] = {member.value: member for member in VirtualTimePolicy}
 
-@dataclass
+
+@slotted_dataclass
 class UserAgentBrandVersion:
     r'''
     Used to specify User Agent Client Hints to emulate. See https://wicg.github.io/ua-client-hints
@@ -211,7 +219,7 @@ class UserAgentBrandVersion:
         )
 
 
-@dataclass
+@slotted_dataclass
 class UserAgentMetadata:
     r'''
     Used to specify User Agent Client Hints to emulate. See https://wicg.github.io/ua-client-hints
@@ -300,10 +308,16 @@ class SensorType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SensorType:
-        return cls(json)
+        try:
+            return _SENSOR_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_SENSOR_TYPE_MEMBERS: typing.Dict[str, SensorType] = {member.value: member for member in SensorType}
+
+
+@slotted_dataclass
 class SensorMetadata:
     available: typing.Optional[bool] = None
 
@@ -330,7 +344,7 @@ class SensorMetadata:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SensorReadingSingle:
     value: float
 
@@ -346,7 +360,7 @@ class SensorReadingSingle:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SensorReadingXYZ:
     x: float
 
@@ -370,7 +384,7 @@ class SensorReadingXYZ:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SensorReadingQuaternion:
     x: float
 
@@ -398,7 +412,7 @@ class SensorReadingQuaternion:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SensorReading:
     single: typing.Optional[SensorReadingSingle] = None
 
@@ -433,7 +447,13 @@ class PressureSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureSource:
-        return cls(json)
+        try:
+            return _PRESSURE_SOURCE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PRESSURE_SOURCE_MEMBERS: typing.Dict[str, PressureSource] = {member.value: member for member in PressureSource}
 
 
 class PressureState(enum.Enum):
@@ -447,10 +467,16 @@ class PressureState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PressureState:
-        return cls(json)
+        try:
+            return _PRESSURE_STATE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PRESSURE_STATE_MEMBERS: typing.Dict[str, PressureState] = {member.value: member for member in PressureState}
 
 
-@dataclass
+@slotted_dataclass
 class PressureMetadata:
     available: typing.Optional[bool] = None
 
@@ -467,7 +493,7 @@ class PressureMetadata:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WorkAreaInsets:
     #: Work area top inset in pixels. Default is 0;
     top: typing.Optional[int] = None
@@ -515,7 +541,7 @@ class ScreenId(str):
         return 'ScreenId({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ScreenInfo:
     r'''
     Screen information similar to the one returned by window.getScreenDetails() method,
@@ -624,7 +650,13 @@ class DisabledImageType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DisabledImageType:
-        return cls(json)
+        try:
+            return _DISABLED_IMAGE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_DISABLED_IMAGE_TYPE_MEMBERS: typing.Dict[str, DisabledImageType] = {member.value: member for member in DisabledImageType}
 
 
 @deprecated(version="1.3")
@@ -643,6 +675,15 @@ def can_emulate() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     return bool(json['result'])
 
 
+can_emulate_command = Command(
+    'Emulation.canEmulate',
+    can_emulate,
+    None,
+    lambda json: bool(json['result']),
+    deprecated='1.3',
+)
+
+
 def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears the overridden device metrics.
@@ -653,6 +694,9 @@ def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
     json = yield cmd_dict
 
 
+clear_device_metrics_override_command = Command('Emulation.clearDeviceMetricsOverride', clear_device_metrics_override)
+
+
 def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears the overridden Geolocation Position and Error.
@@ -663,6 +707,9 @@ def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Non
     json = yield cmd_dict
 
 
+clear_geolocation_override_command = Command('Emulation.clearGeolocationOverride', clear_geolocation_override)
+
+
 def reset_page_scale_factor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Requests that page scale factor is reset to initial values.
@@ -675,6 +722,17 @@ def reset_page_scale_factor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+reset_page_scale_factor_command = Command('Emulation.resetPageScaleFactor', reset_page_scale_factor)
+
+
+def _set_focus_emulation_enabled_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_focus_emulation_enabled(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -685,15 +743,29 @@ def set_focus_emulation_enabled(
 
     :param enabled: Whether to enable to disable focus emulation.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setFocusEmulationEnabled',
-        'params': params,
+        'params': _set_focus_emulation_enabled_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_focus_emulation_enabled_command = Command(
+    'Emulation.setFocusEmulationEnabled',
+    set_focus_emulation_enabled,
+    _set_focus_emulation_enabled_params,
+)
+
+
+def _set_auto_dark_mode_override_params(
+        enabled: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if enabled is not None:
+        params['enabled'] = enabled
+    return params
+
+
 def set_auto_dark_mode_override(
         enabled: typing.Optional[bool] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -704,16 +776,28 @@ def set_auto_dark_mode_override(
 
     :param enabled: *(Optional)* Whether to enable or disable automatic dark mode. If not specified, any existing override will be cleared.
     '''
-    params: T_JSON_DICT = dict()
-    if enabled is not None:
-        params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setAutoDarkModeOverride',
-        'params': params,
+        'params': _set_auto_dark_mode_override_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_auto_dark_mode_override_command = Command(
+    'Emulation.setAutoDarkModeOverride',
+    set_auto_dark_mode_override,
+    _set_auto_dark_mode_override_params,
+)
+
+
+def _set_cpu_throttling_rate_params(
+        rate: float
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['rate'] = rate
+    return params
+
+
 def set_cpu_throttling_rate(
         rate: float
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -722,15 +806,29 @@ def set_cpu_throttling_rate(
 
     :param rate: Throttling rate as a slowdown factor (1 is no throttle, 2 is 2x slowdown, etc).
     '''
-    params: T_JSON_DICT = dict()
-    params['rate'] = rate
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setCPUThrottlingRate',
-        'params': params,
+        'params': _set_cpu_throttling_rate_params(rate),
     }
     json = yield cmd_dict
 
 
+set_cpu_throttling_rate_command = Command(
+    'Emulation.setCPUThrottlingRate',
+    set_cpu_throttling_rate,
+    _set_cpu_throttling_rate_params,
+)
+
+
+def _set_default_background_color_override_params(
+        color: typing.Optional[dom.RGBA] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if color is not None:
+        params['color'] = color.to_json()
+    return params
+
+
 def set_default_background_color_override(
         color: typing.Optional[dom.RGBA] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -740,16 +838,28 @@ def set_default_background_color_override(
 
     :param color: *(Optional)* RGBA of the default background color. If not specified, any existing override will be cleared.
     '''
-    params: T_JSON_DICT = dict()
-    if color is not None:
-        params['color'] = color.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDefaultBackgroundColorOverride',
-        'params': params,
+        'params': _set_default_background_color_override_params(color),
     }
     json = yield cmd_dict
 
 
+set_default_background_color_override_command = Command(
+    'Emulation.setDefaultBackgroundColorOverride',
+    set_default_background_color_override,
+    _set_default_background_color_override_params,
+)
+
+
+def _set_safe_area_insets_override_params(
+        insets: SafeAreaInsets
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['insets'] = insets.to_json()
+    return params
+
+
 def set_safe_area_insets_override(
         insets: SafeAreaInsets
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -761,16 +871,21 @@ def set_safe_area_insets_override(
 
     :param insets:
     '''
-    params: T_JSON_DICT = dict()
-    params['insets'] = insets.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setSafeAreaInsetsOverride',
-        'params': params,
+        'params': _set_safe_area_insets_override_params(insets),
     }
     json = yield cmd_dict
 
 
-def set_device_metrics_override(
+set_safe_area_insets_override_command = Command(
+    'Emulation.setSafeAreaInsetsOverride',
+    set_safe_area_insets_override,
+    _set_safe_area_insets_override_params,
+)
+
+
+def _set_device_metrics_override_params(
         width: int,
         height: int,
         device_scale_factor: float,
@@ -787,29 +902,7 @@ def set_device_metrics_override(
         device_posture: typing.Optional[DevicePosture] = None,
         scrollbar_type: typing.Optional[str] = None,
         screen_orientation_lock_emulation: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
-    window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
-    query results).
-
-    :param width: Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
-    :param height: Overriding height value in pixels (minimum 0, maximum 10000000). 0 disables the override.
-    :param device_scale_factor: Overriding device scale factor value. 0 disables the override.
-    :param mobile: Whether to emulate mobile device. This includes viewport meta tag, overlay scrollbars, text autosizing and more.
-    :param scale: **(EXPERIMENTAL)** *(Optional)* Scale to apply to resulting view image.
-    :param screen_width: **(EXPERIMENTAL)** *(Optional)* Overriding screen width value in pixels (minimum 0, maximum 10000000).
-    :param screen_height: **(EXPERIMENTAL)** *(Optional)* Overriding screen height value in pixels (minimum 0, maximum 10000000).
-    :param position_x: **(EXPERIMENTAL)** *(Optional)* Overriding view X position on screen in pixels (minimum 0, maximum 10000000).
-    :param position_y: **(EXPERIMENTAL)** *(Optional)* Overriding view Y position on screen in pixels (minimum 0, maximum 10000000).
-    :param dont_set_visible_size: **(EXPERIMENTAL)** *(Optional)* Do not set visible view size, rely upon explicit setVisibleSize call.
-    :param screen_orientation: *(Optional)* Screen orientation override.
-    :param viewport: **(EXPERIMENTAL)** *(Optional)* If set, the visible area of the page will be overridden to this viewport. This viewport change is not observed by the page, e.g. viewport-relative elements do not change positions.
-    :param display_feature: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* If set, the display feature of a multi-segment screen. If not set, multi-segment support is turned-off. Deprecated, use Emulation.setDisplayFeaturesOverride.
-    :param device_posture: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* If set, the posture of a foldable device. If not set the posture is set to continuous. Deprecated, use Emulation.setDevicePostureOverride.
-    :param scrollbar_type: **(EXPERIMENTAL)** *(Optional)* Scrollbar type. Default: ``default``.
-    :param screen_orientation_lock_emulation: **(EXPERIMENTAL)** *(Optional)* If set to true, enables screen orientation lock emulation, which intercepts screen.orientation.lock() calls from the page and reports orientation changes via screenOrientationLockChanged events. This is useful for emulating mobile device orientation lock behavior in responsive design mode.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['width'] = width
     params['height'] = height
@@ -839,13 +932,71 @@ def set_device_metrics_override(
         params['scrollbarType'] = scrollbar_type
     if screen_orientation_lock_emulation is not None:
         params['screenOrientationLockEmulation'] = screen_orientation_lock_emulation
+    return params
+
+
+def set_device_metrics_override(
+        width: int,
+        height: int,
+        device_scale_factor: float,
+        mobile: bool,
+        scale: typing.Optional[float] = None,
+        screen_width: typing.Optional[int] = None,
+        screen_height: typing.Optional[int] = None,
+        position_x: typing.Optional[int] = None,
+        position_y: typing.Optional[int] = None,
+        dont_set_visible_size: typing.Optional[bool] = None,
+        screen_orientation: typing.Optional[ScreenOrientation] = None,
+        viewport: typing.Optional[page.Viewport] = None,
+        display_feature: typing.Optional[DisplayFeature] = None,
+        device_posture: typing.Optional[DevicePosture] = None,
+        scrollbar_type: typing.Optional[str] = None,
+        screen_orientation_lock_emulation: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
+    window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
+    query results).
+
+    :param width: Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
+    :param height: Overriding height value in pixels (minimum 0, maximum 10000000). 0 disables the override.
+    :param device_scale_factor: Overriding device scale factor value. 0 disables the override.
+    :param mobile: Whether to emulate mobile device. This includes viewport meta tag, overlay scrollbars, text autosizing and more.
+    :param scale: **(EXPERIMENTAL)** *(Optional)* Scale to apply to resulting view image.
+    :param screen_width: **(EXPERIMENTAL)** *(Optional)* Overriding screen width value in pixels (minimum 0, maximum 10000000).
+    :param screen_height: **(EXPERIMENTAL)** *(Optional)* Overriding screen height value in pixels (minimum 0, maximum 10000000).
+    :param position_x: **(EXPERIMENTAL)** *(Optional)* Overriding view X position on screen in pixels (minimum 0, maximum 10000000).
+    :param position_y: **(EXPERIMENTAL)** *(Optional)* Overriding view Y position on screen in pixels (minimum 0, maximum 10000000).
+    :param dont_set_visible_size: **(EXPERIMENTAL)** *(Optional)* Do not set visible view size, rely upon explicit setVisibleSize call.
+    :param screen_orientation: *(Optional)* Screen orientation override.
+    :param viewport: **(EXPERIMENTAL)** *(Optional)* If set, the visible area of the page will be overridden to this viewport. This viewport change is not observed by the page, e.g. viewport-relative elements do not change positions.
+    :param display_feature: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* If set, the display feature of a multi-segment screen. If not set, multi-segment support is turned-off. Deprecated, use Emulation.setDisplayFeaturesOverride.
+    :param device_posture: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* If set, the posture of a foldable device. If not set the posture is set to continuous. Deprecated, use Emulation.setDevicePostureOverride.
+    :param scrollbar_type: **(EXPERIMENTAL)** *(Optional)* Scrollbar type. Default: ``default``.
+    :param screen_orientation_lock_emulation: **(EXPERIMENTAL)** *(Optional)* If set to true, enables screen orientation lock emulation, which intercepts screen.orientation.lock() calls from the page and reports orientation changes via screenOrientationLockChanged events. This is useful for emulating mobile device orientation lock behavior in responsive design mode.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDeviceMetricsOverride',
-        'params': params,
+        'params': _set_device_metrics_override_params(width, height, device_scale_factor, mobile, scale, screen_width, screen_height, position_x, position_y, dont_set_visible_size, screen_orientation, viewport, display_feature, device_posture, scrollbar_type, screen_orientation_lock_emulation),
     }
     json = yield cmd_dict
 
 
+set_device_metrics_override_command = Command(
+    'Emulation.setDeviceMetricsOverride',
+    set_device_metrics_override,
+    _set_device_metrics_override_params,
+)
+
+
+def _set_device_posture_override_params(
+        posture: DevicePosture
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['posture'] = posture.to_json()
+    return params
+
+
 def set_device_posture_override(
         posture: DevicePosture
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -857,15 +1008,20 @@ def set_device_posture_override(
 
     :param posture:
     '''
-    params: T_JSON_DICT = dict()
-    params['posture'] = posture.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDevicePostureOverride',
-        'params': params,
+        'params': _set_device_posture_override_params(posture),
     }
     json = yield cmd_dict
 
 
+set_device_posture_override_command = Command(
+    'Emulation.setDevicePostureOverride',
+    set_device_posture_override,
+    _set_device_posture_override_params,
+)
+
+
 def clear_device_posture_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears a device posture override set with either setDeviceMetricsOverride()
@@ -881,6 +1037,17 @@ def clear_device_posture_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
     json = yield cmd_dict
 
 
+clear_device_posture_override_command = Command('Emulation.clearDevicePostureOverride', clear_device_posture_override)
+
+
+def _set_display_features_override_params(
+        features: typing.List[DisplayFeature]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['features'] = [i.to_json() for i in features]
+    return params
+
+
 def set_display_features_override(
         features: typing.List[DisplayFeature]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -892,15 +1059,20 @@ def set_display_features_override(
 
     :param features:
     '''
-    params: T_JSON_DICT = dict()
-    params['features'] = [i.to_json() for i in features]
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDisplayFeaturesOverride',
-        'params': params,
+        'params': _set_display_features_override_params(features),
     }
     json = yield cmd_dict
 
 
+set_display_features_override_command = Command(
+    'Emulation.setDisplayFeaturesOverride',
+    set_display_features_override,
+    _set_display_features_override_params,
+)
+
+
 def clear_display_features_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears the display features override set with either setDeviceMetricsOverride()
@@ -916,6 +1088,17 @@ def clear_display_features_override() -> typing.Generator[T_JSON_DICT,T_JSON_DIC
     json = yield cmd_dict
 
 
+clear_display_features_override_command = Command('Emulation.clearDisplayFeaturesOverride', clear_display_features_override)
+
+
+def _set_scrollbars_hidden_params(
+        hidden: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['hidden'] = hidden
+    return params
+
+
 def set_scrollbars_hidden(
         hidden: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -926,15 +1109,28 @@ def set_scrollbars_hidden(
 
     :param hidden: Whether scrollbars should be always hidden.
     '''
-    params: T_JSON_DICT = dict()
-    params['hidden'] = hidden
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setScrollbarsHidden',
-        'params': params,
+        'params': _set_scrollbars_hidden_params(hidden),
     }
     json = yield cmd_dict
 
 
+set_scrollbars_hidden_command = Command(
+    'Emulation.setScrollbarsHidden',
+    set_scrollbars_hidden,
+    _set_scrollbars_hidden_params,
+)
+
+
+def _set_document_cookie_disabled_params(
+        disabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['disabled'] = disabled
+    return params
+
+
 def set_document_cookie_disabled(
         disabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -945,15 +1141,31 @@ def set_document_cookie_disabled(
 
     :param disabled: Whether document.coookie API should be disabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['disabled'] = disabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDocumentCookieDisabled',
-        'params': params,
+        'params': _set_document_cookie_disabled_params(disabled),
     }
     json = yield cmd_dict
 
 
+set_document_cookie_disabled_command = Command(
+    'Emulation.setDocumentCookieDisabled',
+    set_document_cookie_disabled,
+    _set_document_cookie_disabled_params,
+)
+
+
+def _set_emit_touch_events_for_mouse_params(
+        enabled: bool,
+        configuration: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    if configuration is not None:
+        params['configuration'] = configuration
+    return params
+
+
 def set_emit_touch_events_for_mouse(
         enabled: bool,
         configuration: typing.Optional[str] = None
@@ -966,17 +1178,32 @@ def set_emit_touch_events_for_mouse(
     :param enabled: Whether touch emulation based on mouse input should be enabled.
     :param configuration: *(Optional)* Touch/gesture events configuration. Default: current platform.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    if configuration is not None:
-        params['configuration'] = configuration
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setEmitTouchEventsForMouse',
-        'params': params,
+        'params': _set_emit_touch_events_for_mouse_params(enabled, configuration),
     }
     json = yield cmd_dict
 
 
+set_emit_touch_events_for_mouse_command = Command(
+    'Emulation.setEmitTouchEventsForMouse',
+    set_emit_touch_events_for_mouse,
+    _set_emit_touch_events_for_mouse_params,
+)
+
+
+def _set_emulated_media_params(
+        media: typing.Optional[str] = None,
+        features: typing.Optional[typing.List[MediaFeature]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if media is not None:
+        params['media'] = media
+    if features is not None:
+        params['features'] = [i.to_json() for i in features]
+    return params
+
+
 def set_emulated_media(
         media: typing.Optional[str] = None,
         features: typing.Optional[typing.List[MediaFeature]] = None
@@ -987,18 +1214,28 @@ def set_emulated_media(
     :param media: *(Optional)* Media type to emulate. Empty string disables the override.
     :param features: *(Optional)* Media features to emulate.
     '''
-    params: T_JSON_DICT = dict()
-    if media is not None:
-        params['media'] = media
-    if features is not None:
-        params['features'] = [i.to_json() for i in features]
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setEmulatedMedia',
-        'params': params,
+        'params': _set_emulated_media_params(media, features),
     }
     json = yield cmd_dict
 
 
+set_emulated_media_command = Command(
+    'Emulation.setEmulatedMedia',
+    set_emulated_media,
+    _set_emulated_media_params,
+)
+
+
+def _set_emulated_vision_deficiency_params(
+        type_: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['type'] = type_
+    return params
+
+
 def set_emulated_vision_deficiency(
         type_: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1007,15 +1244,29 @@ def set_emulated_vision_deficiency(
 
     :param type_: Vision deficiency to emulate. Order: best-effort emulations come first, followed by any physiologically accurate emulations for medically recognized color vision deficiencies.
     '''
-    params: T_JSON_DICT = dict()
-    params['type'] = type_
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setEmulatedVisionDeficiency',
-        'params': params,
+        'params': _set_emulated_vision_deficiency_params(type_),
     }
     json = yield cmd_dict
 
 
+set_emulated_vision_deficiency_command = Command(
+    'Emulation.setEmulatedVisionDeficiency',
+    set_emulated_vision_deficiency,
+    _set_emulated_vision_deficiency_params,
+)
+
+
+def _set_emulated_os_text_scale_params(
+        scale: typing.Optional[float] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if scale is not None:
+        params['scale'] = scale
+    return params
+
+
 def set_emulated_os_text_scale(
         scale: typing.Optional[float] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1024,17 +1275,21 @@ def set_emulated_os_text_scale(
 
     :param scale: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    if scale is not None:
-        params['scale'] = scale
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setEmulatedOSTextScale',
-        'params': params,
+        'params': _set_emulated_os_text_scale_params(scale),
     }
     json = yield cmd_dict
 
 
-def set_geolocation_override(
+set_emulated_os_text_scale_command = Command(
+    'Emulation.setEmulatedOSTextScale',
+    set_emulated_os_text_scale,
+    _set_emulated_os_text_scale_params,
+)
+
+
+def _set_geolocation_override_params(
         latitude: typing.Optional[float] = None,
         longitude: typing.Optional[float] = None,
         accuracy: typing.Optional[float] = None,
@@ -1042,19 +1297,7 @@ def set_geolocation_override(
         altitude_accuracy: typing.Optional[float] = None,
         heading: typing.Optional[float] = None,
         speed: typing.Optional[float] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Overrides the Geolocation Position or Error. Omitting latitude, longitude or
-    accuracy emulates position unavailable.
-
-    :param latitude: *(Optional)* Mock latitude
-    :param longitude: *(Optional)* Mock longitude
-    :param accuracy: *(Optional)* Mock accuracy
-    :param altitude: *(Optional)* Mock altitude
-    :param altitude_accuracy: *(Optional)* Mock altitudeAccuracy
-    :param heading: *(Optional)* Mock heading
-    :param speed: *(Optional)* Mock speed
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if latitude is not None:
         params['latitude'] = latitude
@@ -1070,34 +1313,92 @@ def set_geolocation_override(
         params['heading'] = heading
     if speed is not None:
         params['speed'] = speed
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.setGeolocationOverride',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return params
 
 
-def get_overridden_sensor_information(
-        type_: SensorType
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
-    r'''
-
-
-    **EXPERIMENTAL**
-
-    :param type_:
-    :returns: 
+def set_geolocation_override(
+        latitude: typing.Optional[float] = None,
+        longitude: typing.Optional[float] = None,
+        accuracy: typing.Optional[float] = None,
+        altitude: typing.Optional[float] = None,
+        altitude_accuracy: typing.Optional[float] = None,
+        heading: typing.Optional[float] = None,
+        speed: typing.Optional[float] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Overrides the Geolocation Position or Error. Omitting latitude, longitude or
+    accuracy emulates position unavailable.
+
+    :param latitude: *(Optional)* Mock latitude
+    :param longitude: *(Optional)* Mock longitude
+    :param accuracy: *(Optional)* Mock accuracy
+    :param altitude: *(Optional)* Mock altitude
+    :param altitude_accuracy: *(Optional)* Mock altitudeAccuracy
+    :param heading: *(Optional)* Mock heading
+    :param speed: *(Optional)* Mock speed
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'Emulation.setGeolocationOverride',
+        'params': _set_geolocation_override_params(latitude, longitude, accuracy, altitude, altitude_accuracy, heading, speed),
+    }
+    json = yield cmd_dict
+
+
+set_geolocation_override_command = Command(
+    'Emulation.setGeolocationOverride',
+    set_geolocation_override,
+    _set_geolocation_override_params,
+)
+
+
+def _get_overridden_sensor_information_params(
+        type_: SensorType
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['type'] = type_.to_json()
+    return params
+
+
+def get_overridden_sensor_information(
+        type_: SensorType
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
+    r'''
+
+
+    **EXPERIMENTAL**
+
+    :param type_:
+    :returns: 
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.getOverriddenSensorInformation',
-        'params': params,
+        'params': _get_overridden_sensor_information_params(type_),
     }
     json = yield cmd_dict
     return float(json['requestedSamplingFrequency'])
 
 
+get_overridden_sensor_information_command = Command(
+    'Emulation.getOverriddenSensorInformation',
+    get_overridden_sensor_information,
+    _get_overridden_sensor_information_params,
+    lambda json: float(json['requestedSamplingFrequency']),
+)
+
+
+def _set_sensor_override_enabled_params(
+        enabled: bool,
+        type_: SensorType,
+        metadata: typing.Optional[SensorMetadata] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    params['type'] = type_.to_json()
+    if metadata is not None:
+        params['metadata'] = metadata.to_json()
+    return params
+
+
 def set_sensor_override_enabled(
         enabled: bool,
         type_: SensorType,
@@ -1116,18 +1417,30 @@ def set_sensor_override_enabled(
     :param type_:
     :param metadata: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    params['type'] = type_.to_json()
-    if metadata is not None:
-        params['metadata'] = metadata.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setSensorOverrideEnabled',
-        'params': params,
+        'params': _set_sensor_override_enabled_params(enabled, type_, metadata),
     }
     json = yield cmd_dict
 
 
+set_sensor_override_enabled_command = Command(
+    'Emulation.setSensorOverrideEnabled',
+    set_sensor_override_enabled,
+    _set_sensor_override_enabled_params,
+)
+
+
+def _set_sensor_override_readings_params(
+        type_: SensorType,
+        reading: SensorReading
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['type'] = type_.to_json()
+    params['reading'] = reading.to_json()
+    return params
+
+
 def set_sensor_override_readings(
         type_: SensorType,
         reading: SensorReading
@@ -1141,16 +1454,33 @@ def set_sensor_override_readings(
     :param type_:
     :param reading:
     '''
-    params: T_JSON_DICT = dict()
-    params['type'] = type_.to_json()
-    params['reading'] = reading.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setSensorOverrideReadings',
-        'params': params,
+        'params': _set_sensor_override_readings_params(type_, reading),
     }
     json = yield cmd_dict
 
 
+set_sensor_override_readings_command = Command(
+    'Emulation.setSensorOverrideReadings',
+    set_sensor_override_readings,
+    _set_sensor_override_readings_params,
+)
+
+
+def _set_pressure_source_override_enabled_params(
+        enabled: bool,
+        source: PressureSource,
+        metadata: typing.Optional[PressureMetadata] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    params['source'] = source.to_json()
+    if metadata is not None:
+        params['metadata'] = metadata.to_json()
+    return params
+
+
 def set_pressure_source_override_enabled(
         enabled: bool,
         source: PressureSource,
@@ -1168,18 +1498,30 @@ def set_pressure_source_override_enabled(
     :param source:
     :param metadata: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    params['source'] = source.to_json()
-    if metadata is not None:
-        params['metadata'] = metadata.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setPressureSourceOverrideEnabled',
-        'params': params,
+        'params': _set_pressure_source_override_enabled_params(enabled, source, metadata),
     }
     json = yield cmd_dict
 
 
+set_pressure_source_override_enabled_command = Command(
+    'Emulation.setPressureSourceOverrideEnabled',
+    set_pressure_source_override_enabled,
+    _set_pressure_source_override_enabled_params,
+)
+
+
+def _set_pressure_state_override_params(
+        source: PressureSource,
+        state: PressureState
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['source'] = source.to_json()
+    params['state'] = state.to_json()
+    return params
+
+
 def set_pressure_state_override(
         source: PressureSource,
         state: PressureState
@@ -1195,16 +1537,33 @@ def set_pressure_state_override(
     :param source:
     :param state:
     '''
-    params: T_JSON_DICT = dict()
-    params['source'] = source.to_json()
-    params['state'] = state.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setPressureStateOverride',
-        'params': params,
+        'params': _set_pressure_state_override_params(source, state),
     }
     json = yield cmd_dict
 
 
+set_pressure_state_override_command = Command(
+    'Emulation.setPressureStateOverride',
+    set_pressure_state_override,
+    _set_pressure_state_override_params,
+)
+
+
+def _set_pressure_data_override_params(
+        source: PressureSource,
+        state: PressureState,
+        own_contribution_estimate: typing.Optional[float] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['source'] = source.to_json()
+    params['state'] = state.to_json()
+    if own_contribution_estimate is not None:
+        params['ownContributionEstimate'] = own_contribution_estimate
+    return params
+
+
 def set_pressure_data_override(
         source: PressureSource,
         state: PressureState,
@@ -1221,18 +1580,30 @@ def set_pressure_data_override(
     :param state:
     :param own_contribution_estimate: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['source'] = source.to_json()
-    params['state'] = state.to_json()
-    if own_contribution_estimate is not None:
-        params['ownContributionEstimate'] = own_contribution_estimate
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setPressureDataOverride',
-        'params': params,
+        'params': _set_pressure_data_override_params(source, state, own_contribution_estimate),
     }
     json = yield cmd_dict
 
 
+set_pressure_data_override_command = Command(
+    'Emulation.setPressureDataOverride',
+    set_pressure_data_override,
+    _set_pressure_data_override_params,
+)
+
+
+def _set_idle_override_params(
+        is_user_active: bool,
+        is_screen_unlocked: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['isUserActive'] = is_user_active
+    params['isScreenUnlocked'] = is_screen_unlocked
+    return params
+
+
 def set_idle_override(
         is_user_active: bool,
         is_screen_unlocked: bool
@@ -1243,16 +1614,20 @@ def set_idle_override(
     :param is_user_active: Mock isUserActive
     :param is_screen_unlocked: Mock isScreenUnlocked
     '''
-    params: T_JSON_DICT = dict()
-    params['isUserActive'] = is_user_active
-    params['isScreenUnlocked'] = is_screen_unlocked
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setIdleOverride',
-        'params': params,
+        'params': _set_idle_override_params(is_user_active, is_screen_unlocked),
     }
     json = yield cmd_dict
 
 
+set_idle_override_command = Command(
+    'Emulation.setIdleOverride',
+    set_idle_override,
+    _set_idle_override_params,
+)
+
+
 def clear_idle_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears Idle state overrides.
@@ -1263,6 +1638,17 @@ def clear_idle_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+clear_idle_override_command = Command('Emulation.clearIdleOverride', clear_idle_override)
+
+
+def _set_navigator_overrides_params(
+        platform: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['platform'] = platform
+    return params
+
+
 @deprecated(version="1.3")
 def set_navigator_overrides(
         platform: str
@@ -1276,15 +1662,29 @@ def set_navigator_overrides(
 
     :param platform: The platform navigator.platform should return.
     '''
-    params: T_JSON_DICT = dict()
-    params['platform'] = platform
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setNavigatorOverrides',
-        'params': params,
+        'params': _set_navigator_overrides_params(platform),
     }
     json = yield cmd_dict
 
 
+set_navigator_overrides_command = Command(
+    'Emulation.setNavigatorOverrides',
+    set_navigator_overrides,
+    _set_navigator_overrides_params,
+    deprecated='1.3',
+)
+
+
+def _set_page_scale_factor_params(
+        page_scale_factor: float
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['pageScaleFactor'] = page_scale_factor
+    return params
+
+
 def set_page_scale_factor(
         page_scale_factor: float
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1295,15 +1695,28 @@ def set_page_scale_factor(
 
     :param page_scale_factor: Page scale factor.
     '''
-    params: T_JSON_DICT = dict()
-    params['pageScaleFactor'] = page_scale_factor
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setPageScaleFactor',
-        'params': params,
+        'params': _set_page_scale_factor_params(page_scale_factor),
     }
     json = yield cmd_dict
 
 
+set_page_scale_factor_command = Command(
+    'Emulation.setPageScaleFactor',
+    set_page_scale_factor,
+    _set_page_scale_factor_params,
+)
+
+
+def _set_script_execution_disabled_params(
+        value: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['value'] = value
+    return params
+
+
 def set_script_execution_disabled(
         value: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1312,15 +1725,31 @@ def set_script_execution_disabled(
 
     :param value: Whether script execution should be disabled in the page.
     '''
-    params: T_JSON_DICT = dict()
-    params['value'] = value
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setScriptExecutionDisabled',
-        'params': params,
+        'params': _set_script_execution_disabled_params(value),
     }
     json = yield cmd_dict
 
 
+set_script_execution_disabled_command = Command(
+    'Emulation.setScriptExecutionDisabled',
+    set_script_execution_disabled,
+    _set_script_execution_disabled_params,
+)
+
+
+def _set_touch_emulation_enabled_params(
+        enabled: bool,
+        max_touch_points: typing.Optional[int] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    if max_touch_points is not None:
+        params['maxTouchPoints'] = max_touch_points
+    return params
+
+
 def set_touch_emulation_enabled(
         enabled: bool,
         max_touch_points: typing.Optional[int] = None
@@ -1331,17 +1760,37 @@ def set_touch_emulation_enabled(
     :param enabled: Whether the touch event emulation should be enabled.
     :param max_touch_points: *(Optional)* Maximum touch points supported. Defaults to one.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    if max_touch_points is not None:
-        params['maxTouchPoints'] = max_touch_points
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setTouchEmulationEnabled',
-        'params': params,
+        'params': _set_touch_emulation_enabled_params(enabled, max_touch_points),
     }
     json = yield cmd_dict
 
 
+set_touch_emulation_enabled_command = Command(
+    'Emulation.setTouchEmulationEnabled',
+    set_touch_emulation_enabled,
+    _set_touch_emulation_enabled_params,
+)
+
+
+def _set_virtual_time_policy_params(
+        policy: VirtualTimePolicy,
+        budget: typing.Optional[float] = None,
+        max_virtual_time_task_starvation_count: typing.Optional[int] = None,
+        initial_virtual_time: typing.Optional[network.TimeSinceEpoch] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['policy'] = policy.to_json()
+    if budget is not None:
+        params['budget'] = budget
+    if max_virtual_time_task_starvation_count is not None:
+        params['maxVirtualTimeTaskStarvationCount'] = max_virtual_time_task_starvation_count
+    if initial_virtual_time is not None:
+        params['initialVirtualTime'] = initial_virtual_time.to_json()
+    return params
+
+
 def set_virtual_time_policy(
         policy: VirtualTimePolicy,
         budget: typing.Optional[float] = None,
@@ -1360,22 +1809,31 @@ def set_virtual_time_policy(
     :param initial_virtual_time: *(Optional)* If set, base::Time::Now will be overridden to initially return this value.
     :returns: Absolute timestamp at which virtual time was first enabled (up time in milliseconds).
     '''
-    params: T_JSON_DICT = dict()
-    params['policy'] = policy.to_json()
-    if budget is not None:
-        params['budget'] = budget
-    if max_virtual_time_task_starvation_count is not None:
-        params['maxVirtualTimeTaskStarvationCount'] = max_virtual_time_task_starvation_count
-    if initial_virtual_time is not None:
-        params['initialVirtualTime'] = initial_virtual_time.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setVirtualTimePolicy',
-        'params': params,
+        'params': _set_virtual_time_policy_params(policy, budget, max_virtual_time_task_starvation_count, initial_virtual_time),
     }
     json = yield cmd_dict
     return float(json['virtualTimeTicksBase'])
 
 
+set_virtual_time_policy_command = Command(
+    'Emulation.setVirtualTimePolicy',
+    set_virtual_time_policy,
+    _set_virtual_time_policy_params,
+    lambda json: float(json['virtualTimeTicksBase']),
+)
+
+
+def _set_locale_override_params(
+        locale: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if locale is not None:
+        params['locale'] = locale
+    return params
+
+
 def set_locale_override(
         locale: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1386,16 +1844,28 @@ def set_locale_override(
 
     :param locale: *(Optional)* ICU style C locale (e.g. "en_US"). If not specified or empty, disables the override and restores default host system locale.
     '''
-    params: T_JSON_DICT = dict()
-    if locale is not None:
-        params['locale'] = locale
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setLocaleOverride',
-        'params': params,
+        'params': _set_locale_override_params(locale),
     }
     json = yield cmd_dict
 
 
+set_locale_override_command = Command(
+    'Emulation.setLocaleOverride',
+    set_locale_override,
+    _set_locale_override_params,
+)
+
+
+def _set_timezone_override_params(
+        timezone_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['timezoneId'] = timezone_id
+    return params
+
+
 def set_timezone_override(
         timezone_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1404,15 +1874,30 @@ def set_timezone_override(
 
     :param timezone_id: The timezone identifier. List of supported timezones: https://source.chromium.org/chromium/chromium/deps/icu.git/+/faee8bc70570192d82d2978a71e2a615788597d1:source/data/misc/metaZones.txt If empty, disables the override and restores default host system timezone.
     '''
-    params: T_JSON_DICT = dict()
-    params['timezoneId'] = timezone_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setTimezoneOverride',
-        'params': params,
+        'params': _set_timezone_override_params(timezone_id),
     }
     json = yield cmd_dict
 
 
+set_timezone_override_command = Command(
+    'Emulation.setTimezoneOverride',
+    set_timezone_override,
+    _set_timezone_override_params,
+)
+
+
+def _set_visible_size_params(
+        width: int,
+        height: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['width'] = width
+    params['height'] = height
+    return params
+
+
 @deprecated(version="1.3")
 def set_visible_size(
         width: int,
@@ -1430,16 +1915,29 @@ def set_visible_size(
     :param width: Frame width (DIP).
     :param height: Frame height (DIP).
     '''
-    params: T_JSON_DICT = dict()
-    params['width'] = width
-    params['height'] = height
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setVisibleSize',
-        'params': params,
+        'params': _set_visible_size_params(width, height),
     }
     json = yield cmd_dict
 
 
+set_visible_size_command = Command(
+    'Emulation.setVisibleSize',
+    set_visible_size,
+    _set_visible_size_params,
+    deprecated='1.3',
+)
+
+
+def _set_disabled_image_types_params(
+        image_types: typing.List[DisabledImageType]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['imageTypes'] = [i.to_json() for i in image_types]
+    return params
+
+
 def set_disabled_image_types(
         image_types: typing.List[DisabledImageType]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1450,15 +1948,29 @@ def set_disabled_image_types(
 
     :param image_types: Image types to disable.
     '''
-    params: T_JSON_DICT = dict()
-    params['imageTypes'] = [i.to_json() for i in image_types]
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDisabledImageTypes',
-        'params': params,
+        'params': _set_disabled_image_types_params(image_types),
     }
     json = yield cmd_dict
 
 
+set_disabled_image_types_command = Command(
+    'Emulation.setDisabledImageTypes',
+    set_disabled_image_types,
+    _set_disabled_image_types_params,
+)
+
+
+def _set_data_saver_override_params(
+        data_saver_enabled: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if data_saver_enabled is not None:
+        params['dataSaverEnabled'] = data_saver_enabled
+    return params
+
+
 def set_data_saver_override(
         data_saver_enabled: typing.Optional[bool] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1469,16 +1981,28 @@ def set_data_saver_override(
 
     :param data_saver_enabled: *(Optional)* Override value. Omitting the parameter disables the override.
     '''
-    params: T_JSON_DICT = dict()
-    if data_saver_enabled is not None:
-        params['dataSaverEnabled'] = data_saver_enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setDataSaverOverride',
-        'params': params,
+        'params': _set_data_saver_override_params(data_saver_enabled),
     }
     json = yield cmd_dict
 
 
+set_data_saver_override_command = Command(
+    'Emulation.setDataSaverOverride',
+    set_data_saver_override,
+    _set_data_saver_override_params,
+)
+
+
+def _set_hardware_concurrency_override_params(
+        hardware_concurrency: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['hardwareConcurrency'] = hardware_concurrency
+    return params
+
+
 def set_hardware_concurrency_override(
         hardware_concurrency: int
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1489,15 +2013,37 @@ def set_hardware_concurrency_override(
 
     :param hardware_concurrency: Hardware concurrency to report
     '''
-    params: T_JSON_DICT = dict()
-    params['hardwareConcurrency'] = hardware_concurrency
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setHardwareConcurrencyOverride',
-        'params': params,
+        'params': _set_hardware_concurrency_override_params(hardware_concurrency),
     }
     json = yield cmd_dict
 
 
+set_hardware_concurrency_override_command = Command(
+    'Emulation.setHardwareConcurrencyOverride',
+    set_hardware_concurrency_override,
+    _set_hardware_concurrency_override_params,
+)
+
+
+def _set_user_agent_override_params(
+        user_agent: str,
+        accept_language: typing.Optional[str] = None,
+        platform: typing.Optional[str] = None,
+        user_agent_metadata: typing.Optional[UserAgentMetadata] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['userAgent'] = user_agent
+    if accept_language is not None:
+        params['acceptLanguage'] = accept_language
+    if platform is not None:
+        params['platform'] = platform
+    if user_agent_metadata is not None:
+        params['userAgentMetadata'] = user_agent_metadata.to_json()
+    return params
+
+
 def set_user_agent_override(
         user_agent: str,
         accept_language: typing.Optional[str] = None,
@@ -1513,21 +2059,28 @@ def set_user_agent_override(
     :param platform: *(Optional)* The platform navigator.platform should return.
     :param user_agent_metadata: **(EXPERIMENTAL)** *(Optional)* To be sent in Sec-CH-UA-* headers and returned in navigator.userAgentData
     '''
-    params: T_JSON_DICT = dict()
-    params['userAgent'] = user_agent
-    if accept_language is not None:
-        params['acceptLanguage'] = accept_language
-    if platform is not None:
-        params['platform'] = platform
-    if user_agent_metadata is not None:
-        params['userAgentMetadata'] = user_agent_metadata.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setUserAgentOverride',
-        'params': params,
+        'params': _set_user_agent_override_params(user_agent, accept_language, platform, user_agent_metadata),
     }
     json = yield cmd_dict
 
 
+set_user_agent_override_command = Command(
+    'Emulation.setUserAgentOverride',
+    set_user_agent_override,
+    _set_user_agent_override_params,
+)
+
+
+def _set_automation_override_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_automation_override(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1538,15 +2091,28 @@ def set_automation_override(
 
     :param enabled: Whether the override should be enabled.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setAutomationOverride',
-        'params': params,
+        'params': _set_automation_override_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_automation_override_command = Command(
+    'Emulation.setAutomationOverride',
+    set_automation_override,
+    _set_automation_override_params,
+)
+
+
+def _set_small_viewport_height_difference_override_params(
+        difference: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['difference'] = difference
+    return params
+
+
 def set_small_viewport_height_difference_override(
         difference: int
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1558,15 +2124,20 @@ def set_small_viewport_height_difference_override(
 
     :param difference: This will cause an element of size 100svh to be ```difference``` pixels smaller than an element of size 100lvh.
     '''
-    params: T_JSON_DICT = dict()
-    params['difference'] = difference
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setSmallViewportHeightDifferenceOverride',
-        'params': params,
+        'params': _set_small_viewport_height_difference_override_params(difference),
     }
     json = yield cmd_dict
 
 
+set_small_viewport_height_difference_override_command = Command(
+    'Emulation.setSmallViewportHeightDifferenceOverride',
+    set_small_viewport_height_difference_override,
+    _set_small_viewport_height_difference_override_params,
+)
+
+
 def get_screen_infos() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ScreenInfo]]:
     r'''
     Returns device's screen configuration. In headful mode, the physical screens configuration is returned,
@@ -1583,6 +2154,46 @@ def get_screen_infos() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[S
     return [ScreenInfo.from_json(i) for i in json['screenInfos']]
 
 
+get_screen_infos_command = Command(
+    'Emulation.getScreenInfos',
+    get_screen_infos,
+    None,
+    lambda json: [ScreenInfo.from_json(i) for i in json['screenInfos']],
+)
+
+
+def _add_screen_params(
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        work_area_insets: typing.Optional[WorkAreaInsets] = None,
+        device_pixel_ratio: typing.Optional[float] = None,
+        rotation: typing.Optional[int] = None,
+        color_depth: typing.Optional[int] = None,
+        label: typing.Optional[str] = None,
+        is_internal: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['left'] = left
+    params['top'] = top
+    params['width'] = width
+    params['height'] = height
+    if work_area_insets is not None:
+        params['workAreaInsets'] = work_area_insets.to_json()
+    if device_pixel_ratio is not None:
+        params['devicePixelRatio'] = device_pixel_ratio
+    if rotation is not None:
+        params['rotation'] = rotation
+    if color_depth is not None:
+        params['colorDepth'] = color_depth
+    if label is not None:
+        params['label'] = label
+    if is_internal is not None:
+        params['isInternal'] = is_internal
+    return params
+
+
 def add_screen(
         left: int,
         top: int,
@@ -1612,11 +2223,45 @@ def add_screen(
     :param is_internal: *(Optional)* Indicates whether the screen is internal to the device or external, attached to the device. Default is false.
     :returns: 
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'Emulation.addScreen',
+        'params': _add_screen_params(left, top, width, height, work_area_insets, device_pixel_ratio, rotation, color_depth, label, is_internal),
+    }
+    json = yield cmd_dict
+    return ScreenInfo.from_json(json['screenInfo'])
+
+
+add_screen_command = Command(
+    'Emulation.addScreen',
+    add_screen,
+    _add_screen_params,
+    lambda json: ScreenInfo.from_json(json['screenInfo']),
+)
+
+
+def _update_screen_params(
+        screen_id: ScreenId,
+        left: typing.Optional[int] = None,
+        top: typing.Optional[int] = None,
+        width: typing.Optional[int] = None,
+        height: typing.Optional[int] = None,
+        work_area_insets: typing.Optional[WorkAreaInsets] = None,
+        device_pixel_ratio: typing.Optional[float] = None,
+        rotation: typing.Optional[int] = None,
+        color_depth: typing.Optional[int] = None,
+        label: typing.Optional[str] = None,
+        is_internal: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
-    params['left'] = left
-    params['top'] = top
-    params['width'] = width
-    params['height'] = height
+    params['screenId'] = screen_id.to_json()
+    if left is not None:
+        params['left'] = left
+    if top is not None:
+        params['top'] = top
+    if width is not None:
+        params['width'] = width
+    if height is not None:
+        params['height'] = height
     if work_area_insets is not None:
         params['workAreaInsets'] = work_area_insets.to_json()
     if device_pixel_ratio is not None:
@@ -1629,12 +2274,7 @@ def add_screen(
         params['label'] = label
     if is_internal is not None:
         params['isInternal'] = is_internal
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Emulation.addScreen',
-        'params': params,
-    }
-    json = yield cmd_dict
-    return ScreenInfo.from_json(json['screenInfo'])
+    return params
 
 
 def update_screen(
@@ -1668,36 +2308,30 @@ def update_screen(
     :param is_internal: *(Optional)* Indicates whether the screen is internal to the device or external, attached to the device. Default is false.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['screenId'] = screen_id.to_json()
-    if left is not None:
-        params['left'] = left
-    if top is not None:
-        params['top'] = top
-    if width is not None:
-        params['width'] = width
-    if height is not None:
-        params['height'] = height
-    if work_area_insets is not None:
-        params['workAreaInsets'] = work_area_insets.to_json()
-    if device_pixel_ratio is not None:
-        params['devicePixelRatio'] = device_pixel_ratio
-    if rotation is not None:
-        params['rotation'] = rotation
-    if color_depth is not None:
-        params['colorDepth'] = color_depth
-    if label is not None:
-        params['label'] = label
-    if is_internal is not None:
-        params['isInternal'] = is_internal
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.updateScreen',
-        'params': params,
+        'params': _update_screen_params(screen_id, left, top, width, height, work_area_insets, device_pixel_ratio, rotation, color_depth, label, is_internal),
     }
     json = yield cmd_dict
     return ScreenInfo.from_json(json['screenInfo'])
 
 
+update_screen_command = Command(
+    'Emulation.updateScreen',
+    update_screen,
+    _update_screen_params,
+    lambda json: ScreenInfo.from_json(json['screenInfo']),
+)
+
+
+def _remove_screen_params(
+        screen_id: ScreenId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['screenId'] = screen_id.to_json()
+    return params
+
+
 def remove_screen(
         screen_id: ScreenId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1708,15 +2342,28 @@ def remove_screen(
 
     :param screen_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['screenId'] = screen_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.removeScreen',
-        'params': params,
+        'params': _remove_screen_params(screen_id),
     }
     json = yield cmd_dict
 
 
+remove_screen_command = Command(
+    'Emulation.removeScreen',
+    remove_screen,
+    _remove_screen_params,
+)
+
+
+def _set_primary_screen_params(
+        screen_id: ScreenId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['screenId'] = screen_id.to_json()
+    return params
+
+
 def set_primary_screen(
         screen_id: ScreenId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1730,17 +2377,22 @@ def set_primary_screen(
 
     :param screen_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['screenId'] = screen_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Emulation.setPrimaryScreen',
-        'params': params,
+        'params': _set_primary_screen_params(screen_id),
     }
     json = yield cmd_dict
 
 
+set_primary_screen_command = Command(
+    'Emulation.setPrimaryScreen',
+    set_primary_screen,
+    _set_primary_screen_params,
+)
+
+
 @event_class('Emulation.virtualTimeBudgetExpired')
-@dataclass
+@slotted_dataclass
 class VirtualTimeBudgetExpired:
     r'''
     **EXPERIMENTAL**
@@ -1757,7 +2409,7 @@ class VirtualTimeBudgetExpired:
 
 
 @event_class('Emulation.screenOrientationLockChanged')
-@dataclass
+@slotted_dataclass
 class ScreenOrientationLockChanged:
     r'''
     **EXPERIMENTAL**
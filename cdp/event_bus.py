@@ -0,0 +1,412 @@
+"""
+CDP Event Bus
+
+This module routes parsed CDP events to the consumers that asked for them:
+the shared event queue behind ``CDPConnection.listen()``, per-type listener
+queues, and one-shot waiters. Routing is keyed by CDP method, so the cost of
+dispatching an event is proportional to the number of consumers of that event
+type, and events nobody consumes are never parsed. Raw listeners receive the
+message dicts, and events only they consume are not parsed either.
+"""
+
+from __future__ import annotations
+import asyncio
+import collections
+import enum
+import itertools
+import logging
+import time
+import typing
+
+from cdp.util import event_method, parse_json_event, T_JSON_DICT
+
+if typing.TYPE_CHECKING:
+    from cdp.metrics import ConnectionMetrics
+
+
+logger = logging.getLogger(__name__)
+
+#: An event type: either a CDP method string such as ``"Page.loadEventFired"``
+#: or a generated event class such as :class:`cdp.page.LoadEventFired`.
+EventSpec = typing.Union[str, typing.Type[typing.Any]]
+
+#: A predicate that decides whether a waiter accepts an event.
+EventPredicate = typing.Callable[[typing.Any], bool]
+
+# Pushed into listener queues to wake up consumers when the bus closes.
+_CLOSED = object()
+
+
+class OverflowPolicy(enum.Enum):
+    """What an :class:`EventQueue` does with a new event when it is full."""
+
+    #: Wait for room. This blocks the receive loop, so command responses
+    #: stall too; only use it when a consumer is always draining the queue.
+    BLOCK = 'block'
+    #: Discard the oldest queued event to make room.
+    DROP_OLDEST = 'drop_oldest'
+    #: Discard the new event.
+    DROP_NEWEST = 'drop_newest'
+    #: Replace the most recent queued event with the same CDP method, so only
+    #: the latest state per method is kept. Falls back to dropping the oldest
+    #: event if no event with that method is queued.
+    COALESCE = 'coalesce'
+
+
+# Outcomes of EventQueue.offer().
+QUEUED = 'queued'
+DROPPED = 'dropped'
+COALESCED = 'coalesced'
+
+
+class EventQueue(asyncio.Queue):
+    """
+    An event queue with an optional size limit and an overflow policy.
+
+    ``get()`` and ``get_nowait()`` return events; use :meth:`offer` rather
+    than ``put()`` to add them so that the overflow policy applies.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        super().__init__(maxsize)
+        self.policy = policy
+
+    def _init(self, maxsize: int) -> None:
+        # Items are (method, event) pairs so that COALESCE can match methods.
+        self._queue: typing.Deque[typing.Tuple[str, typing.Any]] = collections.deque()
+
+    def _get(self) -> typing.Any:
+        return self._queue.popleft()[1]
+
+    async def offer(self, method: str, event: typing.Any) -> str:
+        """
+        Add an event, applying the overflow policy if the queue is full.
+
+        Returns:
+            ``QUEUED``, ``DROPPED`` (this or an older event was discarded) or
+            ``COALESCED`` (an older event with the same method was replaced)
+        """
+        item = (method, event)
+        if not self.full():
+            self.put_nowait(item)
+            return QUEUED
+        policy = self.policy
+        if policy is OverflowPolicy.BLOCK:
+            await self.put(item)
+            return QUEUED
+        if policy is OverflowPolicy.DROP_NEWEST:
+            return DROPPED
+        if policy is OverflowPolicy.COALESCE:
+            queue = self._queue
+            for i in range(len(queue) - 1, -1, -1):
+                if queue[i][0] == method:
+                    queue[i] = item
+                    return COALESCED
+        self.get_nowait()
+        self.put_nowait(item)
+        return DROPPED
+
+
+def to_method(event: EventSpec) -> str:
+    """Return the CDP method string for an event type."""
+    if isinstance(event, str):
+        return event
+    return event_method(event)
+
+
+class EventBus:
+    """
+    Dispatches CDP events to subscribers.
+
+    There are three kinds of consumers:
+
+    - The shared queue, read by ``listen()`` without arguments and by
+      ``get_event_nowait()``. It receives every event, or only subscribed
+      events once :meth:`subscribe` has been called.
+    - Listener queues created by ``listen(*event_types)``. Every call gets its
+      own queue, so concurrent listeners never steal events from each other.
+    - One-shot waiters created by :meth:`expect`, resolved directly when a
+      matching event is dispatched.
+
+    ``listen(raw=True)`` creates a listener queue that receives the unparsed
+    message dicts instead, for the given event types or for every event.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 0,
+        overflow_policy: typing.Union[OverflowPolicy, str] = OverflowPolicy.DROP_OLDEST,
+        metrics: typing.Optional[ConnectionMetrics] = None,
+    ) -> None:
+        """
+        Args:
+            max_queue_size: Maximum number of events buffered in the shared
+                queue and in each listener queue; ``0`` means unbounded
+            overflow_policy: What to do with events that arrive while a
+                queue is full
+            metrics: Receives the parse time of every parsed event
+        """
+        self.metrics = metrics
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self._queue = self._new_queue()
+        self._subscriptions: typing.Dict[str, int] = {}
+        self._skipped_events: typing.Dict[str, int] = {}
+        self._dropped_events = 0
+        self._coalesced_events = 0
+        # Listener queues by method. Parsed listeners always name their
+        # methods; raw listeners for every event are under None.
+        self._listeners: typing.Dict[typing.Optional[str], typing.List[EventQueue]] = {}
+        self._raw_listeners: typing.Dict[typing.Optional[str], typing.List[EventQueue]] = {}
+        self._waiters: typing.Dict[
+            str, typing.List[typing.Tuple[typing.Optional[EventPredicate], asyncio.Future]]
+        ] = {}
+        self._closed = False
+
+    async def dispatch(self, data: T_JSON_DICT) -> None:
+        """
+        Parse an event message and deliver it to its consumers.
+
+        The event is parsed at most once and shared between consumers. If no
+        consumer wants it, it is counted in :attr:`skipped_event_counts`
+        instead of being parsed. Raw listeners get ``data`` itself.
+        """
+        method = data['method']
+        raw = False
+        if self._raw_listeners:
+            raw = await self._dispatch_raw(method, data)
+        listeners = self._listeners.get(method)
+        waiters = self._waiters.get(method)
+        shared = not self._subscriptions or method in self._subscriptions
+        if not (shared or listeners or waiters):
+            if not raw:
+                self._skipped_events[method] = self._skipped_events.get(method, 0) + 1
+            return
+
+        try:
+            if self.metrics is None:
+                event = parse_json_event(data)
+            else:
+                start = time.perf_counter()
+                event = parse_json_event(data)
+                self.metrics.event_parsed(method, time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"Failed to parse event: {e}")
+            return
+
+        if shared:
+            await self._offer(self._queue, method, event)
+        if listeners:
+            for queue in listeners:
+                await self._offer(queue, method, event)
+        if waiters:
+            # Resolved waiters remove themselves via their done callback.
+            for predicate, future in list(waiters):
+                if future.done():
+                    continue
+                try:
+                    if predicate is None or predicate(event):
+                        future.set_result(event)
+                except Exception as e:
+                    future.set_exception(e)
+
+    async def _dispatch_raw(self, method: str, data: T_JSON_DICT) -> bool:
+        """Offer a message to the raw listeners; return whether there were any."""
+        delivered = False
+        for key in (method, None):
+            for queue in self._raw_listeners.get(key, ()):
+                await self._offer(queue, method, data)
+                delivered = True
+        return delivered
+
+    def _new_queue(self) -> EventQueue:
+        return EventQueue(self.max_queue_size, self.overflow_policy)
+
+    async def _offer(self, queue: EventQueue, method: str, event: typing.Any) -> None:
+        outcome = await queue.offer(method, event)
+        if outcome is QUEUED:
+            return
+        if outcome is COALESCED:
+            self._coalesced_events += 1
+            return
+        if self._dropped_events == 0:
+            logger.warning(
+                f"Event queue is full ({self.max_queue_size} events), dropping "
+                f"events with policy {self.overflow_policy.value!r}"
+            )
+        self._dropped_events += 1
+
+    def subscribe(self, *events: EventSpec) -> None:
+        """Add reference-counted subscriptions for the shared queue."""
+        for event in events:
+            method = to_method(event)
+            self._subscriptions[method] = self._subscriptions.get(method, 0) + 1
+
+    def unsubscribe(self, *events: EventSpec) -> None:
+        """Remove subscriptions added by :meth:`subscribe`."""
+        for event in events:
+            method = to_method(event)
+            count = self._subscriptions.get(method, 0)
+            if count == 0:
+                raise ValueError(f"Not subscribed to {method}")
+            if count == 1:
+                del self._subscriptions[method]
+            else:
+                self._subscriptions[method] = count - 1
+
+    @property
+    def subscriptions(self) -> typing.FrozenSet[str]:
+        """The CDP methods subscribed for the shared queue."""
+        return frozenset(self._subscriptions)
+
+    @property
+    def skipped_event_counts(self) -> typing.Dict[str, int]:
+        """Number of events discarded without parsing, by CDP method."""
+        return dict(self._skipped_events)
+
+    @property
+    def dropped_event_count(self) -> int:
+        """Number of events discarded because a queue was full."""
+        return self._dropped_events
+
+    @property
+    def coalesced_event_count(self) -> int:
+        """Number of queued events replaced by a newer event of the same method."""
+        return self._coalesced_events
+
+    def listener_count(self, event: EventSpec) -> int:
+        """Number of listener queues and waiters registered for an event type."""
+        method = to_method(event)
+        return (
+            len(self._listeners.get(method, ()))
+            + len(self._raw_listeners.get(method, ()))
+            + len(self._waiters.get(method, ()))
+        )
+
+    async def listen(
+        self,
+        *event_types: EventSpec,
+        raw: bool = False,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Iterate over events.
+
+        Without arguments, consume the shared queue. With event types, register
+        a private queue that receives only those types until the iterator is
+        closed. With ``raw``, the private queue receives message dicts instead
+        of parsed events, for every event if no types are given.
+        """
+        if not event_types and not raw:
+            async for event in self._listen_shared():
+                yield event
+            return
+
+        queue = self._new_queue()
+        registry = self._raw_listeners if raw else self._listeners
+        methods: typing.Set[typing.Optional[str]] = (
+            {to_method(event) for event in event_types} if event_types else {None}
+        )
+        for method in methods:
+            registry.setdefault(method, []).append(queue)
+        try:
+            while not self._closed:
+                event = await queue.get()
+                if event is _CLOSED:
+                    break
+                yield event
+        finally:
+            for method in methods:
+                listeners = registry.get(method)
+                if listeners is None:
+                    continue
+                listeners.remove(queue)
+                if not listeners:
+                    del registry[method]
+
+    async def _listen_shared(self) -> typing.AsyncIterator[typing.Any]:
+        while not self._closed:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                yield event
+            except asyncio.TimeoutError:
+                # Check if connection is still alive
+                if self._closed:
+                    break
+                continue
+
+    def get_nowait(self) -> typing.Optional[typing.Any]:
+        """Get an event from the shared queue, or ``None`` if it is empty."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    def expect(
+        self,
+        event_type: EventSpec,
+        predicate: typing.Optional[EventPredicate] = None,
+    ) -> asyncio.Future:
+        """
+        Register a one-shot waiter for the next matching event.
+
+        The waiter is registered immediately, so call this *before* sending
+        the command that triggers the event.
+        """
+        method = to_method(event_type)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        if self._closed:
+            future.cancel()
+            return future
+        waiter = (predicate, future)
+        self._waiters.setdefault(method, []).append(waiter)
+
+        def remove(_: asyncio.Future) -> None:
+            waiters = self._waiters.get(method)
+            if waiters is None:
+                return
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                return
+            if not waiters:
+                del self._waiters[method]
+
+        future.add_done_callback(remove)
+        return future
+
+    async def wait_for(
+        self,
+        event_type: EventSpec,
+        predicate: typing.Optional[EventPredicate] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Any:
+        """Wait for the next matching event."""
+        return await asyncio.wait_for(self.expect(event_type, predicate), timeout=timeout)
+
+    def close(self, exc: typing.Optional[BaseException] = None) -> None:
+        """
+        Stop the bus: wake up listeners and fail pending waiters.
+
+        Args:
+            exc: Exception to set on pending waiters; they are cancelled if
+                this is ``None``
+        """
+        self._closed = True
+        for listeners in itertools.chain(self._listeners.values(), self._raw_listeners.values()):
+            for queue in listeners:
+                # Make room so the consumer always sees the sentinel.
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(('', _CLOSED))
+        for waiters in list(self._waiters.values()):
+            for _, future in list(waiters):
+                if future.done():
+                    continue
+                if exc is None:
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
@@ -6,8 +6,7 @@
 # CDP domain: Extensions (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
@@ -26,10 +25,16 @@ class StorageArea(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StorageArea:
-        return cls(json)
+        try:
+            return _STORAGE_AREA_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_STORAGE_AREA_MEMBERS: typing.Dict[str, StorageArea] = {member.value: member for member in StorageArea}
+
+
+@slotted_dataclass
 class ExtensionInfo:
     r'''
     Detailed information about an extension.
@@ -69,6 +74,16 @@ class ExtensionInfo:
         )
 
 
+def _trigger_action_params(
+        id_: str,
+        target_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    params['targetId'] = target_id
+    return params
+
+
 def trigger_action(
         id_: str,
         target_id: str
@@ -81,16 +96,31 @@ def trigger_action(
     :param id_: Extension id.
     :param target_id: A tab target ID to trigger the default extension action on.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    params['targetId'] = target_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.triggerAction',
-        'params': params,
+        'params': _trigger_action_params(id_, target_id),
     }
     json = yield cmd_dict
 
 
+trigger_action_command = Command(
+    'Extensions.triggerAction',
+    trigger_action,
+    _trigger_action_params,
+)
+
+
+def _load_unpacked_params(
+        path: str,
+        enable_in_incognito: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['path'] = path
+    if enable_in_incognito is not None:
+        params['enableInIncognito'] = enable_in_incognito
+    return params
+
+
 def load_unpacked(
         path: str,
         enable_in_incognito: typing.Optional[bool] = None
@@ -106,18 +136,22 @@ def load_unpacked(
     :param enable_in_incognito: *(Optional)* Enable the extension in incognito
     :returns: Extension id.
     '''
-    params: T_JSON_DICT = dict()
-    params['path'] = path
-    if enable_in_incognito is not None:
-        params['enableInIncognito'] = enable_in_incognito
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.loadUnpacked',
-        'params': params,
+        'params': _load_unpacked_params(path, enable_in_incognito),
     }
     json = yield cmd_dict
     return str(json['id'])
 
 
+load_unpacked_command = Command(
+    'Extensions.loadUnpacked',
+    load_unpacked,
+    _load_unpacked_params,
+    lambda json: str(json['id']),
+)
+
+
 def get_extensions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[ExtensionInfo]]:
     r'''
     Gets a list of all unpacked extensions.
@@ -133,6 +167,22 @@ def get_extensions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Ext
     return [ExtensionInfo.from_json(i) for i in json['extensions']]
 
 
+get_extensions_command = Command(
+    'Extensions.getExtensions',
+    get_extensions,
+    None,
+    lambda json: [ExtensionInfo.from_json(i) for i in json['extensions']],
+)
+
+
+def _uninstall_params(
+        id_: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    return params
+
+
 def uninstall(
         id_: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -143,15 +193,33 @@ def uninstall(
 
     :param id_: Extension id.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.uninstall',
-        'params': params,
+        'params': _uninstall_params(id_),
     }
     json = yield cmd_dict
 
 
+uninstall_command = Command(
+    'Extensions.uninstall',
+    uninstall,
+    _uninstall_params,
+)
+
+
+def _get_storage_items_params(
+        id_: str,
+        storage_area: StorageArea,
+        keys: typing.Optional[typing.List[str]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    params['storageArea'] = storage_area.to_json()
+    if keys is not None:
+        params['keys'] = [i for i in keys]
+    return params
+
+
 def get_storage_items(
         id_: str,
         storage_area: StorageArea,
@@ -166,19 +234,34 @@ def get_storage_items(
     :param keys: *(Optional)* Keys to retrieve.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
-    if keys is not None:
-        params['keys'] = [i for i in keys]
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.getStorageItems',
-        'params': params,
+        'params': _get_storage_items_params(id_, storage_area, keys),
     }
     json = yield cmd_dict
     return dict(json['data'])
 
 
+get_storage_items_command = Command(
+    'Extensions.getStorageItems',
+    get_storage_items,
+    _get_storage_items_params,
+    lambda json: dict(json['data']),
+)
+
+
+def _remove_storage_items_params(
+        id_: str,
+        storage_area: StorageArea,
+        keys: typing.List[str]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    params['storageArea'] = storage_area.to_json()
+    params['keys'] = [i for i in keys]
+    return params
+
+
 def remove_storage_items(
         id_: str,
         storage_area: StorageArea,
@@ -191,17 +274,30 @@ def remove_storage_items(
     :param storage_area: StorageArea to remove data from.
     :param keys: Keys to remove.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
-    params['keys'] = [i for i in keys]
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.removeStorageItems',
-        'params': params,
+        'params': _remove_storage_items_params(id_, storage_area, keys),
     }
     json = yield cmd_dict
 
 
+remove_storage_items_command = Command(
+    'Extensions.removeStorageItems',
+    remove_storage_items,
+    _remove_storage_items_params,
+)
+
+
+def _clear_storage_items_params(
+        id_: str,
+        storage_area: StorageArea
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    params['storageArea'] = storage_area.to_json()
+    return params
+
+
 def clear_storage_items(
         id_: str,
         storage_area: StorageArea
@@ -212,16 +308,32 @@ def clear_storage_items(
     :param id_: ID of extension.
     :param storage_area: StorageArea to remove data from.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.clearStorageItems',
-        'params': params,
+        'params': _clear_storage_items_params(id_, storage_area),
     }
     json = yield cmd_dict
 
 
+clear_storage_items_command = Command(
+    'Extensions.clearStorageItems',
+    clear_storage_items,
+    _clear_storage_items_params,
+)
+
+
+def _set_storage_items_params(
+        id_: str,
+        storage_area: StorageArea,
+        values: dict
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['id'] = id_
+    params['storageArea'] = storage_area.to_json()
+    params['values'] = values
+    return params
+
+
 def set_storage_items(
         id_: str,
         storage_area: StorageArea,
@@ -235,12 +347,15 @@ def set_storage_items(
     :param storage_area: StorageArea to set data in.
     :param values: Values to set.
     '''
-    params: T_JSON_DICT = dict()
-    params['id'] = id_
-    params['storageArea'] = storage_area.to_json()
-    params['values'] = values
     cmd_dict: T_JSON_DICT = {
         'method': 'Extensions.setStorageItems',
-        'params': params,
+        'params': _set_storage_items_params(id_, storage_area, values),
     }
     json = yield cmd_dict
+
+
+set_storage_items_command = Command(
+    'Extensions.setStorageItems',
+    set_storage_items,
+    _set_storage_items_params,
+)
@@ -0,0 +1,276 @@
+"""
+CDP Connection Metrics
+
+Per-method instrumentation for ``CDPConnection``. Metrics are off by default;
+pass ``metrics=True`` (or a :class:`ConnectionMetrics` instance) to the
+connection to turn them on. When they are off, the connection does a single
+``is None`` check per message.
+
+Recorded per command method:
+
+- number of completed commands, errors and timeouts
+- bytes sent and received (characters for text frames)
+- time spent serializing requests and deserializing responses
+- a round trip latency histogram
+
+Recorded per event method:
+
+- number of events, bytes received and deserialization time
+- number of events parsed into objects and the time spent parsing them (events
+  nobody listens to are not parsed, see ``CDPConnection.subscribe``)
+
+:meth:`ConnectionMetrics.snapshot` returns everything as plain dicts.
+:class:`MetricsHook` subclasses receive every measurement as it is taken, to
+forward them to Prometheus, StatsD or similar.
+"""
+
+from __future__ import annotations
+import bisect
+import logging
+import typing
+
+
+logger = logging.getLogger(__name__)
+
+#: Default latency histogram bucket upper bounds, in seconds.
+DEFAULT_BUCKETS: typing.Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+class Histogram:
+    """A fixed-bucket histogram, like a Prometheus histogram."""
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        # One count per bound, plus one for values above the last bound.
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return ``count``, ``sum`` and cumulative ``buckets``, a list of
+        ``(upper_bound, count)`` pairs ending with ``float('inf')``.
+        """
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+class CommandStats:
+    """Totals for one command method."""
+
+    __slots__ = (
+        'count', 'errors', 'timeouts', 'bytes_sent', 'bytes_received',
+        'serialize_time', 'deserialize_time', 'latency',
+    )
+
+    def __init__(self, buckets: typing.Sequence[float]):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.serialize_time = 0.0
+        self.deserialize_time = 0.0
+        self.latency = Histogram(buckets)
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'serialize_time': self.serialize_time,
+            'deserialize_time': self.deserialize_time,
+            'latency': self.latency.snapshot(),
+        }
+
+
+class EventStats:
+    """Totals for one event method."""
+
+    __slots__ = ('count', 'bytes_received', 'deserialize_time', 'parsed', 'parse_time')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bytes_received = 0
+        self.deserialize_time = 0.0
+        self.parsed = 0
+        self.parse_time = 0.0
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        return {
+            'count': self.count,
+            'bytes_received': self.bytes_received,
+            'deserialize_time': self.deserialize_time,
+            'parsed': self.parsed,
+            'parse_time': self.parse_time,
+        }
+
+
+class MetricsHook:
+    """
+    Receives every measurement as it is recorded.
+
+    Override the methods you need; the defaults do nothing. Times are in
+    seconds. Exceptions raised by a hook are logged and otherwise ignored.
+
+    Example:
+        class PrometheusHook(MetricsHook):
+            def command_completed(self, method, latency, size, deserialize_time, error):
+                LATENCY.labels(method).observe(latency)
+                if error:
+                    ERRORS.labels(method).inc()
+
+        conn = CDPConnection(url, metrics=ConnectionMetrics(hooks=[PrometheusHook()]))
+    """
+
+    def command_sent(self, method: str, size: int, serialize_time: float) -> None:
+        """A request was serialized and sent."""
+
+    def command_completed(
+        self,
+        method: str,
+        latency: float,
+        size: int,
+        deserialize_time: float,
+        error: bool,
+    ) -> None:
+        """A response arrived; ``error`` is true for error responses."""
+
+    def command_timed_out(self, method: str, elapsed: float) -> None:
+        """A command timed out without a response."""
+
+    def event_received(self, method: str, size: int, deserialize_time: float) -> None:
+        """An event message arrived."""
+
+    def event_parsed(self, method: str, parse_time: float) -> None:
+        """An event was parsed into an event object."""
+
+
+class ConnectionMetrics(MetricsHook):
+    """
+    Collects per-method metrics for a connection and forwards them to hooks.
+
+    One instance may be shared by several connections to aggregate them.
+    """
+
+    def __init__(
+        self,
+        hooks: typing.Iterable[MetricsHook] = (),
+        buckets: typing.Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            hooks: Hooks that receive every measurement
+            buckets: Upper bounds of the latency histogram buckets, in seconds
+        """
+        self.hooks: typing.List[MetricsHook] = list(hooks)
+        self.buckets = tuple(sorted(buckets))
+        self.commands: typing.Dict[str, CommandStats] = {}
+        self.events: typing.Dict[str, EventStats] = {}
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        self.hooks.remove(hook)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self.commands.clear()
+        self.events.clear()
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]]:
+        """
+        Return all metrics as plain data.
+
+        Returns:
+            ``{'commands': {method: {...}}, 'events': {method: {...}}}``; see
+            :class:`CommandStats` and :class:`EventStats` for the fields
+        """
+        return {
+            'commands': {method: stats.snapshot() for method, stats in self.commands.items()},
+            'events': {method: stats.snapshot() for method, stats in self.events.items()},
+        }
+
+    def _command(self, method: str) -> CommandStats:
+        stats = self.commands.get(method)
+        if stats is None:
+            stats = self.commands[method] = CommandStats(self.buckets)
+        return stats
+
+    def _event(self, method: str) -> EventStats:
+        stats = self.events.get(method)
+        if stats is None:
+            stats = self.events[method] = EventStats()
+        return stats
+
+    def _notify(self, name: str, *args: typing.Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(*args)
+            except Exception:
+                logger.exception(f"Metrics hook {hook!r} failed in {name}")
+
+    def command_sent(self, method: str, size: int, serialize_time: float) -> None:
+        stats = self._command(method)
+        stats.bytes_sent += size
+        stats.serialize_time += serialize_time
+        if self.hooks:
+            self._notify('command_sent', method, size, serialize_time)
+
+    def command_completed(
+        self,
+        method: str,
+        latency: float,
+        size: int,
+        deserialize_time: float,
+        error: bool,
+    ) -> None:
+        stats = self._command(method)
+        stats.count += 1
+        if error:
+            stats.errors += 1
+        stats.bytes_received += size
+        stats.deserialize_time += deserialize_time
+        stats.latency.observe(latency)
+        if self.hooks:
+            self._notify('command_completed', method, latency, size, deserialize_time, error)
+
+    def command_timed_out(self, method: str, elapsed: float) -> None:
+        stats = self._command(method)
+        stats.count += 1
+        stats.errors += 1
+        stats.timeouts += 1
+        if self.hooks:
+            self._notify('command_timed_out', method, elapsed)
+
+    def event_received(self, method: str, size: int, deserialize_time: float) -> None:
+        stats = self._event(method)
+        stats.count += 1
+        stats.bytes_received += size
+        stats.deserialize_time += deserialize_time
+        if self.hooks:
+            self._notify('event_received', method, size, deserialize_time)
+
+    def event_parsed(self, method: str, parse_time: float) -> None:
+        stats = self._event(method)
+        stats.parsed += 1
+        stats.parse_time += parse_time
+        if self.hooks:
+            self._notify('event_parsed', method, parse_time)
@@ -0,0 +1,406 @@
+"""
+CDP Mock Server
+
+An in-process asyncio WebSocket server that speaks CDP well enough to
+load-test ``CDPConnection`` and ``browser_control`` without a browser. It is
+driven by the protocol schema the bindings are generated from
+(``browser_protocol.json`` and ``js_protocol.json``):
+
+- Every command in the schema is answered with a synthetic result that is
+  valid according to the schema. Enums get their first value, numbers ``1``,
+  strings the property name, and arrays a single element. Unknown commands
+  get the same error Chrome returns.
+- Responses can be delayed by a fixed ``latency``.
+- :meth:`MockCDPServer.emit` sends one event and :meth:`MockCDPServer.storm`
+  sends a stream of events at a given rate, e.g. 10,000
+  ``Network.requestWillBeSent`` per second.
+
+Example:
+    async with MockCDPServer(latency=0.002) as server:
+        async with CDPConnection(server.url) as conn:
+            await conn.execute(page.navigate(url="https://example.com"))
+            storm = asyncio.create_task(
+                server.storm("Network.requestWillBeSent", rate=10_000, duration=1.0))
+            async for event in conn.listen(network.RequestWillBeSent):
+                ...
+
+It can also run as a separate process::
+
+    python -m cdp.mock_server --port 9222 --latency 0.001
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import collections
+import inspect
+import json
+import logging
+import pathlib
+import typing
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+from cdp.util import T_JSON_DICT
+
+
+logger = logging.getLogger(__name__)
+
+#: Where the protocol schema lives in a source checkout. Installed packages
+#: don't include it, so pass the paths to :meth:`SchemaValues.load` instead.
+DEFAULT_PROTOCOL_PATHS = tuple(
+    pathlib.Path(__file__).resolve().parent.parent / 'generator' / name
+    for name in ('browser_protocol.json', 'js_protocol.json')
+)
+
+CommandHandler = typing.Callable[
+    [T_JSON_DICT], typing.Union[T_JSON_DICT, typing.Awaitable[T_JSON_DICT]]
+]
+
+
+class SchemaValues:
+    """Builds synthetic command results and event parameters from the schema."""
+
+    def __init__(
+        self,
+        domains: typing.Iterable[T_JSON_DICT],
+        include_optional: bool = False,
+        max_depth: int = 4,
+    ):
+        """
+        Args:
+            domains: Domain definitions from the protocol JSON files
+            include_optional: Also fill in optional properties, for larger
+                and more realistic payloads
+            max_depth: Nesting depth after which arrays are left empty and
+                optional properties are omitted, which breaks recursive
+                types such as ``DOM.Node``
+        """
+        self.include_optional = include_optional
+        self.max_depth = max_depth
+        self.types: typing.Dict[str, T_JSON_DICT] = {}
+        self.commands: typing.Dict[str, T_JSON_DICT] = {}
+        self.events: typing.Dict[str, T_JSON_DICT] = {}
+        for domain in domains:
+            name = domain['domain']
+            for type_ in domain.get('types', ()):
+                self.types[f"{name}.{type_['id']}"] = type_
+            for command in domain.get('commands', ()):
+                self.commands[f"{name}.{command['name']}"] = command
+            for event in domain.get('events', ()):
+                self.events[f"{name}.{event['name']}"] = event
+
+    @classmethod
+    def load(
+        cls,
+        paths: typing.Sequence[typing.Union[str, pathlib.Path]] = DEFAULT_PROTOCOL_PATHS,
+        **kwargs: typing.Any,
+    ) -> SchemaValues:
+        """
+        Read the protocol JSON files.
+
+        Args:
+            paths: ``browser_protocol.json`` and ``js_protocol.json``; by
+                default the copies in a source checkout's ``generator/``
+            **kwargs: Passed on to the constructor
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+        """
+        missing = [str(path) for path in paths if not pathlib.Path(path).is_file()]
+        if missing:
+            raise FileNotFoundError(
+                f"CDP protocol schema not found: {', '.join(missing)}. The "
+                "default paths only exist in a source checkout; pass the paths "
+                "of browser_protocol.json and js_protocol.json instead."
+            )
+        domains: typing.List[T_JSON_DICT] = []
+        for path in paths:
+            with open(path) as f:
+                domains.extend(json.load(f)['domains'])
+        return cls(domains, **kwargs)
+
+    def command_result(self, method: str) -> T_JSON_DICT:
+        """Return a synthetic result for a command. Raises ``KeyError`` if unknown."""
+        command = self.commands[method]
+        domain = method.split('.')[0]
+        return self._object(command.get('returns', ()), domain, 0)
+
+    def event_params(self, method: str) -> T_JSON_DICT:
+        """Return synthetic parameters for an event. Raises ``KeyError`` if unknown."""
+        event = self.events[method]
+        domain = method.split('.')[0]
+        return self._object(event.get('parameters', ()), domain, 0)
+
+    def type_value(self, name: str) -> typing.Any:
+        """Return a synthetic value of a type, e.g. ``"Network.Response"``."""
+        return self._value({'$ref': name}, name.split('.')[0], 0)
+
+    def _object(
+        self,
+        properties: typing.Iterable[T_JSON_DICT],
+        domain: str,
+        depth: int,
+    ) -> T_JSON_DICT:
+        result = {}
+        for prop in properties:
+            if prop.get('optional') and not (self.include_optional and depth < self.max_depth):
+                continue
+            result[prop['name']] = self._value(prop, domain, depth + 1)
+        return result
+
+    def _value(self, spec: T_JSON_DICT, domain: str, depth: int) -> typing.Any:
+        ref = spec.get('$ref')
+        if ref is not None:
+            if '.' not in ref:
+                ref = f'{domain}.{ref}'
+            return self._value(self.types[ref], ref.split('.')[0], depth)
+        if 'enum' in spec:
+            return spec['enum'][0]
+        kind = spec.get('type')
+        if kind == 'object':
+            return self._object(spec.get('properties', ()), domain, depth)
+        if kind == 'array':
+            if depth >= self.max_depth:
+                return []
+            return [self._value(spec['items'], domain, depth + 1)]
+        if kind == 'string':
+            return spec.get('name') or spec.get('id') or 'string'
+        if kind == 'integer':
+            return 1
+        if kind == 'number':
+            return 1.0
+        if kind == 'boolean':
+            return False
+        return None
+
+
+class MockCDPServer:
+    """
+    A CDP WebSocket endpoint with synthetic, schema-derived responses.
+
+    Every connected client is answered independently. Events from
+    :meth:`emit` and :meth:`storm` go to all connected clients.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        schema: typing.Optional[SchemaValues] = None,
+    ):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on; ``0`` picks a free one (see :attr:`url`)
+            latency: Seconds to wait before sending each response
+            schema: Source of synthetic values; by default the protocol
+                files of the source checkout are loaded
+
+        Raises:
+            ImportError: If websockets is not installed
+            FileNotFoundError: If ``schema`` is omitted outside a source
+                checkout
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError(
+                "websockets library is required for MockCDPServer. "
+                "Install it with: pip install websockets"
+            )
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.schema = schema if schema is not None else SchemaValues.load()
+        #: Number of requests received, by method.
+        self.requests: typing.Counter[str] = collections.Counter()
+        self._handlers: typing.Dict[str, CommandHandler] = {}
+        self._results: typing.Dict[str, T_JSON_DICT] = {}
+        self._clients: typing.Set[typing.Any] = set()
+        self._delayed: typing.Set[asyncio.Task] = set()
+        self._server: typing.Any = None
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL of the running server."""
+        return f'ws://{self.host}:{self.port}'
+
+    async def start(self) -> None:
+        self._server = await websockets.serve(  # type: ignore
+            self._serve, self.host, self.port, max_size=None
+        )
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+
+    async def stop(self) -> None:
+        for task in list(self._delayed):
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> MockCDPServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def handle(self, method: str, handler: CommandHandler) -> None:
+        """
+        Answer a command with a custom handler instead of a synthetic result.
+
+        The handler receives the request's ``params`` and returns the result,
+        or raises an exception to send an error response.
+        """
+        self._handlers[method] = handler
+
+    async def emit(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT] = None,
+        session_id: typing.Optional[str] = None,
+    ) -> None:
+        """Send one event to every client, with synthetic params by default."""
+        await self._broadcast(self._event_frame(method, params, session_id))
+
+    async def storm(
+        self,
+        method: str,
+        rate: typing.Optional[float] = 10_000,
+        duration: typing.Optional[float] = 1.0,
+        count: typing.Optional[int] = None,
+        params: typing.Optional[T_JSON_DICT] = None,
+    ) -> int:
+        """
+        Send a stream of identical events to every client.
+
+        Args:
+            method: Event method, e.g. ``"Network.requestWillBeSent"``
+            rate: Events per second, or ``None`` for as fast as possible
+            duration: How long to send for, in seconds
+            count: Number of events to send; overrides ``duration``
+            params: Event parameters; synthetic by default
+
+        Returns:
+            The number of events sent
+        """
+        if count is None:
+            if rate is None or duration is None:
+                raise ValueError("count is required without both rate and duration")
+            count = int(rate * duration)
+        frame = self._event_frame(method, params, None)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        while sent < count:
+            if rate is None:
+                due = count
+            else:
+                due = min(count, int((loop.time() - start) * rate) + 1)
+            for _ in range(due - sent):
+                await self._broadcast(frame)
+            sent = due
+            # Let clients and the pacing clock make progress.
+            await asyncio.sleep(0 if rate is None else 0.001)
+        return sent
+
+    def _event_frame(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT],
+        session_id: typing.Optional[str],
+    ) -> str:
+        if params is None:
+            params = self.schema.event_params(method)
+        message: T_JSON_DICT = {'method': method, 'params': params}
+        if session_id is not None:
+            message['sessionId'] = session_id
+        return json.dumps(message)
+
+    async def _broadcast(self, frame: str) -> None:
+        for client in list(self._clients):
+            try:
+                await client.send(frame)
+            except websockets.ConnectionClosed:  # type: ignore
+                self._clients.discard(client)
+
+    async def _serve(self, ws: typing.Any, *_: typing.Any) -> None:
+        self._clients.add(ws)
+        try:
+            async for message in ws:
+                request = json.loads(message)
+                self.requests[request.get('method')] += 1
+                response = await self._respond(request)
+                if self.latency:
+                    task = asyncio.create_task(self._send_later(ws, response))
+                    self._delayed.add(task)
+                    task.add_done_callback(self._delayed.discard)
+                else:
+                    await ws.send(response)
+        except websockets.ConnectionClosed:  # type: ignore
+            pass
+        finally:
+            self._clients.discard(ws)
+
+    async def _respond(self, request: T_JSON_DICT) -> str:
+        method = request.get('method', '')
+        response: T_JSON_DICT = {'id': request.get('id')}
+        if 'sessionId' in request:
+            response['sessionId'] = request['sessionId']
+        if method not in self._handlers and method not in self.schema.commands:
+            response['error'] = {'code': -32601, 'message': f"'{method}' wasn't found"}
+            return json.dumps(response)
+        try:
+            response['result'] = await self._result(method, request.get('params', {}))
+        except Exception as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+        return json.dumps(response)
+
+    async def _result(self, method: str, params: T_JSON_DICT) -> T_JSON_DICT:
+        handler = self._handlers.get(method)
+        if handler is not None:
+            handled = handler(params)
+            if inspect.isawaitable(handled):
+                return await handled
+            return typing.cast(T_JSON_DICT, handled)
+        result = self._results.get(method)
+        if result is None:
+            result = self._results[method] = self.schema.command_result(method)
+        return result
+
+    async def _send_later(self, ws: typing.Any, response: str) -> None:
+        await asyncio.sleep(self.latency)
+        try:
+            await ws.send(response)
+        except websockets.ConnectionClosed:  # type: ignore
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=9222, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0,
+        help='Seconds to wait before each response')
+    parser.add_argument('--include-optional', action='store_true',
+        help='Fill in optional properties of results and events')
+    parser.add_argument('--protocol', nargs='+', default=DEFAULT_PROTOCOL_PATHS,
+        metavar='PATH', help='Protocol JSON files (default: those in generator/)')
+    args = parser.parse_args()
+
+    async def serve() -> None:
+        schema = SchemaValues.load(args.protocol, include_optional=args.include_optional)
+        async with MockCDPServer(args.host, args.port, args.latency, schema) as server:
+            print(f"Listening on {server.url}", flush=True)
+            await asyncio.Future()
+
+    asyncio.run(serve())
+
+
+if __name__ == '__main__':
+    main()
@@ -6,17 +6,19 @@
 # CDP domain: Network
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import debugger
-from . import emulation
-from . import io
-from . import page
-from . import runtime
-from . import security
+if typing.TYPE_CHECKING:
+    from . import debugger
+    from . import emulation
+    from . import io
+    from . import page
+    from . import runtime
+    from . import security
+else:
+    lazy_import(globals(), 'debugger', 'emulation', 'io', 'page', 'runtime', 'security')
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -49,7 +51,13 @@ class ResourceType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourceType:
-        return cls(json)
+        try:
+            return _RESOURCE_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_RESOURCE_TYPE_MEMBERS: typing.Dict[str, ResourceType] = {member.value: member for member in ResourceType}
 
 
 class LoaderId(str):
@@ -123,7 +131,13 @@ class ErrorReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ErrorReason:
-        return cls(json)
+        try:
+            return _ERROR_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_ERROR_REASON_MEMBERS: typing.Dict[str, ErrorReason] = {member.value: member for member in ErrorReason}
 
 
 class TimeSinceEpoch(float):
@@ -190,7 +204,13 @@ class ConnectionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionType:
-        return cls(json)
+        try:
+            return _CONNECTION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CONNECTION_TYPE_MEMBERS: typing.Dict[str, ConnectionType] = {member.value: member for member in ConnectionType}
 
 
 class CookieSameSite(enum.Enum):
@@ -207,7 +227,13 @@ class CookieSameSite(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSameSite:
-        return cls(json)
+        try:
+            return _COOKIE_SAME_SITE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_SAME_SITE_MEMBERS: typing.Dict[str, CookieSameSite] = {member.value: member for member in CookieSameSite}
 
 
 class CookiePriority(enum.Enum):
@@ -224,7 +250,13 @@ class CookiePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookiePriority:
-        return cls(json)
+        try:
+            return _COOKIE_PRIORITY_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_PRIORITY_MEMBERS: typing.Dict[str, CookiePriority] = {member.value: member for member in CookiePriority}
 
 
 class CookieSourceScheme(enum.Enum):
@@ -242,10 +274,16 @@ class CookieSourceScheme(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieSourceScheme:
-        return cls(json)
+        try:
+            return _COOKIE_SOURCE_SCHEME_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_COOKIE_SOURCE_SCHEME_MEMBERS: typing.Dict[str, CookieSourceScheme] = {member.value: member for member in CookieSourceScheme}
+
+
+@slotted_dataclass
 class ResourceTiming:
     r'''
     Timing information for the request.
@@ -383,7 +421,13 @@ class ResourcePriority(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResourcePriority:
-        return cls(json)
+        try:
+            return _RESOURCE_PRIORITY_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_RESOURCE_PRIORITY_MEMBERS: typing.Dict[str, ResourcePriority] = {member.value: member for member in ResourcePriority}
 
 
 class RenderBlockingBehavior(enum.Enum):
@@ -401,10 +445,16 @@ class RenderBlockingBehavior(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> RenderBlockingBehavior:
-        return cls(json)
+        try:
+            return _RENDER_BLOCKING_BEHAVIOR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_RENDER_BLOCKING_BEHAVIOR_MEMBERS: typing.Dict[str, RenderBlockingBehavior] = {member.value: member for member in RenderBlockingBehavior}
 
 
-@dataclass
+@slotted_dataclass
 class PostDataEntry:
     r'''
     Post data entry for HTTP request
@@ -424,7 +474,7 @@ class PostDataEntry:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Request:
     r'''
     HTTP request data.
@@ -521,7 +571,7 @@ class Request:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SignedCertificateTimestamp:
     r'''
     Details of a signed certificate timestamp (SCT).
@@ -577,7 +627,7 @@ class SignedCertificateTimestamp:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SecurityDetails:
     r'''
     Security details about a request.
@@ -685,7 +735,13 @@ class CertificateTransparencyCompliance(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CertificateTransparencyCompliance:
-        return cls(json)
+        try:
+            return _CERTIFICATE_TRANSPARENCY_COMPLIANCE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CERTIFICATE_TRANSPARENCY_COMPLIANCE_MEMBERS: typing.Dict[str, CertificateTransparencyCompliance] = {member.value: member for member in CertificateTransparencyCompliance}
 
 
 class BlockedReason(enum.Enum):
@@ -714,7 +770,13 @@ class BlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BlockedReason:
-        return cls(json)
+        try:
+            return _BLOCKED_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_BLOCKED_REASON_MEMBERS: typing.Dict[str, BlockedReason] = {member.value: member for member in BlockedReason}
 
 
 class CorsError(enum.Enum):
@@ -755,10 +817,16 @@ class CorsError(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CorsError:
-        return cls(json)
+        try:
+            return _CORS_ERROR_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_CORS_ERROR_MEMBERS: typing.Dict[str, CorsError] = {member.value: member for member in CorsError}
 
-@dataclass
+
+@slotted_dataclass
 class CorsErrorStatus:
     cors_error: CorsError
 
@@ -792,10 +860,16 @@ class ServiceWorkerResponseSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerResponseSource:
-        return cls(json)
+        try:
+            return _SERVICE_WORKER_RESPONSE_SOURCE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SERVICE_WORKER_RESPONSE_SOURCE_MEMBERS: typing.Dict[str, ServiceWorkerResponseSource] = {member.value: member for member in ServiceWorkerResponseSource}
 
 
-@dataclass
+@slotted_dataclass
 class TrustTokenParams:
     r'''
     Determines what type of Trust Token operation is executed and
@@ -839,7 +913,13 @@ class TrustTokenOperationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TrustTokenOperationType:
-        return cls(json)
+        try:
+            return _TRUST_TOKEN_OPERATION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_TRUST_TOKEN_OPERATION_TYPE_MEMBERS: typing.Dict[str, TrustTokenOperationType] = {member.value: member for member in TrustTokenOperationType}
 
 
 class AlternateProtocolUsage(enum.Enum):
@@ -860,7 +940,13 @@ class AlternateProtocolUsage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AlternateProtocolUsage:
-        return cls(json)
+        try:
+            return _ALTERNATE_PROTOCOL_USAGE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_ALTERNATE_PROTOCOL_USAGE_MEMBERS: typing.Dict[str, AlternateProtocolUsage] = {member.value: member for member in AlternateProtocolUsage}
 
 
 class ServiceWorkerRouterSource(enum.Enum):
@@ -878,10 +964,16 @@ class ServiceWorkerRouterSource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ServiceWorkerRouterSource:
-        return cls(json)
+        try:
+            return _SERVICE_WORKER_ROUTER_SOURCE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_SERVICE_WORKER_ROUTER_SOURCE_MEMBERS: typing.Dict[str, ServiceWorkerRouterSource] = {member.value: member for member in ServiceWorkerRouterSource}
 
-@dataclass
+
+@slotted_dataclass
 class ServiceWorkerRouterInfo:
     #: ID of the rule matched. If there is a matched rule, this field will
     #: be set, otherwiser no value will be set.
@@ -913,7 +1005,7 @@ class ServiceWorkerRouterInfo:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Response:
     r'''
     HTTP response data.
@@ -1083,7 +1175,7 @@ class Response:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WebSocketRequest:
     r'''
     WebSocket request data.
@@ -1103,7 +1195,7 @@ class WebSocketRequest:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WebSocketResponse:
     r'''
     WebSocket response data.
@@ -1151,7 +1243,7 @@ class WebSocketResponse:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WebSocketFrame:
     r'''
     WebSocket message data. This represents an entire WebSocket message, not just a fragmented frame as the name suggests.
@@ -1183,7 +1275,7 @@ class WebSocketFrame:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CachedResource:
     r'''
     Information about the cached resource.
@@ -1219,7 +1311,7 @@ class CachedResource:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Initiator:
     r'''
     Information about the request initiator.
@@ -1272,7 +1364,7 @@ class Initiator:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CookiePartitionKey:
     r'''
     cookiePartitionKey object
@@ -1299,7 +1391,7 @@ class CookiePartitionKey:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Cookie:
     r'''
     Cookie object
@@ -1427,7 +1519,13 @@ class SetCookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SetCookieBlockedReason:
-        return cls(json)
+        try:
+            return _SET_COOKIE_BLOCKED_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SET_COOKIE_BLOCKED_REASON_MEMBERS: typing.Dict[str, SetCookieBlockedReason] = {member.value: member for member in SetCookieBlockedReason}
 
 
 class CookieBlockedReason(enum.Enum):
@@ -1458,7 +1556,13 @@ class CookieBlockedReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieBlockedReason:
-        return cls(json)
+        try:
+            return _COOKIE_BLOCKED_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_COOKIE_BLOCKED_REASON_MEMBERS: typing.Dict[str, CookieBlockedReason] = {member.value: member for member in CookieBlockedReason}
 
 
 class CookieExemptionReason(enum.Enum):
@@ -1482,10 +1586,16 @@ class CookieExemptionReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CookieExemptionReason:
-        return cls(json)
+        try:
+            return _COOKIE_EXEMPTION_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_COOKIE_EXEMPTION_REASON_MEMBERS: typing.Dict[str, CookieExemptionReason] = {member.value: member for member in CookieExemptionReason}
+
+
+@slotted_dataclass
 class BlockedSetCookieWithReason:
     r'''
     A cookie which was not stored from a response with the corresponding reason.
@@ -1519,7 +1629,7 @@ class BlockedSetCookieWithReason:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ExemptedSetCookieWithReason:
     r'''
     A cookie should have been blocked by 3PCD but is exempted and stored from a response with the
@@ -1550,7 +1660,7 @@ class ExemptedSetCookieWithReason:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AssociatedCookie:
     r'''
     A cookie associated with the request which may or may not be sent with it.
@@ -1583,7 +1693,7 @@ class AssociatedCookie:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CookieParam:
     r'''
     Cookie parameter object
@@ -1677,7 +1787,7 @@ class CookieParam:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AuthChallenge:
     r'''
     Authorization challenge for HTTP status code 401 or 407.
@@ -1713,7 +1823,7 @@ class AuthChallenge:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AuthChallengeResponse:
     r'''
     Response to an AuthChallenge.
@@ -1762,10 +1872,16 @@ class InterceptionStage(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InterceptionStage:
-        return cls(json)
+        try:
+            return _INTERCEPTION_STAGE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_INTERCEPTION_STAGE_MEMBERS: typing.Dict[str, InterceptionStage] = {member.value: member for member in InterceptionStage}
 
-@dataclass
+
+@slotted_dataclass
 class RequestPattern:
     r'''
     Request pattern for interception.
@@ -1799,7 +1915,7 @@ class RequestPattern:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SignedExchangeSignature:
     r'''
     Information about a signed exchange signature.
@@ -1863,7 +1979,7 @@ class SignedExchangeSignature:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SignedExchangeHeader:
     r'''
     Information about a signed exchange header.
@@ -1920,10 +2036,16 @@ class SignedExchangeErrorField(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SignedExchangeErrorField:
-        return cls(json)
+        try:
+            return _SIGNED_EXCHANGE_ERROR_FIELD_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SIGNED_EXCHANGE_ERROR_FIELD_MEMBERS: typing.Dict[str, SignedExchangeErrorField] = {member.value: member for member in SignedExchangeErrorField}
 
 
-@dataclass
+@slotted_dataclass
 class SignedExchangeError:
     r'''
     Information about a signed exchange response.
@@ -1955,7 +2077,7 @@ class SignedExchangeError:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SignedExchangeInfo:
     r'''
     Information about a signed exchange response.
@@ -2013,10 +2135,16 @@ class ContentEncoding(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentEncoding:
-        return cls(json)
+        try:
+            return _CONTENT_ENCODING_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_CONTENT_ENCODING_MEMBERS: typing.Dict[str, ContentEncoding] = {member.value: member for member in ContentEncoding}
 
-@dataclass
+
+@slotted_dataclass
 class NetworkConditions:
     #: Only matching requests will be affected by these conditions. Patterns use the URLPattern constructor string
     #: syntax (https://urlpattern.spec.whatwg.org/) and must be absolute. If the pattern is empty, all requests are
@@ -2074,7 +2202,7 @@ class NetworkConditions:
         )
 
 
-@dataclass
+@slotted_dataclass
 class BlockPattern:
     #: URL pattern to match. Patterns use the URLPattern constructor string syntax
     #: (https://urlpattern.spec.whatwg.org/) and must be absolute. Example: ``*://*:*/*.css``.
@@ -2107,10 +2235,16 @@ class DirectSocketDnsQueryType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DirectSocketDnsQueryType:
-        return cls(json)
+        try:
+            return _DIRECT_SOCKET_DNS_QUERY_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_DIRECT_SOCKET_DNS_QUERY_TYPE_MEMBERS: typing.Dict[str, DirectSocketDnsQueryType] = {member.value: member for member in DirectSocketDnsQueryType}
+
+
+@slotted_dataclass
 class DirectTCPSocketOptions:
     #: TCP_NODELAY option
     no_delay: bool
@@ -2150,7 +2284,7 @@ class DirectTCPSocketOptions:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketOptions:
     remote_addr: typing.Optional[str] = None
 
@@ -2217,7 +2351,7 @@ class DirectUDPSocketOptions:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DirectUDPMessage:
     data: str
 
@@ -2258,7 +2392,13 @@ class LocalNetworkAccessRequestPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> LocalNetworkAccessRequestPolicy:
-        return cls(json)
+        try:
+            return _LOCAL_NETWORK_ACCESS_REQUEST_POLICY_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_LOCAL_NETWORK_ACCESS_REQUEST_POLICY_MEMBERS: typing.Dict[str, LocalNetworkAccessRequestPolicy] = {member.value: member for member in LocalNetworkAccessRequestPolicy}
 
 
 class IPAddressSpace(enum.Enum):
@@ -2272,10 +2412,16 @@ class IPAddressSpace(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> IPAddressSpace:
-        return cls(json)
+        try:
+            return _IP_ADDRESS_SPACE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_IP_ADDRESS_SPACE_MEMBERS: typing.Dict[str, IPAddressSpace] = {member.value: member for member in IPAddressSpace}
 
 
-@dataclass
+@slotted_dataclass
 class ConnectTiming:
     #: Timing's requestTime is a baseline in seconds, while the other numbers are ticks in
     #: milliseconds relatively to this requestTime. Matches ResourceTiming's requestTime for
@@ -2294,7 +2440,7 @@ class ConnectTiming:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ClientSecurityState:
     initiator_is_secure_context: bool
 
@@ -2318,7 +2464,7 @@ class ClientSecurityState:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AdScriptIdentifier:
     r'''
     Identifies the script on the stack that caused a resource or element to be
@@ -2351,7 +2497,7 @@ class AdScriptIdentifier:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AdAncestry:
     r'''
     Encapsulates the script ancestry and the root script filter list rule that
@@ -2396,10 +2542,16 @@ class CrossOriginOpenerPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginOpenerPolicyValue:
-        return cls(json)
+        try:
+            return _CROSS_ORIGIN_OPENER_POLICY_VALUE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_CROSS_ORIGIN_OPENER_POLICY_VALUE_MEMBERS: typing.Dict[str, CrossOriginOpenerPolicyValue] = {member.value: member for member in CrossOriginOpenerPolicyValue}
 
-@dataclass
+
+@slotted_dataclass
 class CrossOriginOpenerPolicyStatus:
     value: CrossOriginOpenerPolicyValue
 
@@ -2439,10 +2591,16 @@ class CrossOriginEmbedderPolicyValue(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginEmbedderPolicyValue:
-        return cls(json)
+        try:
+            return _CROSS_ORIGIN_EMBEDDER_POLICY_VALUE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_CROSS_ORIGIN_EMBEDDER_POLICY_VALUE_MEMBERS: typing.Dict[str, CrossOriginEmbedderPolicyValue] = {member.value: member for member in CrossOriginEmbedderPolicyValue}
+
+
+@slotted_dataclass
 class CrossOriginEmbedderPolicyStatus:
     value: CrossOriginEmbedderPolicyValue
 
@@ -2481,10 +2639,16 @@ class ContentSecurityPolicySource(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContentSecurityPolicySource:
-        return cls(json)
+        try:
+            return _CONTENT_SECURITY_POLICY_SOURCE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_CONTENT_SECURITY_POLICY_SOURCE_MEMBERS: typing.Dict[str, ContentSecurityPolicySource] = {member.value: member for member in ContentSecurityPolicySource}
 
-@dataclass
+
+@slotted_dataclass
 class ContentSecurityPolicyStatus:
     effective_directives: str
 
@@ -2508,7 +2672,7 @@ class ContentSecurityPolicyStatus:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SecurityIsolationStatus:
     coop: typing.Optional[CrossOriginOpenerPolicyStatus] = None
 
@@ -2549,7 +2713,13 @@ class ReportStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReportStatus:
-        return cls(json)
+        try:
+            return _REPORT_STATUS_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_REPORT_STATUS_MEMBERS: typing.Dict[str, ReportStatus] = {member.value: member for member in ReportStatus}
 
 
 class ReportId(str):
@@ -2564,7 +2734,7 @@ class ReportId(str):
         return 'ReportId({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class ReportingApiReport:
     r'''
     An object representing a report generated by the Reporting API.
@@ -2621,7 +2791,7 @@ class ReportingApiReport:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ReportingApiEndpoint:
     #: The URL of the endpoint to which reports may be delivered.
     url: str
@@ -2643,7 +2813,7 @@ class ReportingApiEndpoint:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionKey:
     r'''
     Unique identifier for a device bound session.
@@ -2668,7 +2838,7 @@ class DeviceBoundSessionKey:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionWithUsage:
     r'''
     How a device bound session was used during a request.
@@ -2693,7 +2863,7 @@ class DeviceBoundSessionWithUsage:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionCookieCraving:
     r'''
     A device bound session's cookie craving.
@@ -2739,7 +2909,7 @@ class DeviceBoundSessionCookieCraving:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionUrlRule:
     r'''
     A device bound session's inclusion URL rule.
@@ -2769,7 +2939,7 @@ class DeviceBoundSessionUrlRule:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionInclusionRules:
     r'''
     A device bound session's inclusion rules.
@@ -2801,7 +2971,7 @@ class DeviceBoundSessionInclusionRules:
         )
 
 
-@dataclass
+@slotted_dataclass
 class DeviceBoundSession:
     r'''
     A device bound session.
@@ -2945,10 +3115,16 @@ class DeviceBoundSessionFetchResult(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DeviceBoundSessionFetchResult:
-        return cls(json)
+        try:
+            return _DEVICE_BOUND_SESSION_FETCH_RESULT_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_DEVICE_BOUND_SESSION_FETCH_RESULT_MEMBERS: typing.Dict[str, DeviceBoundSessionFetchResult] = {member.value: member for member in DeviceBoundSessionFetchResult}
 
-@dataclass
+
+@slotted_dataclass
 class DeviceBoundSessionFailedRequest:
     r'''
     Details about a failed device bound session network request.
@@ -2988,7 +3164,7 @@ class DeviceBoundSessionFailedRequest:
         )
 
 
-@dataclass
+@slotted_dataclass
 class CreationEventDetails:
     r'''
     Session event details specific to creation.
@@ -3022,7 +3198,7 @@ class CreationEventDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class RefreshEventDetails:
     r'''
     Session event details specific to refresh.
@@ -3067,7 +3243,7 @@ class RefreshEventDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class TerminationEventDetails:
     r'''
     Session event details specific to termination.
@@ -3087,7 +3263,7 @@ class TerminationEventDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ChallengeEventDetails:
     r'''
     Session event details specific to challenges.
@@ -3112,7 +3288,7 @@ class ChallengeEventDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class LoadNetworkResourcePageResult:
     r'''
     An object providing the result of a network resource load.
@@ -3159,7 +3335,7 @@ class LoadNetworkResourcePageResult:
         )
 
 
-@dataclass
+@slotted_dataclass
 class LoadNetworkResourceOptions:
     r'''
     An options object that may be extended later to better support CORS,
@@ -3183,6 +3359,14 @@ class LoadNetworkResourceOptions:
         )
 
 
+def _set_accepted_encodings_params(
+        encodings: typing.List[ContentEncoding]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['encodings'] = [i.to_json() for i in encodings]
+    return params
+
+
 def set_accepted_encodings(
         encodings: typing.List[ContentEncoding]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3193,15 +3377,20 @@ def set_accepted_encodings(
 
     :param encodings: List of accepted content encodings.
     '''
-    params: T_JSON_DICT = dict()
-    params['encodings'] = [i.to_json() for i in encodings]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setAcceptedEncodings',
-        'params': params,
+        'params': _set_accepted_encodings_params(encodings),
     }
     json = yield cmd_dict
 
 
+set_accepted_encodings_command = Command(
+    'Network.setAcceptedEncodings',
+    set_accepted_encodings,
+    _set_accepted_encodings_params,
+)
+
+
 def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears accepted encodings set by setAcceptedEncodings
@@ -3214,6 +3403,9 @@ def clear_accepted_encodings_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
     json = yield cmd_dict
 
 
+clear_accepted_encodings_override_command = Command('Network.clearAcceptedEncodingsOverride', clear_accepted_encodings_override)
+
+
 @deprecated(version="1.3")
 def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     r'''
@@ -3230,6 +3422,15 @@ def can_clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     return bool(json['result'])
 
 
+can_clear_browser_cache_command = Command(
+    'Network.canClearBrowserCache',
+    can_clear_browser_cache,
+    None,
+    lambda json: bool(json['result']),
+    deprecated='1.3',
+)
+
+
 @deprecated(version="1.3")
 def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     r'''
@@ -3246,6 +3447,15 @@ def can_clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool
     return bool(json['result'])
 
 
+can_clear_browser_cookies_command = Command(
+    'Network.canClearBrowserCookies',
+    can_clear_browser_cookies,
+    None,
+    lambda json: bool(json['result']),
+    deprecated='1.3',
+)
+
+
 @deprecated(version="1.3")
 def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
     r'''
@@ -3262,6 +3472,15 @@ def can_emulate_network_conditions() -> typing.Generator[T_JSON_DICT,T_JSON_DICT
     return bool(json['result'])
 
 
+can_emulate_network_conditions_command = Command(
+    'Network.canEmulateNetworkConditions',
+    can_emulate_network_conditions,
+    None,
+    lambda json: bool(json['result']),
+    deprecated='1.3',
+)
+
+
 def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears browser cache.
@@ -3272,6 +3491,9 @@ def clear_browser_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+clear_browser_cache_command = Command('Network.clearBrowserCache', clear_browser_cache)
+
+
 def clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears browser cookies.
@@ -3282,6 +3504,38 @@ def clear_browser_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+clear_browser_cookies_command = Command('Network.clearBrowserCookies', clear_browser_cookies)
+
+
+def _continue_intercepted_request_params(
+        interception_id: InterceptionId,
+        error_reason: typing.Optional[ErrorReason] = None,
+        raw_response: typing.Optional[str] = None,
+        url: typing.Optional[str] = None,
+        method: typing.Optional[str] = None,
+        post_data: typing.Optional[str] = None,
+        headers: typing.Optional[Headers] = None,
+        auth_challenge_response: typing.Optional[AuthChallengeResponse] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['interceptionId'] = interception_id.to_json()
+    if error_reason is not None:
+        params['errorReason'] = error_reason.to_json()
+    if raw_response is not None:
+        params['rawResponse'] = raw_response
+    if url is not None:
+        params['url'] = url
+    if method is not None:
+        params['method'] = method
+    if post_data is not None:
+        params['postData'] = post_data
+    if headers is not None:
+        params['headers'] = headers.to_json()
+    if auth_challenge_response is not None:
+        params['authChallengeResponse'] = auth_challenge_response.to_json()
+    return params
+
+
 @deprecated(version="1.3")
 def continue_intercepted_request(
         interception_id: InterceptionId,
@@ -3313,29 +3567,41 @@ def continue_intercepted_request(
     :param headers: *(Optional)* If set this allows the request headers to be changed. Must not be set in response to an authChallenge.
     :param auth_challenge_response: *(Optional)* Response to a requestIntercepted with an authChallenge. Must not be set otherwise.
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
-    if error_reason is not None:
-        params['errorReason'] = error_reason.to_json()
-    if raw_response is not None:
-        params['rawResponse'] = raw_response
-    if url is not None:
-        params['url'] = url
-    if method is not None:
-        params['method'] = method
-    if post_data is not None:
-        params['postData'] = post_data
-    if headers is not None:
-        params['headers'] = headers.to_json()
-    if auth_challenge_response is not None:
-        params['authChallengeResponse'] = auth_challenge_response.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.continueInterceptedRequest',
-        'params': params,
+        'params': _continue_intercepted_request_params(interception_id, error_reason, raw_response, url, method, post_data, headers, auth_challenge_response),
     }
     json = yield cmd_dict
 
 
+continue_intercepted_request_command = Command(
+    'Network.continueInterceptedRequest',
+    continue_intercepted_request,
+    _continue_intercepted_request_params,
+    deprecated='1.3',
+)
+
+
+def _delete_cookies_params(
+        name: str,
+        url: typing.Optional[str] = None,
+        domain: typing.Optional[str] = None,
+        path: typing.Optional[str] = None,
+        partition_key: typing.Optional[CookiePartitionKey] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['name'] = name
+    if url is not None:
+        params['url'] = url
+    if domain is not None:
+        params['domain'] = domain
+    if path is not None:
+        params['path'] = path
+    if partition_key is not None:
+        params['partitionKey'] = partition_key.to_json()
+    return params
+
+
 def delete_cookies(
         name: str,
         url: typing.Optional[str] = None,
@@ -3352,23 +3618,20 @@ def delete_cookies(
     :param path: *(Optional)* If specified, deletes only cookies with the exact path.
     :param partition_key: **(EXPERIMENTAL)** *(Optional)* If specified, deletes only cookies with the the given name and partitionKey where all partition key attributes match the cookie partition key attribute.
     '''
-    params: T_JSON_DICT = dict()
-    params['name'] = name
-    if url is not None:
-        params['url'] = url
-    if domain is not None:
-        params['domain'] = domain
-    if path is not None:
-        params['path'] = path
-    if partition_key is not None:
-        params['partitionKey'] = partition_key.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.deleteCookies',
-        'params': params,
+        'params': _delete_cookies_params(name, url, domain, path, partition_key),
     }
     json = yield cmd_dict
 
 
+delete_cookies_command = Command(
+    'Network.deleteCookies',
+    delete_cookies,
+    _delete_cookies_params,
+)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables network tracking, prevents network events from being sent to the client.
@@ -3379,6 +3642,35 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('Network.disable', disable)
+
+
+def _emulate_network_conditions_params(
+        offline: bool,
+        latency: float,
+        download_throughput: float,
+        upload_throughput: float,
+        connection_type: typing.Optional[ConnectionType] = None,
+        packet_loss: typing.Optional[float] = None,
+        packet_queue_length: typing.Optional[int] = None,
+        packet_reordering: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['offline'] = offline
+    params['latency'] = latency
+    params['downloadThroughput'] = download_throughput
+    params['uploadThroughput'] = upload_throughput
+    if connection_type is not None:
+        params['connectionType'] = connection_type.to_json()
+    if packet_loss is not None:
+        params['packetLoss'] = packet_loss
+    if packet_queue_length is not None:
+        params['packetQueueLength'] = packet_queue_length
+    if packet_reordering is not None:
+        params['packetReordering'] = packet_reordering
+    return params
+
+
 @deprecated(version="1.3")
 def emulate_network_conditions(
         offline: bool,
@@ -3405,26 +3697,31 @@ def emulate_network_conditions(
     :param packet_queue_length: **(EXPERIMENTAL)** *(Optional)* WebRTC packet queue length (packet). 0 removes any queue length limitations.
     :param packet_reordering: **(EXPERIMENTAL)** *(Optional)* WebRTC packetReordering feature.
     '''
-    params: T_JSON_DICT = dict()
-    params['offline'] = offline
-    params['latency'] = latency
-    params['downloadThroughput'] = download_throughput
-    params['uploadThroughput'] = upload_throughput
-    if connection_type is not None:
-        params['connectionType'] = connection_type.to_json()
-    if packet_loss is not None:
-        params['packetLoss'] = packet_loss
-    if packet_queue_length is not None:
-        params['packetQueueLength'] = packet_queue_length
-    if packet_reordering is not None:
-        params['packetReordering'] = packet_reordering
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.emulateNetworkConditions',
-        'params': params,
+        'params': _emulate_network_conditions_params(offline, latency, download_throughput, upload_throughput, connection_type, packet_loss, packet_queue_length, packet_reordering),
     }
     json = yield cmd_dict
 
 
+emulate_network_conditions_command = Command(
+    'Network.emulateNetworkConditions',
+    emulate_network_conditions,
+    _emulate_network_conditions_params,
+    deprecated='1.3',
+)
+
+
+def _emulate_network_conditions_by_rule_params(
+        offline: bool,
+        matched_network_conditions: typing.List[NetworkConditions]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['offline'] = offline
+    params['matchedNetworkConditions'] = [i.to_json() for i in matched_network_conditions]
+    return params
+
+
 def emulate_network_conditions_by_rule(
         offline: bool,
         matched_network_conditions: typing.List[NetworkConditions]
@@ -3440,17 +3737,39 @@ def emulate_network_conditions_by_rule(
     :param matched_network_conditions: Configure conditions for matching requests. If multiple entries match a request, the first entry wins.  Global conditions can be configured by leaving the urlPattern for the conditions empty. These global conditions are also applied for throttling of p2p connections.
     :returns: An id for each entry in matchedNetworkConditions. The id will be included in the requestWillBeSentExtraInfo for requests affected by a rule.
     '''
-    params: T_JSON_DICT = dict()
-    params['offline'] = offline
-    params['matchedNetworkConditions'] = [i.to_json() for i in matched_network_conditions]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.emulateNetworkConditionsByRule',
-        'params': params,
+        'params': _emulate_network_conditions_by_rule_params(offline, matched_network_conditions),
     }
     json = yield cmd_dict
     return [str(i) for i in json['ruleIds']]
 
 
+emulate_network_conditions_by_rule_command = Command(
+    'Network.emulateNetworkConditionsByRule',
+    emulate_network_conditions_by_rule,
+    _emulate_network_conditions_by_rule_params,
+    lambda json: [str(i) for i in json['ruleIds']],
+)
+
+
+def _override_network_state_params(
+        offline: bool,
+        latency: float,
+        download_throughput: float,
+        upload_throughput: float,
+        connection_type: typing.Optional[ConnectionType] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['offline'] = offline
+    params['latency'] = latency
+    params['downloadThroughput'] = download_throughput
+    params['uploadThroughput'] = upload_throughput
+    if connection_type is not None:
+        params['connectionType'] = connection_type.to_json()
+    return params
+
+
 def override_network_state(
         offline: bool,
         latency: float,
@@ -3469,36 +3788,27 @@ def override_network_state(
     :param upload_throughput: Maximal aggregated upload throughput (bytes/sec).  -1 disables upload throttling.
     :param connection_type: *(Optional)* Connection type if known.
     '''
-    params: T_JSON_DICT = dict()
-    params['offline'] = offline
-    params['latency'] = latency
-    params['downloadThroughput'] = download_throughput
-    params['uploadThroughput'] = upload_throughput
-    if connection_type is not None:
-        params['connectionType'] = connection_type.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.overrideNetworkState',
-        'params': params,
+        'params': _override_network_state_params(offline, latency, download_throughput, upload_throughput, connection_type),
     }
     json = yield cmd_dict
 
 
-def enable(
-        max_total_buffer_size: typing.Optional[int] = None,
+override_network_state_command = Command(
+    'Network.overrideNetworkState',
+    override_network_state,
+    _override_network_state_params,
+)
+
+
+def _enable_params(
+        max_total_buffer_size: typing.Optional[int] = None,
         max_resource_buffer_size: typing.Optional[int] = None,
         max_post_data_size: typing.Optional[int] = None,
         report_direct_socket_traffic: typing.Optional[bool] = None,
         enable_durable_messages: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Enables network tracking, network events will now be delivered to the client.
-
-    :param max_total_buffer_size: **(EXPERIMENTAL)** *(Optional)* Buffer size in bytes to use when preserving network payloads (XHRs, etc). This is the maximum number of bytes that will be collected by this DevTools session.
-    :param max_resource_buffer_size: **(EXPERIMENTAL)** *(Optional)* Per-resource buffer size in bytes to use when preserving network payloads (XHRs, etc).
-    :param max_post_data_size: *(Optional)* Longest post body size (in bytes) that would be included in requestWillBeSent notification
-    :param report_direct_socket_traffic: **(EXPERIMENTAL)** *(Optional)* Whether DirectSocket chunk send/receive events should be reported.
-    :param enable_durable_messages: **(EXPERIMENTAL)** *(Optional)* Enable storing response bodies outside of renderer, so that these survive a cross-process navigation. Requires maxTotalBufferSize to be set. Currently defaults to false. This field is being deprecated in favor of the dedicated configureDurableMessages command, due to the possibility of deadlocks when awaiting Network.enable before issuing Runtime.runIfWaitingForDebugger.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if max_total_buffer_size is not None:
         params['maxTotalBufferSize'] = max_total_buffer_size
@@ -3510,13 +3820,51 @@ def enable(
         params['reportDirectSocketTraffic'] = report_direct_socket_traffic
     if enable_durable_messages is not None:
         params['enableDurableMessages'] = enable_durable_messages
+    return params
+
+
+def enable(
+        max_total_buffer_size: typing.Optional[int] = None,
+        max_resource_buffer_size: typing.Optional[int] = None,
+        max_post_data_size: typing.Optional[int] = None,
+        report_direct_socket_traffic: typing.Optional[bool] = None,
+        enable_durable_messages: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Enables network tracking, network events will now be delivered to the client.
+
+    :param max_total_buffer_size: **(EXPERIMENTAL)** *(Optional)* Buffer size in bytes to use when preserving network payloads (XHRs, etc). This is the maximum number of bytes that will be collected by this DevTools session.
+    :param max_resource_buffer_size: **(EXPERIMENTAL)** *(Optional)* Per-resource buffer size in bytes to use when preserving network payloads (XHRs, etc).
+    :param max_post_data_size: *(Optional)* Longest post body size (in bytes) that would be included in requestWillBeSent notification
+    :param report_direct_socket_traffic: **(EXPERIMENTAL)** *(Optional)* Whether DirectSocket chunk send/receive events should be reported.
+    :param enable_durable_messages: **(EXPERIMENTAL)** *(Optional)* Enable storing response bodies outside of renderer, so that these survive a cross-process navigation. Requires maxTotalBufferSize to be set. Currently defaults to false. This field is being deprecated in favor of the dedicated configureDurableMessages command, due to the possibility of deadlocks when awaiting Network.enable before issuing Runtime.runIfWaitingForDebugger.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.enable',
-        'params': params,
+        'params': _enable_params(max_total_buffer_size, max_resource_buffer_size, max_post_data_size, report_direct_socket_traffic, enable_durable_messages),
     }
     json = yield cmd_dict
 
 
+enable_command = Command(
+    'Network.enable',
+    enable,
+    _enable_params,
+)
+
+
+def _configure_durable_messages_params(
+        max_total_buffer_size: typing.Optional[int] = None,
+        max_resource_buffer_size: typing.Optional[int] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if max_total_buffer_size is not None:
+        params['maxTotalBufferSize'] = max_total_buffer_size
+    if max_resource_buffer_size is not None:
+        params['maxResourceBufferSize'] = max_resource_buffer_size
+    return params
+
+
 def configure_durable_messages(
         max_total_buffer_size: typing.Optional[int] = None,
         max_resource_buffer_size: typing.Optional[int] = None
@@ -3531,18 +3879,20 @@ def configure_durable_messages(
     :param max_total_buffer_size: *(Optional)* Buffer size in bytes to use when preserving network payloads (XHRs, etc).
     :param max_resource_buffer_size: *(Optional)* Per-resource buffer size in bytes to use when preserving network payloads (XHRs, etc).
     '''
-    params: T_JSON_DICT = dict()
-    if max_total_buffer_size is not None:
-        params['maxTotalBufferSize'] = max_total_buffer_size
-    if max_resource_buffer_size is not None:
-        params['maxResourceBufferSize'] = max_resource_buffer_size
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.configureDurableMessages',
-        'params': params,
+        'params': _configure_durable_messages_params(max_total_buffer_size, max_resource_buffer_size),
     }
     json = yield cmd_dict
 
 
+configure_durable_messages_command = Command(
+    'Network.configureDurableMessages',
+    configure_durable_messages,
+    _configure_durable_messages_params,
+)
+
+
 @deprecated(version="1.3")
 def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cookie]]:
     r'''
@@ -3561,6 +3911,23 @@ def get_all_cookies() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Co
     return [Cookie.from_json(i) for i in json['cookies']]
 
 
+get_all_cookies_command = Command(
+    'Network.getAllCookies',
+    get_all_cookies,
+    None,
+    lambda json: [Cookie.from_json(i) for i in json['cookies']],
+    deprecated='1.3',
+)
+
+
+def _get_certificate_params(
+        origin: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['origin'] = origin
+    return params
+
+
 def get_certificate(
         origin: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
@@ -3572,16 +3939,31 @@ def get_certificate(
     :param origin: Origin to get certificate for.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getCertificate',
-        'params': params,
+        'params': _get_certificate_params(origin),
     }
     json = yield cmd_dict
     return [str(i) for i in json['tableNames']]
 
 
+get_certificate_command = Command(
+    'Network.getCertificate',
+    get_certificate,
+    _get_certificate_params,
+    lambda json: [str(i) for i in json['tableNames']],
+)
+
+
+def _get_cookies_params(
+        urls: typing.Optional[typing.List[str]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if urls is not None:
+        params['urls'] = [i for i in urls]
+    return params
+
+
 def get_cookies(
         urls: typing.Optional[typing.List[str]] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[Cookie]]:
@@ -3592,17 +3974,30 @@ def get_cookies(
     :param urls: *(Optional)* The list of URLs for which applicable cookies will be fetched. If not specified, it's assumed to be set to the list containing the URLs of the page and all of its subframes.
     :returns: Array of cookie objects.
     '''
-    params: T_JSON_DICT = dict()
-    if urls is not None:
-        params['urls'] = [i for i in urls]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getCookies',
-        'params': params,
+        'params': _get_cookies_params(urls),
     }
     json = yield cmd_dict
     return [Cookie.from_json(i) for i in json['cookies']]
 
 
+get_cookies_command = Command(
+    'Network.getCookies',
+    get_cookies,
+    _get_cookies_params,
+    lambda json: [Cookie.from_json(i) for i in json['cookies']],
+)
+
+
+def _get_response_body_params(
+        request_id: RequestId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    return params
+
+
 def get_response_body(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
@@ -3615,11 +4010,9 @@ def get_response_body(
         0. **body** - Response body.
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getResponseBody',
-        'params': params,
+        'params': _get_response_body_params(request_id),
     }
     json = yield cmd_dict
     return (
@@ -3628,6 +4021,25 @@ def get_response_body(
     )
 
 
+get_response_body_command = Command(
+    'Network.getResponseBody',
+    get_response_body,
+    _get_response_body_params,
+    lambda json: (
+        str(json['body']),
+        bool(json['base64Encoded'])
+    ),
+)
+
+
+def _get_request_post_data_params(
+        request_id: RequestId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    return params
+
+
 def get_request_post_data(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
@@ -3640,11 +4052,9 @@ def get_request_post_data(
         0. **postData** - Request body string, omitting files from multipart requests
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getRequestPostData',
-        'params': params,
+        'params': _get_request_post_data_params(request_id),
     }
     json = yield cmd_dict
     return (
@@ -3653,6 +4063,25 @@ def get_request_post_data(
     )
 
 
+get_request_post_data_command = Command(
+    'Network.getRequestPostData',
+    get_request_post_data,
+    _get_request_post_data_params,
+    lambda json: (
+        str(json['postData']),
+        bool(json['base64Encoded'])
+    ),
+)
+
+
+def _get_response_body_for_interception_params(
+        interception_id: InterceptionId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['interceptionId'] = interception_id.to_json()
+    return params
+
+
 def get_response_body_for_interception(
         interception_id: InterceptionId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, bool]]:
@@ -3667,11 +4096,9 @@ def get_response_body_for_interception(
         0. **body** - Response body.
         1. **base64Encoded** - True, if content was sent as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getResponseBodyForInterception',
-        'params': params,
+        'params': _get_response_body_for_interception_params(interception_id),
     }
     json = yield cmd_dict
     return (
@@ -3680,6 +4107,25 @@ def get_response_body_for_interception(
     )
 
 
+get_response_body_for_interception_command = Command(
+    'Network.getResponseBodyForInterception',
+    get_response_body_for_interception,
+    _get_response_body_for_interception_params,
+    lambda json: (
+        str(json['body']),
+        bool(json['base64Encoded'])
+    ),
+)
+
+
+def _take_response_body_for_interception_as_stream_params(
+        interception_id: InterceptionId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['interceptionId'] = interception_id.to_json()
+    return params
+
+
 def take_response_body_for_interception_as_stream(
         interception_id: InterceptionId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,io.StreamHandle]:
@@ -3694,16 +4140,30 @@ def take_response_body_for_interception_as_stream(
     :param interception_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['interceptionId'] = interception_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.takeResponseBodyForInterceptionAsStream',
-        'params': params,
+        'params': _take_response_body_for_interception_as_stream_params(interception_id),
     }
     json = yield cmd_dict
     return io.StreamHandle.from_json(json['stream'])
 
 
+take_response_body_for_interception_as_stream_command = Command(
+    'Network.takeResponseBodyForInterceptionAsStream',
+    take_response_body_for_interception_as_stream,
+    _take_response_body_for_interception_as_stream_params,
+    lambda json: io.StreamHandle.from_json(json['stream']),
+)
+
+
+def _replay_xhr_params(
+        request_id: RequestId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    return params
+
+
 def replay_xhr(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3716,15 +4176,36 @@ def replay_xhr(
 
     :param request_id: Identifier of XHR to replay.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.replayXHR',
-        'params': params,
+        'params': _replay_xhr_params(request_id),
     }
     json = yield cmd_dict
 
 
+replay_xhr_command = Command(
+    'Network.replayXHR',
+    replay_xhr,
+    _replay_xhr_params,
+)
+
+
+def _search_in_response_body_params(
+        request_id: RequestId,
+        query: str,
+        case_sensitive: typing.Optional[bool] = None,
+        is_regex: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    params['query'] = query
+    if case_sensitive is not None:
+        params['caseSensitive'] = case_sensitive
+    if is_regex is not None:
+        params['isRegex'] = is_regex
+    return params
+
+
 def search_in_response_body(
         request_id: RequestId,
         query: str,
@@ -3742,21 +4223,34 @@ def search_in_response_body(
     :param is_regex: *(Optional)* If true, treats string parameter as regex.
     :returns: List of search matches.
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
-    params['query'] = query
-    if case_sensitive is not None:
-        params['caseSensitive'] = case_sensitive
-    if is_regex is not None:
-        params['isRegex'] = is_regex
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.searchInResponseBody',
-        'params': params,
+        'params': _search_in_response_body_params(request_id, query, case_sensitive, is_regex),
     }
     json = yield cmd_dict
     return [debugger.SearchMatch.from_json(i) for i in json['result']]
 
 
+search_in_response_body_command = Command(
+    'Network.searchInResponseBody',
+    search_in_response_body,
+    _search_in_response_body_params,
+    lambda json: [debugger.SearchMatch.from_json(i) for i in json['result']],
+)
+
+
+def _set_blocked_ur_ls_params(
+        url_patterns: typing.Optional[typing.List[BlockPattern]] = None,
+        urls: typing.Optional[typing.List[str]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if url_patterns is not None:
+        params['urlPatterns'] = [i.to_json() for i in url_patterns]
+    if urls is not None:
+        params['urls'] = [i for i in urls]
+    return params
+
+
 def set_blocked_ur_ls(
         url_patterns: typing.Optional[typing.List[BlockPattern]] = None,
         urls: typing.Optional[typing.List[str]] = None
@@ -3769,18 +4263,28 @@ def set_blocked_ur_ls(
     :param url_patterns: *(Optional)* Patterns to match in the order in which they are given. These patterns also take precedence over any wildcard patterns defined in ```urls```.
     :param urls: **(DEPRECATED)** *(Optional)* URL patterns to block. Wildcards ('*') are allowed.
     '''
-    params: T_JSON_DICT = dict()
-    if url_patterns is not None:
-        params['urlPatterns'] = [i.to_json() for i in url_patterns]
-    if urls is not None:
-        params['urls'] = [i for i in urls]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setBlockedURLs',
-        'params': params,
+        'params': _set_blocked_ur_ls_params(url_patterns, urls),
     }
     json = yield cmd_dict
 
 
+set_blocked_ur_ls_command = Command(
+    'Network.setBlockedURLs',
+    set_blocked_ur_ls,
+    _set_blocked_ur_ls_params,
+)
+
+
+def _set_bypass_service_worker_params(
+        bypass: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['bypass'] = bypass
+    return params
+
+
 def set_bypass_service_worker(
         bypass: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3789,15 +4293,28 @@ def set_bypass_service_worker(
 
     :param bypass: Bypass service worker and load from network.
     '''
-    params: T_JSON_DICT = dict()
-    params['bypass'] = bypass
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setBypassServiceWorker',
-        'params': params,
+        'params': _set_bypass_service_worker_params(bypass),
     }
     json = yield cmd_dict
 
 
+set_bypass_service_worker_command = Command(
+    'Network.setBypassServiceWorker',
+    set_bypass_service_worker,
+    _set_bypass_service_worker_params,
+)
+
+
+def _set_cache_disabled_params(
+        cache_disabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['cacheDisabled'] = cache_disabled
+    return params
+
+
 def set_cache_disabled(
         cache_disabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3806,16 +4323,21 @@ def set_cache_disabled(
 
     :param cache_disabled: Cache disabled state.
     '''
-    params: T_JSON_DICT = dict()
-    params['cacheDisabled'] = cache_disabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setCacheDisabled',
-        'params': params,
+        'params': _set_cache_disabled_params(cache_disabled),
     }
     json = yield cmd_dict
 
 
-def set_cookie(
+set_cache_disabled_command = Command(
+    'Network.setCacheDisabled',
+    set_cache_disabled,
+    _set_cache_disabled_params,
+)
+
+
+def _set_cookie_params(
         name: str,
         value: str,
         url: typing.Optional[str] = None,
@@ -3829,25 +4351,7 @@ def set_cookie(
         source_scheme: typing.Optional[CookieSourceScheme] = None,
         source_port: typing.Optional[int] = None,
         partition_key: typing.Optional[CookiePartitionKey] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
-    r'''
-    Sets a cookie with the given cookie data; may overwrite equivalent cookies if they exist.
-
-    :param name: Cookie name.
-    :param value: Cookie value.
-    :param url: *(Optional)* The request-URI to associate with the setting of the cookie. This value can affect the default domain, path, source port, and source scheme values of the created cookie.
-    :param domain: *(Optional)* Cookie domain.
-    :param path: *(Optional)* Cookie path.
-    :param secure: *(Optional)* True if cookie is secure.
-    :param http_only: *(Optional)* True if cookie is http-only.
-    :param same_site: *(Optional)* Cookie SameSite type.
-    :param expires: *(Optional)* Cookie expiration date, session cookie if not set
-    :param priority: **(EXPERIMENTAL)** *(Optional)* Cookie Priority type.
-    :param source_scheme: **(EXPERIMENTAL)** *(Optional)* Cookie source scheme type.
-    :param source_port: **(EXPERIMENTAL)** *(Optional)* Cookie source port. Valid values are {-1, [1, 65535]}, -1 indicates an unspecified port. An unspecified port value allows protocol clients to emulate legacy cookie scope for the port. This is a temporary ability and it will be removed in the future.
-    :param partition_key: **(EXPERIMENTAL)** *(Optional)* Cookie partition key. If not set, the cookie will be set as not partitioned.
-    :returns: Always set to true. If an error occurs, the response indicates protocol error.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['name'] = name
     params['value'] = value
@@ -3873,14 +4377,66 @@ def set_cookie(
         params['sourcePort'] = source_port
     if partition_key is not None:
         params['partitionKey'] = partition_key.to_json()
+    return params
+
+
+def set_cookie(
+        name: str,
+        value: str,
+        url: typing.Optional[str] = None,
+        domain: typing.Optional[str] = None,
+        path: typing.Optional[str] = None,
+        secure: typing.Optional[bool] = None,
+        http_only: typing.Optional[bool] = None,
+        same_site: typing.Optional[CookieSameSite] = None,
+        expires: typing.Optional[TimeSinceEpoch] = None,
+        priority: typing.Optional[CookiePriority] = None,
+        source_scheme: typing.Optional[CookieSourceScheme] = None,
+        source_port: typing.Optional[int] = None,
+        partition_key: typing.Optional[CookiePartitionKey] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
+    r'''
+    Sets a cookie with the given cookie data; may overwrite equivalent cookies if they exist.
+
+    :param name: Cookie name.
+    :param value: Cookie value.
+    :param url: *(Optional)* The request-URI to associate with the setting of the cookie. This value can affect the default domain, path, source port, and source scheme values of the created cookie.
+    :param domain: *(Optional)* Cookie domain.
+    :param path: *(Optional)* Cookie path.
+    :param secure: *(Optional)* True if cookie is secure.
+    :param http_only: *(Optional)* True if cookie is http-only.
+    :param same_site: *(Optional)* Cookie SameSite type.
+    :param expires: *(Optional)* Cookie expiration date, session cookie if not set
+    :param priority: **(EXPERIMENTAL)** *(Optional)* Cookie Priority type.
+    :param source_scheme: **(EXPERIMENTAL)** *(Optional)* Cookie source scheme type.
+    :param source_port: **(EXPERIMENTAL)** *(Optional)* Cookie source port. Valid values are {-1, [1, 65535]}, -1 indicates an unspecified port. An unspecified port value allows protocol clients to emulate legacy cookie scope for the port. This is a temporary ability and it will be removed in the future.
+    :param partition_key: **(EXPERIMENTAL)** *(Optional)* Cookie partition key. If not set, the cookie will be set as not partitioned.
+    :returns: Always set to true. If an error occurs, the response indicates protocol error.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setCookie',
-        'params': params,
+        'params': _set_cookie_params(name, value, url, domain, path, secure, http_only, same_site, expires, priority, source_scheme, source_port, partition_key),
     }
     json = yield cmd_dict
     return bool(json['success'])
 
 
+set_cookie_command = Command(
+    'Network.setCookie',
+    set_cookie,
+    _set_cookie_params,
+    lambda json: bool(json['success']),
+)
+
+
+def _set_cookies_params(
+        cookies: typing.List[CookieParam]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['cookies'] = [i.to_json() for i in cookies]
+    return params
+
+
 def set_cookies(
         cookies: typing.List[CookieParam]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3889,15 +4445,28 @@ def set_cookies(
 
     :param cookies: Cookies to be set.
     '''
-    params: T_JSON_DICT = dict()
-    params['cookies'] = [i.to_json() for i in cookies]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setCookies',
-        'params': params,
+        'params': _set_cookies_params(cookies),
     }
     json = yield cmd_dict
 
 
+set_cookies_command = Command(
+    'Network.setCookies',
+    set_cookies,
+    _set_cookies_params,
+)
+
+
+def _set_extra_http_headers_params(
+        headers: Headers
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['headers'] = headers.to_json()
+    return params
+
+
 def set_extra_http_headers(
         headers: Headers
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3906,15 +4475,28 @@ def set_extra_http_headers(
 
     :param headers: Map with extra HTTP headers.
     '''
-    params: T_JSON_DICT = dict()
-    params['headers'] = headers.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setExtraHTTPHeaders',
-        'params': params,
+        'params': _set_extra_http_headers_params(headers),
     }
     json = yield cmd_dict
 
 
+set_extra_http_headers_command = Command(
+    'Network.setExtraHTTPHeaders',
+    set_extra_http_headers,
+    _set_extra_http_headers_params,
+)
+
+
+def _set_attach_debug_stack_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_attach_debug_stack(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3925,15 +4507,28 @@ def set_attach_debug_stack(
 
     :param enabled: Whether to attach a page script stack for debugging purpose.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setAttachDebugStack',
-        'params': params,
+        'params': _set_attach_debug_stack_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_attach_debug_stack_command = Command(
+    'Network.setAttachDebugStack',
+    set_attach_debug_stack,
+    _set_attach_debug_stack_params,
+)
+
+
+def _set_request_interception_params(
+        patterns: typing.List[RequestPattern]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['patterns'] = [i.to_json() for i in patterns]
+    return params
+
+
 @deprecated(version="1.3")
 def set_request_interception(
         patterns: typing.List[RequestPattern]
@@ -3948,15 +4543,38 @@ def set_request_interception(
 
     :param patterns: Requests matching any of these patterns will be forwarded and wait for the corresponding continueInterceptedRequest call.
     '''
-    params: T_JSON_DICT = dict()
-    params['patterns'] = [i.to_json() for i in patterns]
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setRequestInterception',
-        'params': params,
+        'params': _set_request_interception_params(patterns),
     }
     json = yield cmd_dict
 
 
+set_request_interception_command = Command(
+    'Network.setRequestInterception',
+    set_request_interception,
+    _set_request_interception_params,
+    deprecated='1.3',
+)
+
+
+def _set_user_agent_override_params(
+        user_agent: str,
+        accept_language: typing.Optional[str] = None,
+        platform: typing.Optional[str] = None,
+        user_agent_metadata: typing.Optional[emulation.UserAgentMetadata] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['userAgent'] = user_agent
+    if accept_language is not None:
+        params['acceptLanguage'] = accept_language
+    if platform is not None:
+        params['platform'] = platform
+    if user_agent_metadata is not None:
+        params['userAgentMetadata'] = user_agent_metadata.to_json()
+    return params
+
+
 def set_user_agent_override(
         user_agent: str,
         accept_language: typing.Optional[str] = None,
@@ -3971,21 +4589,28 @@ def set_user_agent_override(
     :param platform: *(Optional)* The platform navigator.platform should return.
     :param user_agent_metadata: **(EXPERIMENTAL)** *(Optional)* To be sent in Sec-CH-UA-* headers and returned in navigator.userAgentData
     '''
-    params: T_JSON_DICT = dict()
-    params['userAgent'] = user_agent
-    if accept_language is not None:
-        params['acceptLanguage'] = accept_language
-    if platform is not None:
-        params['platform'] = platform
-    if user_agent_metadata is not None:
-        params['userAgentMetadata'] = user_agent_metadata.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setUserAgentOverride',
-        'params': params,
+        'params': _set_user_agent_override_params(user_agent, accept_language, platform, user_agent_metadata),
     }
     json = yield cmd_dict
 
 
+set_user_agent_override_command = Command(
+    'Network.setUserAgentOverride',
+    set_user_agent_override,
+    _set_user_agent_override_params,
+)
+
+
+def _stream_resource_content_params(
+        request_id: RequestId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id.to_json()
+    return params
+
+
 def stream_resource_content(
         request_id: RequestId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -3998,16 +4623,31 @@ def stream_resource_content(
     :param request_id: Identifier of the request to stream.
     :returns: Data that has been buffered until streaming is enabled. (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.streamResourceContent',
-        'params': params,
+        'params': _stream_resource_content_params(request_id),
     }
     json = yield cmd_dict
     return str(json['bufferedData'])
 
 
+stream_resource_content_command = Command(
+    'Network.streamResourceContent',
+    stream_resource_content,
+    _stream_resource_content_params,
+    lambda json: str(json['bufferedData']),
+)
+
+
+def _get_security_isolation_status_params(
+        frame_id: typing.Optional[page.FrameId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if frame_id is not None:
+        params['frameId'] = frame_id.to_json()
+    return params
+
+
 def get_security_isolation_status(
         frame_id: typing.Optional[page.FrameId] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SecurityIsolationStatus]:
@@ -4019,17 +4659,30 @@ def get_security_isolation_status(
     :param frame_id: *(Optional)* If no frameId is provided, the status of the target is provided.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.getSecurityIsolationStatus',
-        'params': params,
+        'params': _get_security_isolation_status_params(frame_id),
     }
     json = yield cmd_dict
     return SecurityIsolationStatus.from_json(json['status'])
 
 
+get_security_isolation_status_command = Command(
+    'Network.getSecurityIsolationStatus',
+    get_security_isolation_status,
+    _get_security_isolation_status_params,
+    lambda json: SecurityIsolationStatus.from_json(json['status']),
+)
+
+
+def _enable_reporting_api_params(
+        enable: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enable'] = enable
+    return params
+
+
 def enable_reporting_api(
         enable: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -4041,15 +4694,28 @@ def enable_reporting_api(
 
     :param enable: Whether to enable or disable events for the Reporting API
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.enableReportingApi',
-        'params': params,
+        'params': _enable_reporting_api_params(enable),
     }
     json = yield cmd_dict
 
 
+enable_reporting_api_command = Command(
+    'Network.enableReportingApi',
+    enable_reporting_api,
+    _enable_reporting_api_params,
+)
+
+
+def _enable_device_bound_sessions_params(
+        enable: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enable'] = enable
+    return params
+
+
 def enable_device_bound_sessions(
         enable: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -4060,15 +4726,28 @@ def enable_device_bound_sessions(
 
     :param enable: Whether to enable or disable events.
     '''
-    params: T_JSON_DICT = dict()
-    params['enable'] = enable
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.enableDeviceBoundSessions',
-        'params': params,
+        'params': _enable_device_bound_sessions_params(enable),
     }
     json = yield cmd_dict
 
 
+enable_device_bound_sessions_command = Command(
+    'Network.enableDeviceBoundSessions',
+    enable_device_bound_sessions,
+    _enable_device_bound_sessions_params,
+)
+
+
+def _fetch_schemeful_site_params(
+        origin: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['origin'] = origin
+    return params
+
+
 def fetch_schemeful_site(
         origin: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -4080,16 +4759,35 @@ def fetch_schemeful_site(
     :param origin: The URL origin.
     :returns: The corresponding schemeful site.
     '''
-    params: T_JSON_DICT = dict()
-    params['origin'] = origin
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.fetchSchemefulSite',
-        'params': params,
+        'params': _fetch_schemeful_site_params(origin),
     }
     json = yield cmd_dict
     return str(json['schemefulSite'])
 
 
+fetch_schemeful_site_command = Command(
+    'Network.fetchSchemefulSite',
+    fetch_schemeful_site,
+    _fetch_schemeful_site_params,
+    lambda json: str(json['schemefulSite']),
+)
+
+
+def _load_network_resource_params(
+        url: str,
+        options: LoadNetworkResourceOptions,
+        frame_id: typing.Optional[page.FrameId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if frame_id is not None:
+        params['frameId'] = frame_id.to_json()
+    params['url'] = url
+    params['options'] = options.to_json()
+    return params
+
+
 def load_network_resource(
         url: str,
         options: LoadNetworkResourceOptions,
@@ -4105,19 +4803,34 @@ def load_network_resource(
     :param options: Options for the request.
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    params['url'] = url
-    params['options'] = options.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.loadNetworkResource',
-        'params': params,
+        'params': _load_network_resource_params(url, options, frame_id),
     }
     json = yield cmd_dict
     return LoadNetworkResourcePageResult.from_json(json['resource'])
 
 
+load_network_resource_command = Command(
+    'Network.loadNetworkResource',
+    load_network_resource,
+    _load_network_resource_params,
+    lambda json: LoadNetworkResourcePageResult.from_json(json['resource']),
+)
+
+
+def _set_cookie_controls_params(
+        enable_third_party_cookie_restriction: bool,
+        disable_third_party_cookie_metadata: bool,
+        disable_third_party_cookie_heuristics: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enableThirdPartyCookieRestriction'] = enable_third_party_cookie_restriction
+    params['disableThirdPartyCookieMetadata'] = disable_third_party_cookie_metadata
+    params['disableThirdPartyCookieHeuristics'] = disable_third_party_cookie_heuristics
+    return params
+
+
 def set_cookie_controls(
         enable_third_party_cookie_restriction: bool,
         disable_third_party_cookie_metadata: bool,
@@ -4133,19 +4846,22 @@ def set_cookie_controls(
     :param disable_third_party_cookie_metadata: Whether 3pc grace period exception should be enabled; false by default.
     :param disable_third_party_cookie_heuristics: Whether 3pc heuristics exceptions should be enabled; false by default.
     '''
-    params: T_JSON_DICT = dict()
-    params['enableThirdPartyCookieRestriction'] = enable_third_party_cookie_restriction
-    params['disableThirdPartyCookieMetadata'] = disable_third_party_cookie_metadata
-    params['disableThirdPartyCookieHeuristics'] = disable_third_party_cookie_heuristics
     cmd_dict: T_JSON_DICT = {
         'method': 'Network.setCookieControls',
-        'params': params,
+        'params': _set_cookie_controls_params(enable_third_party_cookie_restriction, disable_third_party_cookie_metadata, disable_third_party_cookie_heuristics),
     }
     json = yield cmd_dict
 
 
+set_cookie_controls_command = Command(
+    'Network.setCookieControls',
+    set_cookie_controls,
+    _set_cookie_controls_params,
+)
+
+
 @event_class('Network.dataReceived')
-@dataclass
+@slotted_dataclass
 class DataReceived:
     r'''
     Fired when data chunk was received over the network.
@@ -4173,7 +4889,7 @@ class DataReceived:
 
 
 @event_class('Network.eventSourceMessageReceived')
-@dataclass
+@slotted_dataclass
 class EventSourceMessageReceived:
     r'''
     Fired when EventSource message is received.
@@ -4201,7 +4917,7 @@ class EventSourceMessageReceived:
 
 
 @event_class('Network.loadingFailed')
-@dataclass
+@slotted_dataclass
 class LoadingFailed:
     r'''
     Fired when HTTP request has failed to load.
@@ -4235,7 +4951,7 @@ class LoadingFailed:
 
 
 @event_class('Network.loadingFinished')
-@dataclass
+@slotted_dataclass
 class LoadingFinished:
     r'''
     Fired when HTTP request has finished loading.
@@ -4258,7 +4974,7 @@ class LoadingFinished:
 
 @deprecated(version="1.3")
 @event_class('Network.requestIntercepted')
-@dataclass
+@slotted_dataclass
 class RequestIntercepted:
     r'''
     **EXPERIMENTAL**
@@ -4318,7 +5034,7 @@ class RequestIntercepted:
 
 
 @event_class('Network.requestServedFromCache')
-@dataclass
+@slotted_dataclass
 class RequestServedFromCache:
     r'''
     Fired if request ended up loading from cache.
@@ -4334,7 +5050,7 @@ class RequestServedFromCache:
 
 
 @event_class('Network.requestWillBeSent')
-@dataclass
+@slotted_dataclass
 class RequestWillBeSent:
     r'''
     Fired when page is about to send HTTP request.
@@ -4388,7 +5104,7 @@ class RequestWillBeSent:
 
 
 @event_class('Network.resourceChangedPriority')
-@dataclass
+@slotted_dataclass
 class ResourceChangedPriority:
     r'''
     **EXPERIMENTAL**
@@ -4412,7 +5128,7 @@ class ResourceChangedPriority:
 
 
 @event_class('Network.signedExchangeReceived')
-@dataclass
+@slotted_dataclass
 class SignedExchangeReceived:
     r'''
     **EXPERIMENTAL**
@@ -4433,7 +5149,7 @@ class SignedExchangeReceived:
 
 
 @event_class('Network.responseReceived')
-@dataclass
+@slotted_dataclass
 class ResponseReceived:
     r'''
     Fired when HTTP response is available.
@@ -4468,7 +5184,7 @@ class ResponseReceived:
 
 
 @event_class('Network.webSocketClosed')
-@dataclass
+@slotted_dataclass
 class WebSocketClosed:
     r'''
     Fired when WebSocket is closed.
@@ -4487,7 +5203,7 @@ class WebSocketClosed:
 
 
 @event_class('Network.webSocketCreated')
-@dataclass
+@slotted_dataclass
 class WebSocketCreated:
     r'''
     Fired upon WebSocket creation.
@@ -4509,7 +5225,7 @@ class WebSocketCreated:
 
 
 @event_class('Network.webSocketFrameError')
-@dataclass
+@slotted_dataclass
 class WebSocketFrameError:
     r'''
     Fired when WebSocket message error occurs.
@@ -4531,7 +5247,7 @@ class WebSocketFrameError:
 
 
 @event_class('Network.webSocketFrameReceived')
-@dataclass
+@slotted_dataclass
 class WebSocketFrameReceived:
     r'''
     Fired when WebSocket message is received.
@@ -4553,7 +5269,7 @@ class WebSocketFrameReceived:
 
 
 @event_class('Network.webSocketFrameSent')
-@dataclass
+@slotted_dataclass
 class WebSocketFrameSent:
     r'''
     Fired when WebSocket message is sent.
@@ -4575,7 +5291,7 @@ class WebSocketFrameSent:
 
 
 @event_class('Network.webSocketHandshakeResponseReceived')
-@dataclass
+@slotted_dataclass
 class WebSocketHandshakeResponseReceived:
     r'''
     Fired when WebSocket handshake response becomes available.
@@ -4597,7 +5313,7 @@ class WebSocketHandshakeResponseReceived:
 
 
 @event_class('Network.webSocketWillSendHandshakeRequest')
-@dataclass
+@slotted_dataclass
 class WebSocketWillSendHandshakeRequest:
     r'''
     Fired when WebSocket is about to initiate handshake.
@@ -4622,7 +5338,7 @@ class WebSocketWillSendHandshakeRequest:
 
 
 @event_class('Network.webTransportCreated')
-@dataclass
+@slotted_dataclass
 class WebTransportCreated:
     r'''
     Fired upon WebTransport creation.
@@ -4647,7 +5363,7 @@ class WebTransportCreated:
 
 
 @event_class('Network.webTransportConnectionEstablished')
-@dataclass
+@slotted_dataclass
 class WebTransportConnectionEstablished:
     r'''
     Fired when WebTransport handshake is finished.
@@ -4666,7 +5382,7 @@ class WebTransportConnectionEstablished:
 
 
 @event_class('Network.webTransportClosed')
-@dataclass
+@slotted_dataclass
 class WebTransportClosed:
     r'''
     Fired when WebTransport is disposed.
@@ -4685,7 +5401,7 @@ class WebTransportClosed:
 
 
 @event_class('Network.directTCPSocketCreated')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketCreated:
     r'''
     **EXPERIMENTAL**
@@ -4713,7 +5429,7 @@ class DirectTCPSocketCreated:
 
 
 @event_class('Network.directTCPSocketOpened')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketOpened:
     r'''
     **EXPERIMENTAL**
@@ -4742,7 +5458,7 @@ class DirectTCPSocketOpened:
 
 
 @event_class('Network.directTCPSocketAborted')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketAborted:
     r'''
     **EXPERIMENTAL**
@@ -4763,7 +5479,7 @@ class DirectTCPSocketAborted:
 
 
 @event_class('Network.directTCPSocketClosed')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketClosed:
     r'''
     **EXPERIMENTAL**
@@ -4782,7 +5498,7 @@ class DirectTCPSocketClosed:
 
 
 @event_class('Network.directTCPSocketChunkSent')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketChunkSent:
     r'''
     **EXPERIMENTAL**
@@ -4803,7 +5519,7 @@ class DirectTCPSocketChunkSent:
 
 
 @event_class('Network.directTCPSocketChunkReceived')
-@dataclass
+@slotted_dataclass
 class DirectTCPSocketChunkReceived:
     r'''
     **EXPERIMENTAL**
@@ -4824,7 +5540,7 @@ class DirectTCPSocketChunkReceived:
 
 
 @event_class('Network.directUDPSocketJoinedMulticastGroup')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketJoinedMulticastGroup:
     r'''
     **EXPERIMENTAL**
@@ -4843,7 +5559,7 @@ class DirectUDPSocketJoinedMulticastGroup:
 
 
 @event_class('Network.directUDPSocketLeftMulticastGroup')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketLeftMulticastGroup:
     r'''
     **EXPERIMENTAL**
@@ -4862,7 +5578,7 @@ class DirectUDPSocketLeftMulticastGroup:
 
 
 @event_class('Network.directUDPSocketCreated')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketCreated:
     r'''
     **EXPERIMENTAL**
@@ -4885,7 +5601,7 @@ class DirectUDPSocketCreated:
 
 
 @event_class('Network.directUDPSocketOpened')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketOpened:
     r'''
     **EXPERIMENTAL**
@@ -4914,7 +5630,7 @@ class DirectUDPSocketOpened:
 
 
 @event_class('Network.directUDPSocketAborted')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketAborted:
     r'''
     **EXPERIMENTAL**
@@ -4935,7 +5651,7 @@ class DirectUDPSocketAborted:
 
 
 @event_class('Network.directUDPSocketClosed')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketClosed:
     r'''
     **EXPERIMENTAL**
@@ -4954,7 +5670,7 @@ class DirectUDPSocketClosed:
 
 
 @event_class('Network.directUDPSocketChunkSent')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketChunkSent:
     r'''
     **EXPERIMENTAL**
@@ -4975,7 +5691,7 @@ class DirectUDPSocketChunkSent:
 
 
 @event_class('Network.directUDPSocketChunkReceived')
-@dataclass
+@slotted_dataclass
 class DirectUDPSocketChunkReceived:
     r'''
     **EXPERIMENTAL**
@@ -4996,7 +5712,7 @@ class DirectUDPSocketChunkReceived:
 
 
 @event_class('Network.requestWillBeSentExtraInfo')
-@dataclass
+@slotted_dataclass
 class RequestWillBeSentExtraInfo:
     r'''
     **EXPERIMENTAL**
@@ -5040,7 +5756,7 @@ class RequestWillBeSentExtraInfo:
 
 
 @event_class('Network.responseReceivedExtraInfo')
-@dataclass
+@slotted_dataclass
 class ResponseReceivedExtraInfo:
     r'''
     **EXPERIMENTAL**
@@ -5095,7 +5811,7 @@ class ResponseReceivedExtraInfo:
 
 
 @event_class('Network.responseReceivedEarlyHints')
-@dataclass
+@slotted_dataclass
 class ResponseReceivedEarlyHints:
     r'''
     **EXPERIMENTAL**
@@ -5121,7 +5837,7 @@ class ResponseReceivedEarlyHints:
 
 
 @event_class('Network.trustTokenOperationDone')
-@dataclass
+@slotted_dataclass
 class TrustTokenOperationDone:
     r'''
     **EXPERIMENTAL**
@@ -5158,7 +5874,7 @@ class TrustTokenOperationDone:
 
 
 @event_class('Network.policyUpdated')
-@dataclass
+@slotted_dataclass
 class PolicyUpdated:
     r'''
     **EXPERIMENTAL**
@@ -5175,7 +5891,7 @@ class PolicyUpdated:
 
 
 @event_class('Network.reportingApiReportAdded')
-@dataclass
+@slotted_dataclass
 class ReportingApiReportAdded:
     r'''
     **EXPERIMENTAL**
@@ -5193,7 +5909,7 @@ class ReportingApiReportAdded:
 
 
 @event_class('Network.reportingApiReportUpdated')
-@dataclass
+@slotted_dataclass
 class ReportingApiReportUpdated:
     r'''
     **EXPERIMENTAL**
@@ -5210,7 +5926,7 @@ class ReportingApiReportUpdated:
 
 
 @event_class('Network.reportingApiEndpointsChangedForOrigin')
-@dataclass
+@slotted_dataclass
 class ReportingApiEndpointsChangedForOrigin:
     r'''
     **EXPERIMENTAL**
@@ -5230,7 +5946,7 @@ class ReportingApiEndpointsChangedForOrigin:
 
 
 @event_class('Network.deviceBoundSessionsAdded')
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionsAdded:
     r'''
     **EXPERIMENTAL**
@@ -5248,7 +5964,7 @@ class DeviceBoundSessionsAdded:
 
 
 @event_class('Network.deviceBoundSessionEventOccurred')
-@dataclass
+@slotted_dataclass
 class DeviceBoundSessionEventOccurred:
     r'''
     **EXPERIMENTAL**
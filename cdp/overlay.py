@@ -6,18 +6,20 @@
 # CDP domain: Overlay (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import dom
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+    from . import runtime
+else:
+    lazy_import(globals(), 'dom', 'page', 'runtime')
 from deprecated.sphinx import deprecated # type: ignore
 
 
-@dataclass
+@slotted_dataclass
 class SourceOrderConfig:
     r'''
     Configuration data for drawing the source order of an elements children.
@@ -42,7 +44,7 @@ class SourceOrderConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class GridHighlightConfig:
     r'''
     Configuration data for the highlighting of Grid elements.
@@ -177,7 +179,7 @@ class GridHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FlexContainerHighlightConfig:
     r'''
     Configuration data for the highlighting of Flex container elements.
@@ -240,7 +242,7 @@ class FlexContainerHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FlexItemHighlightConfig:
     r'''
     Configuration data for the highlighting of Flex item elements.
@@ -273,7 +275,7 @@ class FlexItemHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class LineStyle:
     r'''
     Style information for drawing a line.
@@ -300,7 +302,7 @@ class LineStyle:
         )
 
 
-@dataclass
+@slotted_dataclass
 class BoxStyle:
     r'''
     Style information for drawing a box.
@@ -337,10 +339,16 @@ class ContrastAlgorithm(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ContrastAlgorithm:
-        return cls(json)
+        try:
+            return _CONTRAST_ALGORITHM_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_CONTRAST_ALGORITHM_MEMBERS: typing.Dict[str, ContrastAlgorithm] = {member.value: member for member in ContrastAlgorithm}
+
+
+@slotted_dataclass
 class HighlightConfig:
     r'''
     Configuration data for the highlighting of page elements.
@@ -480,10 +488,16 @@ class ColorFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ColorFormat:
-        return cls(json)
+        try:
+            return _COLOR_FORMAT_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_COLOR_FORMAT_MEMBERS: typing.Dict[str, ColorFormat] = {member.value: member for member in ColorFormat}
 
-@dataclass
+
+@slotted_dataclass
 class GridNodeHighlightConfig:
     r'''
     Configurations for Persistent Grid Highlight
@@ -508,7 +522,7 @@ class GridNodeHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FlexNodeHighlightConfig:
     #: A descriptor for the highlight appearance of flex containers.
     flex_container_highlight_config: FlexContainerHighlightConfig
@@ -530,7 +544,7 @@ class FlexNodeHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScrollSnapContainerHighlightConfig:
     #: The style of the snapport border (default: transparent)
     snapport_border: typing.Optional[LineStyle] = None
@@ -566,7 +580,7 @@ class ScrollSnapContainerHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScrollSnapHighlightConfig:
     #: A descriptor for the highlight appearance of scroll snap containers.
     scroll_snap_container_highlight_config: ScrollSnapContainerHighlightConfig
@@ -588,7 +602,7 @@ class ScrollSnapHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class HingeConfig:
     r'''
     Configuration for dual screen hinge
@@ -620,7 +634,7 @@ class HingeConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WindowControlsOverlayConfig:
     r'''
     Configuration for Window Controls Overlay
@@ -650,7 +664,7 @@ class WindowControlsOverlayConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ContainerQueryHighlightConfig:
     #: A descriptor for the highlight appearance of container query containers.
     container_query_container_highlight_config: ContainerQueryContainerHighlightConfig
@@ -672,7 +686,7 @@ class ContainerQueryHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ContainerQueryContainerHighlightConfig:
     #: The style of the container border.
     container_border: typing.Optional[LineStyle] = None
@@ -696,7 +710,7 @@ class ContainerQueryContainerHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class IsolatedElementHighlightConfig:
     #: A descriptor for the highlight appearance of an element in isolation mode.
     isolation_mode_highlight_config: IsolationModeHighlightConfig
@@ -718,7 +732,7 @@ class IsolatedElementHighlightConfig:
         )
 
 
-@dataclass
+@slotted_dataclass
 class IsolationModeHighlightConfig:
     #: The fill color of the resizers (default: transparent).
     resizer_color: typing.Optional[dom.RGBA] = None
@@ -759,10 +773,16 @@ class InspectMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> InspectMode:
-        return cls(json)
+        try:
+            return _INSPECT_MODE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_INSPECT_MODE_MEMBERS: typing.Dict[str, InspectMode] = {member.value: member for member in InspectMode}
 
 
-@dataclass
+@slotted_dataclass
 class InspectedElementAnchorConfig:
     #: Identifier of the node to highlight.
     node_id: typing.Optional[dom.NodeId] = None
@@ -796,6 +816,9 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('Overlay.disable', disable)
+
+
 def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Enables domain notifications.
@@ -806,6 +829,29 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+enable_command = Command('Overlay.enable', enable)
+
+
+def _get_highlight_object_for_test_params(
+        node_id: dom.NodeId,
+        include_distance: typing.Optional[bool] = None,
+        include_style: typing.Optional[bool] = None,
+        color_format: typing.Optional[ColorFormat] = None,
+        show_accessibility_info: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    if include_distance is not None:
+        params['includeDistance'] = include_distance
+    if include_style is not None:
+        params['includeStyle'] = include_style
+    if color_format is not None:
+        params['colorFormat'] = color_format.to_json()
+    if show_accessibility_info is not None:
+        params['showAccessibilityInfo'] = show_accessibility_info
+    return params
+
+
 def get_highlight_object_for_test(
         node_id: dom.NodeId,
         include_distance: typing.Optional[bool] = None,
@@ -823,24 +869,30 @@ def get_highlight_object_for_test(
     :param show_accessibility_info: *(Optional)* Whether to show accessibility info (default: true).
     :returns: Highlight data for the node.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
-    if include_distance is not None:
-        params['includeDistance'] = include_distance
-    if include_style is not None:
-        params['includeStyle'] = include_style
-    if color_format is not None:
-        params['colorFormat'] = color_format.to_json()
-    if show_accessibility_info is not None:
-        params['showAccessibilityInfo'] = show_accessibility_info
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.getHighlightObjectForTest',
-        'params': params,
+        'params': _get_highlight_object_for_test_params(node_id, include_distance, include_style, color_format, show_accessibility_info),
     }
     json = yield cmd_dict
     return dict(json['highlight'])
 
 
+get_highlight_object_for_test_command = Command(
+    'Overlay.getHighlightObjectForTest',
+    get_highlight_object_for_test,
+    _get_highlight_object_for_test_params,
+    lambda json: dict(json['highlight']),
+)
+
+
+def _get_grid_highlight_objects_for_test_params(
+        node_ids: typing.List[dom.NodeId]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeIds'] = [i.to_json() for i in node_ids]
+    return params
+
+
 def get_grid_highlight_objects_for_test(
         node_ids: typing.List[dom.NodeId]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
@@ -850,16 +902,30 @@ def get_grid_highlight_objects_for_test(
     :param node_ids: Ids of the node to get highlight object for.
     :returns: Grid Highlight data for the node ids provided.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeIds'] = [i.to_json() for i in node_ids]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.getGridHighlightObjectsForTest',
-        'params': params,
+        'params': _get_grid_highlight_objects_for_test_params(node_ids),
     }
     json = yield cmd_dict
     return dict(json['highlights'])
 
 
+get_grid_highlight_objects_for_test_command = Command(
+    'Overlay.getGridHighlightObjectsForTest',
+    get_grid_highlight_objects_for_test,
+    _get_grid_highlight_objects_for_test_params,
+    lambda json: dict(json['highlights']),
+)
+
+
+def _get_source_order_highlight_object_for_test_params(
+        node_id: dom.NodeId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['nodeId'] = node_id.to_json()
+    return params
+
+
 def get_source_order_highlight_object_for_test(
         node_id: dom.NodeId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,dict]:
@@ -869,16 +935,22 @@ def get_source_order_highlight_object_for_test(
     :param node_id: Id of the node to highlight.
     :returns: Source order highlight data for the node id provided.
     '''
-    params: T_JSON_DICT = dict()
-    params['nodeId'] = node_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.getSourceOrderHighlightObjectForTest',
-        'params': params,
+        'params': _get_source_order_highlight_object_for_test_params(node_id),
     }
     json = yield cmd_dict
     return dict(json['highlight'])
 
 
+get_source_order_highlight_object_for_test_command = Command(
+    'Overlay.getSourceOrderHighlightObjectForTest',
+    get_source_order_highlight_object_for_test,
+    _get_source_order_highlight_object_for_test_params,
+    lambda json: dict(json['highlight']),
+)
+
+
 def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Hides any highlight.
@@ -889,6 +961,23 @@ def hide_highlight() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+hide_highlight_command = Command('Overlay.hideHighlight', hide_highlight)
+
+
+def _highlight_frame_params(
+        frame_id: page.FrameId,
+        content_color: typing.Optional[dom.RGBA] = None,
+        content_outline_color: typing.Optional[dom.RGBA] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    if content_color is not None:
+        params['contentColor'] = content_color.to_json()
+    if content_outline_color is not None:
+        params['contentOutlineColor'] = content_outline_color.to_json()
+    return params
+
+
 @deprecated(version="1.3")
 def highlight_frame(
         frame_id: page.FrameId,
@@ -907,19 +996,41 @@ def highlight_frame(
     :param content_color: *(Optional)* The content box highlight fill color (default: transparent).
     :param content_outline_color: *(Optional)* The content box highlight outline color (default: transparent).
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    if content_color is not None:
-        params['contentColor'] = content_color.to_json()
-    if content_outline_color is not None:
-        params['contentOutlineColor'] = content_outline_color.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.highlightFrame',
-        'params': params,
+        'params': _highlight_frame_params(frame_id, content_color, content_outline_color),
     }
     json = yield cmd_dict
 
 
+highlight_frame_command = Command(
+    'Overlay.highlightFrame',
+    highlight_frame,
+    _highlight_frame_params,
+    deprecated='1.3',
+)
+
+
+def _highlight_node_params(
+        highlight_config: HighlightConfig,
+        node_id: typing.Optional[dom.NodeId] = None,
+        backend_node_id: typing.Optional[dom.BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None,
+        selector: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['highlightConfig'] = highlight_config.to_json()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    if selector is not None:
+        params['selector'] = selector
+    return params
+
+
 def highlight_node(
         highlight_config: HighlightConfig,
         node_id: typing.Optional[dom.NodeId] = None,
@@ -937,23 +1048,34 @@ def highlight_node(
     :param object_id: *(Optional)* JavaScript object id of the node to be highlighted.
     :param selector: *(Optional)* Selectors to highlight relevant nodes.
     '''
-    params: T_JSON_DICT = dict()
-    params['highlightConfig'] = highlight_config.to_json()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
-    if selector is not None:
-        params['selector'] = selector
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.highlightNode',
-        'params': params,
+        'params': _highlight_node_params(highlight_config, node_id, backend_node_id, object_id, selector),
     }
     json = yield cmd_dict
 
 
+highlight_node_command = Command(
+    'Overlay.highlightNode',
+    highlight_node,
+    _highlight_node_params,
+)
+
+
+def _highlight_quad_params(
+        quad: dom.Quad,
+        color: typing.Optional[dom.RGBA] = None,
+        outline_color: typing.Optional[dom.RGBA] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['quad'] = quad.to_json()
+    if color is not None:
+        params['color'] = color.to_json()
+    if outline_color is not None:
+        params['outlineColor'] = outline_color.to_json()
+    return params
+
+
 def highlight_quad(
         quad: dom.Quad,
         color: typing.Optional[dom.RGBA] = None,
@@ -966,17 +1088,38 @@ def highlight_quad(
     :param color: *(Optional)* The highlight fill color (default: transparent).
     :param outline_color: *(Optional)* The highlight outline color (default: transparent).
     '''
+    cmd_dict: T_JSON_DICT = {
+        'method': 'Overlay.highlightQuad',
+        'params': _highlight_quad_params(quad, color, outline_color),
+    }
+    json = yield cmd_dict
+
+
+highlight_quad_command = Command(
+    'Overlay.highlightQuad',
+    highlight_quad,
+    _highlight_quad_params,
+)
+
+
+def _highlight_rect_params(
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        color: typing.Optional[dom.RGBA] = None,
+        outline_color: typing.Optional[dom.RGBA] = None
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
-    params['quad'] = quad.to_json()
+    params['x'] = x
+    params['y'] = y
+    params['width'] = width
+    params['height'] = height
     if color is not None:
         params['color'] = color.to_json()
     if outline_color is not None:
         params['outlineColor'] = outline_color.to_json()
-    cmd_dict: T_JSON_DICT = {
-        'method': 'Overlay.highlightQuad',
-        'params': params,
-    }
-    json = yield cmd_dict
+    return params
 
 
 def highlight_rect(
@@ -1000,22 +1143,37 @@ def highlight_rect(
     :param color: *(Optional)* The highlight fill color (default: transparent).
     :param outline_color: *(Optional)* The highlight outline color (default: transparent).
     '''
-    params: T_JSON_DICT = dict()
-    params['x'] = x
-    params['y'] = y
-    params['width'] = width
-    params['height'] = height
-    if color is not None:
-        params['color'] = color.to_json()
-    if outline_color is not None:
-        params['outlineColor'] = outline_color.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.highlightRect',
-        'params': params,
+        'params': _highlight_rect_params(x, y, width, height, color, outline_color),
     }
     json = yield cmd_dict
 
 
+highlight_rect_command = Command(
+    'Overlay.highlightRect',
+    highlight_rect,
+    _highlight_rect_params,
+)
+
+
+def _highlight_source_order_params(
+        source_order_config: SourceOrderConfig,
+        node_id: typing.Optional[dom.NodeId] = None,
+        backend_node_id: typing.Optional[dom.BackendNodeId] = None,
+        object_id: typing.Optional[runtime.RemoteObjectId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['sourceOrderConfig'] = source_order_config.to_json()
+    if node_id is not None:
+        params['nodeId'] = node_id.to_json()
+    if backend_node_id is not None:
+        params['backendNodeId'] = backend_node_id.to_json()
+    if object_id is not None:
+        params['objectId'] = object_id.to_json()
+    return params
+
+
 def highlight_source_order(
         source_order_config: SourceOrderConfig,
         node_id: typing.Optional[dom.NodeId] = None,
@@ -1031,21 +1189,31 @@ def highlight_source_order(
     :param backend_node_id: *(Optional)* Identifier of the backend node to highlight.
     :param object_id: *(Optional)* JavaScript object id of the node to be highlighted.
     '''
-    params: T_JSON_DICT = dict()
-    params['sourceOrderConfig'] = source_order_config.to_json()
-    if node_id is not None:
-        params['nodeId'] = node_id.to_json()
-    if backend_node_id is not None:
-        params['backendNodeId'] = backend_node_id.to_json()
-    if object_id is not None:
-        params['objectId'] = object_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.highlightSourceOrder',
-        'params': params,
+        'params': _highlight_source_order_params(source_order_config, node_id, backend_node_id, object_id),
     }
     json = yield cmd_dict
 
 
+highlight_source_order_command = Command(
+    'Overlay.highlightSourceOrder',
+    highlight_source_order,
+    _highlight_source_order_params,
+)
+
+
+def _set_inspect_mode_params(
+        mode: InspectMode,
+        highlight_config: typing.Optional[HighlightConfig] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['mode'] = mode.to_json()
+    if highlight_config is not None:
+        params['highlightConfig'] = highlight_config.to_json()
+    return params
+
+
 def set_inspect_mode(
         mode: InspectMode,
         highlight_config: typing.Optional[HighlightConfig] = None
@@ -1057,17 +1225,28 @@ def set_inspect_mode(
     :param mode: Set an inspection mode.
     :param highlight_config: *(Optional)* A descriptor for the highlight appearance of hovered-over nodes. May be omitted if ```enabled == false```.
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode.to_json()
-    if highlight_config is not None:
-        params['highlightConfig'] = highlight_config.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setInspectMode',
-        'params': params,
+        'params': _set_inspect_mode_params(mode, highlight_config),
     }
     json = yield cmd_dict
 
 
+set_inspect_mode_command = Command(
+    'Overlay.setInspectMode',
+    set_inspect_mode,
+    _set_inspect_mode_params,
+)
+
+
+def _set_show_ad_highlights_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 def set_show_ad_highlights(
         show: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1076,31 +1255,57 @@ def set_show_ad_highlights(
 
     :param show: True for showing ad highlights
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowAdHighlights',
-        'params': params,
+        'params': _set_show_ad_highlights_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_ad_highlights_command = Command(
+    'Overlay.setShowAdHighlights',
+    set_show_ad_highlights,
+    _set_show_ad_highlights_params,
+)
+
+
+def _set_paused_in_debugger_message_params(
+        message: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if message is not None:
+        params['message'] = message
+    return params
+
+
 def set_paused_in_debugger_message(
         message: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     :param message: *(Optional)* The message to display, also triggers resume and step over controls.
     '''
-    params: T_JSON_DICT = dict()
-    if message is not None:
-        params['message'] = message
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setPausedInDebuggerMessage',
-        'params': params,
+        'params': _set_paused_in_debugger_message_params(message),
     }
     json = yield cmd_dict
 
 
+set_paused_in_debugger_message_command = Command(
+    'Overlay.setPausedInDebuggerMessage',
+    set_paused_in_debugger_message,
+    _set_paused_in_debugger_message_params,
+)
+
+
+def _set_show_debug_borders_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 def set_show_debug_borders(
         show: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1109,15 +1314,28 @@ def set_show_debug_borders(
 
     :param show: True for showing debug borders
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowDebugBorders',
-        'params': params,
+        'params': _set_show_debug_borders_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_debug_borders_command = Command(
+    'Overlay.setShowDebugBorders',
+    set_show_debug_borders,
+    _set_show_debug_borders_params,
+)
+
+
+def _set_show_fps_counter_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 def set_show_fps_counter(
         show: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1126,15 +1344,28 @@ def set_show_fps_counter(
 
     :param show: True for showing the FPS counter
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowFPSCounter',
-        'params': params,
+        'params': _set_show_fps_counter_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_fps_counter_command = Command(
+    'Overlay.setShowFPSCounter',
+    set_show_fps_counter,
+    _set_show_fps_counter_params,
+)
+
+
+def _set_show_grid_overlays_params(
+        grid_node_highlight_configs: typing.List[GridNodeHighlightConfig]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['gridNodeHighlightConfigs'] = [i.to_json() for i in grid_node_highlight_configs]
+    return params
+
+
 def set_show_grid_overlays(
         grid_node_highlight_configs: typing.List[GridNodeHighlightConfig]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1143,75 +1374,140 @@ def set_show_grid_overlays(
 
     :param grid_node_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['gridNodeHighlightConfigs'] = [i.to_json() for i in grid_node_highlight_configs]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowGridOverlays',
-        'params': params,
+        'params': _set_show_grid_overlays_params(grid_node_highlight_configs),
     }
     json = yield cmd_dict
 
 
+set_show_grid_overlays_command = Command(
+    'Overlay.setShowGridOverlays',
+    set_show_grid_overlays,
+    _set_show_grid_overlays_params,
+)
+
+
+def _set_show_flex_overlays_params(
+        flex_node_highlight_configs: typing.List[FlexNodeHighlightConfig]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['flexNodeHighlightConfigs'] = [i.to_json() for i in flex_node_highlight_configs]
+    return params
+
+
 def set_show_flex_overlays(
         flex_node_highlight_configs: typing.List[FlexNodeHighlightConfig]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     :param flex_node_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['flexNodeHighlightConfigs'] = [i.to_json() for i in flex_node_highlight_configs]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowFlexOverlays',
-        'params': params,
+        'params': _set_show_flex_overlays_params(flex_node_highlight_configs),
     }
     json = yield cmd_dict
 
 
+set_show_flex_overlays_command = Command(
+    'Overlay.setShowFlexOverlays',
+    set_show_flex_overlays,
+    _set_show_flex_overlays_params,
+)
+
+
+def _set_show_scroll_snap_overlays_params(
+        scroll_snap_highlight_configs: typing.List[ScrollSnapHighlightConfig]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['scrollSnapHighlightConfigs'] = [i.to_json() for i in scroll_snap_highlight_configs]
+    return params
+
+
 def set_show_scroll_snap_overlays(
         scroll_snap_highlight_configs: typing.List[ScrollSnapHighlightConfig]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     :param scroll_snap_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['scrollSnapHighlightConfigs'] = [i.to_json() for i in scroll_snap_highlight_configs]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowScrollSnapOverlays',
-        'params': params,
+        'params': _set_show_scroll_snap_overlays_params(scroll_snap_highlight_configs),
     }
     json = yield cmd_dict
 
 
+set_show_scroll_snap_overlays_command = Command(
+    'Overlay.setShowScrollSnapOverlays',
+    set_show_scroll_snap_overlays,
+    _set_show_scroll_snap_overlays_params,
+)
+
+
+def _set_show_container_query_overlays_params(
+        container_query_highlight_configs: typing.List[ContainerQueryHighlightConfig]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['containerQueryHighlightConfigs'] = [i.to_json() for i in container_query_highlight_configs]
+    return params
+
+
 def set_show_container_query_overlays(
         container_query_highlight_configs: typing.List[ContainerQueryHighlightConfig]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     :param container_query_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['containerQueryHighlightConfigs'] = [i.to_json() for i in container_query_highlight_configs]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowContainerQueryOverlays',
-        'params': params,
+        'params': _set_show_container_query_overlays_params(container_query_highlight_configs),
     }
     json = yield cmd_dict
 
 
+set_show_container_query_overlays_command = Command(
+    'Overlay.setShowContainerQueryOverlays',
+    set_show_container_query_overlays,
+    _set_show_container_query_overlays_params,
+)
+
+
+def _set_show_inspected_element_anchor_params(
+        inspected_element_anchor_config: InspectedElementAnchorConfig
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['inspectedElementAnchorConfig'] = inspected_element_anchor_config.to_json()
+    return params
+
+
 def set_show_inspected_element_anchor(
         inspected_element_anchor_config: InspectedElementAnchorConfig
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     :param inspected_element_anchor_config: Node identifier for which to show an anchor for.
     '''
-    params: T_JSON_DICT = dict()
-    params['inspectedElementAnchorConfig'] = inspected_element_anchor_config.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowInspectedElementAnchor',
-        'params': params,
+        'params': _set_show_inspected_element_anchor_params(inspected_element_anchor_config),
     }
     json = yield cmd_dict
 
 
+set_show_inspected_element_anchor_command = Command(
+    'Overlay.setShowInspectedElementAnchor',
+    set_show_inspected_element_anchor,
+    _set_show_inspected_element_anchor_params,
+)
+
+
+def _set_show_paint_rects_params(
+        result: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['result'] = result
+    return params
+
+
 def set_show_paint_rects(
         result: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1220,15 +1516,28 @@ def set_show_paint_rects(
 
     :param result: True for showing paint rectangles
     '''
-    params: T_JSON_DICT = dict()
-    params['result'] = result
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowPaintRects',
-        'params': params,
+        'params': _set_show_paint_rects_params(result),
     }
     json = yield cmd_dict
 
 
+set_show_paint_rects_command = Command(
+    'Overlay.setShowPaintRects',
+    set_show_paint_rects,
+    _set_show_paint_rects_params,
+)
+
+
+def _set_show_layout_shift_regions_params(
+        result: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['result'] = result
+    return params
+
+
 def set_show_layout_shift_regions(
         result: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1237,15 +1546,28 @@ def set_show_layout_shift_regions(
 
     :param result: True for showing layout shift regions
     '''
-    params: T_JSON_DICT = dict()
-    params['result'] = result
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowLayoutShiftRegions',
-        'params': params,
+        'params': _set_show_layout_shift_regions_params(result),
     }
     json = yield cmd_dict
 
 
+set_show_layout_shift_regions_command = Command(
+    'Overlay.setShowLayoutShiftRegions',
+    set_show_layout_shift_regions,
+    _set_show_layout_shift_regions_params,
+)
+
+
+def _set_show_scroll_bottleneck_rects_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 def set_show_scroll_bottleneck_rects(
         show: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1254,15 +1576,28 @@ def set_show_scroll_bottleneck_rects(
 
     :param show: True for showing scroll bottleneck rects
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowScrollBottleneckRects',
-        'params': params,
+        'params': _set_show_scroll_bottleneck_rects_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_scroll_bottleneck_rects_command = Command(
+    'Overlay.setShowScrollBottleneckRects',
+    set_show_scroll_bottleneck_rects,
+    _set_show_scroll_bottleneck_rects_params,
+)
+
+
+def _set_show_hit_test_borders_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 @deprecated(version="1.3")
 def set_show_hit_test_borders(
         show: bool
@@ -1274,15 +1609,29 @@ def set_show_hit_test_borders(
 
     :param show: True for showing hit-test borders
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowHitTestBorders',
-        'params': params,
+        'params': _set_show_hit_test_borders_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_hit_test_borders_command = Command(
+    'Overlay.setShowHitTestBorders',
+    set_show_hit_test_borders,
+    _set_show_hit_test_borders_params,
+    deprecated='1.3',
+)
+
+
+def _set_show_web_vitals_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 @deprecated(version="1.3")
 def set_show_web_vitals(
         show: bool
@@ -1294,15 +1643,29 @@ def set_show_web_vitals(
 
     :param show:
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowWebVitals',
-        'params': params,
+        'params': _set_show_web_vitals_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_web_vitals_command = Command(
+    'Overlay.setShowWebVitals',
+    set_show_web_vitals,
+    _set_show_web_vitals_params,
+    deprecated='1.3',
+)
+
+
+def _set_show_viewport_size_on_resize_params(
+        show: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['show'] = show
+    return params
+
+
 def set_show_viewport_size_on_resize(
         show: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1311,15 +1674,29 @@ def set_show_viewport_size_on_resize(
 
     :param show: Whether to paint size or not.
     '''
-    params: T_JSON_DICT = dict()
-    params['show'] = show
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowViewportSizeOnResize',
-        'params': params,
+        'params': _set_show_viewport_size_on_resize_params(show),
     }
     json = yield cmd_dict
 
 
+set_show_viewport_size_on_resize_command = Command(
+    'Overlay.setShowViewportSizeOnResize',
+    set_show_viewport_size_on_resize,
+    _set_show_viewport_size_on_resize_params,
+)
+
+
+def _set_show_hinge_params(
+        hinge_config: typing.Optional[HingeConfig] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if hinge_config is not None:
+        params['hingeConfig'] = hinge_config.to_json()
+    return params
+
+
 def set_show_hinge(
         hinge_config: typing.Optional[HingeConfig] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1328,16 +1705,28 @@ def set_show_hinge(
 
     :param hinge_config: *(Optional)* hinge data, null means hideHinge
     '''
-    params: T_JSON_DICT = dict()
-    if hinge_config is not None:
-        params['hingeConfig'] = hinge_config.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowHinge',
-        'params': params,
+        'params': _set_show_hinge_params(hinge_config),
     }
     json = yield cmd_dict
 
 
+set_show_hinge_command = Command(
+    'Overlay.setShowHinge',
+    set_show_hinge,
+    _set_show_hinge_params,
+)
+
+
+def _set_show_isolated_elements_params(
+        isolated_element_highlight_configs: typing.List[IsolatedElementHighlightConfig]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['isolatedElementHighlightConfigs'] = [i.to_json() for i in isolated_element_highlight_configs]
+    return params
+
+
 def set_show_isolated_elements(
         isolated_element_highlight_configs: typing.List[IsolatedElementHighlightConfig]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1346,15 +1735,29 @@ def set_show_isolated_elements(
 
     :param isolated_element_highlight_configs: An array of node identifiers and descriptors for the highlight appearance.
     '''
-    params: T_JSON_DICT = dict()
-    params['isolatedElementHighlightConfigs'] = [i.to_json() for i in isolated_element_highlight_configs]
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowIsolatedElements',
-        'params': params,
+        'params': _set_show_isolated_elements_params(isolated_element_highlight_configs),
     }
     json = yield cmd_dict
 
 
+set_show_isolated_elements_command = Command(
+    'Overlay.setShowIsolatedElements',
+    set_show_isolated_elements,
+    _set_show_isolated_elements_params,
+)
+
+
+def _set_show_window_controls_overlay_params(
+        window_controls_overlay_config: typing.Optional[WindowControlsOverlayConfig] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if window_controls_overlay_config is not None:
+        params['windowControlsOverlayConfig'] = window_controls_overlay_config.to_json()
+    return params
+
+
 def set_show_window_controls_overlay(
         window_controls_overlay_config: typing.Optional[WindowControlsOverlayConfig] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -1363,18 +1766,22 @@ def set_show_window_controls_overlay(
 
     :param window_controls_overlay_config: *(Optional)* Window Controls Overlay data, null means hide Window Controls Overlay
     '''
-    params: T_JSON_DICT = dict()
-    if window_controls_overlay_config is not None:
-        params['windowControlsOverlayConfig'] = window_controls_overlay_config.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Overlay.setShowWindowControlsOverlay',
-        'params': params,
+        'params': _set_show_window_controls_overlay_params(window_controls_overlay_config),
     }
     json = yield cmd_dict
 
 
+set_show_window_controls_overlay_command = Command(
+    'Overlay.setShowWindowControlsOverlay',
+    set_show_window_controls_overlay,
+    _set_show_window_controls_overlay_params,
+)
+
+
 @event_class('Overlay.inspectNodeRequested')
-@dataclass
+@slotted_dataclass
 class InspectNodeRequested:
     r'''
     Fired when the node should be inspected. This happens after call to ``setInspectMode`` or when
@@ -1391,7 +1798,7 @@ class InspectNodeRequested:
 
 
 @event_class('Overlay.nodeHighlightRequested')
-@dataclass
+@slotted_dataclass
 class NodeHighlightRequested:
     r'''
     Fired when the node should be highlighted. This happens after call to ``setInspectMode``.
@@ -1406,7 +1813,7 @@ class NodeHighlightRequested:
 
 
 @event_class('Overlay.screenshotRequested')
-@dataclass
+@slotted_dataclass
 class ScreenshotRequested:
     r'''
     Fired when user asks to capture screenshot of some area on the page.
@@ -1422,7 +1829,7 @@ class ScreenshotRequested:
 
 
 @event_class('Overlay.inspectPanelShowRequested')
-@dataclass
+@slotted_dataclass
 class InspectPanelShowRequested:
     r'''
     Fired when user asks to show the Inspect panel.
@@ -1438,7 +1845,7 @@ class InspectPanelShowRequested:
 
 
 @event_class('Overlay.inspectedElementWindowRestored')
-@dataclass
+@slotted_dataclass
 class InspectedElementWindowRestored:
     r'''
     Fired when user asks to restore the Inspected Element floating window.
@@ -1454,7 +1861,7 @@ class InspectedElementWindowRestored:
 
 
 @event_class('Overlay.inspectModeCanceled')
-@dataclass
+@slotted_dataclass
 class InspectModeCanceled:
     r'''
     Fired when user cancels the inspect mode.
@@ -6,17 +6,19 @@
 # CDP domain: Page
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import debugger
-from . import dom
-from . import emulation
-from . import io
-from . import network
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import debugger
+    from . import dom
+    from . import emulation
+    from . import io
+    from . import network
+    from . import runtime
+else:
+    lazy_import(globals(), 'debugger', 'dom', 'emulation', 'io', 'network', 'runtime')
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -48,7 +50,13 @@ class AdFrameType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameType:
-        return cls(json)
+        try:
+            return _AD_FRAME_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_AD_FRAME_TYPE_MEMBERS: typing.Dict[str, AdFrameType] = {member.value: member for member in AdFrameType}
 
 
 class AdFrameExplanation(enum.Enum):
@@ -61,10 +69,16 @@ class AdFrameExplanation(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> AdFrameExplanation:
-        return cls(json)
+        try:
+            return _AD_FRAME_EXPLANATION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_AD_FRAME_EXPLANATION_MEMBERS: typing.Dict[str, AdFrameExplanation] = {member.value: member for member in AdFrameExplanation}
+
+
+@slotted_dataclass
 class AdFrameStatus:
     r'''
     Indicates whether a frame has been identified as an ad and why.
@@ -102,7 +116,13 @@ class SecureContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> SecureContextType:
-        return cls(json)
+        try:
+            return _SECURE_CONTEXT_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SECURE_CONTEXT_TYPE_MEMBERS: typing.Dict[str, SecureContextType] = {member.value: member for member in SecureContextType}
 
 
 class CrossOriginIsolatedContextType(enum.Enum):
@@ -118,7 +138,13 @@ class CrossOriginIsolatedContextType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> CrossOriginIsolatedContextType:
-        return cls(json)
+        try:
+            return _CROSS_ORIGIN_ISOLATED_CONTEXT_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CROSS_ORIGIN_ISOLATED_CONTEXT_TYPE_MEMBERS: typing.Dict[str, CrossOriginIsolatedContextType] = {member.value: member for member in CrossOriginIsolatedContextType}
 
 
 class GatedAPIFeatures(enum.Enum):
@@ -132,7 +158,13 @@ class GatedAPIFeatures(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> GatedAPIFeatures:
-        return cls(json)
+        try:
+            return _GATED_API_FEATURES_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_GATED_API_FEATURES_MEMBERS: typing.Dict[str, GatedAPIFeatures] = {member.value: member for member in GatedAPIFeatures}
 
 
 class PermissionsPolicyFeature(enum.Enum):
@@ -257,7 +289,13 @@ class PermissionsPolicyFeature(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyFeature:
-        return cls(json)
+        try:
+            return _PERMISSIONS_POLICY_FEATURE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_PERMISSIONS_POLICY_FEATURE_MEMBERS: typing.Dict[str, PermissionsPolicyFeature] = {member.value: member for member in PermissionsPolicyFeature}
 
 
 class PermissionsPolicyBlockReason(enum.Enum):
@@ -274,10 +312,16 @@ class PermissionsPolicyBlockReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> PermissionsPolicyBlockReason:
-        return cls(json)
+        try:
+            return _PERMISSIONS_POLICY_BLOCK_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_PERMISSIONS_POLICY_BLOCK_REASON_MEMBERS: typing.Dict[str, PermissionsPolicyBlockReason] = {member.value: member for member in PermissionsPolicyBlockReason}
 
-@dataclass
+
+@slotted_dataclass
 class PermissionsPolicyBlockLocator:
     frame_id: FrameId
 
@@ -297,7 +341,7 @@ class PermissionsPolicyBlockLocator:
         )
 
 
-@dataclass
+@slotted_dataclass
 class PermissionsPolicyFeatureState:
     feature: PermissionsPolicyFeature
 
@@ -345,7 +389,13 @@ class OriginTrialTokenStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialTokenStatus:
-        return cls(json)
+        try:
+            return _ORIGIN_TRIAL_TOKEN_STATUS_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_ORIGIN_TRIAL_TOKEN_STATUS_MEMBERS: typing.Dict[str, OriginTrialTokenStatus] = {member.value: member for member in OriginTrialTokenStatus}
 
 
 class OriginTrialStatus(enum.Enum):
@@ -362,7 +412,13 @@ class OriginTrialStatus(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialStatus:
-        return cls(json)
+        try:
+            return _ORIGIN_TRIAL_STATUS_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_ORIGIN_TRIAL_STATUS_MEMBERS: typing.Dict[str, OriginTrialStatus] = {member.value: member for member in OriginTrialStatus}
 
 
 class OriginTrialUsageRestriction(enum.Enum):
@@ -374,10 +430,16 @@ class OriginTrialUsageRestriction(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> OriginTrialUsageRestriction:
-        return cls(json)
+        try:
+            return _ORIGIN_TRIAL_USAGE_RESTRICTION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_ORIGIN_TRIAL_USAGE_RESTRICTION_MEMBERS: typing.Dict[str, OriginTrialUsageRestriction] = {member.value: member for member in OriginTrialUsageRestriction}
+
+
+@slotted_dataclass
 class OriginTrialToken:
     origin: str
 
@@ -413,7 +475,7 @@ class OriginTrialToken:
         )
 
 
-@dataclass
+@slotted_dataclass
 class OriginTrialTokenWithStatus:
     raw_token_text: str
 
@@ -440,7 +502,7 @@ class OriginTrialTokenWithStatus:
         )
 
 
-@dataclass
+@slotted_dataclass
 class OriginTrial:
     trial_name: str
 
@@ -464,7 +526,7 @@ class OriginTrial:
         )
 
 
-@dataclass
+@slotted_dataclass
 class SecurityOriginDetails:
     r'''
     Additional information about the frame document's security origin.
@@ -486,7 +548,7 @@ class SecurityOriginDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Frame:
     r'''
     Information about the Frame on the page.
@@ -585,7 +647,7 @@ class Frame:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FrameResource:
     r'''
     Information about the Resource on the page.
@@ -639,7 +701,7 @@ class FrameResource:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FrameResourceTree:
     r'''
     Information about the Frame hierarchy along with their cached resources.
@@ -670,7 +732,7 @@ class FrameResourceTree:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FrameTree:
     r'''
     Information about the Frame hierarchy.
@@ -734,10 +796,16 @@ class TransitionType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TransitionType:
-        return cls(json)
+        try:
+            return _TRANSITION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_TRANSITION_TYPE_MEMBERS: typing.Dict[str, TransitionType] = {member.value: member for member in TransitionType}
 
-@dataclass
+
+@slotted_dataclass
 class NavigationEntry:
     r'''
     Navigation history entry.
@@ -777,7 +845,7 @@ class NavigationEntry:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScreencastFrameMetadata:
     r'''
     Screencast frame metadata.
@@ -842,10 +910,16 @@ class DialogType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> DialogType:
-        return cls(json)
+        try:
+            return _DIALOG_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_DIALOG_TYPE_MEMBERS: typing.Dict[str, DialogType] = {member.value: member for member in DialogType}
 
 
-@dataclass
+@slotted_dataclass
 class AppManifestError:
     r'''
     Error while paring app manifest.
@@ -880,7 +954,7 @@ class AppManifestError:
         )
 
 
-@dataclass
+@slotted_dataclass
 class AppManifestParsedProperties:
     r'''
     Parsed app manifest properties.
@@ -900,7 +974,7 @@ class AppManifestParsedProperties:
         )
 
 
-@dataclass
+@slotted_dataclass
 class LayoutViewport:
     r'''
     Layout viewport position and dimensions.
@@ -935,7 +1009,7 @@ class LayoutViewport:
         )
 
 
-@dataclass
+@slotted_dataclass
 class VisualViewport:
     r'''
     Visual viewport position, dimensions, and scale.
@@ -991,7 +1065,7 @@ class VisualViewport:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Viewport:
     r'''
     Viewport for capturing screenshot.
@@ -1031,7 +1105,7 @@ class Viewport:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FontFamilies:
     r'''
     Generic font families collection.
@@ -1088,7 +1162,7 @@ class FontFamilies:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScriptFontFamilies:
     r'''
     Font families collection for a script.
@@ -1113,7 +1187,7 @@ class ScriptFontFamilies:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FontSizes:
     r'''
     Default font sizes.
@@ -1157,7 +1231,13 @@ class ClientNavigationReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationReason:
-        return cls(json)
+        try:
+            return _CLIENT_NAVIGATION_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_CLIENT_NAVIGATION_REASON_MEMBERS: typing.Dict[str, ClientNavigationReason] = {member.value: member for member in ClientNavigationReason}
 
 
 class ClientNavigationDisposition(enum.Enum):
@@ -1171,10 +1251,16 @@ class ClientNavigationDisposition(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ClientNavigationDisposition:
-        return cls(json)
+        try:
+            return _CLIENT_NAVIGATION_DISPOSITION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_CLIENT_NAVIGATION_DISPOSITION_MEMBERS: typing.Dict[str, ClientNavigationDisposition] = {member.value: member for member in ClientNavigationDisposition}
+
+
+@slotted_dataclass
 class InstallabilityErrorArgument:
     #: Argument name (e.g. name:'minimum-icon-size-in-pixels').
     name: str
@@ -1196,7 +1282,7 @@ class InstallabilityErrorArgument:
         )
 
 
-@dataclass
+@slotted_dataclass
 class InstallabilityError:
     r'''
     The installability error
@@ -1239,10 +1325,16 @@ class ReferrerPolicy(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ReferrerPolicy:
-        return cls(json)
+        try:
+            return _REFERRER_POLICY_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_REFERRER_POLICY_MEMBERS: typing.Dict[str, ReferrerPolicy] = {member.value: member for member in ReferrerPolicy}
 
-@dataclass
+
+@slotted_dataclass
 class CompilationCacheParams:
     r'''
     Per-script compilation cache parameters for ``Page.produceCompilationCache``
@@ -1269,7 +1361,7 @@ class CompilationCacheParams:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FileFilter:
     name: typing.Optional[str] = None
 
@@ -1291,7 +1383,7 @@ class FileFilter:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FileHandler:
     action: str
 
@@ -1328,7 +1420,7 @@ class FileHandler:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ImageResource:
     r'''
     The image definition used in both icon and screenshot.
@@ -1359,7 +1451,7 @@ class ImageResource:
         )
 
 
-@dataclass
+@slotted_dataclass
 class LaunchHandler:
     client_mode: str
 
@@ -1375,7 +1467,7 @@ class LaunchHandler:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ProtocolHandler:
     protocol: str
 
@@ -1395,7 +1487,7 @@ class ProtocolHandler:
         )
 
 
-@dataclass
+@slotted_dataclass
 class RelatedApplication:
     url: str
 
@@ -1416,7 +1508,7 @@ class RelatedApplication:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ScopeExtension:
     #: Instead of using tuple, this field always returns the serialized string
     #: for easy understanding and comparison.
@@ -1438,7 +1530,7 @@ class ScopeExtension:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Screenshot:
     image: ImageResource
 
@@ -1463,7 +1555,7 @@ class Screenshot:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ShareTarget:
     action: str
 
@@ -1508,7 +1600,7 @@ class ShareTarget:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Shortcut:
     name: str
 
@@ -1528,7 +1620,7 @@ class Shortcut:
         )
 
 
-@dataclass
+@slotted_dataclass
 class WebAppManifest:
     background_color: typing.Optional[str] = None
 
@@ -1677,7 +1769,13 @@ class NavigationType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> NavigationType:
-        return cls(json)
+        try:
+            return _NAVIGATION_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_NAVIGATION_TYPE_MEMBERS: typing.Dict[str, NavigationType] = {member.value: member for member in NavigationType}
 
 
 class BackForwardCacheNotRestoredReason(enum.Enum):
@@ -1837,7 +1935,13 @@ class BackForwardCacheNotRestoredReason(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReason:
-        return cls(json)
+        try:
+            return _BACK_FORWARD_CACHE_NOT_RESTORED_REASON_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_BACK_FORWARD_CACHE_NOT_RESTORED_REASON_MEMBERS: typing.Dict[str, BackForwardCacheNotRestoredReason] = {member.value: member for member in BackForwardCacheNotRestoredReason}
 
 
 class BackForwardCacheNotRestoredReasonType(enum.Enum):
@@ -1853,10 +1957,16 @@ class BackForwardCacheNotRestoredReasonType(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> BackForwardCacheNotRestoredReasonType:
-        return cls(json)
+        try:
+            return _BACK_FORWARD_CACHE_NOT_RESTORED_REASON_TYPE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
 
 
-@dataclass
+_BACK_FORWARD_CACHE_NOT_RESTORED_REASON_TYPE_MEMBERS: typing.Dict[str, BackForwardCacheNotRestoredReasonType] = {member.value: member for member in BackForwardCacheNotRestoredReasonType}
+
+
+@slotted_dataclass
 class BackForwardCacheBlockingDetails:
     #: Line number in the script (0-based).
     line_number: int
@@ -1890,7 +2000,7 @@ class BackForwardCacheBlockingDetails:
         )
 
 
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotRestoredExplanation:
     #: Type of the reason
     type_: BackForwardCacheNotRestoredReasonType
@@ -1925,7 +2035,7 @@ class BackForwardCacheNotRestoredExplanation:
         )
 
 
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotRestoredExplanationTree:
     #: URL of each frame
     url: str
@@ -1952,6 +2062,14 @@ class BackForwardCacheNotRestoredExplanationTree:
         )
 
 
+def _add_script_to_evaluate_on_load_params(
+        script_source: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['scriptSource'] = script_source
+    return params
+
+
 @deprecated(version="1.3")
 def add_script_to_evaluate_on_load(
         script_source: str
@@ -1966,16 +2084,40 @@ def add_script_to_evaluate_on_load(
     :param script_source:
     :returns: Identifier of the added script.
     '''
-    params: T_JSON_DICT = dict()
-    params['scriptSource'] = script_source
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.addScriptToEvaluateOnLoad',
-        'params': params,
+        'params': _add_script_to_evaluate_on_load_params(script_source),
     }
     json = yield cmd_dict
     return ScriptIdentifier.from_json(json['identifier'])
 
 
+add_script_to_evaluate_on_load_command = Command(
+    'Page.addScriptToEvaluateOnLoad',
+    add_script_to_evaluate_on_load,
+    _add_script_to_evaluate_on_load_params,
+    lambda json: ScriptIdentifier.from_json(json['identifier']),
+    deprecated='1.3',
+)
+
+
+def _add_script_to_evaluate_on_new_document_params(
+        source: str,
+        world_name: typing.Optional[str] = None,
+        include_command_line_api: typing.Optional[bool] = None,
+        run_immediately: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['source'] = source
+    if world_name is not None:
+        params['worldName'] = world_name
+    if include_command_line_api is not None:
+        params['includeCommandLineAPI'] = include_command_line_api
+    if run_immediately is not None:
+        params['runImmediately'] = run_immediately
+    return params
+
+
 def add_script_to_evaluate_on_new_document(
         source: str,
         world_name: typing.Optional[str] = None,
@@ -1991,22 +2133,22 @@ def add_script_to_evaluate_on_new_document(
     :param run_immediately: **(EXPERIMENTAL)** *(Optional)* If true, runs the script immediately on existing execution contexts or worlds. Default: false.
     :returns: Identifier of the added script.
     '''
-    params: T_JSON_DICT = dict()
-    params['source'] = source
-    if world_name is not None:
-        params['worldName'] = world_name
-    if include_command_line_api is not None:
-        params['includeCommandLineAPI'] = include_command_line_api
-    if run_immediately is not None:
-        params['runImmediately'] = run_immediately
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.addScriptToEvaluateOnNewDocument',
-        'params': params,
+        'params': _add_script_to_evaluate_on_new_document_params(source, world_name, include_command_line_api, run_immediately),
     }
     json = yield cmd_dict
     return ScriptIdentifier.from_json(json['identifier'])
 
 
+add_script_to_evaluate_on_new_document_command = Command(
+    'Page.addScriptToEvaluateOnNewDocument',
+    add_script_to_evaluate_on_new_document,
+    _add_script_to_evaluate_on_new_document_params,
+    lambda json: ScriptIdentifier.from_json(json['identifier']),
+)
+
+
 def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Brings page to front (activates tab).
@@ -2017,25 +2159,17 @@ def bring_to_front() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
-def capture_screenshot(
+bring_to_front_command = Command('Page.bringToFront', bring_to_front)
+
+
+def _capture_screenshot_params(
         format_: typing.Optional[str] = None,
         quality: typing.Optional[int] = None,
         clip: typing.Optional[Viewport] = None,
         from_surface: typing.Optional[bool] = None,
         capture_beyond_viewport: typing.Optional[bool] = None,
         optimize_for_speed: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
-    r'''
-    Capture page screenshot.
-
-    :param format_: *(Optional)* Image compression format (defaults to png).
-    :param quality: *(Optional)* Compression quality from range [0..100] (jpeg only).
-    :param clip: *(Optional)* Capture the screenshot of a given region only.
-    :param from_surface: **(EXPERIMENTAL)** *(Optional)* Capture the screenshot from the surface, rather than the view. Defaults to true.
-    :param capture_beyond_viewport: **(EXPERIMENTAL)** *(Optional)* Capture the screenshot beyond the viewport. Defaults to false.
-    :param optimize_for_speed: **(EXPERIMENTAL)** *(Optional)* Optimize image encoding for speed, not for resulting size (defaults to false)
-    :returns: Base64-encoded image data. (Encoded as a base64 string when passed over JSON)
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if format_ is not None:
         params['format'] = format_
@@ -2049,14 +2183,53 @@ def capture_screenshot(
         params['captureBeyondViewport'] = capture_beyond_viewport
     if optimize_for_speed is not None:
         params['optimizeForSpeed'] = optimize_for_speed
+    return params
+
+
+def capture_screenshot(
+        format_: typing.Optional[str] = None,
+        quality: typing.Optional[int] = None,
+        clip: typing.Optional[Viewport] = None,
+        from_surface: typing.Optional[bool] = None,
+        capture_beyond_viewport: typing.Optional[bool] = None,
+        optimize_for_speed: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
+    r'''
+    Capture page screenshot.
+
+    :param format_: *(Optional)* Image compression format (defaults to png).
+    :param quality: *(Optional)* Compression quality from range [0..100] (jpeg only).
+    :param clip: *(Optional)* Capture the screenshot of a given region only.
+    :param from_surface: **(EXPERIMENTAL)** *(Optional)* Capture the screenshot from the surface, rather than the view. Defaults to true.
+    :param capture_beyond_viewport: **(EXPERIMENTAL)** *(Optional)* Capture the screenshot beyond the viewport. Defaults to false.
+    :param optimize_for_speed: **(EXPERIMENTAL)** *(Optional)* Optimize image encoding for speed, not for resulting size (defaults to false)
+    :returns: Base64-encoded image data. (Encoded as a base64 string when passed over JSON)
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.captureScreenshot',
-        'params': params,
+        'params': _capture_screenshot_params(format_, quality, clip, from_surface, capture_beyond_viewport, optimize_for_speed),
     }
     json = yield cmd_dict
     return str(json['data'])
 
 
+capture_screenshot_command = Command(
+    'Page.captureScreenshot',
+    capture_screenshot,
+    _capture_screenshot_params,
+    lambda json: str(json['data']),
+)
+
+
+def _capture_snapshot_params(
+        format_: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if format_ is not None:
+        params['format'] = format_
+    return params
+
+
 def capture_snapshot(
         format_: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -2069,17 +2242,22 @@ def capture_snapshot(
     :param format_: *(Optional)* Format (defaults to mhtml).
     :returns: Serialized page data.
     '''
-    params: T_JSON_DICT = dict()
-    if format_ is not None:
-        params['format'] = format_
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.captureSnapshot',
-        'params': params,
+        'params': _capture_snapshot_params(format_),
     }
     json = yield cmd_dict
     return str(json['data'])
 
 
+capture_snapshot_command = Command(
+    'Page.captureSnapshot',
+    capture_snapshot,
+    _capture_snapshot_params,
+    lambda json: str(json['data']),
+)
+
+
 @deprecated(version="1.3")
 def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
@@ -2095,6 +2273,13 @@ def clear_device_metrics_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,
     json = yield cmd_dict
 
 
+clear_device_metrics_override_command = Command(
+    'Page.clearDeviceMetricsOverride',
+    clear_device_metrics_override,
+    deprecated='1.3',
+)
+
+
 @deprecated(version="1.3")
 def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
@@ -2110,6 +2295,13 @@ def clear_device_orientation_override() -> typing.Generator[T_JSON_DICT,T_JSON_D
     json = yield cmd_dict
 
 
+clear_device_orientation_override_command = Command(
+    'Page.clearDeviceOrientationOverride',
+    clear_device_orientation_override,
+    deprecated='1.3',
+)
+
+
 @deprecated(version="1.3")
 def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
@@ -2123,6 +2315,27 @@ def clear_geolocation_override() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Non
     json = yield cmd_dict
 
 
+clear_geolocation_override_command = Command(
+    'Page.clearGeolocationOverride',
+    clear_geolocation_override,
+    deprecated='1.3',
+)
+
+
+def _create_isolated_world_params(
+        frame_id: FrameId,
+        world_name: typing.Optional[str] = None,
+        grant_univeral_access: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    if world_name is not None:
+        params['worldName'] = world_name
+    if grant_univeral_access is not None:
+        params['grantUniveralAccess'] = grant_univeral_access
+    return params
+
+
 def create_isolated_world(
         frame_id: FrameId,
         world_name: typing.Optional[str] = None,
@@ -2136,20 +2349,32 @@ def create_isolated_world(
     :param grant_univeral_access: *(Optional)* Whether or not universal access should be granted to the isolated world. This is a powerful option, use with caution.
     :returns: Execution context of the isolated world.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    if world_name is not None:
-        params['worldName'] = world_name
-    if grant_univeral_access is not None:
-        params['grantUniveralAccess'] = grant_univeral_access
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.createIsolatedWorld',
-        'params': params,
+        'params': _create_isolated_world_params(frame_id, world_name, grant_univeral_access),
     }
     json = yield cmd_dict
     return runtime.ExecutionContextId.from_json(json['executionContextId'])
 
 
+create_isolated_world_command = Command(
+    'Page.createIsolatedWorld',
+    create_isolated_world,
+    _create_isolated_world_params,
+    lambda json: runtime.ExecutionContextId.from_json(json['executionContextId']),
+)
+
+
+def _delete_cookie_params(
+        cookie_name: str,
+        url: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['cookieName'] = cookie_name
+    params['url'] = url
+    return params
+
+
 @deprecated(version="1.3")
 def delete_cookie(
         cookie_name: str,
@@ -2165,16 +2390,21 @@ def delete_cookie(
     :param cookie_name: Name of the cookie to remove.
     :param url: URL to match cooke domain and path.
     '''
-    params: T_JSON_DICT = dict()
-    params['cookieName'] = cookie_name
-    params['url'] = url
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.deleteCookie',
-        'params': params,
+        'params': _delete_cookie_params(cookie_name, url),
     }
     json = yield cmd_dict
 
 
+delete_cookie_command = Command(
+    'Page.deleteCookie',
+    delete_cookie,
+    _delete_cookie_params,
+    deprecated='1.3',
+)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables page domain notifications.
@@ -2185,6 +2415,18 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('Page.disable', disable)
+
+
+def _enable_params(
+        enable_file_chooser_opened_event: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if enable_file_chooser_opened_event is not None:
+        params['enableFileChooserOpenedEvent'] = enable_file_chooser_opened_event
+    return params
+
+
 def enable(
         enable_file_chooser_opened_event: typing.Optional[bool] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2193,16 +2435,29 @@ def enable(
 
     :param enable_file_chooser_opened_event: **(EXPERIMENTAL)** *(Optional)* If true, the ```Page.fileChooserOpened```` event will be emitted regardless of the state set by ````Page.setInterceptFileChooserDialog``` command (default: false).
     '''
-    params: T_JSON_DICT = dict()
-    if enable_file_chooser_opened_event is not None:
-        params['enableFileChooserOpenedEvent'] = enable_file_chooser_opened_event
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.enable',
-        'params': params,
+        'params': _enable_params(enable_file_chooser_opened_event),
     }
     json = yield cmd_dict
 
 
+enable_command = Command(
+    'Page.enable',
+    enable,
+    _enable_params,
+)
+
+
+def _get_app_manifest_params(
+        manifest_id: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if manifest_id is not None:
+        params['manifestId'] = manifest_id
+    return params
+
+
 def get_app_manifest(
         manifest_id: typing.Optional[str] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.List[AppManifestError], typing.Optional[str], typing.Optional[AppManifestParsedProperties], WebAppManifest]]:
@@ -2222,12 +2477,9 @@ def get_app_manifest(
         3. **parsed** - *(Optional)* Parsed manifest properties. Deprecated, use manifest instead.
         4. **manifest** - 
     '''
-    params: T_JSON_DICT = dict()
-    if manifest_id is not None:
-        params['manifestId'] = manifest_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getAppManifest',
-        'params': params,
+        'params': _get_app_manifest_params(manifest_id),
     }
     json = yield cmd_dict
     return (
@@ -2239,6 +2491,20 @@ def get_app_manifest(
     )
 
 
+get_app_manifest_command = Command(
+    'Page.getAppManifest',
+    get_app_manifest,
+    _get_app_manifest_params,
+    lambda json: (
+        str(json['url']),
+        [AppManifestError.from_json(i) for i in json['errors']],
+        str(json['data']) if 'data' in json else None,
+        AppManifestParsedProperties.from_json(json['parsed']) if 'parsed' in json else None,
+        WebAppManifest.from_json(json['manifest'])
+    ),
+)
+
+
 def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[InstallabilityError]]:
     r'''
 
@@ -2254,6 +2520,14 @@ def get_installability_errors() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typi
     return [InstallabilityError.from_json(i) for i in json['installabilityErrors']]
 
 
+get_installability_errors_command = Command(
+    'Page.getInstallabilityErrors',
+    get_installability_errors,
+    None,
+    lambda json: [InstallabilityError.from_json(i) for i in json['installabilityErrors']],
+)
+
+
 @deprecated(version="1.3")
 def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[str]]:
     r'''
@@ -2272,6 +2546,15 @@ def get_manifest_icons() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Opti
     return str(json['primaryIcon']) if 'primaryIcon' in json else None
 
 
+get_manifest_icons_command = Command(
+    'Page.getManifestIcons',
+    get_manifest_icons,
+    None,
+    lambda json: str(json['primaryIcon']) if 'primaryIcon' in json else None,
+    deprecated='1.3',
+)
+
+
 def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.Optional[str], typing.Optional[str]]]:
     r'''
     Returns the unique (PWA) app id.
@@ -2294,6 +2577,25 @@ def get_app_id() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing
     )
 
 
+get_app_id_command = Command(
+    'Page.getAppId',
+    get_app_id,
+    None,
+    lambda json: (
+        str(json['appId']) if 'appId' in json else None,
+        str(json['recommendedId']) if 'recommendedId' in json else None
+    ),
+)
+
+
+def _get_ad_script_ancestry_params(
+        frame_id: FrameId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    return params
+
+
 def get_ad_script_ancestry(
         frame_id: FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[network.AdAncestry]]:
@@ -2305,16 +2607,22 @@ def get_ad_script_ancestry(
     :param frame_id:
     :returns: *(Optional)* The ancestry chain of ad script identifiers leading to this frame's creation, along with the root script's filterlist rule. The ancestry chain is ordered from the most immediate script (in the frame creation stack) to more distant ancestors (that created the immediately preceding script). Only sent if frame is labelled as an ad and ids are available.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getAdScriptAncestry',
-        'params': params,
+        'params': _get_ad_script_ancestry_params(frame_id),
     }
     json = yield cmd_dict
     return network.AdAncestry.from_json(json['adScriptAncestry']) if 'adScriptAncestry' in json else None
 
 
+get_ad_script_ancestry_command = Command(
+    'Page.getAdScriptAncestry',
+    get_ad_script_ancestry,
+    _get_ad_script_ancestry_params,
+    lambda json: network.AdAncestry.from_json(json['adScriptAncestry']) if 'adScriptAncestry' in json else None,
+)
+
+
 def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
     r'''
     Returns present frame tree structure.
@@ -2328,6 +2636,14 @@ def get_frame_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameTree]:
     return FrameTree.from_json(json['frameTree'])
 
 
+get_frame_tree_command = Command(
+    'Page.getFrameTree',
+    get_frame_tree,
+    None,
+    lambda json: FrameTree.from_json(json['frameTree']),
+)
+
+
 def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[LayoutViewport, VisualViewport, dom.Rect, LayoutViewport, VisualViewport, dom.Rect]]:
     r'''
     Returns metrics relating to the layouting of the page, such as viewport bounds/scale.
@@ -2355,6 +2671,21 @@ def get_layout_metrics() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tupl
     )
 
 
+get_layout_metrics_command = Command(
+    'Page.getLayoutMetrics',
+    get_layout_metrics,
+    None,
+    lambda json: (
+        LayoutViewport.from_json(json['layoutViewport']),
+        VisualViewport.from_json(json['visualViewport']),
+        dom.Rect.from_json(json['contentSize']),
+        LayoutViewport.from_json(json['cssLayoutViewport']),
+        VisualViewport.from_json(json['cssVisualViewport']),
+        dom.Rect.from_json(json['cssContentSize'])
+    ),
+)
+
+
 def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[int, typing.List[NavigationEntry]]]:
     r'''
     Returns navigation history for the current page.
@@ -2374,6 +2705,17 @@ def get_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.
     )
 
 
+get_navigation_history_command = Command(
+    'Page.getNavigationHistory',
+    get_navigation_history,
+    None,
+    lambda json: (
+        int(json['currentIndex']),
+        [NavigationEntry.from_json(i) for i in json['entries']]
+    ),
+)
+
+
 def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Resets navigation history for the current page.
@@ -2384,6 +2726,19 @@ def reset_navigation_history() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]
     json = yield cmd_dict
 
 
+reset_navigation_history_command = Command('Page.resetNavigationHistory', reset_navigation_history)
+
+
+def _get_resource_content_params(
+        frame_id: FrameId,
+        url: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    params['url'] = url
+    return params
+
+
 def get_resource_content(
         frame_id: FrameId,
         url: str
@@ -2400,12 +2755,9 @@ def get_resource_content(
         0. **content** - Resource content.
         1. **base64Encoded** - True, if content was served as base64.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['url'] = url
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getResourceContent',
-        'params': params,
+        'params': _get_resource_content_params(frame_id, url),
     }
     json = yield cmd_dict
     return (
@@ -2414,6 +2766,17 @@ def get_resource_content(
     )
 
 
+get_resource_content_command = Command(
+    'Page.getResourceContent',
+    get_resource_content,
+    _get_resource_content_params,
+    lambda json: (
+        str(json['content']),
+        bool(json['base64Encoded'])
+    ),
+)
+
+
 def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourceTree]:
     r'''
     Returns present frame / resource tree structure.
@@ -2429,27 +2792,69 @@ def get_resource_tree() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,FrameResourc
     return FrameResourceTree.from_json(json['frameTree'])
 
 
-def handle_java_script_dialog(
+get_resource_tree_command = Command(
+    'Page.getResourceTree',
+    get_resource_tree,
+    None,
+    lambda json: FrameResourceTree.from_json(json['frameTree']),
+)
+
+
+def _handle_java_script_dialog_params(
         accept: bool,
         prompt_text: typing.Optional[str] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload).
-
-    :param accept: Whether to accept or dismiss the dialog.
-    :param prompt_text: *(Optional)* The text to enter into the dialog prompt before accepting. Used only if this is a prompt dialog.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['accept'] = accept
     if prompt_text is not None:
         params['promptText'] = prompt_text
+    return params
+
+
+def handle_java_script_dialog(
+        accept: bool,
+        prompt_text: typing.Optional[str] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload).
+
+    :param accept: Whether to accept or dismiss the dialog.
+    :param prompt_text: *(Optional)* The text to enter into the dialog prompt before accepting. Used only if this is a prompt dialog.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.handleJavaScriptDialog',
-        'params': params,
+        'params': _handle_java_script_dialog_params(accept, prompt_text),
     }
     json = yield cmd_dict
 
 
+handle_java_script_dialog_command = Command(
+    'Page.handleJavaScriptDialog',
+    handle_java_script_dialog,
+    _handle_java_script_dialog_params,
+)
+
+
+def _navigate_params(
+        url: str,
+        referrer: typing.Optional[str] = None,
+        transition_type: typing.Optional[TransitionType] = None,
+        frame_id: typing.Optional[FrameId] = None,
+        referrer_policy: typing.Optional[ReferrerPolicy] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['url'] = url
+    if referrer is not None:
+        params['referrer'] = referrer
+    if transition_type is not None:
+        params['transitionType'] = transition_type.to_json()
+    if frame_id is not None:
+        params['frameId'] = frame_id.to_json()
+    if referrer_policy is not None:
+        params['referrerPolicy'] = referrer_policy.to_json()
+    return params
+
+
 def navigate(
         url: str,
         referrer: typing.Optional[str] = None,
@@ -2472,19 +2877,9 @@ def navigate(
         2. **errorText** - *(Optional)* User friendly error message, present if and only if navigation has failed.
         3. **isDownload** - *(Optional)* Whether the navigation resulted in a download.
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    if referrer is not None:
-        params['referrer'] = referrer
-    if transition_type is not None:
-        params['transitionType'] = transition_type.to_json()
-    if frame_id is not None:
-        params['frameId'] = frame_id.to_json()
-    if referrer_policy is not None:
-        params['referrerPolicy'] = referrer_policy.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.navigate',
-        'params': params,
+        'params': _navigate_params(url, referrer, transition_type, frame_id, referrer_policy),
     }
     json = yield cmd_dict
     return (
@@ -2495,6 +2890,27 @@ def navigate(
     )
 
 
+navigate_command = Command(
+    'Page.navigate',
+    navigate,
+    _navigate_params,
+    lambda json: (
+        FrameId.from_json(json['frameId']),
+        network.LoaderId.from_json(json['loaderId']) if 'loaderId' in json else None,
+        str(json['errorText']) if 'errorText' in json else None,
+        bool(json['isDownload']) if 'isDownload' in json else None
+    ),
+)
+
+
+def _navigate_to_history_entry_params(
+        entry_id: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['entryId'] = entry_id
+    return params
+
+
 def navigate_to_history_entry(
         entry_id: int
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2503,16 +2919,21 @@ def navigate_to_history_entry(
 
     :param entry_id: Unique id of the entry to navigate to.
     '''
-    params: T_JSON_DICT = dict()
-    params['entryId'] = entry_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.navigateToHistoryEntry',
-        'params': params,
+        'params': _navigate_to_history_entry_params(entry_id),
     }
     json = yield cmd_dict
 
 
-def print_to_pdf(
+navigate_to_history_entry_command = Command(
+    'Page.navigateToHistoryEntry',
+    navigate_to_history_entry,
+    _navigate_to_history_entry_params,
+)
+
+
+def _print_to_pdf_params(
         landscape: typing.Optional[bool] = None,
         display_header_footer: typing.Optional[bool] = None,
         print_background: typing.Optional[bool] = None,
@@ -2530,32 +2951,7 @@ def print_to_pdf(
         transfer_mode: typing.Optional[str] = None,
         generate_tagged_pdf: typing.Optional[bool] = None,
         generate_document_outline: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.Optional[io.StreamHandle]]]:
-    r'''
-    Print page as PDF.
-
-    :param landscape: *(Optional)* Paper orientation. Defaults to false.
-    :param display_header_footer: *(Optional)* Display header and footer. Defaults to false.
-    :param print_background: *(Optional)* Print background graphics. Defaults to false.
-    :param scale: *(Optional)* Scale of the webpage rendering. Defaults to 1.
-    :param paper_width: *(Optional)* Paper width in inches. Defaults to 8.5 inches.
-    :param paper_height: *(Optional)* Paper height in inches. Defaults to 11 inches.
-    :param margin_top: *(Optional)* Top margin in inches. Defaults to 1cm (~0.4 inches).
-    :param margin_bottom: *(Optional)* Bottom margin in inches. Defaults to 1cm (~0.4 inches).
-    :param margin_left: *(Optional)* Left margin in inches. Defaults to 1cm (~0.4 inches).
-    :param margin_right: *(Optional)* Right margin in inches. Defaults to 1cm (~0.4 inches).
-    :param page_ranges: *(Optional)* Paper ranges to print, one based, e.g., '1-5, 8, 11-13'. Pages are printed in the document order, not in the order specified, and no more than once. Defaults to empty string, which implies the entire document is printed. The page numbers are quietly capped to actual page count of the document, and ranges beyond the end of the document are ignored. If this results in no pages to print, an error is reported. It is an error to specify a range with start greater than end.
-    :param header_template: *(Optional)* HTML template for the print header. Should be valid HTML markup with following classes used to inject printing values into them: - ```date````: formatted print date - ````title````: document title - ````url````: document location - ````pageNumber````: current page number - ````totalPages````: total pages in the document  For example, ````<span class=title></span>```` would generate span containing the title.
-    :param footer_template: *(Optional)* HTML template for the print footer. Should use the same format as the ````headerTemplate````.
-    :param prefer_css_page_size: *(Optional)* Whether or not to prefer page size as defined by css. Defaults to false, in which case the content will be scaled to fit the paper size.
-    :param transfer_mode: **(EXPERIMENTAL)** *(Optional)* return as stream
-    :param generate_tagged_pdf: **(EXPERIMENTAL)** *(Optional)* Whether or not to generate tagged (accessible) PDF. Defaults to embedder choice.
-    :param generate_document_outline: **(EXPERIMENTAL)** *(Optional)* Whether or not to embed the document outline into the PDF.
-    :returns: A tuple with the following items:
-
-        0. **data** - Base64-encoded pdf data. Empty if `` returnAsStream` is specified. (Encoded as a base64 string when passed over JSON)
-        1. **stream** - *(Optional)* A handle of the stream that holds resulting PDF data.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if landscape is not None:
         params['landscape'] = landscape
@@ -2591,9 +2987,56 @@ def print_to_pdf(
         params['generateTaggedPDF'] = generate_tagged_pdf
     if generate_document_outline is not None:
         params['generateDocumentOutline'] = generate_document_outline
+    return params
+
+
+def print_to_pdf(
+        landscape: typing.Optional[bool] = None,
+        display_header_footer: typing.Optional[bool] = None,
+        print_background: typing.Optional[bool] = None,
+        scale: typing.Optional[float] = None,
+        paper_width: typing.Optional[float] = None,
+        paper_height: typing.Optional[float] = None,
+        margin_top: typing.Optional[float] = None,
+        margin_bottom: typing.Optional[float] = None,
+        margin_left: typing.Optional[float] = None,
+        margin_right: typing.Optional[float] = None,
+        page_ranges: typing.Optional[str] = None,
+        header_template: typing.Optional[str] = None,
+        footer_template: typing.Optional[str] = None,
+        prefer_css_page_size: typing.Optional[bool] = None,
+        transfer_mode: typing.Optional[str] = None,
+        generate_tagged_pdf: typing.Optional[bool] = None,
+        generate_document_outline: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[str, typing.Optional[io.StreamHandle]]]:
+    r'''
+    Print page as PDF.
+
+    :param landscape: *(Optional)* Paper orientation. Defaults to false.
+    :param display_header_footer: *(Optional)* Display header and footer. Defaults to false.
+    :param print_background: *(Optional)* Print background graphics. Defaults to false.
+    :param scale: *(Optional)* Scale of the webpage rendering. Defaults to 1.
+    :param paper_width: *(Optional)* Paper width in inches. Defaults to 8.5 inches.
+    :param paper_height: *(Optional)* Paper height in inches. Defaults to 11 inches.
+    :param margin_top: *(Optional)* Top margin in inches. Defaults to 1cm (~0.4 inches).
+    :param margin_bottom: *(Optional)* Bottom margin in inches. Defaults to 1cm (~0.4 inches).
+    :param margin_left: *(Optional)* Left margin in inches. Defaults to 1cm (~0.4 inches).
+    :param margin_right: *(Optional)* Right margin in inches. Defaults to 1cm (~0.4 inches).
+    :param page_ranges: *(Optional)* Paper ranges to print, one based, e.g., '1-5, 8, 11-13'. Pages are printed in the document order, not in the order specified, and no more than once. Defaults to empty string, which implies the entire document is printed. The page numbers are quietly capped to actual page count of the document, and ranges beyond the end of the document are ignored. If this results in no pages to print, an error is reported. It is an error to specify a range with start greater than end.
+    :param header_template: *(Optional)* HTML template for the print header. Should be valid HTML markup with following classes used to inject printing values into them: - ```date````: formatted print date - ````title````: document title - ````url````: document location - ````pageNumber````: current page number - ````totalPages````: total pages in the document  For example, ````<span class=title></span>```` would generate span containing the title.
+    :param footer_template: *(Optional)* HTML template for the print footer. Should use the same format as the ````headerTemplate````.
+    :param prefer_css_page_size: *(Optional)* Whether or not to prefer page size as defined by css. Defaults to false, in which case the content will be scaled to fit the paper size.
+    :param transfer_mode: **(EXPERIMENTAL)** *(Optional)* return as stream
+    :param generate_tagged_pdf: **(EXPERIMENTAL)** *(Optional)* Whether or not to generate tagged (accessible) PDF. Defaults to embedder choice.
+    :param generate_document_outline: **(EXPERIMENTAL)** *(Optional)* Whether or not to embed the document outline into the PDF.
+    :returns: A tuple with the following items:
+
+        0. **data** - Base64-encoded pdf data. Empty if `` returnAsStream` is specified. (Encoded as a base64 string when passed over JSON)
+        1. **stream** - *(Optional)* A handle of the stream that holds resulting PDF data.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.printToPDF',
-        'params': params,
+        'params': _print_to_pdf_params(landscape, display_header_footer, print_background, scale, paper_width, paper_height, margin_top, margin_bottom, margin_left, margin_right, page_ranges, header_template, footer_template, prefer_css_page_size, transfer_mode, generate_tagged_pdf, generate_document_outline),
     }
     json = yield cmd_dict
     return (
@@ -2602,6 +3045,32 @@ def print_to_pdf(
     )
 
 
+print_to_pdf_command = Command(
+    'Page.printToPDF',
+    print_to_pdf,
+    _print_to_pdf_params,
+    lambda json: (
+        str(json['data']),
+        io.StreamHandle.from_json(json['stream']) if 'stream' in json else None
+    ),
+)
+
+
+def _reload_params(
+        ignore_cache: typing.Optional[bool] = None,
+        script_to_evaluate_on_load: typing.Optional[str] = None,
+        loader_id: typing.Optional[network.LoaderId] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if ignore_cache is not None:
+        params['ignoreCache'] = ignore_cache
+    if script_to_evaluate_on_load is not None:
+        params['scriptToEvaluateOnLoad'] = script_to_evaluate_on_load
+    if loader_id is not None:
+        params['loaderId'] = loader_id.to_json()
+    return params
+
+
 def reload(
         ignore_cache: typing.Optional[bool] = None,
         script_to_evaluate_on_load: typing.Optional[str] = None,
@@ -2614,20 +3083,28 @@ def reload(
     :param script_to_evaluate_on_load: *(Optional)* If set, the script will be injected into all frames of the inspected page after reload. Argument will be ignored if reloading dataURL origin.
     :param loader_id: **(EXPERIMENTAL)** *(Optional)* If set, an error will be thrown if the target page's main frame's loader id does not match the provided id. This prevents accidentally reloading an unintended target in case there's a racing navigation.
     '''
-    params: T_JSON_DICT = dict()
-    if ignore_cache is not None:
-        params['ignoreCache'] = ignore_cache
-    if script_to_evaluate_on_load is not None:
-        params['scriptToEvaluateOnLoad'] = script_to_evaluate_on_load
-    if loader_id is not None:
-        params['loaderId'] = loader_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.reload',
-        'params': params,
+        'params': _reload_params(ignore_cache, script_to_evaluate_on_load, loader_id),
     }
     json = yield cmd_dict
 
 
+reload_command = Command(
+    'Page.reload',
+    reload,
+    _reload_params,
+)
+
+
+def _remove_script_to_evaluate_on_load_params(
+        identifier: ScriptIdentifier
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['identifier'] = identifier.to_json()
+    return params
+
+
 @deprecated(version="1.3")
 def remove_script_to_evaluate_on_load(
         identifier: ScriptIdentifier
@@ -2641,15 +3118,29 @@ def remove_script_to_evaluate_on_load(
 
     :param identifier:
     '''
-    params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.removeScriptToEvaluateOnLoad',
-        'params': params,
+        'params': _remove_script_to_evaluate_on_load_params(identifier),
     }
     json = yield cmd_dict
 
 
+remove_script_to_evaluate_on_load_command = Command(
+    'Page.removeScriptToEvaluateOnLoad',
+    remove_script_to_evaluate_on_load,
+    _remove_script_to_evaluate_on_load_params,
+    deprecated='1.3',
+)
+
+
+def _remove_script_to_evaluate_on_new_document_params(
+        identifier: ScriptIdentifier
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['identifier'] = identifier.to_json()
+    return params
+
+
 def remove_script_to_evaluate_on_new_document(
         identifier: ScriptIdentifier
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2658,15 +3149,28 @@ def remove_script_to_evaluate_on_new_document(
 
     :param identifier:
     '''
-    params: T_JSON_DICT = dict()
-    params['identifier'] = identifier.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.removeScriptToEvaluateOnNewDocument',
-        'params': params,
+        'params': _remove_script_to_evaluate_on_new_document_params(identifier),
     }
     json = yield cmd_dict
 
 
+remove_script_to_evaluate_on_new_document_command = Command(
+    'Page.removeScriptToEvaluateOnNewDocument',
+    remove_script_to_evaluate_on_new_document,
+    _remove_script_to_evaluate_on_new_document_params,
+)
+
+
+def _screencast_frame_ack_params(
+        session_id: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['sessionId'] = session_id
+    return params
+
+
 def screencast_frame_ack(
         session_id: int
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2677,15 +3181,38 @@ def screencast_frame_ack(
 
     :param session_id: Frame number.
     '''
-    params: T_JSON_DICT = dict()
-    params['sessionId'] = session_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.screencastFrameAck',
-        'params': params,
+        'params': _screencast_frame_ack_params(session_id),
     }
     json = yield cmd_dict
 
 
+screencast_frame_ack_command = Command(
+    'Page.screencastFrameAck',
+    screencast_frame_ack,
+    _screencast_frame_ack_params,
+)
+
+
+def _search_in_resource_params(
+        frame_id: FrameId,
+        url: str,
+        query: str,
+        case_sensitive: typing.Optional[bool] = None,
+        is_regex: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    params['url'] = url
+    params['query'] = query
+    if case_sensitive is not None:
+        params['caseSensitive'] = case_sensitive
+    if is_regex is not None:
+        params['isRegex'] = is_regex
+    return params
+
+
 def search_in_resource(
         frame_id: FrameId,
         url: str,
@@ -2705,22 +3232,30 @@ def search_in_resource(
     :param is_regex: *(Optional)* If true, treats string parameter as regex.
     :returns: List of search matches.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['url'] = url
-    params['query'] = query
-    if case_sensitive is not None:
-        params['caseSensitive'] = case_sensitive
-    if is_regex is not None:
-        params['isRegex'] = is_regex
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.searchInResource',
-        'params': params,
+        'params': _search_in_resource_params(frame_id, url, query, case_sensitive, is_regex),
     }
     json = yield cmd_dict
     return [debugger.SearchMatch.from_json(i) for i in json['result']]
 
 
+search_in_resource_command = Command(
+    'Page.searchInResource',
+    search_in_resource,
+    _search_in_resource_params,
+    lambda json: [debugger.SearchMatch.from_json(i) for i in json['result']],
+)
+
+
+def _set_ad_blocking_enabled_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_ad_blocking_enabled(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2731,15 +3266,28 @@ def set_ad_blocking_enabled(
 
     :param enabled: Whether to block ads.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setAdBlockingEnabled',
-        'params': params,
+        'params': _set_ad_blocking_enabled_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_ad_blocking_enabled_command = Command(
+    'Page.setAdBlockingEnabled',
+    set_ad_blocking_enabled,
+    _set_ad_blocking_enabled_params,
+)
+
+
+def _set_bypass_csp_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_bypass_csp(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2748,15 +3296,28 @@ def set_bypass_csp(
 
     :param enabled: Whether to bypass page CSP.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setBypassCSP',
-        'params': params,
+        'params': _set_bypass_csp_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_bypass_csp_command = Command(
+    'Page.setBypassCSP',
+    set_bypass_csp,
+    _set_bypass_csp_params,
+)
+
+
+def _get_permissions_policy_state_params(
+        frame_id: FrameId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    return params
+
+
 def get_permissions_policy_state(
         frame_id: FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[PermissionsPolicyFeatureState]]:
@@ -2768,16 +3329,30 @@ def get_permissions_policy_state(
     :param frame_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getPermissionsPolicyState',
-        'params': params,
+        'params': _get_permissions_policy_state_params(frame_id),
     }
     json = yield cmd_dict
     return [PermissionsPolicyFeatureState.from_json(i) for i in json['states']]
 
 
+get_permissions_policy_state_command = Command(
+    'Page.getPermissionsPolicyState',
+    get_permissions_policy_state,
+    _get_permissions_policy_state_params,
+    lambda json: [PermissionsPolicyFeatureState.from_json(i) for i in json['states']],
+)
+
+
+def _get_origin_trials_params(
+        frame_id: FrameId
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    return params
+
+
 def get_origin_trials(
         frame_id: FrameId
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[OriginTrial]]:
@@ -2789,18 +3364,23 @@ def get_origin_trials(
     :param frame_id:
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getOriginTrials',
-        'params': params,
+        'params': _get_origin_trials_params(frame_id),
     }
     json = yield cmd_dict
     return [OriginTrial.from_json(i) for i in json['originTrials']]
 
 
-@deprecated(version="1.3")
-def set_device_metrics_override(
+get_origin_trials_command = Command(
+    'Page.getOriginTrials',
+    get_origin_trials,
+    _get_origin_trials_params,
+    lambda json: [OriginTrial.from_json(i) for i in json['originTrials']],
+)
+
+
+def _set_device_metrics_override_params(
         width: int,
         height: int,
         device_scale_factor: float,
@@ -2813,29 +3393,7 @@ def set_device_metrics_override(
         dont_set_visible_size: typing.Optional[bool] = None,
         screen_orientation: typing.Optional[emulation.ScreenOrientation] = None,
         viewport: typing.Optional[Viewport] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
-    window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
-    query results).
-
-    .. deprecated:: 1.3
-
-    **EXPERIMENTAL**
-
-    :param width: Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
-    :param height: Overriding height value in pixels (minimum 0, maximum 10000000). 0 disables the override.
-    :param device_scale_factor: Overriding device scale factor value. 0 disables the override.
-    :param mobile: Whether to emulate mobile device. This includes viewport meta tag, overlay scrollbars, text autosizing and more.
-    :param scale: *(Optional)* Scale to apply to resulting view image.
-    :param screen_width: *(Optional)* Overriding screen width value in pixels (minimum 0, maximum 10000000).
-    :param screen_height: *(Optional)* Overriding screen height value in pixels (minimum 0, maximum 10000000).
-    :param position_x: *(Optional)* Overriding view X position on screen in pixels (minimum 0, maximum 10000000).
-    :param position_y: *(Optional)* Overriding view Y position on screen in pixels (minimum 0, maximum 10000000).
-    :param dont_set_visible_size: *(Optional)* Do not set visible view size, rely upon explicit setVisibleSize call.
-    :param screen_orientation: *(Optional)* Screen orientation override.
-    :param viewport: *(Optional)* The viewport dimensions and scale. If not set, the override is cleared.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['width'] = width
     params['height'] = height
@@ -2857,13 +3415,73 @@ def set_device_metrics_override(
         params['screenOrientation'] = screen_orientation.to_json()
     if viewport is not None:
         params['viewport'] = viewport.to_json()
+    return params
+
+
+@deprecated(version="1.3")
+def set_device_metrics_override(
+        width: int,
+        height: int,
+        device_scale_factor: float,
+        mobile: bool,
+        scale: typing.Optional[float] = None,
+        screen_width: typing.Optional[int] = None,
+        screen_height: typing.Optional[int] = None,
+        position_x: typing.Optional[int] = None,
+        position_y: typing.Optional[int] = None,
+        dont_set_visible_size: typing.Optional[bool] = None,
+        screen_orientation: typing.Optional[emulation.ScreenOrientation] = None,
+        viewport: typing.Optional[Viewport] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
+    window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
+    query results).
+
+    .. deprecated:: 1.3
+
+    **EXPERIMENTAL**
+
+    :param width: Overriding width value in pixels (minimum 0, maximum 10000000). 0 disables the override.
+    :param height: Overriding height value in pixels (minimum 0, maximum 10000000). 0 disables the override.
+    :param device_scale_factor: Overriding device scale factor value. 0 disables the override.
+    :param mobile: Whether to emulate mobile device. This includes viewport meta tag, overlay scrollbars, text autosizing and more.
+    :param scale: *(Optional)* Scale to apply to resulting view image.
+    :param screen_width: *(Optional)* Overriding screen width value in pixels (minimum 0, maximum 10000000).
+    :param screen_height: *(Optional)* Overriding screen height value in pixels (minimum 0, maximum 10000000).
+    :param position_x: *(Optional)* Overriding view X position on screen in pixels (minimum 0, maximum 10000000).
+    :param position_y: *(Optional)* Overriding view Y position on screen in pixels (minimum 0, maximum 10000000).
+    :param dont_set_visible_size: *(Optional)* Do not set visible view size, rely upon explicit setVisibleSize call.
+    :param screen_orientation: *(Optional)* Screen orientation override.
+    :param viewport: *(Optional)* The viewport dimensions and scale. If not set, the override is cleared.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setDeviceMetricsOverride',
-        'params': params,
+        'params': _set_device_metrics_override_params(width, height, device_scale_factor, mobile, scale, screen_width, screen_height, position_x, position_y, dont_set_visible_size, screen_orientation, viewport),
     }
     json = yield cmd_dict
 
 
+set_device_metrics_override_command = Command(
+    'Page.setDeviceMetricsOverride',
+    set_device_metrics_override,
+    _set_device_metrics_override_params,
+    deprecated='1.3',
+)
+
+
+def _set_device_orientation_override_params(
+        alpha: float,
+        beta: float,
+        gamma: float
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['alpha'] = alpha
+    params['beta'] = beta
+    params['gamma'] = gamma
+    return params
+
+
 @deprecated(version="1.3")
 def set_device_orientation_override(
         alpha: float,
@@ -2881,17 +3499,32 @@ def set_device_orientation_override(
     :param beta: Mock beta
     :param gamma: Mock gamma
     '''
-    params: T_JSON_DICT = dict()
-    params['alpha'] = alpha
-    params['beta'] = beta
-    params['gamma'] = gamma
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setDeviceOrientationOverride',
-        'params': params,
+        'params': _set_device_orientation_override_params(alpha, beta, gamma),
     }
     json = yield cmd_dict
 
 
+set_device_orientation_override_command = Command(
+    'Page.setDeviceOrientationOverride',
+    set_device_orientation_override,
+    _set_device_orientation_override_params,
+    deprecated='1.3',
+)
+
+
+def _set_font_families_params(
+        font_families: FontFamilies,
+        for_scripts: typing.Optional[typing.List[ScriptFontFamilies]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['fontFamilies'] = font_families.to_json()
+    if for_scripts is not None:
+        params['forScripts'] = [i.to_json() for i in for_scripts]
+    return params
+
+
 def set_font_families(
         font_families: FontFamilies,
         for_scripts: typing.Optional[typing.List[ScriptFontFamilies]] = None
@@ -2904,17 +3537,28 @@ def set_font_families(
     :param font_families: Specifies font families to set. If a font family is not specified, it won't be changed.
     :param for_scripts: *(Optional)* Specifies font families to set for individual scripts.
     '''
-    params: T_JSON_DICT = dict()
-    params['fontFamilies'] = font_families.to_json()
-    if for_scripts is not None:
-        params['forScripts'] = [i.to_json() for i in for_scripts]
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setFontFamilies',
-        'params': params,
+        'params': _set_font_families_params(font_families, for_scripts),
     }
     json = yield cmd_dict
 
 
+set_font_families_command = Command(
+    'Page.setFontFamilies',
+    set_font_families,
+    _set_font_families_params,
+)
+
+
+def _set_font_sizes_params(
+        font_sizes: FontSizes
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['fontSizes'] = font_sizes.to_json()
+    return params
+
+
 def set_font_sizes(
         font_sizes: FontSizes
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -2925,15 +3569,30 @@ def set_font_sizes(
 
     :param font_sizes: Specifies font sizes to set. If a font size is not specified, it won't be changed.
     '''
-    params: T_JSON_DICT = dict()
-    params['fontSizes'] = font_sizes.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setFontSizes',
-        'params': params,
+        'params': _set_font_sizes_params(font_sizes),
     }
     json = yield cmd_dict
 
 
+set_font_sizes_command = Command(
+    'Page.setFontSizes',
+    set_font_sizes,
+    _set_font_sizes_params,
+)
+
+
+def _set_document_content_params(
+        frame_id: FrameId,
+        html: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['frameId'] = frame_id.to_json()
+    params['html'] = html
+    return params
+
+
 def set_document_content(
         frame_id: FrameId,
         html: str
@@ -2944,16 +3603,31 @@ def set_document_content(
     :param frame_id: Frame id to set HTML for.
     :param html: HTML content to set.
     '''
-    params: T_JSON_DICT = dict()
-    params['frameId'] = frame_id.to_json()
-    params['html'] = html
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setDocumentContent',
-        'params': params,
+        'params': _set_document_content_params(frame_id, html),
     }
     json = yield cmd_dict
 
 
+set_document_content_command = Command(
+    'Page.setDocumentContent',
+    set_document_content,
+    _set_document_content_params,
+)
+
+
+def _set_download_behavior_params(
+        behavior: str,
+        download_path: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['behavior'] = behavior
+    if download_path is not None:
+        params['downloadPath'] = download_path
+    return params
+
+
 @deprecated(version="1.3")
 def set_download_behavior(
         behavior: str,
@@ -2969,17 +3643,36 @@ def set_download_behavior(
     :param behavior: Whether to allow all or deny all download requests, or use default Chrome behavior if available (otherwise deny).
     :param download_path: *(Optional)* The default path to save downloaded files to. This is required if behavior is set to 'allow'
     '''
-    params: T_JSON_DICT = dict()
-    params['behavior'] = behavior
-    if download_path is not None:
-        params['downloadPath'] = download_path
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setDownloadBehavior',
-        'params': params,
+        'params': _set_download_behavior_params(behavior, download_path),
     }
     json = yield cmd_dict
 
 
+set_download_behavior_command = Command(
+    'Page.setDownloadBehavior',
+    set_download_behavior,
+    _set_download_behavior_params,
+    deprecated='1.3',
+)
+
+
+def _set_geolocation_override_params(
+        latitude: typing.Optional[float] = None,
+        longitude: typing.Optional[float] = None,
+        accuracy: typing.Optional[float] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if latitude is not None:
+        params['latitude'] = latitude
+    if longitude is not None:
+        params['longitude'] = longitude
+    if accuracy is not None:
+        params['accuracy'] = accuracy
+    return params
+
+
 @deprecated(version="1.3")
 def set_geolocation_override(
         latitude: typing.Optional[float] = None,
@@ -2996,20 +3689,29 @@ def set_geolocation_override(
     :param longitude: *(Optional)* Mock longitude
     :param accuracy: *(Optional)* Mock accuracy
     '''
-    params: T_JSON_DICT = dict()
-    if latitude is not None:
-        params['latitude'] = latitude
-    if longitude is not None:
-        params['longitude'] = longitude
-    if accuracy is not None:
-        params['accuracy'] = accuracy
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setGeolocationOverride',
-        'params': params,
+        'params': _set_geolocation_override_params(latitude, longitude, accuracy),
     }
     json = yield cmd_dict
 
 
+set_geolocation_override_command = Command(
+    'Page.setGeolocationOverride',
+    set_geolocation_override,
+    _set_geolocation_override_params,
+    deprecated='1.3',
+)
+
+
+def _set_lifecycle_events_enabled_params(
+        enabled: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    return params
+
+
 def set_lifecycle_events_enabled(
         enabled: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3018,15 +3720,31 @@ def set_lifecycle_events_enabled(
 
     :param enabled: If true, starts emitting lifecycle events.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setLifecycleEventsEnabled',
-        'params': params,
+        'params': _set_lifecycle_events_enabled_params(enabled),
     }
     json = yield cmd_dict
 
 
+set_lifecycle_events_enabled_command = Command(
+    'Page.setLifecycleEventsEnabled',
+    set_lifecycle_events_enabled,
+    _set_lifecycle_events_enabled_params,
+)
+
+
+def _set_touch_emulation_enabled_params(
+        enabled: bool,
+        configuration: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    if configuration is not None:
+        params['configuration'] = configuration
+    return params
+
+
 @deprecated(version="1.3")
 def set_touch_emulation_enabled(
         enabled: bool,
@@ -3042,17 +3760,42 @@ def set_touch_emulation_enabled(
     :param enabled: Whether the touch event emulation should be enabled.
     :param configuration: *(Optional)* Touch/gesture events configuration. Default: current platform.
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    if configuration is not None:
-        params['configuration'] = configuration
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setTouchEmulationEnabled',
-        'params': params,
+        'params': _set_touch_emulation_enabled_params(enabled, configuration),
     }
     json = yield cmd_dict
 
 
+set_touch_emulation_enabled_command = Command(
+    'Page.setTouchEmulationEnabled',
+    set_touch_emulation_enabled,
+    _set_touch_emulation_enabled_params,
+    deprecated='1.3',
+)
+
+
+def _start_screencast_params(
+        format_: typing.Optional[str] = None,
+        quality: typing.Optional[int] = None,
+        max_width: typing.Optional[int] = None,
+        max_height: typing.Optional[int] = None,
+        every_nth_frame: typing.Optional[int] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if format_ is not None:
+        params['format'] = format_
+    if quality is not None:
+        params['quality'] = quality
+    if max_width is not None:
+        params['maxWidth'] = max_width
+    if max_height is not None:
+        params['maxHeight'] = max_height
+    if every_nth_frame is not None:
+        params['everyNthFrame'] = every_nth_frame
+    return params
+
+
 def start_screencast(
         format_: typing.Optional[str] = None,
         quality: typing.Optional[int] = None,
@@ -3071,24 +3814,20 @@ def start_screencast(
     :param max_height: *(Optional)* Maximum screenshot height.
     :param every_nth_frame: *(Optional)* Send every n-th frame.
     '''
-    params: T_JSON_DICT = dict()
-    if format_ is not None:
-        params['format'] = format_
-    if quality is not None:
-        params['quality'] = quality
-    if max_width is not None:
-        params['maxWidth'] = max_width
-    if max_height is not None:
-        params['maxHeight'] = max_height
-    if every_nth_frame is not None:
-        params['everyNthFrame'] = every_nth_frame
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.startScreencast',
-        'params': params,
+        'params': _start_screencast_params(format_, quality, max_width, max_height, every_nth_frame),
     }
     json = yield cmd_dict
 
 
+start_screencast_command = Command(
+    'Page.startScreencast',
+    start_screencast,
+    _start_screencast_params,
+)
+
+
 def stop_loading() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Force the page stop all navigations and pending resource fetches.
@@ -3099,6 +3838,9 @@ def stop_loading() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+stop_loading_command = Command('Page.stopLoading', stop_loading)
+
+
 def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Crashes renderer on the IO thread, generates minidumps.
@@ -3111,6 +3853,9 @@ def crash() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+crash_command = Command('Page.crash', crash)
+
+
 def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Tries to close page, running its beforeunload hooks, if any.
@@ -3121,6 +3866,17 @@ def close() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+close_command = Command('Page.close', close)
+
+
+def _set_web_lifecycle_state_params(
+        state: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['state'] = state
+    return params
+
+
 def set_web_lifecycle_state(
         state: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3133,15 +3889,20 @@ def set_web_lifecycle_state(
 
     :param state: Target lifecycle state
     '''
-    params: T_JSON_DICT = dict()
-    params['state'] = state
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setWebLifecycleState',
-        'params': params,
+        'params': _set_web_lifecycle_state_params(state),
     }
     json = yield cmd_dict
 
 
+set_web_lifecycle_state_command = Command(
+    'Page.setWebLifecycleState',
+    set_web_lifecycle_state,
+    _set_web_lifecycle_state_params,
+)
+
+
 def stop_screencast() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Stops sending each frame in the ``screencastFrame``.
@@ -3154,6 +3915,17 @@ def stop_screencast() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+stop_screencast_command = Command('Page.stopScreencast', stop_screencast)
+
+
+def _produce_compilation_cache_params(
+        scripts: typing.List[CompilationCacheParams]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['scripts'] = [i.to_json() for i in scripts]
+    return params
+
+
 def produce_compilation_cache(
         scripts: typing.List[CompilationCacheParams]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3169,15 +3941,30 @@ def produce_compilation_cache(
 
     :param scripts:
     '''
-    params: T_JSON_DICT = dict()
-    params['scripts'] = [i.to_json() for i in scripts]
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.produceCompilationCache',
-        'params': params,
+        'params': _produce_compilation_cache_params(scripts),
     }
     json = yield cmd_dict
 
 
+produce_compilation_cache_command = Command(
+    'Page.produceCompilationCache',
+    produce_compilation_cache,
+    _produce_compilation_cache_params,
+)
+
+
+def _add_compilation_cache_params(
+        url: str,
+        data: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['url'] = url
+    params['data'] = data
+    return params
+
+
 def add_compilation_cache(
         url: str,
         data: str
@@ -3191,16 +3978,20 @@ def add_compilation_cache(
     :param url:
     :param data: Base64-encoded data (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    params['url'] = url
-    params['data'] = data
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.addCompilationCache',
-        'params': params,
+        'params': _add_compilation_cache_params(url, data),
     }
     json = yield cmd_dict
 
 
+add_compilation_cache_command = Command(
+    'Page.addCompilationCache',
+    add_compilation_cache,
+    _add_compilation_cache_params,
+)
+
+
 def clear_compilation_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Clears seeded compilation cache.
@@ -3213,6 +4004,17 @@ def clear_compilation_cache() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+clear_compilation_cache_command = Command('Page.clearCompilationCache', clear_compilation_cache)
+
+
+def _set_spc_transaction_mode_params(
+        mode: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['mode'] = mode
+    return params
+
+
 def set_spc_transaction_mode(
         mode: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3224,15 +4026,28 @@ def set_spc_transaction_mode(
 
     :param mode:
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setSPCTransactionMode',
-        'params': params,
+        'params': _set_spc_transaction_mode_params(mode),
     }
     json = yield cmd_dict
 
 
+set_spc_transaction_mode_command = Command(
+    'Page.setSPCTransactionMode',
+    set_spc_transaction_mode,
+    _set_spc_transaction_mode_params,
+)
+
+
+def _set_rph_registration_mode_params(
+        mode: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['mode'] = mode
+    return params
+
+
 def set_rph_registration_mode(
         mode: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3244,15 +4059,31 @@ def set_rph_registration_mode(
 
     :param mode:
     '''
-    params: T_JSON_DICT = dict()
-    params['mode'] = mode
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setRPHRegistrationMode',
-        'params': params,
+        'params': _set_rph_registration_mode_params(mode),
     }
     json = yield cmd_dict
 
 
+set_rph_registration_mode_command = Command(
+    'Page.setRPHRegistrationMode',
+    set_rph_registration_mode,
+    _set_rph_registration_mode_params,
+)
+
+
+def _generate_test_report_params(
+        message: str,
+        group: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['message'] = message
+    if group is not None:
+        params['group'] = group
+    return params
+
+
 def generate_test_report(
         message: str,
         group: typing.Optional[str] = None
@@ -3265,17 +4096,20 @@ def generate_test_report(
     :param message: Message to be displayed in the report.
     :param group: *(Optional)* Specifies the endpoint group to deliver the report to.
     '''
-    params: T_JSON_DICT = dict()
-    params['message'] = message
-    if group is not None:
-        params['group'] = group
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.generateTestReport',
-        'params': params,
+        'params': _generate_test_report_params(message, group),
     }
     json = yield cmd_dict
 
 
+generate_test_report_command = Command(
+    'Page.generateTestReport',
+    generate_test_report,
+    _generate_test_report_params,
+)
+
+
 def wait_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Pauses page execution. Can be resumed using generic Runtime.runIfWaitingForDebugger.
@@ -3288,6 +4122,20 @@ def wait_for_debugger() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+wait_for_debugger_command = Command('Page.waitForDebugger', wait_for_debugger)
+
+
+def _set_intercept_file_chooser_dialog_params(
+        enabled: bool,
+        cancel: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['enabled'] = enabled
+    if cancel is not None:
+        params['cancel'] = cancel
+    return params
+
+
 def set_intercept_file_chooser_dialog(
         enabled: bool,
         cancel: typing.Optional[bool] = None
@@ -3300,17 +4148,28 @@ def set_intercept_file_chooser_dialog(
     :param enabled:
     :param cancel: **(EXPERIMENTAL)** *(Optional)* If true, cancels the dialog by emitting relevant events (if any) in addition to not showing it if the interception is enabled (default: false).
     '''
-    params: T_JSON_DICT = dict()
-    params['enabled'] = enabled
-    if cancel is not None:
-        params['cancel'] = cancel
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setInterceptFileChooserDialog',
-        'params': params,
+        'params': _set_intercept_file_chooser_dialog_params(enabled, cancel),
     }
     json = yield cmd_dict
 
 
+set_intercept_file_chooser_dialog_command = Command(
+    'Page.setInterceptFileChooserDialog',
+    set_intercept_file_chooser_dialog,
+    _set_intercept_file_chooser_dialog_params,
+)
+
+
+def _set_prerendering_allowed_params(
+        is_allowed: bool
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['isAllowed'] = is_allowed
+    return params
+
+
 def set_prerendering_allowed(
         is_allowed: bool
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -3327,15 +4186,29 @@ def set_prerendering_allowed(
 
     :param is_allowed:
     '''
-    params: T_JSON_DICT = dict()
-    params['isAllowed'] = is_allowed
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.setPrerenderingAllowed',
-        'params': params,
+        'params': _set_prerendering_allowed_params(is_allowed),
     }
     json = yield cmd_dict
 
 
+set_prerendering_allowed_command = Command(
+    'Page.setPrerenderingAllowed',
+    set_prerendering_allowed,
+    _set_prerendering_allowed_params,
+)
+
+
+def _get_annotated_page_content_params(
+        include_actionable_information: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if include_actionable_information is not None:
+        params['includeActionableInformation'] = include_actionable_information
+    return params
+
+
 def get_annotated_page_content(
         include_actionable_information: typing.Optional[bool] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
@@ -3348,19 +4221,24 @@ def get_annotated_page_content(
     :param include_actionable_information: *(Optional)* Whether to include actionable information. Defaults to true.
     :returns: The annotated page content as a base64 encoded protobuf. The format is defined by the ``AnnotatedPageContent`` message in components/optimization_guide/proto/features/common_quality_data.proto (Encoded as a base64 string when passed over JSON)
     '''
-    params: T_JSON_DICT = dict()
-    if include_actionable_information is not None:
-        params['includeActionableInformation'] = include_actionable_information
     cmd_dict: T_JSON_DICT = {
         'method': 'Page.getAnnotatedPageContent',
-        'params': params,
+        'params': _get_annotated_page_content_params(include_actionable_information),
     }
     json = yield cmd_dict
     return str(json['content'])
 
 
+get_annotated_page_content_command = Command(
+    'Page.getAnnotatedPageContent',
+    get_annotated_page_content,
+    _get_annotated_page_content_params,
+    lambda json: str(json['content']),
+)
+
+
 @event_class('Page.domContentEventFired')
-@dataclass
+@slotted_dataclass
 class DomContentEventFired:
     timestamp: network.MonotonicTime
 
@@ -3372,7 +4250,7 @@ class DomContentEventFired:
 
 
 @event_class('Page.fileChooserOpened')
-@dataclass
+@slotted_dataclass
 class FileChooserOpened:
     r'''
     Emitted only when ``page.interceptFileChooser`` is enabled.
@@ -3394,7 +4272,7 @@ class FileChooserOpened:
 
 
 @event_class('Page.frameAttached')
-@dataclass
+@slotted_dataclass
 class FrameAttached:
     r'''
     Fired when frame has been attached to its parent.
@@ -3417,7 +4295,7 @@ class FrameAttached:
 
 @deprecated(version="1.3")
 @event_class('Page.frameClearedScheduledNavigation')
-@dataclass
+@slotted_dataclass
 class FrameClearedScheduledNavigation:
     r'''
     Fired when frame no longer has a scheduled navigation.
@@ -3433,7 +4311,7 @@ class FrameClearedScheduledNavigation:
 
 
 @event_class('Page.frameDetached')
-@dataclass
+@slotted_dataclass
 class FrameDetached:
     r'''
     Fired when frame has been detached from its parent.
@@ -3451,7 +4329,7 @@ class FrameDetached:
 
 
 @event_class('Page.frameSubtreeWillBeDetached')
-@dataclass
+@slotted_dataclass
 class FrameSubtreeWillBeDetached:
     r'''
     **EXPERIMENTAL**
@@ -3470,7 +4348,7 @@ class FrameSubtreeWillBeDetached:
 
 
 @event_class('Page.frameNavigated')
-@dataclass
+@slotted_dataclass
 class FrameNavigated:
     r'''
     Fired once navigation of the frame has completed. Frame is now associated with the new loader.
@@ -3488,7 +4366,7 @@ class FrameNavigated:
 
 
 @event_class('Page.documentOpened')
-@dataclass
+@slotted_dataclass
 class DocumentOpened:
     r'''
     **EXPERIMENTAL**
@@ -3506,7 +4384,7 @@ class DocumentOpened:
 
 
 @event_class('Page.frameResized')
-@dataclass
+@slotted_dataclass
 class FrameResized:
     r'''
     **EXPERIMENTAL**
@@ -3523,7 +4401,7 @@ class FrameResized:
 
 
 @event_class('Page.frameStartedNavigating')
-@dataclass
+@slotted_dataclass
 class FrameStartedNavigating:
     r'''
     **EXPERIMENTAL**
@@ -3558,7 +4436,7 @@ class FrameStartedNavigating:
 
 
 @event_class('Page.frameRequestedNavigation')
-@dataclass
+@slotted_dataclass
 class FrameRequestedNavigation:
     r'''
     **EXPERIMENTAL**
@@ -3587,7 +4465,7 @@ class FrameRequestedNavigation:
 
 @deprecated(version="1.3")
 @event_class('Page.frameScheduledNavigation')
-@dataclass
+@slotted_dataclass
 class FrameScheduledNavigation:
     r'''
     Fired when frame schedules a potential navigation.
@@ -3613,7 +4491,7 @@ class FrameScheduledNavigation:
 
 
 @event_class('Page.frameStartedLoading')
-@dataclass
+@slotted_dataclass
 class FrameStartedLoading:
     r'''
     **EXPERIMENTAL**
@@ -3631,7 +4509,7 @@ class FrameStartedLoading:
 
 
 @event_class('Page.frameStoppedLoading')
-@dataclass
+@slotted_dataclass
 class FrameStoppedLoading:
     r'''
     **EXPERIMENTAL**
@@ -3650,7 +4528,7 @@ class FrameStoppedLoading:
 
 @deprecated(version="1.3")
 @event_class('Page.downloadWillBegin')
-@dataclass
+@slotted_dataclass
 class DownloadWillBegin:
     r'''
     **EXPERIMENTAL**
@@ -3679,7 +4557,7 @@ class DownloadWillBegin:
 
 @deprecated(version="1.3")
 @event_class('Page.downloadProgress')
-@dataclass
+@slotted_dataclass
 class DownloadProgress:
     r'''
     **EXPERIMENTAL**
@@ -3707,7 +4585,7 @@ class DownloadProgress:
 
 
 @event_class('Page.interstitialHidden')
-@dataclass
+@slotted_dataclass
 class InterstitialHidden:
     r'''
     Fired when interstitial page was hidden
@@ -3722,7 +4600,7 @@ class InterstitialHidden:
 
 
 @event_class('Page.interstitialShown')
-@dataclass
+@slotted_dataclass
 class InterstitialShown:
     r'''
     Fired when interstitial page was shown
@@ -3737,7 +4615,7 @@ class InterstitialShown:
 
 
 @event_class('Page.javascriptDialogClosed')
-@dataclass
+@slotted_dataclass
 class JavascriptDialogClosed:
     r'''
     Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) has been
@@ -3760,7 +4638,7 @@ class JavascriptDialogClosed:
 
 
 @event_class('Page.javascriptDialogOpening')
-@dataclass
+@slotted_dataclass
 class JavascriptDialogOpening:
     r'''
     Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) is about to
@@ -3794,7 +4672,7 @@ class JavascriptDialogOpening:
 
 
 @event_class('Page.lifecycleEvent')
-@dataclass
+@slotted_dataclass
 class LifecycleEvent:
     r'''
     Fired for lifecycle events (navigation, load, paint, etc) in the current
@@ -3818,7 +4696,7 @@ class LifecycleEvent:
 
 
 @event_class('Page.backForwardCacheNotUsed')
-@dataclass
+@slotted_dataclass
 class BackForwardCacheNotUsed:
     r'''
     **EXPERIMENTAL**
@@ -3848,7 +4726,7 @@ class BackForwardCacheNotUsed:
 
 
 @event_class('Page.loadEventFired')
-@dataclass
+@slotted_dataclass
 class LoadEventFired:
     timestamp: network.MonotonicTime
 
@@ -3860,7 +4738,7 @@ class LoadEventFired:
 
 
 @event_class('Page.navigatedWithinDocument')
-@dataclass
+@slotted_dataclass
 class NavigatedWithinDocument:
     r'''
     **EXPERIMENTAL**
@@ -3884,7 +4762,7 @@ class NavigatedWithinDocument:
 
 
 @event_class('Page.screencastFrame')
-@dataclass
+@slotted_dataclass
 class ScreencastFrame:
     r'''
     **EXPERIMENTAL**
@@ -3908,7 +4786,7 @@ class ScreencastFrame:
 
 
 @event_class('Page.screencastVisibilityChanged')
-@dataclass
+@slotted_dataclass
 class ScreencastVisibilityChanged:
     r'''
     **EXPERIMENTAL**
@@ -3926,7 +4804,7 @@ class ScreencastVisibilityChanged:
 
 
 @event_class('Page.windowOpen')
-@dataclass
+@slotted_dataclass
 class WindowOpen:
     r'''
     Fired when a new window is going to be opened, via window.open(), link click, form submission,
@@ -3952,7 +4830,7 @@ class WindowOpen:
 
 
 @event_class('Page.compilationCacheProduced')
-@dataclass
+@slotted_dataclass
 class CompilationCacheProduced:
     r'''
     **EXPERIMENTAL**
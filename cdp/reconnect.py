@@ -0,0 +1,135 @@
+"""
+CDP Reconnect Support
+
+Configuration and bookkeeping for ``CDPConnection(reconnect=...)``. When the
+transport drops, a connection with a :class:`ReconnectPolicy` reopens it with
+exponential backoff. It then restores what it recorded in
+:class:`DomainState`: domain ``enable`` calls, scripts added with
+``Page.addScriptToEvaluateOnNewDocument``, and attached sessions. Finally it
+resends the idempotent commands that were in flight.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+import random
+import typing
+
+from cdp.registry import SIDE_EFFECT_FREE_COMMANDS
+from cdp.util import T_JSON_DICT
+
+
+ADD_SCRIPT = 'Page.addScriptToEvaluateOnNewDocument'
+REMOVE_SCRIPT = 'Page.removeScriptToEvaluateOnNewDocument'
+
+
+def is_idempotent(method: str) -> bool:
+    """
+    Whether a command can safely be sent again: it is in
+    :data:`cdp.registry.SIDE_EFFECT_FREE_COMMANDS`, or it enables or disables
+    a domain.
+
+    ``DOM.getDocument`` and ``Network.enable`` are; ``Page.navigate`` and
+    ``Input.dispatchKeyEvent`` are not.
+    """
+    if method in SIDE_EFFECT_FREE_COMMANDS:
+        return True
+    return method.partition('.')[2] in ('enable', 'disable')
+
+
+@dataclass
+class ReconnectPolicy:
+    """How and when ``CDPConnection`` reconnects after the transport drops."""
+
+    #: Give up after this many failed attempts; ``None`` retries forever.
+    max_attempts: typing.Optional[int] = 10
+    #: Delay before the first attempt, in seconds.
+    initial_delay: float = 0.1
+    #: Upper bound for the delay between attempts, in seconds.
+    max_delay: float = 10.0
+    #: Factor applied to the delay after every failed attempt.
+    multiplier: float = 2.0
+    #: Random variation of each delay, as a fraction of it.
+    jitter: float = 0.1
+    #: Seconds a reopened connection must stay up before the next drop
+    #: starts the backoff from ``initial_delay`` again. A connection that
+    #: drops sooner counts towards ``max_attempts`` and keeps backing off.
+    stable_after: float = 5.0
+    #: Decides which in-flight commands are resent after reconnecting. The
+    #: others fail with ``CDPConnectionError``.
+    is_idempotent: typing.Callable[[str], bool] = is_idempotent
+    #: Called with the connection once it is back online and its state has
+    #: been restored, to restore anything else.
+    on_reconnect: typing.Optional[
+        typing.Callable[[typing.Any], typing.Awaitable[None]]
+    ] = None
+
+    def delays(self, start: int = 0) -> typing.Iterator[float]:
+        """Yield the delay before each attempt, from attempt ``start``."""
+        delay = self.initial_delay
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            if attempt >= start:
+                jitter = 1 + random.uniform(-self.jitter, self.jitter)
+                yield min(delay, self.max_delay) * jitter
+            delay = min(delay * self.multiplier, self.max_delay)
+            attempt += 1
+
+
+class DomainState:
+    """
+    Commands that set up a browser or session, to replay after reconnecting.
+
+    Domains are re-enabled with the parameters of their last ``enable`` call,
+    unless they were disabled since. Scripts are added again; because the
+    browser assigns them new identifiers, later
+    ``Page.removeScriptToEvaluateOnNewDocument`` calls with the original
+    identifier are translated with :meth:`translate`.
+    """
+
+    def __init__(self) -> None:
+        #: Domain name to (method, params) of its last enable call.
+        self.enables: typing.Dict[str, typing.Tuple[str, T_JSON_DICT]] = {}
+        #: Original identifier to (params, current identifier) of each script.
+        self.scripts: typing.Dict[str, typing.Tuple[T_JSON_DICT, str]] = {}
+
+    def record(self, method: str, params: T_JSON_DICT, result: T_JSON_DICT) -> None:
+        """Record a successful command."""
+        domain, _, command = method.partition('.')
+        if command == 'enable':
+            self.enables[domain] = (method, params)
+        elif command == 'disable':
+            self.enables.pop(domain, None)
+        elif method == ADD_SCRIPT:
+            identifier = result['identifier']
+            self.scripts[identifier] = (params, identifier)
+        elif method == REMOVE_SCRIPT:
+            identifier = params.get('identifier')
+            for original, (_, current) in list(self.scripts.items()):
+                if current == identifier:
+                    del self.scripts[original]
+
+    def translate(self, method: str, params: T_JSON_DICT) -> T_JSON_DICT:
+        """Map original script identifiers in a request to current ones."""
+        if method != REMOVE_SCRIPT:
+            return params
+        script = self.scripts.get(params.get('identifier'))  # type: ignore[arg-type]
+        if script is None:
+            return params
+        return dict(params, identifier=script[1])
+
+    def replay(self) -> typing.List[typing.Tuple[str, T_JSON_DICT, typing.Optional[str]]]:
+        """
+        Return the commands to replay, as ``(method, params, script)``
+        tuples. ``script`` is the original identifier for added scripts.
+        """
+        commands: typing.List[typing.Tuple[str, T_JSON_DICT, typing.Optional[str]]] = [
+            (method, params, None) for method, params in self.enables.values()
+        ]
+        for original, (params, _) in self.scripts.items():
+            commands.append((ADD_SCRIPT, params, original))
+        return commands
+
+    def script_replayed(self, original: str, identifier: str) -> None:
+        """Record the identifier a replayed script was given."""
+        params, _ = self.scripts[original]
+        self.scripts[original] = (params, identifier)
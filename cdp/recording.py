@@ -0,0 +1,253 @@
+"""
+CDP Traffic Recording and Replay
+
+:class:`RecordingTransport` wraps another transport and writes every frame it
+sends and receives, with a timestamp, to a gzip-compressed JSON Lines file.
+:class:`ReplayTransport` plays such a file back without a browser, either at
+the recorded speed or as fast as possible. Use it to measure decoding and
+dispatch throughput offline from real traffic (see ``python -m
+cdp.bench.replay``), or to run code against a fixed conversation in
+regression tests.
+
+The first line of a recording is a header::
+
+    {"format": "cdp-recording", "version": 1, "transport": "...", "time": 1700000000.0}
+
+Every other line is one frame::
+
+    {"t": 0.0132, "dir": "send", "frame": "{\\"id\\":1,\\"method\\":...}"}
+
+``t`` is seconds since the transport was first opened and ``dir`` is
+``"send"`` or ``"recv"``. Frames that were ``bytes`` carry ``"binary": true``.
+If the transport is reopened (see ``CDPConnection(reconnect=...)``), a new
+gzip member is appended, starting with an ``{"t": ..., "dir": "open"}`` line.
+
+Example:
+    transport = RecordingTransport(WebSocketTransport(url), "session.jsonl.gz")
+    async with CDPConnection(transport=transport) as conn:
+        await conn.execute(page.navigate(url="https://example.com"))
+
+    # Later, without a browser:
+    async with CDPConnection(transport=ReplayTransport("session.jsonl.gz")) as conn:
+        await conn.execute(page.navigate(url="https://example.com"))
+"""
+
+from __future__ import annotations
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+import typing
+
+from cdp.codec import Frame
+from cdp.transport import Transport
+
+
+logger = logging.getLogger(__name__)
+
+FORMAT = 'cdp-recording'
+VERSION = 1
+
+PathLike = typing.Union[str, 'os.PathLike[str]']
+
+
+class RecordingTransport(Transport):
+    """Records the traffic of another transport to a file."""
+
+    def __init__(self, transport: Transport, path: PathLike):
+        """
+        Args:
+            transport: The transport to record
+            path: File to write; it is overwritten
+        """
+        self.transport = transport
+        self.path = path
+        self.frame_count = 0
+        self._file: typing.Optional[typing.TextIO] = None
+        self._start: typing.Optional[float] = None
+
+    @property
+    def reopenable(self) -> bool:  # type: ignore[override]
+        return self.transport.reopenable
+
+    async def open(self) -> None:
+        await self.transport.open()
+        if self._start is None:
+            self._start = time.monotonic()
+            self._file = typing.cast(typing.TextIO, gzip.open(self.path, 'wt', encoding='utf-8'))
+            self._write({
+                'format': FORMAT,
+                'version': VERSION,
+                'transport': repr(self.transport),
+                'time': time.time(),
+            })
+        else:
+            self._file = typing.cast(typing.TextIO, gzip.open(self.path, 'at', encoding='utf-8'))
+            self._write({'t': time.monotonic() - self._start, 'dir': 'open'})
+
+    async def send(self, frame: Frame) -> None:
+        self._record('send', frame)
+        await self.transport.send(frame)
+
+    async def recv(self) -> Frame:
+        frame = await self.transport.recv()
+        self._record('recv', frame)
+        return frame
+
+    async def close(self) -> None:
+        try:
+            await self.transport.close()
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _record(self, direction: str, frame: Frame) -> None:
+        if self._file is None:
+            return
+        entry: typing.Dict[str, typing.Any] = {
+            't': time.monotonic() - typing.cast(float, self._start),
+            'dir': direction,
+        }
+        if isinstance(frame, bytes):
+            entry['frame'] = frame.decode('utf-8')
+            entry['binary'] = True
+        else:
+            entry['frame'] = frame
+        self._write(entry)
+        self.frame_count += 1
+
+    def _write(self, entry: typing.Dict[str, typing.Any]) -> None:
+        self._file.write(json.dumps(entry, separators=(',', ':')) + '\n')  # type: ignore[union-attr]
+
+    def __repr__(self) -> str:
+        return f'RecordingTransport({self.transport!r}, {str(self.path)!r})'
+
+
+def load_recording(path: PathLike) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Read the frames of a recording.
+
+    Returns:
+        The ``send`` and ``recv`` entries, in order
+
+    Raises:
+        ValueError: If the file is not a recording
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or 'null')
+        if not isinstance(header, dict) or header.get('format') != FORMAT:
+            raise ValueError(f"{path} is not a CDP recording")
+        if header.get('version') != VERSION:
+            raise ValueError(f"Unsupported recording version {header.get('version')}")
+        entries = []
+        for line in f:
+            entry = json.loads(line)
+            if entry['dir'] in ('send', 'recv'):
+                if entry.get('binary'):
+                    entry['frame'] = entry['frame'].encode('utf-8')
+                entries.append(entry)
+    return entries
+
+
+class ReplayTransport(Transport):
+    """
+    Plays back a recording made with :class:`RecordingTransport`.
+
+    By default the recording is followed step by step: a recorded ``send``
+    waits until the connection sends its next frame, so a response is never
+    delivered before the request it answers. Code that issues the same
+    commands in the same order as the recorded session therefore receives
+    the same responses and events, with the same command IDs. Frames sent
+    that differ from the recording (compared by method) are collected in
+    :attr:`mismatches`.
+
+    With ``follow_sends=False`` all received frames are played back
+    regardless of what the connection sends, which is what throughput
+    measurements want.
+
+    After the last frame, ``recv`` raises ``ConnectionError``, as if the
+    browser went away, and :attr:`finished` is set.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        speed: typing.Optional[float] = 1.0,
+        follow_sends: bool = True,
+    ):
+        """
+        Args:
+            path: The recording to play back
+            speed: Playback speed relative to the recording; ``None`` plays
+                frames as fast as possible
+            follow_sends: Wait for the connection to send each recorded
+                request before playing back what followed it
+
+        Raises:
+            ValueError: If the file is not a recording
+        """
+        self.path = path
+        self.speed = speed
+        self.follow_sends = follow_sends
+        self.entries = load_recording(path)
+        #: ``(recorded method, sent method)`` for each frame that differed
+        self.mismatches: typing.List[typing.Tuple[typing.Optional[str], typing.Optional[str]]] = []
+        self._position = 0
+        self._start = 0.0
+        self._sent: typing.Optional[asyncio.Queue] = None
+        self.finished: typing.Optional[asyncio.Event] = None
+
+    async def open(self) -> None:
+        self._position = 0
+        self._start = asyncio.get_running_loop().time()
+        self._sent = asyncio.Queue()
+        self.finished = asyncio.Event()
+
+    async def send(self, frame: Frame) -> None:
+        if self._sent is None:
+            raise ConnectionError("Replay is not open")
+        if self.follow_sends:
+            self._sent.put_nowait(frame)
+
+    async def recv(self) -> Frame:
+        if self._sent is None:
+            raise ConnectionError("Replay is not open")
+        loop = asyncio.get_running_loop()
+        entries = self.entries
+        while self._position < len(entries):
+            entry = entries[self._position]
+            self._position += 1
+            if entry['dir'] == 'send':
+                if self.follow_sends:
+                    self._check_sent(entry['frame'], await self._sent.get())
+                continue
+            if self.speed is not None:
+                delay = self._start + entry['t'] / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return entry['frame']
+        typing.cast(asyncio.Event, self.finished).set()
+        raise ConnectionError("End of recording")
+
+    async def close(self) -> None:
+        self._sent = None
+
+    def _check_sent(self, recorded: Frame, sent: Frame) -> None:
+        expected = _method(recorded)
+        actual = _method(sent)
+        if expected != actual:
+            logger.warning(f"Replay expected {expected}, but {actual} was sent")
+            self.mismatches.append((expected, actual))
+
+    def __repr__(self) -> str:
+        return f'ReplayTransport({str(self.path)!r})'
+
+
+def _method(frame: Frame) -> typing.Optional[str]:
+    try:
+        return json.loads(frame).get('method')
+    except ValueError:
+        return None
@@ -0,0 +1,396 @@
+# DO NOT EDIT THIS FILE!
+#
+# This file is generated from the CDP specification. If you need to make
+# changes, edit the generator and regenerate all of the modules.
+
+"""
+Tables derived from the CDP schema, for use by :mod:`cdp.connection` and
+:func:`cdp.util.parse_json_event`.
+"""
+
+#: Commands that only read browser state, so identical concurrent calls
+#: can share one request (see ``CDPConnection(coalesce=True)``).
+SIDE_EFFECT_FREE_COMMANDS = frozenset({
+    'Accessibility.getPartialAXTree',
+    'Accessibility.getFullAXTree',
+    'Accessibility.getRootAXNode',
+    'Accessibility.getAXNodeAndAncestors',
+    'Accessibility.getChildAXNodes',
+    'Accessibility.queryAXTree',
+    'Animation.getCurrentTime',
+    'Animation.getPlaybackRate',
+    'Animation.resolveAnimation',
+    'Audits.getEncodedResponse',
+    'Browser.getVersion',
+    'Browser.getBrowserCommandLine',
+    'Browser.getHistograms',
+    'Browser.getHistogram',
+    'Browser.getWindowBounds',
+    'Browser.getWindowForTarget',
+    'CSS.getBackgroundColors',
+    'CSS.getComputedStyleForNode',
+    'CSS.resolveValues',
+    'CSS.getLonghandProperties',
+    'CSS.getInlineStylesForNode',
+    'CSS.getAnimatedStylesForNode',
+    'CSS.getMatchedStylesForNode',
+    'CSS.getEnvironmentVariables',
+    'CSS.getMediaQueries',
+    'CSS.getPlatformFontsForNode',
+    'CSS.getStyleSheetText',
+    'CSS.getLayersForNode',
+    'CSS.getLocationForSelector',
+    'DOM.describeNode',
+    'DOM.getAttributes',
+    'DOM.getBoxModel',
+    'DOM.getContentQuads',
+    'DOM.getDocument',
+    'DOM.getFlattenedDocument',
+    'DOM.getNodesForSubtreeByStyle',
+    'DOM.getNodeForLocation',
+    'DOM.getOuterHTML',
+    'DOM.getRelayoutBoundary',
+    'DOM.getSearchResults',
+    'DOM.querySelector',
+    'DOM.querySelectorAll',
+    'DOM.getTopLayerElements',
+    'DOM.getElementByRelation',
+    'DOM.resolveNode',
+    'DOM.getNodeStackTraces',
+    'DOM.getFileInfo',
+    'DOM.getDetachedDomNodes',
+    'DOM.getFrameOwner',
+    'DOM.getContainerForNode',
+    'DOM.getQueryingDescendantsForContainer',
+    'DOM.getAnchorElement',
+    'DOMDebugger.getEventListeners',
+    'DOMSnapshot.getSnapshot',
+    'DOMSnapshot.captureSnapshot',
+    'DOMStorage.getDOMStorageItems',
+    'Debugger.getPossibleBreakpoints',
+    'Debugger.getScriptSource',
+    'Debugger.getWasmBytecode',
+    'Debugger.getStackTrace',
+    'Debugger.searchInContent',
+    'Emulation.canEmulate',
+    'Emulation.getOverriddenSensorInformation',
+    'Emulation.getScreenInfos',
+    'Extensions.getExtensions',
+    'Extensions.getStorageItems',
+    'Fetch.getResponseBody',
+    'FileSystem.getDirectory',
+    'HeapProfiler.getHeapObjectId',
+    'HeapProfiler.getObjectByHeapObjectId',
+    'HeapProfiler.getSamplingProfile',
+    'IO.resolveBlob',
+    'IndexedDB.getMetadata',
+    'Memory.getDOMCounters',
+    'Memory.getAllTimeSamplingProfile',
+    'Memory.getBrowserSamplingProfile',
+    'Memory.getSamplingProfile',
+    'Network.canClearBrowserCache',
+    'Network.canClearBrowserCookies',
+    'Network.canEmulateNetworkConditions',
+    'Network.getAllCookies',
+    'Network.getCertificate',
+    'Network.getCookies',
+    'Network.getResponseBody',
+    'Network.getRequestPostData',
+    'Network.getResponseBodyForInterception',
+    'Network.searchInResponseBody',
+    'Network.getSecurityIsolationStatus',
+    'Overlay.getHighlightObjectForTest',
+    'Overlay.getGridHighlightObjectsForTest',
+    'Overlay.getSourceOrderHighlightObjectForTest',
+    'PWA.getOsAppState',
+    'Page.captureScreenshot',
+    'Page.captureSnapshot',
+    'Page.getAppManifest',
+    'Page.getInstallabilityErrors',
+    'Page.getManifestIcons',
+    'Page.getAppId',
+    'Page.getAdScriptAncestry',
+    'Page.getFrameTree',
+    'Page.getLayoutMetrics',
+    'Page.getNavigationHistory',
+    'Page.getResourceContent',
+    'Page.getResourceTree',
+    'Page.searchInResource',
+    'Page.getPermissionsPolicyState',
+    'Page.getOriginTrials',
+    'Page.getAnnotatedPageContent',
+    'Performance.getMetrics',
+    'Profiler.getBestEffortCoverage',
+    'Runtime.getIsolateId',
+    'Runtime.getHeapUsage',
+    'Runtime.getProperties',
+    'Runtime.queryObjects',
+    'Runtime.getExceptionDetails',
+    'Schema.getDomains',
+    'Storage.getStorageKeyForFrame',
+    'Storage.getStorageKey',
+    'Storage.getCookies',
+    'Storage.getUsageAndQuota',
+    'Storage.getTrustTokens',
+    'Storage.getInterestGroupDetails',
+    'Storage.getSharedStorageMetadata',
+    'Storage.getSharedStorageEntries',
+    'Storage.getRelatedWebsiteSets',
+    'Storage.getAffectedUrlsForThirdPartyCookieMetadata',
+    'SystemInfo.getInfo',
+    'SystemInfo.getFeatureState',
+    'SystemInfo.getProcessInfo',
+    'Target.getBrowserContexts',
+    'Target.getTargetInfo',
+    'Target.getTargets',
+    'Target.getDevToolsTarget',
+    'Tracing.getCategories',
+    'Tracing.getTrackEventDescriptor',
+    'WebAudio.getRealtimeData',
+    'WebAuthn.getCredential',
+    'WebAuthn.getCredentials',
+})
+
+#: Event method -> (module in ``cdp``, class name), used to import the
+#: domain that defines an event the first time the event is received.
+EVENT_CLASSES = {
+    'Accessibility.loadComplete': ('accessibility', 'LoadComplete'),
+    'Accessibility.nodesUpdated': ('accessibility', 'NodesUpdated'),
+    'Animation.animationCanceled': ('animation', 'AnimationCanceled'),
+    'Animation.animationCreated': ('animation', 'AnimationCreated'),
+    'Animation.animationStarted': ('animation', 'AnimationStarted'),
+    'Animation.animationUpdated': ('animation', 'AnimationUpdated'),
+    'Audits.issueAdded': ('audits', 'IssueAdded'),
+    'Autofill.addressFormFilled': ('autofill', 'AddressFormFilled'),
+    'BackgroundService.recordingStateChanged': ('background_service', 'RecordingStateChanged'),
+    'BackgroundService.backgroundServiceEventReceived': ('background_service', 'BackgroundServiceEventReceived'),
+    'BluetoothEmulation.gattOperationReceived': ('bluetooth_emulation', 'GattOperationReceived'),
+    'BluetoothEmulation.characteristicOperationReceived': ('bluetooth_emulation', 'CharacteristicOperationReceived'),
+    'BluetoothEmulation.descriptorOperationReceived': ('bluetooth_emulation', 'DescriptorOperationReceived'),
+    'Browser.downloadWillBegin': ('browser', 'DownloadWillBegin'),
+    'Browser.downloadProgress': ('browser', 'DownloadProgress'),
+    'CSS.fontsUpdated': ('css', 'FontsUpdated'),
+    'CSS.mediaQueryResultChanged': ('css', 'MediaQueryResultChanged'),
+    'CSS.styleSheetAdded': ('css', 'StyleSheetAdded'),
+    'CSS.styleSheetChanged': ('css', 'StyleSheetChanged'),
+    'CSS.styleSheetRemoved': ('css', 'StyleSheetRemoved'),
+    'CSS.computedStyleUpdated': ('css', 'ComputedStyleUpdated'),
+    'Cast.sinksUpdated': ('cast', 'SinksUpdated'),
+    'Cast.issueUpdated': ('cast', 'IssueUpdated'),
+    'Console.messageAdded': ('console', 'MessageAdded'),
+    'DOM.attributeModified': ('dom', 'AttributeModified'),
+    'DOM.adoptedStyleSheetsModified': ('dom', 'AdoptedStyleSheetsModified'),
+    'DOM.attributeRemoved': ('dom', 'AttributeRemoved'),
+    'DOM.characterDataModified': ('dom', 'CharacterDataModified'),
+    'DOM.childNodeCountUpdated': ('dom', 'ChildNodeCountUpdated'),
+    'DOM.childNodeInserted': ('dom', 'ChildNodeInserted'),
+    'DOM.childNodeRemoved': ('dom', 'ChildNodeRemoved'),
+    'DOM.distributedNodesUpdated': ('dom', 'DistributedNodesUpdated'),
+    'DOM.documentUpdated': ('dom', 'DocumentUpdated'),
+    'DOM.inlineStyleInvalidated': ('dom', 'InlineStyleInvalidated'),
+    'DOM.pseudoElementAdded': ('dom', 'PseudoElementAdded'),
+    'DOM.topLayerElementsUpdated': ('dom', 'TopLayerElementsUpdated'),
+    'DOM.scrollableFlagUpdated': ('dom', 'ScrollableFlagUpdated'),
+    'DOM.adRelatedStateUpdated': ('dom', 'AdRelatedStateUpdated'),
+    'DOM.affectedByStartingStylesFlagUpdated': ('dom', 'AffectedByStartingStylesFlagUpdated'),
+    'DOM.pseudoElementRemoved': ('dom', 'PseudoElementRemoved'),
+    'DOM.setChildNodes': ('dom', 'SetChildNodes'),
+    'DOM.shadowRootPopped': ('dom', 'ShadowRootPopped'),
+    'DOM.shadowRootPushed': ('dom', 'ShadowRootPushed'),
+    'DOMStorage.domStorageItemAdded': ('dom_storage', 'DomStorageItemAdded'),
+    'DOMStorage.domStorageItemRemoved': ('dom_storage', 'DomStorageItemRemoved'),
+    'DOMStorage.domStorageItemUpdated': ('dom_storage', 'DomStorageItemUpdated'),
+    'DOMStorage.domStorageItemsCleared': ('dom_storage', 'DomStorageItemsCleared'),
+    'Debugger.breakpointResolved': ('debugger', 'BreakpointResolved'),
+    'Debugger.paused': ('debugger', 'Paused'),
+    'Debugger.resumed': ('debugger', 'Resumed'),
+    'Debugger.scriptFailedToParse': ('debugger', 'ScriptFailedToParse'),
+    'Debugger.scriptParsed': ('debugger', 'ScriptParsed'),
+    'DeviceAccess.deviceRequestPrompted': ('device_access', 'DeviceRequestPrompted'),
+    'Emulation.virtualTimeBudgetExpired': ('emulation', 'VirtualTimeBudgetExpired'),
+    'Emulation.screenOrientationLockChanged': ('emulation', 'ScreenOrientationLockChanged'),
+    'FedCm.dialogShown': ('fed_cm', 'DialogShown'),
+    'FedCm.dialogClosed': ('fed_cm', 'DialogClosed'),
+    'Fetch.requestPaused': ('fetch', 'RequestPaused'),
+    'Fetch.authRequired': ('fetch', 'AuthRequired'),
+    'HeapProfiler.addHeapSnapshotChunk': ('heap_profiler', 'AddHeapSnapshotChunk'),
+    'HeapProfiler.heapStatsUpdate': ('heap_profiler', 'HeapStatsUpdate'),
+    'HeapProfiler.lastSeenObjectId': ('heap_profiler', 'LastSeenObjectId'),
+    'HeapProfiler.reportHeapSnapshotProgress': ('heap_profiler', 'ReportHeapSnapshotProgress'),
+    'HeapProfiler.resetProfiles': ('heap_profiler', 'ResetProfiles'),
+    'Input.dragIntercepted': ('input_', 'DragIntercepted'),
+    'Inspector.detached': ('inspector', 'Detached'),
+    'Inspector.targetCrashed': ('inspector', 'TargetCrashed'),
+    'Inspector.targetReloadedAfterCrash': ('inspector', 'TargetReloadedAfterCrash'),
+    'Inspector.workerScriptLoaded': ('inspector', 'WorkerScriptLoaded'),
+    'LayerTree.layerPainted': ('layer_tree', 'LayerPainted'),
+    'LayerTree.layerTreeDidChange': ('layer_tree', 'LayerTreeDidChange'),
+    'Log.entryAdded': ('log', 'EntryAdded'),
+    'Media.playerPropertiesChanged': ('media', 'PlayerPropertiesChanged'),
+    'Media.playerEventsAdded': ('media', 'PlayerEventsAdded'),
+    'Media.playerMessagesLogged': ('media', 'PlayerMessagesLogged'),
+    'Media.playerErrorsRaised': ('media', 'PlayerErrorsRaised'),
+    'Media.playerCreated': ('media', 'PlayerCreated'),
+    'Network.dataReceived': ('network', 'DataReceived'),
+    'Network.eventSourceMessageReceived': ('network', 'EventSourceMessageReceived'),
+    'Network.loadingFailed': ('network', 'LoadingFailed'),
+    'Network.loadingFinished': ('network', 'LoadingFinished'),
+    'Network.requestIntercepted': ('network', 'RequestIntercepted'),
+    'Network.requestServedFromCache': ('network', 'RequestServedFromCache'),
+    'Network.requestWillBeSent': ('network', 'RequestWillBeSent'),
+    'Network.resourceChangedPriority': ('network', 'ResourceChangedPriority'),
+    'Network.signedExchangeReceived': ('network', 'SignedExchangeReceived'),
+    'Network.responseReceived': ('network', 'ResponseReceived'),
+    'Network.webSocketClosed': ('network', 'WebSocketClosed'),
+    'Network.webSocketCreated': ('network', 'WebSocketCreated'),
+    'Network.webSocketFrameError': ('network', 'WebSocketFrameError'),
+    'Network.webSocketFrameReceived': ('network', 'WebSocketFrameReceived'),
+    'Network.webSocketFrameSent': ('network', 'WebSocketFrameSent'),
+    'Network.webSocketHandshakeResponseReceived': ('network', 'WebSocketHandshakeResponseReceived'),
+    'Network.webSocketWillSendHandshakeRequest': ('network', 'WebSocketWillSendHandshakeRequest'),
+    'Network.webTransportCreated': ('network', 'WebTransportCreated'),
+    'Network.webTransportConnectionEstablished': ('network', 'WebTransportConnectionEstablished'),
+    'Network.webTransportClosed': ('network', 'WebTransportClosed'),
+    'Network.directTCPSocketCreated': ('network', 'DirectTCPSocketCreated'),
+    'Network.directTCPSocketOpened': ('network', 'DirectTCPSocketOpened'),
+    'Network.directTCPSocketAborted': ('network', 'DirectTCPSocketAborted'),
+    'Network.directTCPSocketClosed': ('network', 'DirectTCPSocketClosed'),
+    'Network.directTCPSocketChunkSent': ('network', 'DirectTCPSocketChunkSent'),
+    'Network.directTCPSocketChunkReceived': ('network', 'DirectTCPSocketChunkReceived'),
+    'Network.directUDPSocketJoinedMulticastGroup': ('network', 'DirectUDPSocketJoinedMulticastGroup'),
+    'Network.directUDPSocketLeftMulticastGroup': ('network', 'DirectUDPSocketLeftMulticastGroup'),
+    'Network.directUDPSocketCreated': ('network', 'DirectUDPSocketCreated'),
+    'Network.directUDPSocketOpened': ('network', 'DirectUDPSocketOpened'),
+    'Network.directUDPSocketAborted': ('network', 'DirectUDPSocketAborted'),
+    'Network.directUDPSocketClosed': ('network', 'DirectUDPSocketClosed'),
+    'Network.directUDPSocketChunkSent': ('network', 'DirectUDPSocketChunkSent'),
+    'Network.directUDPSocketChunkReceived': ('network', 'DirectUDPSocketChunkReceived'),
+    'Network.requestWillBeSentExtraInfo': ('network', 'RequestWillBeSentExtraInfo'),
+    'Network.responseReceivedExtraInfo': ('network', 'ResponseReceivedExtraInfo'),
+    'Network.responseReceivedEarlyHints': ('network', 'ResponseReceivedEarlyHints'),
+    'Network.trustTokenOperationDone': ('network', 'TrustTokenOperationDone'),
+    'Network.policyUpdated': ('network', 'PolicyUpdated'),
+    'Network.reportingApiReportAdded': ('network', 'ReportingApiReportAdded'),
+    'Network.reportingApiReportUpdated': ('network', 'ReportingApiReportUpdated'),
+    'Network.reportingApiEndpointsChangedForOrigin': ('network', 'ReportingApiEndpointsChangedForOrigin'),
+    'Network.deviceBoundSessionsAdded': ('network', 'DeviceBoundSessionsAdded'),
+    'Network.deviceBoundSessionEventOccurred': ('network', 'DeviceBoundSessionEventOccurred'),
+    'Overlay.inspectNodeRequested': ('overlay', 'InspectNodeRequested'),
+    'Overlay.nodeHighlightRequested': ('overlay', 'NodeHighlightRequested'),
+    'Overlay.screenshotRequested': ('overlay', 'ScreenshotRequested'),
+    'Overlay.inspectPanelShowRequested': ('overlay', 'InspectPanelShowRequested'),
+    'Overlay.inspectedElementWindowRestored': ('overlay', 'InspectedElementWindowRestored'),
+    'Overlay.inspectModeCanceled': ('overlay', 'InspectModeCanceled'),
+    'Page.domContentEventFired': ('page', 'DomContentEventFired'),
+    'Page.fileChooserOpened': ('page', 'FileChooserOpened'),
+    'Page.frameAttached': ('page', 'FrameAttached'),
+    'Page.frameClearedScheduledNavigation': ('page', 'FrameClearedScheduledNavigation'),
+    'Page.frameDetached': ('page', 'FrameDetached'),
+    'Page.frameSubtreeWillBeDetached': ('page', 'FrameSubtreeWillBeDetached'),
+    'Page.frameNavigated': ('page', 'FrameNavigated'),
+    'Page.documentOpened': ('page', 'DocumentOpened'),
+    'Page.frameResized': ('page', 'FrameResized'),
+    'Page.frameStartedNavigating': ('page', 'FrameStartedNavigating'),
+    'Page.frameRequestedNavigation': ('page', 'FrameRequestedNavigation'),
+    'Page.frameScheduledNavigation': ('page', 'FrameScheduledNavigation'),
+    'Page.frameStartedLoading': ('page', 'FrameStartedLoading'),
+    'Page.frameStoppedLoading': ('page', 'FrameStoppedLoading'),
+    'Page.downloadWillBegin': ('page', 'DownloadWillBegin'),
+    'Page.downloadProgress': ('page', 'DownloadProgress'),
+    'Page.interstitialHidden': ('page', 'InterstitialHidden'),
+    'Page.interstitialShown': ('page', 'InterstitialShown'),
+    'Page.javascriptDialogClosed': ('page', 'JavascriptDialogClosed'),
+    'Page.javascriptDialogOpening': ('page', 'JavascriptDialogOpening'),
+    'Page.lifecycleEvent': ('page', 'LifecycleEvent'),
+    'Page.backForwardCacheNotUsed': ('page', 'BackForwardCacheNotUsed'),
+    'Page.loadEventFired': ('page', 'LoadEventFired'),
+    'Page.navigatedWithinDocument': ('page', 'NavigatedWithinDocument'),
+    'Page.screencastFrame': ('page', 'ScreencastFrame'),
+    'Page.screencastVisibilityChanged': ('page', 'ScreencastVisibilityChanged'),
+    'Page.windowOpen': ('page', 'WindowOpen'),
+    'Page.compilationCacheProduced': ('page', 'CompilationCacheProduced'),
+    'Performance.metrics': ('performance', 'Metrics'),
+    'PerformanceTimeline.timelineEventAdded': ('performance_timeline', 'TimelineEventAdded'),
+    'Preload.ruleSetUpdated': ('preload', 'RuleSetUpdated'),
+    'Preload.ruleSetRemoved': ('preload', 'RuleSetRemoved'),
+    'Preload.preloadEnabledStateUpdated': ('preload', 'PreloadEnabledStateUpdated'),
+    'Preload.prefetchStatusUpdated': ('preload', 'PrefetchStatusUpdated'),
+    'Preload.prerenderStatusUpdated': ('preload', 'PrerenderStatusUpdated'),
+    'Preload.preloadingAttemptSourcesUpdated': ('preload', 'PreloadingAttemptSourcesUpdated'),
+    'Profiler.consoleProfileFinished': ('profiler', 'ConsoleProfileFinished'),
+    'Profiler.consoleProfileStarted': ('profiler', 'ConsoleProfileStarted'),
+    'Profiler.preciseCoverageDeltaUpdate': ('profiler', 'PreciseCoverageDeltaUpdate'),
+    'Runtime.bindingCalled': ('runtime', 'BindingCalled'),
+    'Runtime.consoleAPICalled': ('runtime', 'ConsoleAPICalled'),
+    'Runtime.exceptionRevoked': ('runtime', 'ExceptionRevoked'),
+    'Runtime.exceptionThrown': ('runtime', 'ExceptionThrown'),
+    'Runtime.executionContextCreated': ('runtime', 'ExecutionContextCreated'),
+    'Runtime.executionContextDestroyed': ('runtime', 'ExecutionContextDestroyed'),
+    'Runtime.executionContextsCleared': ('runtime', 'ExecutionContextsCleared'),
+    'Runtime.inspectRequested': ('runtime', 'InspectRequested'),
+    'Security.certificateError': ('security', 'CertificateError'),
+    'Security.visibleSecurityStateChanged': ('security', 'VisibleSecurityStateChanged'),
+    'Security.securityStateChanged': ('security', 'SecurityStateChanged'),
+    'ServiceWorker.workerErrorReported': ('service_worker', 'WorkerErrorReported'),
+    'ServiceWorker.workerRegistrationUpdated': ('service_worker', 'WorkerRegistrationUpdated'),
+    'ServiceWorker.workerVersionUpdated': ('service_worker', 'WorkerVersionUpdated'),
+    'SmartCardEmulation.establishContextRequested': ('smart_card_emulation', 'EstablishContextRequested'),
+    'SmartCardEmulation.releaseContextRequested': ('smart_card_emulation', 'ReleaseContextRequested'),
+    'SmartCardEmulation.listReadersRequested': ('smart_card_emulation', 'ListReadersRequested'),
+    'SmartCardEmulation.getStatusChangeRequested': ('smart_card_emulation', 'GetStatusChangeRequested'),
+    'SmartCardEmulation.cancelRequested': ('smart_card_emulation', 'CancelRequested'),
+    'SmartCardEmulation.connectRequested': ('smart_card_emulation', 'ConnectRequested'),
+    'SmartCardEmulation.disconnectRequested': ('smart_card_emulation', 'DisconnectRequested'),
+    'SmartCardEmulation.transmitRequested': ('smart_card_emulation', 'TransmitRequested'),
+    'SmartCardEmulation.controlRequested': ('smart_card_emulation', 'ControlRequested'),
+    'SmartCardEmulation.getAttribRequested': ('smart_card_emulation', 'GetAttribRequested'),
+    'SmartCardEmulation.setAttribRequested': ('smart_card_emulation', 'SetAttribRequested'),
+    'SmartCardEmulation.statusRequested': ('smart_card_emulation', 'StatusRequested'),
+    'SmartCardEmulation.beginTransactionRequested': ('smart_card_emulation', 'BeginTransactionRequested'),
+    'SmartCardEmulation.endTransactionRequested': ('smart_card_emulation', 'EndTransactionRequested'),
+    'Storage.cacheStorageContentUpdated': ('storage', 'CacheStorageContentUpdated'),
+    'Storage.cacheStorageListUpdated': ('storage', 'CacheStorageListUpdated'),
+    'Storage.indexedDBContentUpdated': ('storage', 'IndexedDBContentUpdated'),
+    'Storage.indexedDBListUpdated': ('storage', 'IndexedDBListUpdated'),
+    'Storage.interestGroupAccessed': ('storage', 'InterestGroupAccessed'),
+    'Storage.interestGroupAuctionEventOccurred': ('storage', 'InterestGroupAuctionEventOccurred'),
+    'Storage.interestGroupAuctionNetworkRequestCreated': ('storage', 'InterestGroupAuctionNetworkRequestCreated'),
+    'Storage.sharedStorageAccessed': ('storage', 'SharedStorageAccessed'),
+    'Storage.sharedStorageWorkletOperationExecutionFinished': ('storage', 'SharedStorageWorkletOperationExecutionFinished'),
+    'Storage.storageBucketCreatedOrUpdated': ('storage', 'StorageBucketCreatedOrUpdated'),
+    'Storage.storageBucketDeleted': ('storage', 'StorageBucketDeleted'),
+    'Storage.attributionReportingSourceRegistered': ('storage', 'AttributionReportingSourceRegistered'),
+    'Storage.attributionReportingTriggerRegistered': ('storage', 'AttributionReportingTriggerRegistered'),
+    'Storage.attributionReportingReportSent': ('storage', 'AttributionReportingReportSent'),
+    'Storage.attributionReportingVerboseDebugReportSent': ('storage', 'AttributionReportingVerboseDebugReportSent'),
+    'Target.attachedToTarget': ('target', 'AttachedToTarget'),
+    'Target.detachedFromTarget': ('target', 'DetachedFromTarget'),
+    'Target.receivedMessageFromTarget': ('target', 'ReceivedMessageFromTarget'),
+    'Target.targetCreated': ('target', 'TargetCreated'),
+    'Target.targetDestroyed': ('target', 'TargetDestroyed'),
+    'Target.targetCrashed': ('target', 'TargetCrashed'),
+    'Target.targetInfoChanged': ('target', 'TargetInfoChanged'),
+    'Tethering.accepted': ('tethering', 'Accepted'),
+    'Tracing.bufferUsage': ('tracing', 'BufferUsage'),
+    'Tracing.dataCollected': ('tracing', 'DataCollected'),
+    'Tracing.tracingComplete': ('tracing', 'TracingComplete'),
+    'WebAudio.contextCreated': ('web_audio', 'ContextCreated'),
+    'WebAudio.contextWillBeDestroyed': ('web_audio', 'ContextWillBeDestroyed'),
+    'WebAudio.contextChanged': ('web_audio', 'ContextChanged'),
+    'WebAudio.audioListenerCreated': ('web_audio', 'AudioListenerCreated'),
+    'WebAudio.audioListenerWillBeDestroyed': ('web_audio', 'AudioListenerWillBeDestroyed'),
+    'WebAudio.audioNodeCreated': ('web_audio', 'AudioNodeCreated'),
+    'WebAudio.audioNodeWillBeDestroyed': ('web_audio', 'AudioNodeWillBeDestroyed'),
+    'WebAudio.audioParamCreated': ('web_audio', 'AudioParamCreated'),
+    'WebAudio.audioParamWillBeDestroyed': ('web_audio', 'AudioParamWillBeDestroyed'),
+    'WebAudio.nodesConnected': ('web_audio', 'NodesConnected'),
+    'WebAudio.nodesDisconnected': ('web_audio', 'NodesDisconnected'),
+    'WebAudio.nodeParamConnected': ('web_audio', 'NodeParamConnected'),
+    'WebAudio.nodeParamDisconnected': ('web_audio', 'NodeParamDisconnected'),
+    'WebAuthn.credentialAdded': ('web_authn', 'CredentialAdded'),
+    'WebAuthn.credentialDeleted': ('web_authn', 'CredentialDeleted'),
+    'WebAuthn.credentialUpdated': ('web_authn', 'CredentialUpdated'),
+    'WebAuthn.credentialAsserted': ('web_authn', 'CredentialAsserted'),
+    'WebMCP.toolsAdded': ('web_mcp', 'ToolsAdded'),
+    'WebMCP.toolsRemoved': ('web_mcp', 'ToolsRemoved'),
+}
@@ -6,8 +6,7 @@
 # CDP domain: SmartCardEmulation (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
@@ -58,7 +57,13 @@ class ResultCode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ResultCode:
-        return cls(json)
+        try:
+            return _RESULT_CODE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_RESULT_CODE_MEMBERS: typing.Dict[str, ResultCode] = {member.value: member for member in ResultCode}
 
 
 class ShareMode(enum.Enum):
@@ -74,7 +79,13 @@ class ShareMode(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ShareMode:
-        return cls(json)
+        try:
+            return _SHARE_MODE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_SHARE_MODE_MEMBERS: typing.Dict[str, ShareMode] = {member.value: member for member in ShareMode}
 
 
 class Disposition(enum.Enum):
@@ -91,7 +102,13 @@ class Disposition(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> Disposition:
-        return cls(json)
+        try:
+            return _DISPOSITION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_DISPOSITION_MEMBERS: typing.Dict[str, Disposition] = {member.value: member for member in Disposition}
 
 
 class ConnectionState(enum.Enum):
@@ -110,10 +127,16 @@ class ConnectionState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> ConnectionState:
-        return cls(json)
+        try:
+            return _CONNECTION_STATE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_CONNECTION_STATE_MEMBERS: typing.Dict[str, ConnectionState] = {member.value: member for member in ConnectionState}
 
-@dataclass
+
+@slotted_dataclass
 class ReaderStateFlags:
     r'''
     Maps to the ``SCARD_STATE_*`` flags.
@@ -183,7 +206,7 @@ class ReaderStateFlags:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ProtocolSet:
     r'''
     Maps to the ``SCARD_PROTOCOL_*`` flags.
@@ -226,10 +249,16 @@ class Protocol(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> Protocol:
-        return cls(json)
+        try:
+            return _PROTOCOL_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
 
+_PROTOCOL_MEMBERS: typing.Dict[str, Protocol] = {member.value: member for member in Protocol}
 
-@dataclass
+
+@slotted_dataclass
 class ReaderStateIn:
     reader: str
 
@@ -253,7 +282,7 @@ class ReaderStateIn:
         )
 
 
-@dataclass
+@slotted_dataclass
 class ReaderStateOut:
     reader: str
 
@@ -291,6 +320,9 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+enable_command = Command('SmartCardEmulation.enable', enable)
+
+
 def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     r'''
     Disables the ``SmartCardEmulation`` domain.
@@ -301,6 +333,19 @@ def disable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+disable_command = Command('SmartCardEmulation.disable', disable)
+
+
+def _report_establish_context_result_params(
+        request_id: str,
+        context_id: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['contextId'] = context_id
+    return params
+
+
 def report_establish_context_result(
         request_id: str,
         context_id: int
@@ -315,16 +360,28 @@ def report_establish_context_result(
     :param request_id:
     :param context_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['contextId'] = context_id
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportEstablishContextResult',
-        'params': params,
+        'params': _report_establish_context_result_params(request_id, context_id),
     }
     json = yield cmd_dict
 
 
+report_establish_context_result_command = Command(
+    'SmartCardEmulation.reportEstablishContextResult',
+    report_establish_context_result,
+    _report_establish_context_result_params,
+)
+
+
+def _report_release_context_result_params(
+        request_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    return params
+
+
 def report_release_context_result(
         request_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -337,15 +394,30 @@ def report_release_context_result(
 
     :param request_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportReleaseContextResult',
-        'params': params,
+        'params': _report_release_context_result_params(request_id),
     }
     json = yield cmd_dict
 
 
+report_release_context_result_command = Command(
+    'SmartCardEmulation.reportReleaseContextResult',
+    report_release_context_result,
+    _report_release_context_result_params,
+)
+
+
+def _report_list_readers_result_params(
+        request_id: str,
+        readers: typing.List[str]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['readers'] = [i for i in readers]
+    return params
+
+
 def report_list_readers_result(
         request_id: str,
         readers: typing.List[str]
@@ -360,16 +432,30 @@ def report_list_readers_result(
     :param request_id:
     :param readers:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['readers'] = [i for i in readers]
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportListReadersResult',
-        'params': params,
+        'params': _report_list_readers_result_params(request_id, readers),
     }
     json = yield cmd_dict
 
 
+report_list_readers_result_command = Command(
+    'SmartCardEmulation.reportListReadersResult',
+    report_list_readers_result,
+    _report_list_readers_result_params,
+)
+
+
+def _report_get_status_change_result_params(
+        request_id: str,
+        reader_states: typing.List[ReaderStateOut]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['readerStates'] = [i.to_json() for i in reader_states]
+    return params
+
+
 def report_get_status_change_result(
         request_id: str,
         reader_states: typing.List[ReaderStateOut]
@@ -384,16 +470,30 @@ def report_get_status_change_result(
     :param request_id:
     :param reader_states:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['readerStates'] = [i.to_json() for i in reader_states]
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportGetStatusChangeResult',
-        'params': params,
+        'params': _report_get_status_change_result_params(request_id, reader_states),
     }
     json = yield cmd_dict
 
 
+report_get_status_change_result_command = Command(
+    'SmartCardEmulation.reportGetStatusChangeResult',
+    report_get_status_change_result,
+    _report_get_status_change_result_params,
+)
+
+
+def _report_begin_transaction_result_params(
+        request_id: str,
+        handle: int
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['handle'] = handle
+    return params
+
+
 def report_begin_transaction_result(
         request_id: str,
         handle: int
@@ -409,16 +509,28 @@ def report_begin_transaction_result(
     :param request_id:
     :param handle:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['handle'] = handle
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportBeginTransactionResult',
-        'params': params,
+        'params': _report_begin_transaction_result_params(request_id, handle),
     }
     json = yield cmd_dict
 
 
+report_begin_transaction_result_command = Command(
+    'SmartCardEmulation.reportBeginTransactionResult',
+    report_begin_transaction_result,
+    _report_begin_transaction_result_params,
+)
+
+
+def _report_plain_result_params(
+        request_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    return params
+
+
 def report_plain_result(
         request_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -445,15 +557,33 @@ def report_plain_result(
 
     :param request_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportPlainResult',
-        'params': params,
+        'params': _report_plain_result_params(request_id),
     }
     json = yield cmd_dict
 
 
+report_plain_result_command = Command(
+    'SmartCardEmulation.reportPlainResult',
+    report_plain_result,
+    _report_plain_result_params,
+)
+
+
+def _report_connect_result_params(
+        request_id: str,
+        handle: int,
+        active_protocol: typing.Optional[Protocol] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['handle'] = handle
+    if active_protocol is not None:
+        params['activeProtocol'] = active_protocol.to_json()
+    return params
+
+
 def report_connect_result(
         request_id: str,
         handle: int,
@@ -470,18 +600,30 @@ def report_connect_result(
     :param handle:
     :param active_protocol: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['handle'] = handle
-    if active_protocol is not None:
-        params['activeProtocol'] = active_protocol.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportConnectResult',
-        'params': params,
+        'params': _report_connect_result_params(request_id, handle, active_protocol),
     }
     json = yield cmd_dict
 
 
+report_connect_result_command = Command(
+    'SmartCardEmulation.reportConnectResult',
+    report_connect_result,
+    _report_connect_result_params,
+)
+
+
+def _report_data_result_params(
+        request_id: str,
+        data: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['data'] = data
+    return params
+
+
 def report_data_result(
         request_id: str,
         data: str
@@ -506,16 +648,37 @@ def report_data_result(
     :param request_id:
     :param data:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['data'] = data
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportDataResult',
-        'params': params,
+        'params': _report_data_result_params(request_id, data),
     }
     json = yield cmd_dict
 
 
+report_data_result_command = Command(
+    'SmartCardEmulation.reportDataResult',
+    report_data_result,
+    _report_data_result_params,
+)
+
+
+def _report_status_result_params(
+        request_id: str,
+        reader_name: str,
+        state: ConnectionState,
+        atr: str,
+        protocol: typing.Optional[Protocol] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['readerName'] = reader_name
+    params['state'] = state.to_json()
+    params['atr'] = atr
+    if protocol is not None:
+        params['protocol'] = protocol.to_json()
+    return params
+
+
 def report_status_result(
         request_id: str,
         reader_name: str,
@@ -536,20 +699,30 @@ def report_status_result(
     :param atr:
     :param protocol: *(Optional)*
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['readerName'] = reader_name
-    params['state'] = state.to_json()
-    params['atr'] = atr
-    if protocol is not None:
-        params['protocol'] = protocol.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportStatusResult',
-        'params': params,
+        'params': _report_status_result_params(request_id, reader_name, state, atr, protocol),
     }
     json = yield cmd_dict
 
 
+report_status_result_command = Command(
+    'SmartCardEmulation.reportStatusResult',
+    report_status_result,
+    _report_status_result_params,
+)
+
+
+def _report_error_params(
+        request_id: str,
+        result_code: ResultCode
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['requestId'] = request_id
+    params['resultCode'] = result_code.to_json()
+    return params
+
+
 def report_error(
         request_id: str,
         result_code: ResultCode
@@ -560,18 +733,22 @@ def report_error(
     :param request_id:
     :param result_code:
     '''
-    params: T_JSON_DICT = dict()
-    params['requestId'] = request_id
-    params['resultCode'] = result_code.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'SmartCardEmulation.reportError',
-        'params': params,
+        'params': _report_error_params(request_id, result_code),
     }
     json = yield cmd_dict
 
 
+report_error_command = Command(
+    'SmartCardEmulation.reportError',
+    report_error,
+    _report_error_params,
+)
+
+
 @event_class('SmartCardEmulation.establishContextRequested')
-@dataclass
+@slotted_dataclass
 class EstablishContextRequested:
     r'''
     Fired when ``SCardEstablishContext`` is called.
@@ -590,7 +767,7 @@ class EstablishContextRequested:
 
 
 @event_class('SmartCardEmulation.releaseContextRequested')
-@dataclass
+@slotted_dataclass
 class ReleaseContextRequested:
     r'''
     Fired when ``SCardReleaseContext`` is called.
@@ -611,7 +788,7 @@ class ReleaseContextRequested:
 
 
 @event_class('SmartCardEmulation.listReadersRequested')
-@dataclass
+@slotted_dataclass
 class ListReadersRequested:
     r'''
     Fired when ``SCardListReaders`` is called.
@@ -632,7 +809,7 @@ class ListReadersRequested:
 
 
 @event_class('SmartCardEmulation.getStatusChangeRequested')
-@dataclass
+@slotted_dataclass
 class GetStatusChangeRequested:
     r'''
     Fired when ``SCardGetStatusChange`` is called. Timeout is specified in milliseconds.
@@ -658,7 +835,7 @@ class GetStatusChangeRequested:
 
 
 @event_class('SmartCardEmulation.cancelRequested')
-@dataclass
+@slotted_dataclass
 class CancelRequested:
     r'''
     Fired when ``SCardCancel`` is called.
@@ -679,7 +856,7 @@ class CancelRequested:
 
 
 @event_class('SmartCardEmulation.connectRequested')
-@dataclass
+@slotted_dataclass
 class ConnectRequested:
     r'''
     Fired when ``SCardConnect`` is called.
@@ -706,7 +883,7 @@ class ConnectRequested:
 
 
 @event_class('SmartCardEmulation.disconnectRequested')
-@dataclass
+@slotted_dataclass
 class DisconnectRequested:
     r'''
     Fired when ``SCardDisconnect`` is called.
@@ -729,7 +906,7 @@ class DisconnectRequested:
 
 
 @event_class('SmartCardEmulation.transmitRequested')
-@dataclass
+@slotted_dataclass
 class TransmitRequested:
     r'''
     Fired when ``SCardTransmit`` is called.
@@ -754,7 +931,7 @@ class TransmitRequested:
 
 
 @event_class('SmartCardEmulation.controlRequested')
-@dataclass
+@slotted_dataclass
 class ControlRequested:
     r'''
     Fired when ``SCardControl`` is called.
@@ -779,7 +956,7 @@ class ControlRequested:
 
 
 @event_class('SmartCardEmulation.getAttribRequested')
-@dataclass
+@slotted_dataclass
 class GetAttribRequested:
     r'''
     Fired when ``SCardGetAttrib`` is called.
@@ -802,7 +979,7 @@ class GetAttribRequested:
 
 
 @event_class('SmartCardEmulation.setAttribRequested')
-@dataclass
+@slotted_dataclass
 class SetAttribRequested:
     r'''
     Fired when ``SCardSetAttrib`` is called.
@@ -827,7 +1004,7 @@ class SetAttribRequested:
 
 
 @event_class('SmartCardEmulation.statusRequested')
-@dataclass
+@slotted_dataclass
 class StatusRequested:
     r'''
     Fired when ``SCardStatus`` is called.
@@ -848,7 +1025,7 @@ class StatusRequested:
 
 
 @event_class('SmartCardEmulation.beginTransactionRequested')
-@dataclass
+@slotted_dataclass
 class BeginTransactionRequested:
     r'''
     Fired when ``SCardBeginTransaction`` is called.
@@ -869,7 +1046,7 @@ class BeginTransactionRequested:
 
 
 @event_class('SmartCardEmulation.endTransactionRequested')
-@dataclass
+@slotted_dataclass
 class EndTransactionRequested:
     r'''
     Fired when ``SCardEndTransaction`` is called.
@@ -0,0 +1,272 @@
+"""
+Synchronous CDP Client
+
+:class:`SyncCDPConnection` wraps :class:`~cdp.connection.CDPConnection` for
+code that is not async, such as Celery tasks and thread pool workers. All
+connections in a process share one event loop, running in a background
+daemon thread started on first use. Each blocking call hands its coroutine to
+that loop and waits for the result, so a connection is only ever touched from
+the loop thread and can be used from many threads at once.
+
+Example:
+    from cdp import page
+    from cdp.sync import SyncCDPConnection
+
+    with SyncCDPConnection("ws://localhost:9222/devtools/page/...") as conn:
+        conn.execute(page.enable())
+        conn.execute(page.navigate(url="https://example.com"))
+        for event in conn.listen(page.LoadEventFired):
+            break
+"""
+
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import os
+import threading
+import typing
+
+from cdp.connection import CDPConnection, T_COMMAND
+from cdp.event_bus import EventPredicate, EventSpec
+from cdp.util import CommandRequest, T_JSON_DICT
+
+
+_T = typing.TypeVar('_T')
+
+_lock = threading.Lock()
+_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+_thread: typing.Optional[threading.Thread] = None
+_pid: typing.Optional[int] = None
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background event loop, starting its thread if needed.
+
+    The loop runs until the process exits. After a fork the child starts its
+    own loop, because the parent's thread does not exist in the child.
+    """
+    global _loop, _thread, _pid
+    with _lock:
+        if _loop is None or _pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name='cdp-event-loop', daemon=True
+            )
+            _thread.start()
+            _pid = os.getpid()
+        return _loop
+
+
+def run_sync(coro: typing.Awaitable[_T]) -> _T:
+    """
+    Run a coroutine on the background loop and block until it finishes.
+
+    Raises:
+        RuntimeError: If called from the background loop thread itself,
+            which would deadlock
+    """
+    loop = background_loop()
+    if threading.current_thread() is _thread:
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise RuntimeError(
+            "Blocking CDP calls can't be made from the background event loop; "
+            "use CDPConnection there"
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+    try:
+        return future.result()
+    except BaseException:
+        # E.g. KeyboardInterrupt in the waiting thread: stop the coroutine too.
+        future.cancel()
+        raise
+
+
+async def _create(*args: typing.Any, **kwargs: typing.Any) -> CDPConnection:
+    return CDPConnection(*args, **kwargs)
+
+
+async def _call(fn: typing.Callable[..., _T], *args: typing.Any) -> _T:
+    return fn(*args)
+
+
+class SyncCDPConnection:
+    """
+    A blocking CDP connection backed by the shared background event loop.
+
+    Takes the same arguments as :class:`~cdp.connection.CDPConnection`. The
+    underlying async connection is available as :attr:`connection`, for
+    coroutines scheduled on :func:`background_loop`.
+    """
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any):
+        """
+        Create the connection. Call :meth:`connect` or use ``with`` to open it.
+
+        Args:
+            args: Positional arguments for ``CDPConnection``
+            kwargs: Keyword arguments for ``CDPConnection``
+        """
+        self.connection: CDPConnection = run_sync(_create(*args, **kwargs))
+
+    def connect(self) -> None:
+        """Open the connection."""
+        run_sync(self.connection.connect())
+
+    def close(self) -> None:
+        """Close the connection."""
+        run_sync(self.connection.close())
+
+    def __enter__(self) -> SyncCDPConnection:
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def execute(
+        self,
+        cmd: typing.Union[typing.Generator[T_JSON_DICT, T_JSON_DICT, _T], CommandRequest[_T]],
+        timeout: typing.Optional[float] = None,
+        raw: bool = False,
+    ) -> _T:
+        """
+        Execute a CDP command and block until its result arrives.
+
+        See :meth:`CDPConnection.execute`.
+        """
+        return run_sync(self.connection.execute(cmd, timeout, raw))
+
+    def execute_raw(
+        self,
+        method: str,
+        params: typing.Optional[T_JSON_DICT] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> T_JSON_DICT:
+        """
+        Execute a CDP command given by name and block until its undecoded
+        result arrives.
+
+        See :meth:`CDPConnection.execute_raw`.
+        """
+        return run_sync(self.connection.execute_raw(method, params, timeout))
+
+    def execute_many(
+        self,
+        cmds: typing.Iterable[T_COMMAND],
+        timeout: typing.Optional[float] = None,
+        ordered: bool = True,
+    ) -> typing.List[typing.Any]:
+        """
+        Execute a batch of CDP commands with a single round trip.
+
+        See :meth:`CDPConnection.execute_many`.
+        """
+        return run_sync(self.connection.execute_many(list(cmds), timeout, ordered))
+
+    def listen(self, *event_types: EventSpec, raw: bool = False) -> EventIterator:
+        """
+        Iterate over events, blocking until each one arrives.
+
+        Unlike the async version, a listener for ``event_types`` is
+        registered as soon as this returns, before iteration starts. Close
+        the iterator (or use it in a ``with`` block) when you stop early.
+        See :meth:`CDPConnection.listen`.
+
+        Example:
+            with conn.listen(page.LoadEventFired) as events:
+                conn.execute(page.reload())
+                event = next(events)
+        """
+        return EventIterator(self.connection, event_types, raw)
+
+    def wait_for_event(
+        self,
+        event_type: EventSpec,
+        predicate: typing.Optional[EventPredicate] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Any:
+        """
+        Block until the next matching event arrives.
+
+        See :meth:`CDPConnection.wait_for_event`.
+        """
+        return run_sync(self.connection.wait_for_event(event_type, predicate, timeout))
+
+    def subscribe(self, *events: EventSpec) -> None:
+        """See :meth:`CDPConnection.subscribe`."""
+        run_sync(_call(self.connection.subscribe, *events))
+
+    def unsubscribe(self, *events: EventSpec) -> None:
+        """See :meth:`CDPConnection.unsubscribe`."""
+        run_sync(_call(self.connection.unsubscribe, *events))
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connection.is_connected
+
+
+class EventIterator:
+    """
+    Blocking iterator over the events of a :class:`SyncCDPConnection`.
+
+    One event is always being fetched in the background, so the listener
+    stays registered between calls to ``next()``.
+    """
+
+    def __init__(
+        self,
+        connection: CDPConnection,
+        event_types: typing.Tuple[EventSpec, ...],
+        raw: bool = False,
+    ):
+        self._agen = connection.listen(*event_types, raw=raw)
+        self._pending: typing.Optional[asyncio.Future] = None
+        self._closed = False
+        run_sync(self._start())
+
+    async def _start(self) -> None:
+        self._pending = asyncio.ensure_future(self._agen.__anext__())
+        # Let the listener register before returning to the caller.
+        await asyncio.sleep(0)
+
+    async def _advance(self) -> typing.Any:
+        pending = typing.cast(asyncio.Future, self._pending)
+        event = await pending
+        self._pending = asyncio.ensure_future(self._agen.__anext__())
+        return event
+
+    async def _aclose(self) -> None:
+        pending = self._pending
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+        await self._agen.aclose()  # type: ignore[attr-defined]
+
+    def __iter__(self) -> EventIterator:
+        return self
+
+    def __next__(self) -> typing.Any:
+        if self._closed:
+            raise StopIteration
+        try:
+            return run_sync(self._advance())
+        except (StopAsyncIteration, asyncio.CancelledError, concurrent.futures.CancelledError):
+            self._closed = True
+            raise StopIteration
+
+    def close(self) -> None:
+        """Stop listening. Threads blocked in ``next()`` stop iterating."""
+        if not self._closed:
+            self._closed = True
+            run_sync(self._aclose())
+
+    def __enter__(self) -> EventIterator:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
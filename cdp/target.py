@@ -6,13 +6,15 @@
 # CDP domain: Target
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import browser
-from . import page
+if typing.TYPE_CHECKING:
+    from . import browser
+    from . import page
+else:
+    lazy_import(globals(), 'browser', 'page')
 from deprecated.sphinx import deprecated # type: ignore
 
 
@@ -43,7 +45,7 @@ class SessionID(str):
         return 'SessionID({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class TargetInfo:
     target_id: TargetID
 
@@ -112,7 +114,7 @@ class TargetInfo:
         )
 
 
-@dataclass
+@slotted_dataclass
 class FilterEntry:
     r'''
     A filter used by target query/discovery/auto-attach operations.
@@ -159,7 +161,7 @@ class TargetFilter(list):
         return 'TargetFilter({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class RemoteLocation:
     host: str
 
@@ -193,7 +195,21 @@ class WindowState(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> WindowState:
-        return cls(json)
+        try:
+            return _WINDOW_STATE_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_WINDOW_STATE_MEMBERS: typing.Dict[str, WindowState] = {member.value: member for member in WindowState}
+
+
+def _activate_target_params(
+        target_id: TargetID
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    return params
 
 
 def activate_target(
@@ -204,15 +220,31 @@ def activate_target(
 
     :param target_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.activateTarget',
-        'params': params,
+        'params': _activate_target_params(target_id),
     }
     json = yield cmd_dict
 
 
+activate_target_command = Command(
+    'Target.activateTarget',
+    activate_target,
+    _activate_target_params,
+)
+
+
+def _attach_to_target_params(
+        target_id: TargetID,
+        flatten: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    if flatten is not None:
+        params['flatten'] = flatten
+    return params
+
+
 def attach_to_target(
         target_id: TargetID,
         flatten: typing.Optional[bool] = None
@@ -224,18 +256,22 @@ def attach_to_target(
     :param flatten: *(Optional)* Enables "flat" access to the session via specifying sessionId attribute in the commands. We plan to make this the default, deprecate non-flattened mode, and eventually retire it. See crbug.com/991325.
     :returns: Id assigned to the session.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    if flatten is not None:
-        params['flatten'] = flatten
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.attachToTarget',
-        'params': params,
+        'params': _attach_to_target_params(target_id, flatten),
     }
     json = yield cmd_dict
     return SessionID.from_json(json['sessionId'])
 
 
+attach_to_target_command = Command(
+    'Target.attachToTarget',
+    attach_to_target,
+    _attach_to_target_params,
+    lambda json: SessionID.from_json(json['sessionId']),
+)
+
+
 def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,SessionID]:
     r'''
     Attaches to the browser target, only uses flat sessionId mode.
@@ -251,6 +287,22 @@ def attach_to_browser_target() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,Sessi
     return SessionID.from_json(json['sessionId'])
 
 
+attach_to_browser_target_command = Command(
+    'Target.attachToBrowserTarget',
+    attach_to_browser_target,
+    None,
+    lambda json: SessionID.from_json(json['sessionId']),
+)
+
+
+def _close_target_params(
+        target_id: TargetID
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    return params
+
+
 def close_target(
         target_id: TargetID
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,bool]:
@@ -260,16 +312,36 @@ def close_target(
     :param target_id:
     :returns: Always set to true. If an error occurs, the response indicates protocol error.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.closeTarget',
-        'params': params,
+        'params': _close_target_params(target_id),
     }
     json = yield cmd_dict
     return bool(json['success'])
 
 
+close_target_command = Command(
+    'Target.closeTarget',
+    close_target,
+    _close_target_params,
+    lambda json: bool(json['success']),
+)
+
+
+def _expose_dev_tools_protocol_params(
+        target_id: TargetID,
+        binding_name: typing.Optional[str] = None,
+        inherit_permissions: typing.Optional[bool] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    if binding_name is not None:
+        params['bindingName'] = binding_name
+    if inherit_permissions is not None:
+        params['inheritPermissions'] = inherit_permissions
+    return params
+
+
 def expose_dev_tools_protocol(
         target_id: TargetID,
         binding_name: typing.Optional[str] = None,
@@ -291,19 +363,38 @@ def expose_dev_tools_protocol(
     :param binding_name: *(Optional)* Binding name, 'cdp' if not specified.
     :param inherit_permissions: *(Optional)* If true, inherits the current root session's permissions (default: false).
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    if binding_name is not None:
-        params['bindingName'] = binding_name
-    if inherit_permissions is not None:
-        params['inheritPermissions'] = inherit_permissions
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.exposeDevToolsProtocol',
-        'params': params,
+        'params': _expose_dev_tools_protocol_params(target_id, binding_name, inherit_permissions),
     }
     json = yield cmd_dict
 
 
+expose_dev_tools_protocol_command = Command(
+    'Target.exposeDevToolsProtocol',
+    expose_dev_tools_protocol,
+    _expose_dev_tools_protocol_params,
+)
+
+
+def _create_browser_context_params(
+        dispose_on_detach: typing.Optional[bool] = None,
+        proxy_server: typing.Optional[str] = None,
+        proxy_bypass_list: typing.Optional[str] = None,
+        origins_with_universal_network_access: typing.Optional[typing.List[str]] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if dispose_on_detach is not None:
+        params['disposeOnDetach'] = dispose_on_detach
+    if proxy_server is not None:
+        params['proxyServer'] = proxy_server
+    if proxy_bypass_list is not None:
+        params['proxyBypassList'] = proxy_bypass_list
+    if origins_with_universal_network_access is not None:
+        params['originsWithUniversalNetworkAccess'] = [i for i in origins_with_universal_network_access]
+    return params
+
+
 def create_browser_context(
         dispose_on_detach: typing.Optional[bool] = None,
         proxy_server: typing.Optional[str] = None,
@@ -320,23 +411,22 @@ def create_browser_context(
     :param origins_with_universal_network_access: **(EXPERIMENTAL)** *(Optional)* An optional list of origins to grant unlimited cross-origin access to. Parts of the URL other than those constituting origin are ignored.
     :returns: The id of the context created.
     '''
-    params: T_JSON_DICT = dict()
-    if dispose_on_detach is not None:
-        params['disposeOnDetach'] = dispose_on_detach
-    if proxy_server is not None:
-        params['proxyServer'] = proxy_server
-    if proxy_bypass_list is not None:
-        params['proxyBypassList'] = proxy_bypass_list
-    if origins_with_universal_network_access is not None:
-        params['originsWithUniversalNetworkAccess'] = [i for i in origins_with_universal_network_access]
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.createBrowserContext',
-        'params': params,
+        'params': _create_browser_context_params(dispose_on_detach, proxy_server, proxy_bypass_list, origins_with_universal_network_access),
     }
     json = yield cmd_dict
     return browser.BrowserContextID.from_json(json['browserContextId'])
 
 
+create_browser_context_command = Command(
+    'Target.createBrowserContext',
+    create_browser_context,
+    _create_browser_context_params,
+    lambda json: browser.BrowserContextID.from_json(json['browserContextId']),
+)
+
+
 def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tuple[typing.List[browser.BrowserContextID], typing.Optional[browser.BrowserContextID]]]:
     r'''
     Returns all browser contexts created with ``Target.createBrowserContext`` method.
@@ -356,7 +446,18 @@ def get_browser_contexts() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Tu
     )
 
 
-def create_target(
+get_browser_contexts_command = Command(
+    'Target.getBrowserContexts',
+    get_browser_contexts,
+    None,
+    lambda json: (
+        [browser.BrowserContextID.from_json(i) for i in json['browserContextIds']],
+        browser.BrowserContextID.from_json(json['defaultBrowserContextId']) if 'defaultBrowserContextId' in json else None
+    ),
+)
+
+
+def _create_target_params(
         url: str,
         left: typing.Optional[int] = None,
         top: typing.Optional[int] = None,
@@ -370,25 +471,7 @@ def create_target(
         for_tab: typing.Optional[bool] = None,
         hidden: typing.Optional[bool] = None,
         focus: typing.Optional[bool] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetID]:
-    r'''
-    Creates a new page.
-
-    :param url: The initial URL the page will be navigated to. An empty string indicates about:blank.
-    :param left: **(EXPERIMENTAL)** *(Optional)* Frame left origin in DIP (requires newWindow to be true or headless shell).
-    :param top: **(EXPERIMENTAL)** *(Optional)* Frame top origin in DIP (requires newWindow to be true or headless shell).
-    :param width: *(Optional)* Frame width in DIP (requires newWindow to be true or headless shell).
-    :param height: *(Optional)* Frame height in DIP (requires newWindow to be true or headless shell).
-    :param window_state: *(Optional)* Frame window state (requires newWindow to be true or headless shell). Default is normal.
-    :param browser_context_id: **(EXPERIMENTAL)** *(Optional)* The browser context to create the page in.
-    :param enable_begin_frame_control: **(EXPERIMENTAL)** *(Optional)* Whether BeginFrames for this target will be controlled via DevTools (headless shell only, not supported on MacOS yet, false by default).
-    :param new_window: *(Optional)* Whether to create a new Window or Tab (false by default, not supported by headless shell).
-    :param background: *(Optional)* Whether to create the target in background or foreground (false by default, not supported by headless shell).
-    :param for_tab: **(EXPERIMENTAL)** *(Optional)* Whether to create the target of type "tab".
-    :param hidden: **(EXPERIMENTAL)** *(Optional)* Whether to create a hidden target. The hidden target is observable via protocol, but not present in the tab UI strip. Cannot be created with `forTab: true`, `newWindow: true` or `background: false`. The life-time of the tab is limited to the life-time of the session.
-    :param focus: **(EXPERIMENTAL)** *(Optional)* If specified, the option is used to determine if the new target should be focused or not. By default, the focus behavior depends on the value of the background field. For example, background=false and focus=false will result in the target tab being opened but the browser window remain unchanged (if it was in the background, it will remain in the background) and background=false with focus=undefined will result in the window being focused. Using background: true and focus: true is not supported and will result in an error.
-    :returns: The id of the page opened.
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     params['url'] = url
     if left is not None:
@@ -415,14 +498,70 @@ def create_target(
         params['hidden'] = hidden
     if focus is not None:
         params['focus'] = focus
+    return params
+
+
+def create_target(
+        url: str,
+        left: typing.Optional[int] = None,
+        top: typing.Optional[int] = None,
+        width: typing.Optional[int] = None,
+        height: typing.Optional[int] = None,
+        window_state: typing.Optional[WindowState] = None,
+        browser_context_id: typing.Optional[browser.BrowserContextID] = None,
+        enable_begin_frame_control: typing.Optional[bool] = None,
+        new_window: typing.Optional[bool] = None,
+        background: typing.Optional[bool] = None,
+        for_tab: typing.Optional[bool] = None,
+        hidden: typing.Optional[bool] = None,
+        focus: typing.Optional[bool] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetID]:
+    r'''
+    Creates a new page.
+
+    :param url: The initial URL the page will be navigated to. An empty string indicates about:blank.
+    :param left: **(EXPERIMENTAL)** *(Optional)* Frame left origin in DIP (requires newWindow to be true or headless shell).
+    :param top: **(EXPERIMENTAL)** *(Optional)* Frame top origin in DIP (requires newWindow to be true or headless shell).
+    :param width: *(Optional)* Frame width in DIP (requires newWindow to be true or headless shell).
+    :param height: *(Optional)* Frame height in DIP (requires newWindow to be true or headless shell).
+    :param window_state: *(Optional)* Frame window state (requires newWindow to be true or headless shell). Default is normal.
+    :param browser_context_id: **(EXPERIMENTAL)** *(Optional)* The browser context to create the page in.
+    :param enable_begin_frame_control: **(EXPERIMENTAL)** *(Optional)* Whether BeginFrames for this target will be controlled via DevTools (headless shell only, not supported on MacOS yet, false by default).
+    :param new_window: *(Optional)* Whether to create a new Window or Tab (false by default, not supported by headless shell).
+    :param background: *(Optional)* Whether to create the target in background or foreground (false by default, not supported by headless shell).
+    :param for_tab: **(EXPERIMENTAL)** *(Optional)* Whether to create the target of type "tab".
+    :param hidden: **(EXPERIMENTAL)** *(Optional)* Whether to create a hidden target. The hidden target is observable via protocol, but not present in the tab UI strip. Cannot be created with `forTab: true`, `newWindow: true` or `background: false`. The life-time of the tab is limited to the life-time of the session.
+    :param focus: **(EXPERIMENTAL)** *(Optional)* If specified, the option is used to determine if the new target should be focused or not. By default, the focus behavior depends on the value of the background field. For example, background=false and focus=false will result in the target tab being opened but the browser window remain unchanged (if it was in the background, it will remain in the background) and background=false with focus=undefined will result in the window being focused. Using background: true and focus: true is not supported and will result in an error.
+    :returns: The id of the page opened.
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.createTarget',
-        'params': params,
+        'params': _create_target_params(url, left, top, width, height, window_state, browser_context_id, enable_begin_frame_control, new_window, background, for_tab, hidden, focus),
     }
     json = yield cmd_dict
     return TargetID.from_json(json['targetId'])
 
 
+create_target_command = Command(
+    'Target.createTarget',
+    create_target,
+    _create_target_params,
+    lambda json: TargetID.from_json(json['targetId']),
+)
+
+
+def _detach_from_target_params(
+        session_id: typing.Optional[SessionID] = None,
+        target_id: typing.Optional[TargetID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if session_id is not None:
+        params['sessionId'] = session_id.to_json()
+    if target_id is not None:
+        params['targetId'] = target_id.to_json()
+    return params
+
+
 def detach_from_target(
         session_id: typing.Optional[SessionID] = None,
         target_id: typing.Optional[TargetID] = None
@@ -433,18 +572,28 @@ def detach_from_target(
     :param session_id: *(Optional)* Session to detach.
     :param target_id: **(DEPRECATED)** *(Optional)* Deprecated.
     '''
-    params: T_JSON_DICT = dict()
-    if session_id is not None:
-        params['sessionId'] = session_id.to_json()
-    if target_id is not None:
-        params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.detachFromTarget',
-        'params': params,
+        'params': _detach_from_target_params(session_id, target_id),
     }
     json = yield cmd_dict
 
 
+detach_from_target_command = Command(
+    'Target.detachFromTarget',
+    detach_from_target,
+    _detach_from_target_params,
+)
+
+
+def _dispose_browser_context_params(
+        browser_context_id: browser.BrowserContextID
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['browserContextId'] = browser_context_id.to_json()
+    return params
+
+
 def dispose_browser_context(
         browser_context_id: browser.BrowserContextID
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -454,15 +603,29 @@ def dispose_browser_context(
 
     :param browser_context_id:
     '''
-    params: T_JSON_DICT = dict()
-    params['browserContextId'] = browser_context_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.disposeBrowserContext',
-        'params': params,
+        'params': _dispose_browser_context_params(browser_context_id),
     }
     json = yield cmd_dict
 
 
+dispose_browser_context_command = Command(
+    'Target.disposeBrowserContext',
+    dispose_browser_context,
+    _dispose_browser_context_params,
+)
+
+
+def _get_target_info_params(
+        target_id: typing.Optional[TargetID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if target_id is not None:
+        params['targetId'] = target_id.to_json()
+    return params
+
+
 def get_target_info(
         target_id: typing.Optional[TargetID] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,TargetInfo]:
@@ -474,17 +637,31 @@ def get_target_info(
     :param target_id: *(Optional)*
     :returns: 
     '''
-    params: T_JSON_DICT = dict()
-    if target_id is not None:
-        params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.getTargetInfo',
-        'params': params,
+        'params': _get_target_info_params(target_id),
     }
     json = yield cmd_dict
     return TargetInfo.from_json(json['targetInfo'])
 
 
+get_target_info_command = Command(
+    'Target.getTargetInfo',
+    get_target_info,
+    _get_target_info_params,
+    lambda json: TargetInfo.from_json(json['targetInfo']),
+)
+
+
+def _get_targets_params(
+        filter_: typing.Optional[TargetFilter] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if filter_ is not None:
+        params['filter'] = filter_.to_json()
+    return params
+
+
 def get_targets(
         filter_: typing.Optional[TargetFilter] = None
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[TargetInfo]]:
@@ -494,17 +671,36 @@ def get_targets(
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be reported. If filter is not specified and target discovery is currently enabled, a filter used for target discovery is used for consistency.
     :returns: The list of targets.
     '''
-    params: T_JSON_DICT = dict()
-    if filter_ is not None:
-        params['filter'] = filter_.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.getTargets',
-        'params': params,
+        'params': _get_targets_params(filter_),
     }
     json = yield cmd_dict
     return [TargetInfo.from_json(i) for i in json['targetInfos']]
 
 
+get_targets_command = Command(
+    'Target.getTargets',
+    get_targets,
+    _get_targets_params,
+    lambda json: [TargetInfo.from_json(i) for i in json['targetInfos']],
+)
+
+
+def _send_message_to_target_params(
+        message: str,
+        session_id: typing.Optional[SessionID] = None,
+        target_id: typing.Optional[TargetID] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['message'] = message
+    if session_id is not None:
+        params['sessionId'] = session_id.to_json()
+    if target_id is not None:
+        params['targetId'] = target_id.to_json()
+    return params
+
+
 @deprecated(version="1.3")
 def send_message_to_target(
         message: str,
@@ -522,19 +718,37 @@ def send_message_to_target(
     :param session_id: *(Optional)* Identifier of the session.
     :param target_id: **(DEPRECATED)** *(Optional)* Deprecated.
     '''
-    params: T_JSON_DICT = dict()
-    params['message'] = message
-    if session_id is not None:
-        params['sessionId'] = session_id.to_json()
-    if target_id is not None:
-        params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.sendMessageToTarget',
-        'params': params,
+        'params': _send_message_to_target_params(message, session_id, target_id),
     }
     json = yield cmd_dict
 
 
+send_message_to_target_command = Command(
+    'Target.sendMessageToTarget',
+    send_message_to_target,
+    _send_message_to_target_params,
+    deprecated='1.3',
+)
+
+
+def _set_auto_attach_params(
+        auto_attach: bool,
+        wait_for_debugger_on_start: bool,
+        flatten: typing.Optional[bool] = None,
+        filter_: typing.Optional[TargetFilter] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['autoAttach'] = auto_attach
+    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
+    if flatten is not None:
+        params['flatten'] = flatten
+    if filter_ is not None:
+        params['filter'] = filter_.to_json()
+    return params
+
+
 def set_auto_attach(
         auto_attach: bool,
         wait_for_debugger_on_start: bool,
@@ -556,20 +770,33 @@ def set_auto_attach(
     :param flatten: **(EXPERIMENTAL)** *(Optional)* Enables "flat" access to the session via specifying sessionId attribute in the commands. We plan to make this the default, deprecate non-flattened mode, and eventually retire it. See crbug.com/991325.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached.
     '''
-    params: T_JSON_DICT = dict()
-    params['autoAttach'] = auto_attach
-    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
-    if flatten is not None:
-        params['flatten'] = flatten
-    if filter_ is not None:
-        params['filter'] = filter_.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.setAutoAttach',
-        'params': params,
+        'params': _set_auto_attach_params(auto_attach, wait_for_debugger_on_start, flatten, filter_),
     }
     json = yield cmd_dict
 
 
+set_auto_attach_command = Command(
+    'Target.setAutoAttach',
+    set_auto_attach,
+    _set_auto_attach_params,
+)
+
+
+def _auto_attach_related_params(
+        target_id: TargetID,
+        wait_for_debugger_on_start: bool,
+        filter_: typing.Optional[TargetFilter] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
+    if filter_ is not None:
+        params['filter'] = filter_.to_json()
+    return params
+
+
 def auto_attach_related(
         target_id: TargetID,
         wait_for_debugger_on_start: bool,
@@ -588,18 +815,31 @@ def auto_attach_related(
     :param wait_for_debugger_on_start: Whether to pause new targets when attaching to them. Use ```Runtime.runIfWaitingForDebugger``` to run paused targets.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    params['waitForDebuggerOnStart'] = wait_for_debugger_on_start
-    if filter_ is not None:
-        params['filter'] = filter_.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.autoAttachRelated',
-        'params': params,
+        'params': _auto_attach_related_params(target_id, wait_for_debugger_on_start, filter_),
     }
     json = yield cmd_dict
 
 
+auto_attach_related_command = Command(
+    'Target.autoAttachRelated',
+    auto_attach_related,
+    _auto_attach_related_params,
+)
+
+
+def _set_discover_targets_params(
+        discover: bool,
+        filter_: typing.Optional[TargetFilter] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['discover'] = discover
+    if filter_ is not None:
+        params['filter'] = filter_.to_json()
+    return params
+
+
 def set_discover_targets(
         discover: bool,
         filter_: typing.Optional[TargetFilter] = None
@@ -611,17 +851,28 @@ def set_discover_targets(
     :param discover: Whether to discover available targets.
     :param filter_: **(EXPERIMENTAL)** *(Optional)* Only targets matching filter will be attached. If ```discover```` is false, ````filter``` must be omitted or empty.
     '''
-    params: T_JSON_DICT = dict()
-    params['discover'] = discover
-    if filter_ is not None:
-        params['filter'] = filter_.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.setDiscoverTargets',
-        'params': params,
+        'params': _set_discover_targets_params(discover, filter_),
     }
     json = yield cmd_dict
 
 
+set_discover_targets_command = Command(
+    'Target.setDiscoverTargets',
+    set_discover_targets,
+    _set_discover_targets_params,
+)
+
+
+def _set_remote_locations_params(
+        locations: typing.List[RemoteLocation]
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['locations'] = [i.to_json() for i in locations]
+    return params
+
+
 def set_remote_locations(
         locations: typing.List[RemoteLocation]
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -633,15 +884,28 @@ def set_remote_locations(
 
     :param locations: List of remote locations.
     '''
-    params: T_JSON_DICT = dict()
-    params['locations'] = [i.to_json() for i in locations]
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.setRemoteLocations',
-        'params': params,
+        'params': _set_remote_locations_params(locations),
     }
     json = yield cmd_dict
 
 
+set_remote_locations_command = Command(
+    'Target.setRemoteLocations',
+    set_remote_locations,
+    _set_remote_locations_params,
+)
+
+
+def _get_dev_tools_target_params(
+        target_id: TargetID
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    return params
+
+
 def get_dev_tools_target(
         target_id: TargetID
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.Optional[TargetID]]:
@@ -654,16 +918,33 @@ def get_dev_tools_target(
     :param target_id: Page or tab target ID.
     :returns: *(Optional)* The targetId of DevTools page target if exists.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.getDevToolsTarget',
-        'params': params,
+        'params': _get_dev_tools_target_params(target_id),
     }
     json = yield cmd_dict
     return TargetID.from_json(json['targetId']) if 'targetId' in json else None
 
 
+get_dev_tools_target_command = Command(
+    'Target.getDevToolsTarget',
+    get_dev_tools_target,
+    _get_dev_tools_target_params,
+    lambda json: TargetID.from_json(json['targetId']) if 'targetId' in json else None,
+)
+
+
+def _open_dev_tools_params(
+        target_id: TargetID,
+        panel_id: typing.Optional[str] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['targetId'] = target_id.to_json()
+    if panel_id is not None:
+        params['panelId'] = panel_id
+    return params
+
+
 def open_dev_tools(
         target_id: TargetID,
         panel_id: typing.Optional[str] = None
@@ -677,20 +958,24 @@ def open_dev_tools(
     :param panel_id: *(Optional)* The id of the panel we want DevTools to open initially. Currently supported panels are elements, console, network, sources, resources and performance.
     :returns: The targetId of DevTools page target.
     '''
-    params: T_JSON_DICT = dict()
-    params['targetId'] = target_id.to_json()
-    if panel_id is not None:
-        params['panelId'] = panel_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Target.openDevTools',
-        'params': params,
+        'params': _open_dev_tools_params(target_id, panel_id),
     }
     json = yield cmd_dict
     return TargetID.from_json(json['targetId'])
 
 
+open_dev_tools_command = Command(
+    'Target.openDevTools',
+    open_dev_tools,
+    _open_dev_tools_params,
+    lambda json: TargetID.from_json(json['targetId']),
+)
+
+
 @event_class('Target.attachedToTarget')
-@dataclass
+@slotted_dataclass
 class AttachedToTarget:
     r'''
     **EXPERIMENTAL**
@@ -712,7 +997,7 @@ class AttachedToTarget:
 
 
 @event_class('Target.detachedFromTarget')
-@dataclass
+@slotted_dataclass
 class DetachedFromTarget:
     r'''
     **EXPERIMENTAL**
@@ -734,7 +1019,7 @@ class DetachedFromTarget:
 
 
 @event_class('Target.receivedMessageFromTarget')
-@dataclass
+@slotted_dataclass
 class ReceivedMessageFromTarget:
     r'''
     Notifies about a new protocol message received from the session (as reported in
@@ -756,7 +1041,7 @@ class ReceivedMessageFromTarget:
 
 
 @event_class('Target.targetCreated')
-@dataclass
+@slotted_dataclass
 class TargetCreated:
     r'''
     Issued when a possible inspection target is created.
@@ -771,7 +1056,7 @@ class TargetCreated:
 
 
 @event_class('Target.targetDestroyed')
-@dataclass
+@slotted_dataclass
 class TargetDestroyed:
     r'''
     Issued when a target is destroyed.
@@ -786,7 +1071,7 @@ class TargetDestroyed:
 
 
 @event_class('Target.targetCrashed')
-@dataclass
+@slotted_dataclass
 class TargetCrashed:
     r'''
     Issued when a target has crashed.
@@ -807,7 +1092,7 @@ class TargetCrashed:
 
 
 @event_class('Target.targetInfoChanged')
-@dataclass
+@slotted_dataclass
 class TargetInfoChanged:
     r'''
     Issued when some information about a target has changed. This only happens between
@@ -6,12 +6,14 @@
 # CDP domain: Tracing
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import io
+if typing.TYPE_CHECKING:
+    from . import io
+else:
+    lazy_import(globals(), 'io')
 
 
 class MemoryDumpConfig(dict):
@@ -29,7 +31,7 @@ class MemoryDumpConfig(dict):
         return 'MemoryDumpConfig({})'.format(super().__repr__())
 
 
-@dataclass
+@slotted_dataclass
 class TraceConfig:
     #: Controls how the trace buffer stores data. The default is ``recordUntilFull``.
     record_mode: typing.Optional[str] = None
@@ -109,7 +111,13 @@ class StreamFormat(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamFormat:
-        return cls(json)
+        try:
+            return _STREAM_FORMAT_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_STREAM_FORMAT_MEMBERS: typing.Dict[str, StreamFormat] = {member.value: member for member in StreamFormat}
 
 
 class StreamCompression(enum.Enum):
@@ -124,7 +132,13 @@ class StreamCompression(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> StreamCompression:
-        return cls(json)
+        try:
+            return _STREAM_COMPRESSION_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_STREAM_COMPRESSION_MEMBERS: typing.Dict[str, StreamCompression] = {member.value: member for member in StreamCompression}
 
 
 class MemoryDumpLevelOfDetail(enum.Enum):
@@ -142,7 +156,13 @@ class MemoryDumpLevelOfDetail(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> MemoryDumpLevelOfDetail:
-        return cls(json)
+        try:
+            return _MEMORY_DUMP_LEVEL_OF_DETAIL_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_MEMORY_DUMP_LEVEL_OF_DETAIL_MEMBERS: typing.Dict[str, MemoryDumpLevelOfDetail] = {member.value: member for member in MemoryDumpLevelOfDetail}
 
 
 class TracingBackend(enum.Enum):
@@ -162,7 +182,13 @@ class TracingBackend(enum.Enum):
 
     @classmethod
     def from_json(cls, json: str) -> TracingBackend:
-        return cls(json)
+        try:
+            return _TRACING_BACKEND_MEMBERS[json]
+        except KeyError:
+            return unknown_enum_value(cls, json)
+
+
+_TRACING_BACKEND_MEMBERS: typing.Dict[str, TracingBackend] = {member.value: member for member in TracingBackend}
 
 
 def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -175,6 +201,9 @@ def end() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+end_command = Command('Tracing.end', end)
+
+
 def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str]]:
     r'''
     Gets supported tracing categories.
@@ -190,6 +219,14 @@ def get_categories() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,typing.List[str
     return [str(i) for i in json['categories']]
 
 
+get_categories_command = Command(
+    'Tracing.getCategories',
+    get_categories,
+    None,
+    lambda json: [str(i) for i in json['categories']],
+)
+
+
 def get_track_event_descriptor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str]:
     r'''
     Return a descriptor for all available tracing categories.
@@ -205,6 +242,22 @@ def get_track_event_descriptor() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,str
     return str(json['descriptor'])
 
 
+get_track_event_descriptor_command = Command(
+    'Tracing.getTrackEventDescriptor',
+    get_track_event_descriptor,
+    None,
+    lambda json: str(json['descriptor']),
+)
+
+
+def _record_clock_sync_marker_params(
+        sync_id: str
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    params['syncId'] = sync_id
+    return params
+
+
 def record_clock_sync_marker(
         sync_id: str
     ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -215,15 +268,32 @@ def record_clock_sync_marker(
 
     :param sync_id: The ID of this clock sync marker
     '''
-    params: T_JSON_DICT = dict()
-    params['syncId'] = sync_id
     cmd_dict: T_JSON_DICT = {
         'method': 'Tracing.recordClockSyncMarker',
-        'params': params,
+        'params': _record_clock_sync_marker_params(sync_id),
     }
     json = yield cmd_dict
 
 
+record_clock_sync_marker_command = Command(
+    'Tracing.recordClockSyncMarker',
+    record_clock_sync_marker,
+    _record_clock_sync_marker_params,
+)
+
+
+def _request_memory_dump_params(
+        deterministic: typing.Optional[bool] = None,
+        level_of_detail: typing.Optional[MemoryDumpLevelOfDetail] = None
+    ) -> T_JSON_DICT:
+    params: T_JSON_DICT = dict()
+    if deterministic is not None:
+        params['deterministic'] = deterministic
+    if level_of_detail is not None:
+        params['levelOfDetail'] = level_of_detail.to_json()
+    return params
+
+
 def request_memory_dump(
         deterministic: typing.Optional[bool] = None,
         level_of_detail: typing.Optional[MemoryDumpLevelOfDetail] = None
@@ -240,14 +310,9 @@ def request_memory_dump(
         0. **dumpGuid** - GUID of the resulting global memory dump.
         1. **success** - True iff the global memory dump succeeded.
     '''
-    params: T_JSON_DICT = dict()
-    if deterministic is not None:
-        params['deterministic'] = deterministic
-    if level_of_detail is not None:
-        params['levelOfDetail'] = level_of_detail.to_json()
     cmd_dict: T_JSON_DICT = {
         'method': 'Tracing.requestMemoryDump',
-        'params': params,
+        'params': _request_memory_dump_params(deterministic, level_of_detail),
     }
     json = yield cmd_dict
     return (
@@ -256,7 +321,18 @@ def request_memory_dump(
     )
 
 
-def start(
+request_memory_dump_command = Command(
+    'Tracing.requestMemoryDump',
+    request_memory_dump,
+    _request_memory_dump_params,
+    lambda json: (
+        str(json['dumpGuid']),
+        bool(json['success'])
+    ),
+)
+
+
+def _start_params(
         categories: typing.Optional[str] = None,
         options: typing.Optional[str] = None,
         buffer_usage_reporting_interval: typing.Optional[float] = None,
@@ -266,20 +342,7 @@ def start(
         trace_config: typing.Optional[TraceConfig] = None,
         perfetto_config: typing.Optional[str] = None,
         tracing_backend: typing.Optional[TracingBackend] = None
-    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
-    r'''
-    Start trace events collection.
-
-    :param categories: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* Category/tag filter
-    :param options: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* Tracing options
-    :param buffer_usage_reporting_interval: **(EXPERIMENTAL)** *(Optional)* If set, the agent will issue bufferUsage events at this interval, specified in milliseconds
-    :param transfer_mode: *(Optional)* Whether to report trace events as series of dataCollected events or to save trace to a stream (defaults to ```ReportEvents````).
-    :param stream_format: *(Optional)* Trace data format to use. This only applies when using ````ReturnAsStream```` transfer mode (defaults to ````json````).
-    :param stream_compression: **(EXPERIMENTAL)** *(Optional)* Compression format to use. This only applies when using ````ReturnAsStream```` transfer mode (defaults to ````none````)
-    :param trace_config: *(Optional)*
-    :param perfetto_config: **(EXPERIMENTAL)** *(Optional)* Base64-encoded serialized perfetto.protos.TraceConfig protobuf message When specified, the parameters ````categories````, ````options````, ````traceConfig```` are ignored. (Encoded as a base64 string when passed over JSON)
-    :param tracing_backend: **(EXPERIMENTAL)** *(Optional)* Backend type (defaults to ````auto```)
-    '''
+    ) -> T_JSON_DICT:
     params: T_JSON_DICT = dict()
     if categories is not None:
         params['categories'] = categories
@@ -299,15 +362,49 @@ def start(
         params['perfettoConfig'] = perfetto_config
     if tracing_backend is not None:
         params['tracingBackend'] = tracing_backend.to_json()
+    return params
+
+
+def start(
+        categories: typing.Optional[str] = None,
+        options: typing.Optional[str] = None,
+        buffer_usage_reporting_interval: typing.Optional[float] = None,
+        transfer_mode: typing.Optional[str] = None,
+        stream_format: typing.Optional[StreamFormat] = None,
+        stream_compression: typing.Optional[StreamCompression] = None,
+        trace_config: typing.Optional[TraceConfig] = None,
+        perfetto_config: typing.Optional[str] = None,
+        tracing_backend: typing.Optional[TracingBackend] = None
+    ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
+    r'''
+    Start trace events collection.
+
+    :param categories: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* Category/tag filter
+    :param options: **(DEPRECATED)** **(EXPERIMENTAL)** *(Optional)* Tracing options
+    :param buffer_usage_reporting_interval: **(EXPERIMENTAL)** *(Optional)* If set, the agent will issue bufferUsage events at this interval, specified in milliseconds
+    :param transfer_mode: *(Optional)* Whether to report trace events as series of dataCollected events or to save trace to a stream (defaults to ```ReportEvents````).
+    :param stream_format: *(Optional)* Trace data format to use. This only applies when using ````ReturnAsStream```` transfer mode (defaults to ````json````).
+    :param stream_compression: **(EXPERIMENTAL)** *(Optional)* Compression format to use. This only applies when using ````ReturnAsStream```` transfer mode (defaults to ````none````)
+    :param trace_config: *(Optional)*
+    :param perfetto_config: **(EXPERIMENTAL)** *(Optional)* Base64-encoded serialized perfetto.protos.TraceConfig protobuf message When specified, the parameters ````categories````, ````options````, ````traceConfig```` are ignored. (Encoded as a base64 string when passed over JSON)
+    :param tracing_backend: **(EXPERIMENTAL)** *(Optional)* Backend type (defaults to ````auto```)
+    '''
     cmd_dict: T_JSON_DICT = {
         'method': 'Tracing.start',
-        'params': params,
+        'params': _start_params(categories, options, buffer_usage_reporting_interval, transfer_mode, stream_format, stream_compression, trace_config, perfetto_config, tracing_backend),
     }
     json = yield cmd_dict
 
 
+start_command = Command(
+    'Tracing.start',
+    start,
+    _start_params,
+)
+
+
 @event_class('Tracing.bufferUsage')
-@dataclass
+@slotted_dataclass
 class BufferUsage:
     r'''
     **EXPERIMENTAL**
@@ -333,7 +430,7 @@ class BufferUsage:
 
 
 @event_class('Tracing.dataCollected')
-@dataclass
+@slotted_dataclass
 class DataCollected:
     r'''
     **EXPERIMENTAL**
@@ -351,7 +448,7 @@ class DataCollected:
 
 
 @event_class('Tracing.tracingComplete')
-@dataclass
+@slotted_dataclass
 class TracingComplete:
     r'''
     Signals that tracing is stopped and there is no trace buffers pending flush, all data were
@@ -0,0 +1,327 @@
+"""
+CDP Transports
+
+A transport moves encoded CDP messages between ``CDPConnection`` and the
+browser. Two are provided:
+
+- :class:`WebSocketTransport`, for ``--remote-debugging-port`` endpoints.
+- :class:`PipeTransport`, for ``--remote-debugging-pipe``, where Chrome reads
+  NUL-terminated JSON messages from file descriptor 3 and writes them to file
+  descriptor 4. The pipe skips WebSocket framing and masking, and it is
+  required by some commands, e.g. ``Extensions.loadUnpacked``.
+"""
+
+from __future__ import annotations
+import asyncio
+import os
+import subprocess
+import typing
+
+try:
+    import websockets
+    try:
+        from websockets.client import WebSocketClientProtocol  # type: ignore[attr-defined]
+    except Exception:
+        WebSocketClientProtocol = typing.Any  # type: ignore
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    WebSocketClientProtocol = typing.Any  # type: ignore
+
+from cdp.codec import Frame
+
+
+#: Default largest message accepted, in bytes. Full-page screenshots and
+#: ``DOM.getDocument(depth=-1)`` responses easily exceed the 1 MiB default of
+#: the websockets library.
+DEFAULT_MAX_SIZE = 256 * 2**20
+
+#: Close code sent by websockets when a message exceeds ``max_size``.
+_MESSAGE_TOO_BIG = 1009
+
+
+class MessageTooBigError(ConnectionError):
+    """
+    Raised by :meth:`Transport.recv` for a message larger than ``max_size``.
+
+    The connection is gone, but unlike other drops it is not worth
+    reopening: the browser would send the same message again.
+    """
+
+
+class Transport:
+    """
+    Base class for transports.
+
+    A transport is created with its configuration and opened by
+    ``CDPConnection.connect()``. ``recv`` returns one complete message at a
+    time. ``send`` and ``recv`` raise ``ConnectionError`` once the other side
+    has gone away.
+    """
+
+    #: Whether :meth:`open` can be called again after the connection dropped,
+    #: which ``CDPConnection(reconnect=...)`` relies on.
+    reopenable = False
+
+    async def open(self) -> None:
+        """Establish the connection."""
+        raise NotImplementedError
+
+    async def send(self, frame: Frame) -> None:
+        """Send one encoded message."""
+        raise NotImplementedError
+
+    async def recv(self) -> Frame:
+        """Receive one encoded message."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Close the connection. Must be safe to call more than once."""
+        raise NotImplementedError
+
+
+class WebSocketTransport(Transport):
+    """Transport over a DevTools WebSocket endpoint."""
+
+    reopenable = True
+
+    def __init__(
+        self,
+        url: str,
+        binary_frames: bool = False,
+        max_size: typing.Optional[int] = DEFAULT_MAX_SIZE,
+        read_limit: int = 2**20,
+        write_limit: int = 2**16,
+        ping_interval: typing.Optional[float] = 20.0,
+        ping_timeout: typing.Optional[float] = 20.0,
+        compression: bool = False,
+    ):
+        """
+        Args:
+            url: WebSocket URL for the CDP endpoint
+            binary_frames: Send ``bytes`` frames as binary WebSocket frames
+                instead of decoding them to ``str`` first. Chrome's DevTools
+                socket only accepts text frames, so leave this off unless the
+                endpoint accepts binary frames (e.g. a proxy or test server).
+            max_size: Largest message accepted, in bytes, or ``None`` for no
+                limit. Larger messages close the connection with a
+                :class:`MessageTooBigError` naming this limit.
+            read_limit: High-water mark of the receive buffer, in bytes. A
+                larger buffer reads big messages in fewer pauses.
+            write_limit: High-water mark of the send buffer, in bytes
+            ping_interval: Seconds between keepalive pings, or ``None`` to
+                disable them
+            ping_timeout: Seconds to wait for a pong before closing the
+                connection, or ``None`` to wait forever
+            compression: Offer the permessage-deflate extension. Chrome does
+                not negotiate it, so this only matters for proxies and remote
+                browser services; see the connection docs for the trade-off.
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError(
+                "websockets library is required for WebSocketTransport. "
+                "Install it with: pip install websockets"
+            )
+        self.url = url
+        self.binary_frames = binary_frames
+        self.max_size = max_size
+        self.read_limit = read_limit
+        self.write_limit = write_limit
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.compression = compression
+        self._ws: typing.Optional[WebSocketClientProtocol] = None
+
+    async def open(self) -> None:
+        self._ws = await websockets.connect(  # type: ignore
+            self.url,
+            max_size=self.max_size,
+            read_limit=self.read_limit,
+            write_limit=self.write_limit,
+            ping_interval=self.ping_interval,
+            ping_timeout=self.ping_timeout,
+            compression='deflate' if self.compression else None,
+        )
+
+    async def send(self, frame: Frame) -> None:
+        if isinstance(frame, bytes) and not self.binary_frames:
+            frame = frame.decode('utf-8')
+        try:
+            await self._ws.send(frame)  # type: ignore[union-attr]
+        except websockets.ConnectionClosed as e:  # type: ignore
+            raise ConnectionError(f"WebSocket closed: {e}") from e
+
+    async def recv(self) -> Frame:
+        try:
+            return await self._ws.recv()  # type: ignore[union-attr]
+        except websockets.ConnectionClosed as e:  # type: ignore
+            sent = getattr(e, 'sent', None)
+            if sent is not None and sent.code == _MESSAGE_TOO_BIG:
+                raise MessageTooBigError(
+                    f"Received a message larger than max_size ({self.max_size} bytes); "
+                    f"pass a larger max_size to CDPConnection"
+                ) from e
+            raise ConnectionError(f"WebSocket closed: {e}") from e
+
+    async def close(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    def __repr__(self) -> str:
+        return f'WebSocketTransport({self.url!r})'
+
+
+class PipeTransport(Transport):
+    """
+    Transport over a pair of pipes carrying NUL-terminated messages.
+
+    Use :meth:`launch` to start a browser with ``--remote-debugging-pipe``,
+    or pass the parent's ends of existing pipes to adopt a process that was
+    started some other way. POSIX only.
+
+    Example:
+        transport = PipeTransport.launch([
+            "chromium", "--headless=new", "--remote-debugging-pipe",
+        ])
+        async with CDPConnection(transport=transport) as conn:
+            targets = await conn.execute(target.get_targets())
+    """
+
+    def __init__(
+        self,
+        read_fd: int,
+        write_fd: int,
+        process: typing.Optional[subprocess.Popen] = None,
+        max_size: int = 256 * 2**20,
+    ):
+        """
+        Args:
+            read_fd: File descriptor the browser's messages are read from
+                (the other end is the browser's fd 4)
+            write_fd: File descriptor messages to the browser are written to
+                (the other end is the browser's fd 3)
+            process: The browser process, if this transport owns it. It is
+                terminated when the transport closes.
+            max_size: Largest message accepted, in bytes
+        """
+        self.read_fd = read_fd
+        self.write_fd = write_fd
+        self.process = process
+        self.max_size = max_size
+        self._reader: typing.Optional[asyncio.StreamReader] = None
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+        self._read_transport: typing.Optional[asyncio.ReadTransport] = None
+
+    @classmethod
+    def launch(
+        cls,
+        args: typing.Sequence[str],
+        max_size: int = 256 * 2**20,
+        **popen_kwargs: typing.Any,
+    ) -> PipeTransport:
+        """
+        Start a process with its CDP pipe on file descriptors 3 and 4.
+
+        The child inherits only its standard streams and the two pipe ends.
+        The pipe ends are moved to 3 and 4 by a ``preexec_fn``, which
+        :class:`subprocess.Popen` documents as unsafe while other threads
+        are running (e.g. the loop thread of :mod:`cdp.sync`): call this
+        before starting threads, or from a program whose threads don't hold
+        locks across a fork.
+
+        Args:
+            args: Command line, which must include ``--remote-debugging-pipe``
+                for Chrome
+            max_size: Largest message accepted, in bytes
+            popen_kwargs: Extra arguments for :class:`subprocess.Popen`
+
+        Returns:
+            A transport that owns the process
+        """
+        import fcntl
+
+        # Browser reads requests from 3 and writes responses to 4.
+        to_browser_r, to_browser_w = os.pipe()
+        from_browser_r, from_browser_w = os.pipe()
+
+        def remap_fds() -> None:
+            # Move both ends above 4 first, so that neither is clobbered
+            # when the other is duplicated onto 3 or 4.
+            read_fd = fcntl.fcntl(to_browser_r, fcntl.F_DUPFD, 5)
+            write_fd = fcntl.fcntl(from_browser_w, fcntl.F_DUPFD, 5)
+            os.dup2(read_fd, 3)
+            os.dup2(write_fd, 4)
+            os.close(read_fd)
+            os.close(write_fd)
+
+        try:
+            # Popen closes every other descriptor after preexec_fn has run.
+            process = subprocess.Popen(
+                args, preexec_fn=remap_fds, close_fds=True, pass_fds=(3, 4),
+                **popen_kwargs
+            )
+        except BaseException:
+            for fd in (to_browser_r, to_browser_w, from_browser_r, from_browser_w):
+                os.close(fd)
+            raise
+        os.close(to_browser_r)
+        os.close(from_browser_w)
+        return cls(from_browser_r, to_browser_w, process, max_size)
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=self.max_size, loop=loop)
+        self._read_transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop),
+            os.fdopen(self.read_fd, 'rb', buffering=0),
+        )
+        write_transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader(loop=loop), loop=loop),
+            os.fdopen(self.write_fd, 'wb', buffering=0),
+        )
+        self._reader = reader
+        self._writer = asyncio.StreamWriter(write_transport, protocol, None, loop)
+
+    async def send(self, frame: Frame) -> None:
+        if isinstance(frame, str):
+            frame = frame.encode('utf-8')
+        writer = self._writer
+        if writer is None:
+            raise ConnectionError("Pipe is closed")
+        writer.write(frame)
+        writer.write(b'\0')
+        await writer.drain()
+
+    async def recv(self) -> Frame:
+        if self._reader is None:
+            raise ConnectionError("Pipe is closed")
+        try:
+            message = await self._reader.readuntil(b'\0')
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Pipe closed by the other side")
+        except asyncio.LimitOverrunError:
+            raise MessageTooBigError(
+                f"Message larger than max_size ({self.max_size} bytes)"
+            )
+        return message[:-1]
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._read_transport is not None:
+            self._read_transport.close()
+            self._read_transport = None
+        self._reader = None
+        process = self.process
+        if process is not None and process.poll() is None:
+            process.terminate()
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.wait_for(loop.run_in_executor(None, process.wait), 5.0)
+            except asyncio.TimeoutError:
+                process.kill()
+
+    def __repr__(self) -> str:
+        return f'PipeTransport(read_fd={self.read_fd}, write_fd={self.write_fd})'
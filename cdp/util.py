@@ -1,19 +1,330 @@
 import cdp
+import dataclasses
+import importlib
+import sys
+import types
 import typing
+import warnings
+
+from cdp.registry import EVENT_CLASSES
 
 
 T_JSON_DICT = typing.Dict[str, typing.Any]
 _event_parsers = dict()
+_event_methods = dict()
 
 
 def event_class(method):
     ''' A decorator that registers a class as an event class. '''
     def decorate(cls):
         _event_parsers[method] = cls
+        _event_methods[cls] = method
         return cls
     return decorate
 
 
+def _add_slots(cls):
+    ''' Recreate a dataclass with ``__slots__`` for its fields, like
+    ``dataclass(slots=True)`` does on Python 3.10+. '''
+    namespace = dict(cls.__dict__)
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    for name in names:
+        # Defaults live on as __init__ arguments.
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+if typing.TYPE_CHECKING:
+    # Type checkers understand dataclass() and the constructors it creates.
+    from dataclasses import dataclass as slotted_dataclass
+else:
+    def slotted_dataclass(cls):
+        ''' A ``dataclass`` decorator that gives instances ``__slots__`` instead
+        of a ``__dict__``, which makes them smaller and their attributes
+        faster. '''
+        if sys.version_info >= (3, 10):
+            return dataclasses.dataclass(slots=True)(cls)
+        return _add_slots(dataclasses.dataclass(cls))
+
+
+def event_method(cls: typing.Type) -> str:
+    ''' Return the CDP method name (e.g. ``Page.loadEventFired``) of an event
+    class. '''
+    try:
+        return _event_methods[cls]
+    except KeyError:
+        raise ValueError(f'{cls!r} is not a CDP event class') from None
+
+
+@slotted_dataclass
+class UnknownEvent:
+    ''' An event whose method is not in the protocol version this package was
+    generated from. It keeps the raw JSON parameters. '''
+    #: The CDP method, e.g. ``Page.someNewEvent``.
+    method: str
+
+    #: The event parameters, as received.
+    params: T_JSON_DICT
+
+
+class UnknownEnumValue:
+    ''' Decoded in place of an enum member when a value is not in the protocol
+    version this package was generated from, e.g. a resource type added by a
+    newer browser. It encodes back to the same value. '''
+    __slots__ = ('enum', 'value')
+
+    def __init__(self, enum: typing.Type, value: str):
+        #: The enum class that did not have the value.
+        self.enum = enum
+        #: The value, as received.
+        self.value = value
+
+    def to_json(self) -> str:
+        return self.value
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.enum is other.enum and self.value == other.value
+
+    def __hash__(self):
+        return hash((self.enum, self.value))
+
+    def __repr__(self):
+        return f'UnknownEnumValue({self.enum.__qualname__}, {self.value!r})'
+
+
+def unknown_enum_value(enum: typing.Type, value: typing.Any) -> typing.Any:
+    ''' Decode a value missing from a generated enum's table of values: a
+    member of the enum is returned as it is, anything else as an
+    :class:`UnknownEnumValue`. '''
+    if isinstance(value, enum):
+        return value
+    return UnknownEnumValue(enum, value)
+
+
+_T = typing.TypeVar('_T')
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import ParamSpec
+    _P = ParamSpec('_P')
+elif sys.version_info >= (3, 10):
+    _P = typing.ParamSpec('_P')
+else:
+    # Only type checkers need to tell parameter specifications apart.
+    _P = typing.TypeVar('_P')
+
+
+class Command(typing.Generic[_P, _T]):
+    ''' A compiled CDP command: its method name, a function that encodes call
+    arguments as the command's parameters, and one that decodes its result.
+
+    Each generated command function ``f`` has a descriptor ``f_command``.
+    Calling the descriptor with the same arguments as ``f`` returns a
+    :class:`CommandRequest`, which :class:`cdp.connection.CDPConnection`
+    executes without running a generator. Type checkers check the arguments
+    against the signature of ``f``. '''
+    __slots__ = ('method', 'function', 'encode', 'decode', 'deprecated')
+
+    def __init__(
+        self,
+        method: str,
+        function: typing.Callable[_P, typing.Generator[T_JSON_DICT, T_JSON_DICT, _T]],
+        encode: typing.Optional[typing.Callable[_P, T_JSON_DICT]] = None,
+        decode: typing.Optional[typing.Callable[[T_JSON_DICT], _T]] = None,
+        deprecated: typing.Optional[str] = None,
+    ):
+        #: The CDP method, e.g. ``Page.navigate``.
+        self.method = method
+        #: The command function this descriptor belongs to.
+        self.function = function
+        #: Builds the parameters from call arguments, or ``None`` if the
+        #: command has no parameters.
+        self.encode = encode
+        #: Builds the return value from the result, or ``None`` if the
+        #: command returns nothing.
+        self.decode = decode
+        #: The version the command was deprecated in, or ``None``. Calling
+        #: the descriptor of a deprecated command warns like calling the
+        #: function does.
+        self.deprecated = deprecated
+
+    def __call__(self, *args: '_P.args', **kwargs: '_P.kwargs') -> 'CommandRequest[_T]':
+        if self.deprecated is not None:
+            warnings.warn(
+                f'Call to deprecated command {self.method}. '
+                f'-- Deprecated since version {self.deprecated}.',
+                category=DeprecationWarning, stacklevel=2,
+            )
+        if self.encode is None:
+            if args or kwargs:
+                raise TypeError(f'{self.method} takes no parameters')
+            return CommandRequest(self, None)
+        return CommandRequest(self, self.encode(*args, **kwargs))
+
+    def __repr__(self):
+        return f'Command({self.method!r})'
+
+
+class CommandRequest(typing.Generic[_T]):
+    ''' A :class:`Command` with encoded parameters. Unlike the generator
+    returned by a command function, it can be executed any number of times,
+    and its method and parameters can be read without executing it. '''
+    __slots__ = ('command', 'params')
+
+    def __init__(self, command: 'Command[..., _T]', params: typing.Optional[T_JSON_DICT]):
+        #: The command descriptor.
+        self.command = command
+        #: The encoded parameters, or ``None``. Don't modify them once the
+        #: request has been executed, the result cache may refer to them.
+        self.params = params
+
+    @property
+    def method(self) -> str:
+        return self.command.method
+
+    def request(self) -> T_JSON_DICT:
+        ''' Return a new request dict, like the one a command generator
+        yields. '''
+        if self.params is None:
+            return {'method': self.command.method}
+        return {'method': self.command.method, 'params': self.params}
+
+    def decode(self, result: T_JSON_DICT) -> _T:
+        ''' Decode the ``result`` object of the response. '''
+        decode = self.command.decode
+        return None if decode is None else decode(result)  # type: ignore[return-value]
+
+    def __repr__(self):
+        return f'CommandRequest({self.command.method!r}, {self.params!r})'
+
+
 def parse_json_event(json: T_JSON_DICT) -> typing.Any:
-    ''' Parse a JSON dictionary into a CDP event. '''
-    return _event_parsers[json['method']].from_json(json['params'])
+    ''' Parse a JSON dictionary into a CDP event. Methods that this package
+    does not know are returned as an :class:`UnknownEvent`. '''
+    method = json['method']
+    cls = _event_parsers.get(method)
+    if cls is not None:
+        return cls.from_json(json['params'])
+    loaded = _load_event_class(method)
+    if loaded is None:
+        return UnknownEvent(method, json.get('params', {}))
+    return loaded.from_json(json['params'])
+
+
+def _load_event_class(method: str) -> typing.Optional[typing.Type[typing.Any]]:
+    ''' Import the module that defines an event, which registers its class,
+    using the table in :mod:`cdp.registry`. Return ``None`` for unknown
+    methods. '''
+    try:
+        module, name = EVENT_CLASSES[method]
+    except KeyError:
+        return None
+    cls = getattr(importlib.import_module(f'cdp.{module}'), name)
+    _event_parsers[method] = cls
+    return cls
+
+
+class _LazyModule(types.ModuleType):
+    ''' Stands in for a domain module that another domain module refers to,
+    until one of its attributes is read. Then the real module is imported and
+    replaces the placeholder in the referring module's globals, so later
+    lookups cost nothing extra. '''
+
+    def __init__(self, name: str, namespace: typing.Dict[str, typing.Any], alias: str):
+        super().__init__(name)
+        self._lazy_namespace = namespace
+        self._lazy_alias = alias
+
+    def __getattr__(self, attr: str) -> typing.Any:
+        module = importlib.import_module(self.__name__)
+        self._lazy_namespace[self._lazy_alias] = module
+        return getattr(module, attr)
+
+
+def lazy_import(namespace: typing.Dict[str, typing.Any], *modules: str) -> None:
+    ''' Bind sibling modules of the ``cdp`` package in ``namespace`` (a
+    module's ``globals()``) without importing them yet. Generated modules use
+    this for the domains their types refer to, so importing one domain does
+    not import every domain it can reach. '''
+    package = namespace['__package__']
+    for module in modules:
+        namespace[module] = _LazyModule(f'{package}.{module}', namespace, module)
+
+
+class _LazyField:
+    ''' A descriptor that decodes one JSON field on first access and caches the
+    result in the instance ``__dict__``, so later reads are plain attribute
+    lookups. '''
+    __slots__ = ('key', 'decode', 'name')
+
+    def __init__(self, key: str, decode: typing.Optional[typing.Callable] = None):
+        self.key = key
+        self.decode = decode
+        self.name = key
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        raw = obj._json.get(self.key)
+        if raw is None or self.decode is None:
+            value = raw
+        else:
+            value = self.decode(raw)
+        obj.__dict__[self.name] = value
+        return value
+
+
+def lazy_field(key: str, decode: typing.Optional[typing.Callable] = None) -> typing.Any:
+    ''' Declare a field of a :class:`LazyObject`.
+
+    :param key: the field's name in the CDP JSON object
+    :param decode: converts the raw JSON value, or ``None`` to use it as-is
+    '''
+    return _LazyField(key, decode)
+
+
+_T_Lazy = typing.TypeVar('_T_Lazy', bound='LazyObject')
+
+
+class LazyObject:
+    ''' Base class for CDP types and events generated in lazy mode
+    (``generate.py --lazy``).
+
+    ``from_json()`` only stores the raw JSON dict. Each field is decoded the
+    first time it is read, so a handler that only looks at ``request_id`` never
+    builds the nested ``Request``/``Response`` objects. Objects created with
+    the constructor behave like the eager dataclasses. '''
+    _fields: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    _json: T_JSON_DICT
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for name, value in vars(cls).items()
+            if isinstance(value, _LazyField))
+
+    @classmethod
+    def from_json(cls: typing.Type[_T_Lazy], json: T_JSON_DICT) -> _T_Lazy:
+        obj = cls.__new__(cls)
+        obj._json = json
+        return obj
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self._fields)
+        return f'{type(self).__qualname__}({fields})'
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+            for name in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
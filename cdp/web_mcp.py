@@ -6,17 +6,19 @@
 # CDP domain: WebMCP (experimental)
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
-from . import dom
-from . import page
-from . import runtime
+if typing.TYPE_CHECKING:
+    from . import dom
+    from . import page
+    from . import runtime
+else:
+    lazy_import(globals(), 'dom', 'page', 'runtime')
 
 
-@dataclass
+@slotted_dataclass
 class Annotation:
     r'''
     Tool annotations
@@ -43,7 +45,7 @@ class Annotation:
         )
 
 
-@dataclass
+@slotted_dataclass
 class Tool:
     r'''
     Definition of a tool that can be invoked.
@@ -108,8 +110,11 @@ def enable() -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
     json = yield cmd_dict
 
 
+enable_command = Command('WebMCP.enable', enable)
+
+
 @event_class('WebMCP.toolsAdded')
-@dataclass
+@slotted_dataclass
 class ToolsAdded:
     r'''
     Event fired when new tools are added.
@@ -125,7 +130,7 @@ class ToolsAdded:
 
 
 @event_class('WebMCP.toolsRemoved')
-@dataclass
+@slotted_dataclass
 class ToolsRemoved:
     r'''
     Event fired when tools are removed.
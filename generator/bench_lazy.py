@@ -0,0 +1,143 @@
+'''
+Compare event decoding cost of eager (default) and lazy (``--lazy``) modules.
+
+Usage::
+
+    python generator/bench_lazy.py [--events N]
+
+Both variants are generated from the bundled schema into a temporary
+directory, so this works without regenerating ``cdp/``. Each event payload is
+synthesized from the schema with every optional field filled in, which is
+close to what Chrome sends for busy pages. Two access patterns are timed:
+
+- **first field**: ``from_json()`` and read one scalar, e.g. ``request_id``
+  (what most handlers in a crawl do).
+- **all fields**: ``from_json()`` and read every top-level field.
+'''
+
+import argparse
+import importlib
+from pathlib import Path
+import sys
+import tempfile
+import time
+import typing
+
+from generate import CdpDomain, CdpProperty, parse, patchCDP
+
+
+EVENTS = [
+    ('Network', 'requestWillBeSent'),
+    ('Network', 'responseReceived'),
+    ('DOM', 'setChildNodes'),
+]
+
+# Deep recursive types (e.g. DOM.Node.children) are cut off at this depth.
+MAX_DEPTH = 3
+
+
+def load_domains() -> typing.List[CdpDomain]:
+    here = Path(__file__).parent.resolve()
+    domains = list()
+    for name in ('browser_protocol.json', 'js_protocol.json'):
+        domains.extend(parse(here / name, here))
+    patchCDP(domains)
+    return domains
+
+
+def sample_value(prop: CdpProperty, domain: str, types: dict, depth: int) -> typing.Any:
+    ''' Synthesize a JSON value for a property. '''
+    if prop.items:
+        item = CdpProperty(prop.name, None, prop.items.type, prop.items.ref,
+            [], None, False, False, False)
+        return [sample_value(item, domain, types, depth + 1) for _ in range(2)]
+    if prop.ref:
+        ref = prop.ref if '.' in prop.ref else f'{domain}.{prop.ref}'
+        type_ = types[ref]
+        ref_domain = ref.split('.')[0]
+        if type_.enum:
+            return type_.enum[0]
+        if type_.properties:
+            return {
+                p.name: sample_value(p, ref_domain, types, depth + 1)
+                for p in type_.properties
+                if not p.optional or depth < MAX_DEPTH
+            }
+        if type_.items:
+            return sample_value(CdpProperty('', None, type_.type, None, [],
+                type_.items, False, False, False), ref_domain, types, depth)
+        return sample_value(CdpProperty('', None, type_.type, None, [], None,
+            False, False, False), ref_domain, types, depth)
+    if prop.enum:
+        return prop.enum[0]
+    return {
+        'string': 'sample',
+        'integer': 7,
+        'number': 1.5,
+        'boolean': True,
+        'object': {'key': 'value'},
+        'any': None,
+        'array': [],
+    }[typing.cast(str, prop.type)]
+
+
+def generate_package(out: Path, name: str, domains: typing.List[CdpDomain],
+        lazy: bool) -> None:
+    package = out / name
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    for domain in domains:
+        code = domain.generate_code(lazy=lazy)
+        (package / f'{domain.module}.py').write_text(code)
+
+
+def time_events(cls, payloads, access: typing.Callable) -> float:
+    ''' Return microseconds per event. '''
+    start = time.perf_counter()
+    for payload in payloads:
+        access(cls.from_json(payload))
+    return (time.perf_counter() - start) / len(payloads) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=5_000,
+        help='Number of events per measurement')
+    args = parser.parse_args()
+
+    domains = load_domains()
+    types = {f'{d.domain}.{t.id}': t for d in domains for t in d.types}
+    by_name = {d.domain: d for d in domains}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        generate_package(out, 'cdp_eager', domains, lazy=False)
+        generate_package(out, 'cdp_lazy', domains, lazy=True)
+        # The generated modules import cdp.util from this repository.
+        sys.path[:0] = [tmp, str(Path(__file__).parent.parent.resolve())]
+
+        print(f"{'event':<34}{'variant':<8}{'first field':>14}{'all fields':>14}   (us/event)")
+        for domain_name, event_name in EVENTS:
+            domain = by_name[domain_name]
+            event = next(e for e in domain.events if e.name == event_name)
+            payload = {
+                p.name: sample_value(p, domain_name, types, 0)
+                for p in event.parameters
+            }
+            # Fresh dicts per event so lazy objects can't share decode results.
+            payloads = [dict(payload) for _ in range(args.events)]
+            first = event.parameters[0].py_name
+            names = [p.py_name for p in event.parameters]
+
+            for variant in ('eager', 'lazy'):
+                module = importlib.import_module(f'cdp_{variant}.{domain.module}')
+                cls = getattr(module, event.py_name)
+                one = time_events(cls, payloads, lambda e: getattr(e, first))
+                every = time_events(cls, payloads,
+                    lambda e: [getattr(e, n) for n in names])
+                print(f'{domain_name}.{event_name:<{33 - len(domain_name)}}'
+                    f'{variant:<8}{one:>14.2f}{every:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
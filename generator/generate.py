@@ -1,3 +1,4 @@
+import argparse
 import builtins
 from dataclasses import dataclass
 from enum import Enum
@@ -33,15 +34,56 @@ MODULE_HEADER = '''{}
 # CDP domain: {{}}{{}}
 
 from __future__ import annotations
-from cdp.util import event_class, T_JSON_DICT
-from dataclasses import dataclass
+from cdp.util import Command, event_class, lazy_import, slotted_dataclass, T_JSON_DICT, unknown_enum_value
 import enum
 import typing
 
 '''.format(SHARED_HEADER)
 
+LAZY_IMPORTS = '''from cdp.util import LazyObject, lazy_field
+'''
+
+REGISTRY_HEADER = '''{}
+
+"""
+Tables derived from the CDP schema, for use by :mod:`cdp.connection` and
+:func:`cdp.util.parse_json_event`.
+"""
+'''.format(SHARED_HEADER)
+
+# The schema does not say which commands are free of side effects, so they
+# are recognised by name: these prefixes only read browser state...
+SIDE_EFFECT_FREE_RE = re.compile(r'(get|query|describe|resolve|search|capture|can)[A-Z]')
+# ...except for these commands, which also change it.
+SIDE_EFFECT_COMMANDS = frozenset({
+    'Memory.getDOMCountersForLeakDetection',  # forces garbage collection
+})
+
 current_version = ''
 
+# Names (``Domain.Type``) of the primitive and array types. Their
+# ``from_json()`` only calls the class.
+non_object_types: typing.Set[str] = set()
+
+# Hand-written files that live alongside the generated modules in ``cdp/`` and
+# must survive regeneration.
+PRESERVED_FILES = frozenset({
+    '__init__.py',
+    'py.typed',
+    'util.py',
+    'connection.py',
+    'codec.py',
+    'event_bus.py',
+    'metrics.py',
+    'transport.py',
+    'reconnect.py',
+    'recording.py',
+    'mock_server.py',
+    'sync.py',
+    'browser_control.py',
+    'cache.py',
+})
+
 
 def indent(s: str, n: int):
     ''' A shortcut for ``textwrap.indent`` that always uses spaces. '''
@@ -289,9 +331,12 @@ class CdpProperty:
             code = assign
         return code
 
-    def generate_from_json(self, dict_: str, domain: typing.Optional[str] = None) -> str:
+    def generate_from_json(self, dict_: str, domain: typing.Optional[str] = None,
+            fast: bool = False) -> str:
         ''' Generate the code that creates an instance from a JSON dict named
         ``dict_``. '''
+        if fast:
+            return self.generate_fast_from_json(dict_, domain)
         if self.items:
             if self.items.ref:
                 py_ref = ref_to_python(self.items.ref, domain)
@@ -310,6 +355,99 @@ class CdpProperty:
             expr = f"{expr} if '{self.name}' in {dict_} else None"
         return expr
 
+    def generate_fast_from_json(self, dict_: str, domain: typing.Optional[str] = None) -> str:
+        ''' Like ``generate_from_json``, but optional fields are read with a
+        single ``{dict_}.get()`` instead of an ``in`` test and a subscript, and
+        values that JSON already decodes to the right type (strings, integers,
+        booleans, lists of them) are used as-is instead of being passed through
+        ``str()``, ``int()`` or ``bool()``. Primitive and array types are
+        constructed directly instead of through their ``from_json()``, and lists
+        are decoded with ``map()``, which looks up the decoder once per list
+        instead of once per item.
+
+        ``{dict_}.get`` is deliberately not bound to a local: on CPython 3.11+
+        the specialized method call is faster than calling a bound method. '''
+        def decoder(ref: str) -> str:
+            py_ref = ref_to_python(ref, domain)
+            name = ref if '.' in ref else f'{domain}.{ref}'
+            return py_ref if name in non_object_types else f'{py_ref}.from_json'
+
+        val = 'v' if self.optional else f"{dict_}['{self.name}']"
+        if self.items:
+            if self.items.ref:
+                expr = f"list(map({decoder(self.items.ref)}, {val}))"
+            elif self.items.type == 'number':
+                expr = f"[float(i) for i in {val}]"
+            else:
+                expr = val
+        elif self.ref:
+            expr = f"{decoder(self.ref)}({val})"
+        elif self.type == 'number':
+            # JSON numbers without a fraction decode to int.
+            expr = f"float({val})"
+        else:
+            expr = val
+        if not self.optional:
+            return expr
+        if expr == 'v':
+            return f"{dict_}.get('{self.name}')"
+        return f"None if (v := {dict_}.get('{self.name}')) is None else {expr}"
+
+    def generate_lazy_decoder(self, domain: typing.Optional[str] = None) -> typing.Optional[str]:
+        ''' Generate the expression that decodes this property's raw JSON value
+        in lazy mode, or ``None`` if the raw value can be used as-is. Refs are
+        wrapped in a lambda so that they resolve at decode time, after every
+        class in the module (and in other modules) exists. '''
+        if self.items:
+            if self.items.ref:
+                py_ref = ref_to_python(self.items.ref, domain)
+                return f"lambda v: [{py_ref}.from_json(i) for i in v]"
+            elif self.items.type == 'number':
+                return "lambda v: [float(i) for i in v]"
+        elif self.ref:
+            py_ref = ref_to_python(self.ref, domain)
+            return f"lambda v: {py_ref}.from_json(v)"
+        elif self.type == 'number':
+            return 'float'
+        return None
+
+    def generate_lazy_decl(self, domain: typing.Optional[str] = None) -> str:
+        ''' Generate the code that declares this property as a lazily decoded
+        field. '''
+        code = inline_doc(self.description)
+        if code:
+            code += '\n'
+        ann = self._get_py_annotation(domain)
+        decoder = self.generate_lazy_decoder(domain)
+        args = f"'{self.name}'"
+        if decoder:
+            args += f', {decoder}'
+        code += f'{self.py_name}: {ann} = lazy_field({args})'
+        return code
+
+
+def generate_lazy_init(props: typing.Sequence[CdpProperty], domain: str,
+        defaults: bool) -> str:
+    '''
+    Generate the ``__init__`` method of a lazy class.
+
+    The signature matches the constructor of the equivalent dataclass, so lazy
+    and eager modules can be used interchangeably. Arguments are stored in the
+    instance ``__dict__``, where they take precedence over the lazy fields.
+    '''
+    args = ['self']
+    for p in props:
+        arg = f'{p.py_name}: {p._get_py_annotation(domain)}'
+        if defaults and p.optional:
+            arg += ' = None'
+        args.append(arg)
+    code = 'def __init__(\n'
+    code += indent(',\n'.join(args), 8)
+    code += '\n'
+    code += indent(') -> None:\n', 4)
+    code += indent('\n'.join(f'self.{p.py_name} = {p.py_name}' for p in props), 4)
+    return code
+
 
 @dataclass
 class CdpType:
@@ -335,13 +473,15 @@ class CdpType:
             domain,
         )
 
-    def generate_code(self) -> str:
+    def generate_code(self, lazy: bool = False, fast: bool = False) -> str:
         ''' Generate Python code for this type. '''
         logger.debug('Generating type %s: %s', self.id, self.type)
         if self.enum:
             return self.generate_enum_code()
         elif self.properties:
-            return self.generate_class_code()
+            if lazy:
+                return self.generate_lazy_class_code()
+            return self.generate_class_code(fast)
         else:
             return self.generate_primitive_code()
 
@@ -390,15 +530,24 @@ class CdpType:
         members. Each class member is upper snaked case, e.g.
         ``MyTypeClass.MY_ENUM_VALUE`` and is assigned a string value from the
         CDP metadata.
+
+        ``from_json()`` looks values up in a dict built once after the class,
+        which is much faster than ``cls(json)``, and returns a
+        ``cdp.util.UnknownEnumValue`` for values that are not in the schema
+        (see ``cdp.util.unknown_enum_value``).
         '''
         def_to_json = dedent('''\
             def to_json(self) -> str:
                 return self.value''')
 
+        members = f'_{inflection.underscore(self.id).upper()}_MEMBERS'
         def_from_json = dedent(f'''\
             @classmethod
             def from_json(cls, json: str) -> {self.id}:
-                return cls(json)''')
+                try:
+                    return {members}[json]
+                except KeyError:
+                    return unknown_enum_value(cls, json)''')
 
         code = f'class {self.id}(enum.Enum):\n'
         doc = docstring(self.description)
@@ -410,19 +559,22 @@ class CdpType:
             code += indent(enum_code, 4)
         code += '\n' + indent(def_to_json, 4)
         code += '\n\n' + indent(def_from_json, 4)
+        code += '\n\n\n'
+        code += f'{members}: typing.Dict[str, {self.id}] = {{member.value: member for member in {self.id}}}'
 
         return code
 
-    def generate_class_code(self) -> str:
+    def generate_class_code(self, fast: bool = False) -> str:
         '''
         Generate a class type.
 
         Top-level types that are defined as a CDP ``object`` are turned into Python
-        dataclasses.
+        dataclasses. ``fast`` selects the optimized ``from_json()`` style, see
+        ``CdpProperty.generate_fast_from_json``.
         '''
         # children = set()
         code = dedent(f'''\
-            @dataclass
+            @slotted_dataclass
             class {self.id}:\n''')
         doc = docstring(self.description)
         if doc:
@@ -457,7 +609,7 @@ class CdpType:
         ''')
         from_jsons = list()
         for p in props:
-            from_json = p.generate_from_json(dict_='json', domain=self.domain)
+            from_json = p.generate_from_json(dict_='json', domain=self.domain, fast=fast)
             from_jsons.append(f'{p.py_name}={from_json},')
         def_from_json += indent('\n'.join(from_jsons), 8)
         def_from_json += '\n'
@@ -466,6 +618,39 @@ class CdpType:
 
         return code
 
+    def generate_lazy_class_code(self) -> str:
+        '''
+        Generate a lazy class type.
+
+        Instead of a dataclass, the type subclasses ``LazyObject``: it keeps the
+        raw JSON dict and decodes each property on first attribute access.
+        '''
+        code = f'class {self.id}(LazyObject):\n'
+        doc = docstring(self.description)
+        if doc:
+            code += indent(doc, 4) + '\n'
+
+        # Properties are sorted the same way as in generate_class_code() so
+        # the constructor signatures match.
+        props = list(self.properties)
+        props.sort(key=operator.attrgetter('optional'))
+        code += '\n\n'.join(indent(p.generate_lazy_decl(self.domain), 4) for p in props)
+        code += '\n\n'
+        code += indent(generate_lazy_init(props, self.domain, defaults=True), 4)
+        code += '\n\n'
+
+        def_to_json = dedent('''\
+            def to_json(self) -> T_JSON_DICT:
+                json: T_JSON_DICT = dict()
+        ''')
+        assigns = (p.generate_to_json(dict_='json') for p in props)
+        def_to_json += indent('\n'.join(assigns), 4)
+        def_to_json += '\n'
+        def_to_json += indent('return json', 4)
+        code += indent(def_to_json, 4)
+
+        return code
+
     def get_refs(self):
         ''' Return all refs for this type. '''
         refs = set()
@@ -541,11 +726,12 @@ class CdpParameter(CdpProperty):
             doc += f' {desc}'
         return doc
 
-    def generate_from_json(self, dict_: str, domain: typing.Optional[str] = None) -> str:
+    def generate_from_json(self, dict_: str, domain: typing.Optional[str] = None,
+            fast: bool = False) -> str:
         '''
         Generate the code to instantiate this parameter from a JSON dict.
         '''
-        code = super().generate_from_json(dict_, domain)
+        code = super().generate_from_json(dict_, domain, fast)
         return f'{self.py_name}={code}'
 
 
@@ -585,9 +771,10 @@ class CdpReturn(CdpProperty):
             doc = ''
         return doc
 
-    def generate_return(self, dict_: str, domain: typing.Optional[str] = None):
+    def generate_return(self, dict_: str, domain: typing.Optional[str] = None,
+            fast: bool = False):
         ''' Generate code for returning this value. '''
-        return super().generate_from_json(dict_, domain)
+        return super().generate_from_json(dict_, domain, fast)
 
 
 @dataclass
@@ -606,6 +793,12 @@ class CdpCommand:
         ''' Get a Python name for this command. '''
         return snake_case(self.name)
 
+    @property
+    def side_effect_free(self) -> bool:
+        ''' Whether the command only reads state, judging by its name. '''
+        return (SIDE_EFFECT_FREE_RE.match(self.name) is not None
+            and f'{self.domain}.{self.name}' not in SIDE_EFFECT_COMMANDS)
+
     @classmethod
     def from_json(cls, command, domain) -> 'CdpCommand':
         ''' Instantiate a CDP command from a JSON object. '''
@@ -622,7 +815,7 @@ class CdpCommand:
             domain,
         )
 
-    def generate_code(self) -> str:
+    def generate_code(self, fast: bool = False) -> str:
         ''' Generate code for a CDP command. '''
         global current_version
         # Generate the function header
@@ -633,24 +826,14 @@ class CdpCommand:
         else:
             nested_types = ', '.join(r.get_py_annotation(self.domain) for r in self.returns)
             ret_type = f'typing.Tuple[{nested_types}]'
-        ret_type = f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]"
 
-        code = ''
+        code = self.generate_encoder()
 
         if self.deprecated:
             code += f'@deprecated(version="{current_version}")\n'
 
         code += f'def {self.py_name}('
-        ret = f') -> {ret_type}:\n'
-        if self.parameters:
-            code += '\n'
-            code += indent(
-                ',\n'.join([p.generate_code(self.domain) for p in self.parameters if not p.optional] + [p.generate_code(self.domain) for p in self.parameters if p.optional]),
-                8)
-            code += '\n'
-            code += indent(ret, 4)
-        else:
-            code += ret
+        code += self.generate_signature(f"typing.Generator[T_JSON_DICT,T_JSON_DICT,{ret_type}]")
 
         # Generate the docstring
         doc = ''
@@ -679,31 +862,95 @@ class CdpCommand:
             code += indent(docstring(doc), 4)
 
         # Generate the function body
-        if self.parameters:
-            code += '\n'
-            code += indent('params: T_JSON_DICT = dict()', 4)
-            code += '\n'
-        assigns = (p.generate_to_json(dict_='params', use_self=False)
-            for p in self.parameters)
-        code += indent('\n'.join(assigns), 4)
         code += '\n'
         code += indent('cmd_dict: T_JSON_DICT = {\n', 4)
         code += indent(f"'method': '{self.domain}.{self.name}',\n", 8)
         if self.parameters:
-            code += indent("'params': params,\n", 8)
+            args = ', '.join(p.py_name for p in self.ordered_parameters)
+            code += indent(f"'params': _{self.py_name}_params({args}),\n", 8)
         code += indent('}\n', 4)
         code += indent('json = yield cmd_dict', 4)
+        ret = self.generate_result(fast)
+        if ret:
+            code += indent(f'\nreturn {ret}', 4)
+        code += '\n\n\n'
+        code += self.generate_descriptor(ret)
+        return code
+
+    @property
+    def ordered_parameters(self) -> typing.List[CdpParameter]:
+        ''' The parameters in the order the generated functions take them:
+        required ones first, since optional ones have defaults. '''
+        return ([p for p in self.parameters if not p.optional]
+            + [p for p in self.parameters if p.optional])
+
+    def generate_signature(self, ret_type: str) -> str:
+        ''' Generate the parameter list and return annotation of a function
+        that takes this command's parameters. '''
+        ret = f') -> {ret_type}:\n'
+        if not self.parameters:
+            return ret
+        code = '\n'
+        code += indent(
+            ',\n'.join(p.generate_code(self.domain) for p in self.ordered_parameters),
+            8)
+        code += '\n'
+        code += indent(ret, 4)
+        return code
+
+    def generate_result(self, fast: bool = False) -> str:
+        ''' Generate an expression that decodes the result ``json``, or an
+        empty string if the command returns nothing. '''
         if len(self.returns) == 0:
-            pass
+            return ''
         elif len(self.returns) == 1:
-            ret = self.returns[0].generate_return(dict_='json', domain=self.domain)
-            code += indent(f'\nreturn {ret}', 4)
+            return self.returns[0].generate_return(dict_='json', domain=self.domain, fast=fast)
+        ret = '(\n'
+        expr = ',\n'.join(r.generate_return(dict_='json', domain=self.domain, fast=fast)
+            for r in self.returns)
+        ret += indent(expr, 4)
+        ret += '\n)'
+        return ret
+
+    def generate_encoder(self) -> str:
+        ''' Generate the private function that encodes this command's
+        parameters, which the command function and its descriptor share, or an
+        empty string if the command has no parameters. '''
+        if not self.parameters:
+            return ''
+        code = f'def _{self.py_name}_params('
+        code += self.generate_signature('T_JSON_DICT')
+        code += indent('params: T_JSON_DICT = dict()', 4)
+        code += '\n'
+        assigns = (p.generate_to_json(dict_='params', use_self=False)
+            for p in self.parameters)
+        code += indent('\n'.join(assigns), 4)
+        code += '\n'
+        code += indent('return params', 4)
+        code += '\n\n\n'
+        return code
+
+    def generate_descriptor(self, ret: str) -> str:
+        ''' Generate the :class:`cdp.util.Command` descriptor of this command.
+        Its argument and result types are inferred from the command
+        function. '''
+        global current_version
+        args = [f"'{self.domain}.{self.name}'", self.py_name]
+        if self.parameters:
+            args.append(f'_{self.py_name}_params')
+        if ret:
+            if not self.parameters:
+                args.append('None')
+            args.append(f'lambda json: {ret}')
+        if self.deprecated:
+            args.append(f"deprecated='{current_version}'")
+        code = f'{self.py_name}_command = Command('
+        if len(args) == 2:
+            code += f'{args[0]}, {args[1]})'
         else:
-            ret = '\nreturn (\n'
-            expr = ',\n'.join(r.generate_return(dict_='json', domain=self.domain) for r in self.returns)
-            ret += indent(expr, 4)
-            ret += '\n)'
-            code += indent(ret, 4)
+            code += '\n'
+            code += indent(''.join(f'{arg},\n' for arg in args), 4)
+            code += ')'
         return code
 
     def get_refs(self):
@@ -745,12 +992,14 @@ class CdpEvent:
             domain
         )
 
-    def generate_code(self) -> str:
+    def generate_code(self, lazy: bool = False, fast: bool = False) -> str:
         ''' Generate code for a CDP event. '''
         global current_version
+        if lazy:
+            return self.generate_lazy_code()
         code = dedent(f'''\
             @event_class('{self.domain}.{self.name}')
-            @dataclass
+            @slotted_dataclass
             class {self.py_name}:''')
 
         if self.deprecated:
@@ -776,13 +1025,46 @@ class CdpEvent:
                 return cls(
         ''')
         code += indent(def_from_json, 4)
-        from_json = ',\n'.join(p.generate_from_json(dict_='json', domain=self.domain)
+        from_json = ',\n'.join(p.generate_from_json(dict_='json', domain=self.domain, fast=fast)
             for p in self.parameters)
         code += indent(from_json, 12)
         code += '\n'
         code += indent(')', 8)
         return code
 
+    def generate_lazy_code(self) -> str:
+        ''' Generate code for a CDP event that decodes its parameters on first
+        access. '''
+        global current_version
+        code = dedent(f'''\
+            @event_class('{self.domain}.{self.name}')
+            class {self.py_name}(LazyObject):''')
+
+        if self.deprecated:
+            code = f'@deprecated(version="{current_version}")\n' + code
+
+        code += '\n'
+        desc = ''
+        if self.description or self.experimental:
+            if self.experimental:
+                desc += '**EXPERIMENTAL**\n\n'
+
+            if self.description:
+                desc += self.description
+
+            code += indent(docstring(desc), 4)
+            code += '\n'
+        if not self.parameters:
+            if not desc:
+                code += indent('pass', 4)
+            return code.rstrip('\n')
+        code += indent(
+            '\n'.join(p.generate_lazy_decl(self.domain) for p in self.parameters), 4)
+        code += '\n\n'
+        # Event dataclasses have no field defaults, so neither does __init__.
+        code += indent(generate_lazy_init(self.parameters, self.domain, defaults=False), 4)
+        return code
+
     def get_refs(self):
         ''' Get all refs for this event. '''
         refs = set()
@@ -829,22 +1111,30 @@ class CdpDomain:
             [CdpEvent.from_json(event, domain_name) for event in events]
         )
 
-    def generate_code(self) -> str:
-        ''' Generate the Python module code for a given CDP domain. '''
+    def generate_code(self, lazy: bool = False, fast: bool = False) -> str:
+        '''
+        Generate the Python module code for a given CDP domain.
+
+        :param lazy: emit object types and events as ``LazyObject`` classes
+            that decode their fields on first access, instead of dataclasses
+        :param fast: emit the optimized ``from_json()`` style, with a single
+            lookup per optional field and no redundant constructor calls
+        '''
         exp = ' (experimental)' if self.experimental else ''
         code = MODULE_HEADER.format(self.domain, exp)
+        if lazy:
+            code += LAZY_IMPORTS
         import_code = self.generate_imports()
         if import_code:
             code += import_code
             code += '\n\n'
         code += '\n'
-        item_iter_t = typing.Union[CdpEvent, CdpCommand, CdpType]
-        item_iter: typing.Iterator[item_iter_t] = itertools.chain(
-            iter(self.types),
-            iter(self.commands),
-            iter(self.events),
+        items = itertools.chain(
+            (type_.generate_code(lazy, fast) for type_ in self.types),
+            (command.generate_code(fast) for command in self.commands),
+            (event.generate_code(lazy, fast) for event in self.events),
         )
-        code += '\n\n\n'.join(item.generate_code() for item in item_iter)
+        code += '\n\n\n'.join(items)
         code += '\n'
         return code
 
@@ -878,7 +1168,14 @@ class CdpDomain:
                 continue
             if domain != self.domain:
                 dependencies.add(snake_case(domain))
-        code = '\n'.join(f'from . import {d}' for d in sorted(dependencies))
+        # Other domains are imported on first use, see ``cdp.util.lazy_import``.
+        code = ''
+        if dependencies:
+            code = 'if typing.TYPE_CHECKING:\n'
+            code += ''.join(f'    from . import {d}\n' for d in sorted(dependencies))
+            code += 'else:\n'
+            modules = ', '.join(repr(d) for d in sorted(dependencies))
+            code += f'    lazy_import(globals(), {modules})'
 
         if needs_deprecation:
             code += '\nfrom deprecated.sphinx import deprecated # type: ignore'
@@ -925,7 +1222,12 @@ class CdpDomain:
                 commands, and ``z`` is the return type you should pay attention
                 to. For more information, see
                 :ref:`Getting Started: Commands <getting-started-commands>`.
-            ''')
+
+                Each command also has a descriptor named after it with a
+                ``_command`` suffix, e.g. ``{}_command``: a
+                :class:`cdp.util.Command` that builds reusable requests
+                without a generator.
+            ''').format(min(command.py_name for command in self.commands))
         else:
             docs += '*There are no types in this module.*\n'
         for command in sorted(self.commands, key=operator.attrgetter('py_name')):
@@ -1004,6 +1306,39 @@ def generate_init(init_path, domains):
     write_text_atomic(init_path, ''.join(init_lines))
 
 
+def generate_registry(registry_path, domains):
+    '''
+    Generate ``registry.py``, the method tables used by the connection.
+
+    :param Path registry_path: a file path to create the registry in
+    :param list[CdpDomain] domains: the domains to include
+    '''
+    lines = [
+        REGISTRY_HEADER,
+        '\n',
+        '#: Commands that only read browser state, so identical concurrent calls\n',
+        '#: can share one request (see ``CDPConnection(coalesce=True)``).\n',
+        'SIDE_EFFECT_FREE_COMMANDS = frozenset({\n',
+    ]
+    for domain in domains:
+        for command in domain.commands:
+            if command.side_effect_free:
+                lines.append(f"    '{domain.domain}.{command.name}',\n")
+    lines.append('})\n')
+    lines.extend([
+        '\n',
+        '#: Event method -> (module in ``cdp``, class name), used to import the\n',
+        '#: domain that defines an event the first time the event is received.\n',
+        'EVENT_CLASSES = {\n',
+    ])
+    for domain in domains:
+        for event in domain.events:
+            lines.append(f"    '{domain.domain}.{event.name}': "
+                f"('{domain.module}', '{event.py_name}'),\n")
+    lines.append('}\n')
+    write_text_atomic(registry_path, ''.join(lines))
+
+
 def generate_docs(docs_path, domains):
     '''
     Generate Sphinx documents for each domain.
@@ -1054,6 +1389,14 @@ def patchCDP(domains):
 
 def main():
     ''' Main entry point. '''
+    parser = argparse.ArgumentParser(description='Generate the cdp package from the CDP schema.')
+    parser.add_argument('--lazy', action='store_true',
+        help='emit types and events that decode their fields on first access')
+    parser.add_argument('--fast-decode', action='store_true',
+        help='emit from_json() code with one lookup per optional field and no '
+            'redundant constructor calls')
+    args = parser.parse_args()
+
     here = Path(__file__).parent.resolve()
     json_paths = [
         here / 'browser_protocol.json',
@@ -1064,7 +1407,7 @@ def main():
 
     # Remove generated code
     for subpath in output_path.iterdir():
-        if subpath.is_file() and subpath.name not in ('py.typed', 'util.py', 'connection.py', '__init__.py') and not subpath.name.startswith('.'):
+        if subpath.is_file() and subpath.name not in PRESERVED_FILES and not subpath.name.startswith('.'):
             subpath.unlink()
 
     # Parse domains
@@ -1076,15 +1419,22 @@ def main():
 
     patchCDP(domains)
 
+    non_object_types.update(f'{domain.domain}.{type_.id}'
+        for domain in domains for type_ in domain.types
+        if not type_.properties and not type_.enum)
+
     for domain in domains:
         logger.info('Generating module: %s → %s.py', domain.domain,
             domain.module)
         module_path = output_path / f'{domain.module}.py'
-        write_text_atomic(module_path, domain.generate_code())
+        write_text_atomic(module_path, domain.generate_code(lazy=args.lazy, fast=args.fast_decode))
 
     init_path = output_path / '__init__.py'
     generate_init(init_path, domains)
 
+    registry_path = output_path / 'registry.py'
+    generate_registry(registry_path, domains)
+
     docs_path = here.parent / 'docs' / 'api'
     generate_docs(docs_path, domains)
 
@@ -10,9 +10,10 @@ Pytest doesn't display stdout by default unless a test fails, and debugging
 codegen tests is almost always easier with the values displayed on stdout.
 '''
 
-from textwrap import dedent
+from textwrap import dedent, indent
 
-from generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring, generate_init
+import generate
+from generate import CdpCommand, CdpDomain, CdpEvent, CdpType, docstring, generate_init, generate_registry
 
 
 def test_docstring():
@@ -77,6 +78,30 @@ def test_generate_init_uses_lazy_submodule_loader(tmp_path):
     assert 'import cdp.accessibility' not in actual
 
 
+def test_generate_registry(tmp_path):
+    def command(name, domain):
+        return CdpCommand.from_json({'name': name}, domain)
+
+    class StubDomain:
+        domain = 'Memory'
+        module = 'memory'
+        commands = [
+            command('getDOMCounters', 'Memory'),
+            command('getDOMCountersForLeakDetection', 'Memory'),
+            command('forciblyPurgeJavaScriptMemory', 'Memory'),
+            command('getter', 'Memory'),
+        ]
+        events = [CdpEvent.from_json({'name': 'pressureNotified', 'parameters': []}, 'Memory')]
+
+    registry_path = tmp_path / 'registry.py'
+    generate_registry(registry_path, [StubDomain()])
+    namespace = {}
+    exec(registry_path.read_text(), namespace)
+
+    assert namespace['SIDE_EFFECT_FREE_COMMANDS'] == {'Memory.getDOMCounters'}
+    assert namespace['EVENT_CLASSES'] == {'Memory.pressureNotified': ('memory', 'PressureNotified')}
+
+
 def test_cdp_primitive_type():
     json_type = {
         "id": "AXNodeId",
@@ -163,7 +188,13 @@ def test_cdp_enum_type():
 
             @classmethod
             def from_json(cls, json: str) -> AXValueSourceType:
-                return cls(json)""")
+                try:
+                    return _AX_VALUE_SOURCE_TYPE_MEMBERS[json]
+                except KeyError:
+                    return unknown_enum_value(cls, json)
+
+
+        _AX_VALUE_SOURCE_TYPE_MEMBERS: typing.Dict[str, AXValueSourceType] = {member.value: member for member in AXValueSourceType}""")
 
     type = CdpType.from_json(json_type, "TestDomain")
     actual = type.generate_code()
@@ -208,7 +239,7 @@ def test_cdp_class_type():
         ]
     }
     expected = dedent("""\
-        @dataclass
+        @slotted_dataclass
         class AXValue:
             r'''
             A single computed AX property.
@@ -250,6 +281,115 @@ def test_cdp_class_type():
     assert expected == actual
 
 
+def test_cdp_fast_class_type(monkeypatch):
+    monkeypatch.setattr(generate, 'non_object_types', {'TestDomain.AXValueType'})
+    json_type = {
+        "id": "AXValue",
+        "type": "object",
+        "properties": [
+            {"name": "type", "$ref": "AXValueType"},
+            {"name": "name", "type": "string"},
+            {"name": "value", "optional": True, "type": "any"},
+            {"name": "weight", "optional": True, "type": "number"},
+            {"name": "source", "optional": True, "$ref": "AXValueSource"},
+            {"name": "relatedNodes", "optional": True, "type": "array",
+                "items": {"$ref": "AXRelatedNode"}},
+        ]
+    }
+    expected = dedent("""\
+        @classmethod
+        def from_json(cls, json: T_JSON_DICT) -> AXValue:
+            return cls(
+                type_=AXValueType(json['type']),
+                name=json['name'],
+                value=json.get('value'),
+                weight=None if (v := json.get('weight')) is None else float(v),
+                source=None if (v := json.get('source')) is None else AXValueSource.from_json(v),
+                related_nodes=None if (v := json.get('relatedNodes')) is None else list(map(AXRelatedNode.from_json, v)),
+            )""")
+
+    type = CdpType.from_json(json_type, "TestDomain")
+    actual = type.generate_code(fast=True)
+    assert actual.endswith(indent(expected, 4 * ' '))
+
+
+def test_cdp_lazy_class_type():
+    json_type = {
+        "id": "AXValue",
+        "description": "A single computed AX property.",
+        "type": "object",
+        "properties": [
+            {
+                "name": "type",
+                "description": "The type of this value.",
+                "$ref": "AXValueType"
+            },
+            {
+                "name": "value",
+                "description": "The computed value of this property.",
+                "optional": True,
+                "type": "any"
+            },
+            {
+                "name": "relatedNodes",
+                "description": "One or more related nodes, if applicable.",
+                "optional": True,
+                "type": "array",
+                "items": {
+                    "$ref": "AXRelatedNode"
+                }
+            },
+            {
+                "name": "weight",
+                "optional": True,
+                "type": "number"
+            }
+        ]
+    }
+    expected = dedent("""\
+        class AXValue(LazyObject):
+            r'''
+            A single computed AX property.
+            '''
+            #: The type of this value.
+            type_: AXValueType = lazy_field('type', lambda v: AXValueType.from_json(v))
+
+            #: The computed value of this property.
+            value: typing.Optional[typing.Any] = lazy_field('value')
+
+            #: One or more related nodes, if applicable.
+            related_nodes: typing.Optional[typing.List[AXRelatedNode]] = lazy_field('relatedNodes', lambda v: [AXRelatedNode.from_json(i) for i in v])
+
+            weight: typing.Optional[float] = lazy_field('weight', float)
+
+            def __init__(
+                    self,
+                    type_: AXValueType,
+                    value: typing.Optional[typing.Any] = None,
+                    related_nodes: typing.Optional[typing.List[AXRelatedNode]] = None,
+                    weight: typing.Optional[float] = None
+                ) -> None:
+                self.type_ = type_
+                self.value = value
+                self.related_nodes = related_nodes
+                self.weight = weight
+
+            def to_json(self) -> T_JSON_DICT:
+                json: T_JSON_DICT = dict()
+                json['type'] = self.type_.to_json()
+                if self.value is not None:
+                    json['value'] = self.value
+                if self.related_nodes is not None:
+                    json['relatedNodes'] = [i.to_json() for i in self.related_nodes]
+                if self.weight is not None:
+                    json['weight'] = self.weight
+                return json""")
+
+    type = CdpType.from_json(json_type, "TestDomain")
+    actual = type.generate_code(lazy=True)
+    assert expected == actual
+
+
 def test_cdp_command():
     json_cmd = {
         "name": "getPartialAXTree",
@@ -293,6 +433,24 @@ def test_cdp_command():
         ]
     }
     expected = dedent("""\
+        def _get_partial_ax_tree_params(
+                node_id: typing.Optional[dom.NodeId] = None,
+                backend_node_id: typing.Optional[dom.BackendNodeId] = None,
+                object_id: typing.Optional[runtime.RemoteObjectId] = None,
+                fetch_relatives: typing.Optional[bool] = None
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            if node_id is not None:
+                params['nodeId'] = node_id.to_json()
+            if backend_node_id is not None:
+                params['backendNodeId'] = backend_node_id.to_json()
+            if object_id is not None:
+                params['objectId'] = object_id.to_json()
+            if fetch_relatives is not None:
+                params['fetchRelatives'] = fetch_relatives
+            return params
+
+
         def get_partial_ax_tree(
                 node_id: typing.Optional[dom.NodeId] = None,
                 backend_node_id: typing.Optional[dom.BackendNodeId] = None,
@@ -310,21 +468,20 @@ def test_cdp_command():
             :param fetch_relatives: *(Optional)* Whether to fetch this nodes ancestors, siblings and children. Defaults to true.
             :returns: The ``Accessibility.AXNode`` for this DOM node, if it exists, plus its ancestors, siblings and children, if requested.
             '''
-            params: T_JSON_DICT = dict()
-            if node_id is not None:
-                params['nodeId'] = node_id.to_json()
-            if backend_node_id is not None:
-                params['backendNodeId'] = backend_node_id.to_json()
-            if object_id is not None:
-                params['objectId'] = object_id.to_json()
-            if fetch_relatives is not None:
-                params['fetchRelatives'] = fetch_relatives
             cmd_dict: T_JSON_DICT = {
                 'method': 'Accessibility.getPartialAXTree',
-                'params': params,
+                'params': _get_partial_ax_tree_params(node_id, backend_node_id, object_id, fetch_relatives),
             }
             json = yield cmd_dict
-            return [AXNode.from_json(i) for i in json['nodes']]""")
+            return [AXNode.from_json(i) for i in json['nodes']]
+
+
+        get_partial_ax_tree_command = Command(
+            'Accessibility.getPartialAXTree',
+            get_partial_ax_tree,
+            _get_partial_ax_tree_params,
+            lambda json: [AXNode.from_json(i) for i in json['nodes']],
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
@@ -344,7 +501,10 @@ def test_cdp_command_no_params_or_returns():
             cmd_dict: T_JSON_DICT = {
                 'method': 'Accessibility.disable',
             }
-            json = yield cmd_dict""")
+            json = yield cmd_dict
+
+
+        disable_command = Command('Accessibility.disable', disable)""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Accessibility')
     actual = cmd.generate_code()
@@ -371,6 +531,14 @@ def test_cdp_command_return_primitive():
         ]
     }
     expected = dedent("""\
+        def _get_current_time_params(
+                id_: str
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            params['id'] = id_
+            return params
+
+
         def get_current_time(
                 id_: str
             ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,float]:
@@ -380,14 +548,20 @@ def test_cdp_command_return_primitive():
             :param id_: Id of animation.
             :returns: Current time of the page.
             '''
-            params: T_JSON_DICT = dict()
-            params['id'] = id_
             cmd_dict: T_JSON_DICT = {
                 'method': 'Animation.getCurrentTime',
-                'params': params,
+                'params': _get_current_time_params(id_),
             }
             json = yield cmd_dict
-            return float(json['currentTime'])""")
+            return float(json['currentTime'])
+
+
+        get_current_time_command = Command(
+            'Animation.getCurrentTime',
+            get_current_time,
+            _get_current_time_params,
+            lambda json: float(json['currentTime']),
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -424,7 +598,15 @@ def test_cdp_command_return_array_of_primitive():
                 'method': 'Browser.getBrowserCommandLine',
             }
             json = yield cmd_dict
-            return [str(i) for i in json['arguments']]""")
+            return [str(i) for i in json['arguments']]
+
+
+        get_browser_command_line_command = Command(
+            'Browser.getBrowserCommandLine',
+            get_browser_command_line,
+            None,
+            lambda json: [str(i) for i in json['arguments']],
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -447,6 +629,14 @@ def test_cdp_command_array_of_primitive_parameter():
         ]
     }
     expected = dedent("""\
+        def _release_animations_params(
+                animations: typing.List[str]
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            params['animations'] = [i for i in animations]
+            return params
+
+
         def release_animations(
                 animations: typing.List[str]
             ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,None]:
@@ -455,13 +645,18 @@ def test_cdp_command_array_of_primitive_parameter():
 
             :param animations: List of animation ids to seek.
             '''
-            params: T_JSON_DICT = dict()
-            params['animations'] = [i for i in animations]
             cmd_dict: T_JSON_DICT = {
                 'method': 'Animation.releaseAnimations',
-                'params': params,
+                'params': _release_animations_params(animations),
             }
-            json = yield cmd_dict""")
+            json = yield cmd_dict
+
+
+        release_animations_command = Command(
+            'Animation.releaseAnimations',
+            release_animations,
+            _release_animations_params,
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -488,6 +683,14 @@ def test_cdp_command_ref_parameter():
         ]
     }
     expected = dedent("""\
+        def _resolve_animation_params(
+                animation_id: str
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            params['animationId'] = animation_id
+            return params
+
+
         def resolve_animation(
                 animation_id: str
             ) -> typing.Generator[T_JSON_DICT,T_JSON_DICT,runtime.RemoteObject]:
@@ -497,14 +700,20 @@ def test_cdp_command_ref_parameter():
             :param animation_id: Animation id.
             :returns: Corresponding remote object.
             '''
-            params: T_JSON_DICT = dict()
-            params['animationId'] = animation_id
             cmd_dict: T_JSON_DICT = {
                 'method': 'Animation.resolveAnimation',
-                'params': params,
+                'params': _resolve_animation_params(animation_id),
             }
             json = yield cmd_dict
-            return runtime.RemoteObject.from_json(json['remoteObject'])""")
+            return runtime.RemoteObject.from_json(json['remoteObject'])
+
+
+        resolve_animation_command = Command(
+            'Animation.resolveAnimation',
+            resolve_animation,
+            _resolve_animation_params,
+            lambda json: runtime.RemoteObject.from_json(json['remoteObject']),
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Animation')
     actual = cmd.generate_code()
@@ -564,6 +773,22 @@ def test_cdp_command_multiple_return():
         ]
     }
     expected = dedent("""\
+        def _get_encoded_response_params(
+                request_id: network.RequestId,
+                encoding: str,
+                quality: typing.Optional[float] = None,
+                size_only: typing.Optional[bool] = None
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            params['requestId'] = request_id.to_json()
+            params['encoding'] = encoding
+            if quality is not None:
+                params['quality'] = quality
+            if size_only is not None:
+                params['sizeOnly'] = size_only
+            return params
+
+
         def get_encoded_response(
                 request_id: network.RequestId,
                 encoding: str,
@@ -584,23 +809,28 @@ def test_cdp_command_multiple_return():
                 1. **originalSize** - Size before re-encoding.
                 2. **encodedSize** - Size after re-encoding.
             '''
-            params: T_JSON_DICT = dict()
-            params['requestId'] = request_id.to_json()
-            params['encoding'] = encoding
-            if quality is not None:
-                params['quality'] = quality
-            if size_only is not None:
-                params['sizeOnly'] = size_only
             cmd_dict: T_JSON_DICT = {
                 'method': 'Audits.getEncodedResponse',
-                'params': params,
+                'params': _get_encoded_response_params(request_id, encoding, quality, size_only),
             }
             json = yield cmd_dict
             return (
                 str(json['body']) if 'body' in json else None,
                 int(json['originalSize']),
                 int(json['encodedSize'])
-            )""")
+            )
+
+
+        get_encoded_response_command = Command(
+            'Audits.getEncodedResponse',
+            get_encoded_response,
+            _get_encoded_response_params,
+            lambda json: (
+                str(json['body']) if 'body' in json else None,
+                int(json['originalSize']),
+                int(json['encodedSize'])
+            ),
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Audits')
     actual = cmd.generate_code()
@@ -633,6 +863,19 @@ def test_cdp_command_array_of_ref_parameter():
         ]
     }
     expected = dedent("""\
+        def _grant_permissions_params(
+                origin: str,
+                permissions: typing.List[PermissionType],
+                browser_context_id: typing.Optional[target.BrowserContextID] = None
+            ) -> T_JSON_DICT:
+            params: T_JSON_DICT = dict()
+            params['origin'] = origin
+            params['permissions'] = [i.to_json() for i in permissions]
+            if browser_context_id is not None:
+                params['browserContextId'] = browser_context_id.to_json()
+            return params
+
+
         def grant_permissions(
                 origin: str,
                 permissions: typing.List[PermissionType],
@@ -647,16 +890,18 @@ def test_cdp_command_array_of_ref_parameter():
             :param permissions:
             :param browser_context_id: *(Optional)* BrowserContext to override permissions. When omitted, default browser context is used.
             '''
-            params: T_JSON_DICT = dict()
-            params['origin'] = origin
-            params['permissions'] = [i.to_json() for i in permissions]
-            if browser_context_id is not None:
-                params['browserContextId'] = browser_context_id.to_json()
             cmd_dict: T_JSON_DICT = {
                 'method': 'Browser.grantPermissions',
-                'params': params,
+                'params': _grant_permissions_params(origin, permissions, browser_context_id),
             }
-            json = yield cmd_dict""")
+            json = yield cmd_dict
+
+
+        grant_permissions_command = Command(
+            'Browser.grantPermissions',
+            grant_permissions,
+            _grant_permissions_params,
+        )""")
 
     cmd = CdpCommand.from_json(json_cmd, 'Browser')
     actual = cmd.generate_code()
@@ -680,7 +925,7 @@ def test_cdp_event():
     }
     expected = dedent("""\
         @event_class('BackgroundService.recordingStateChanged')
-        @dataclass
+        @slotted_dataclass
         class RecordingStateChanged:
             r'''
             Called when the recording state for the service has been updated.
@@ -700,6 +945,43 @@ def test_cdp_event():
     assert expected == actual
 
 
+def test_cdp_lazy_event():
+    json_event = {
+        "name": "recordingStateChanged",
+        "description": "Called when the recording state for the service has been updated.",
+        "parameters": [
+            {
+                "name": "isRecording",
+                "type": "boolean"
+            },
+            {
+                "name": "service",
+                "$ref": "ServiceName"
+            }
+        ]
+    }
+    expected = dedent("""\
+        @event_class('BackgroundService.recordingStateChanged')
+        class RecordingStateChanged(LazyObject):
+            r'''
+            Called when the recording state for the service has been updated.
+            '''
+            is_recording: bool = lazy_field('isRecording')
+            service: ServiceName = lazy_field('service', lambda v: ServiceName.from_json(v))
+
+            def __init__(
+                    self,
+                    is_recording: bool,
+                    service: ServiceName
+                ) -> None:
+                self.is_recording = is_recording
+                self.service = service""")
+
+    cmd = CdpEvent.from_json(json_event, 'BackgroundService')
+    actual = cmd.generate_code(lazy=True)
+    assert expected == actual
+
+
 def test_cdp_event_parameter_docs():
     json_event = {
         "name": "windowOpen",
@@ -732,7 +1014,7 @@ def test_cdp_event_parameter_docs():
     }
     expected = dedent("""\
         @event_class('Page.windowOpen')
-        @dataclass
+        @slotted_dataclass
         class WindowOpen:
             r'''
             Fired when a new window is going to be opened, via window.open(), link click, form submission,
@@ -850,15 +1132,18 @@ def test_cdp_domain_imports():
         ]
     }
     expected = dedent("""\
-        from . import door
-        from . import driver
-        from . import engine
-        from . import engine_parts
-        from . import lock
-        from . import passenger
-        from . import vehicle
-        from . import window
-        from . import window_state""") # A domain should have a new line at the end.
+        if typing.TYPE_CHECKING:
+            from . import door
+            from . import driver
+            from . import engine
+            from . import engine_parts
+            from . import lock
+            from . import passenger
+            from . import vehicle
+            from . import window
+            from . import window_state
+        else:
+            lazy_import(globals(), 'door', 'driver', 'engine', 'engine_parts', 'lock', 'passenger', 'vehicle', 'window', 'window_state')""") # A domain should have a new line at the end.
 
     domain = CdpDomain.from_json(json_domain)
     actual = domain.generate_imports()
@@ -980,6 +1265,11 @@ def test_cdp_domain_sphinx():
         to. For more information, see
         :ref:`Getting Started: Commands <getting-started-commands>`.
 
+        Each command also has a descriptor named after it with a
+        ``_command`` suffix, e.g. ``get_current_time_command``: a
+        :class:`cdp.util.Command` that builds reusable requests
+        without a generator.
+
         .. autofunction:: get_current_time
 
         Events
@@ -0,0 +1,104 @@
+"""
+Shared test fixtures.
+"""
+import asyncio
+import json
+
+import pytest
+
+from cdp.transport import Transport
+
+
+class ScriptedTransport(Transport):
+    """
+    An in-memory browser for testing connections without a socket.
+
+    Each request is passed to ``respond``, which returns ``None`` to leave it
+    unanswered, or a list of messages to receive in reply:
+
+    - a dict with a ``method`` is an event;
+    - any other dict is the response, and gets the request's ``id`` and
+      ``sessionId``;
+    - a ``str`` or ``bytes`` frame is received as it is;
+    - an exception is raised by :meth:`recv`, e.g. to drop the connection.
+
+    By default every request gets an empty result. The transport can be
+    reopened, and its requests are recorded across connections.
+    """
+
+    reopenable = True
+
+    def __init__(self, respond=None, refuse=0, send_delay=0.0, send_error=None):
+        """
+        Args:
+            respond: Called with each request dict
+            refuse: Number of upcoming ``open()`` calls to fail
+            send_delay: Seconds each ``send()`` takes
+            send_error: Exception raised by every ``send()``, after the delay
+        """
+        self.respond = respond or (lambda request: [{"result": {}}])
+        self.refuse = refuse
+        self.send_delay = send_delay
+        self.send_error = send_error
+        #: (number of opens so far, request) of every request sent.
+        self.requests = []
+        self.opens = 0
+        self.incoming = None
+
+    @property
+    def methods(self):
+        """The method of every request sent."""
+        return [request["method"] for _, request in self.requests]
+
+    async def open(self):
+        if self.refuse:
+            self.refuse -= 1
+            raise OSError("connection refused")
+        self.opens += 1
+        self.incoming = asyncio.Queue()
+
+    async def send(self, frame):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        if self.send_error is not None:
+            raise self.send_error
+        request = json.loads(frame)
+        self.requests.append((self.opens, request))
+        for message in self.respond(request) or ():
+            if isinstance(message, dict) and "method" not in message:
+                message = dict(message, id=request["id"])
+                if "sessionId" in request:
+                    message["sessionId"] = request["sessionId"]
+            self.receive(message)
+
+    def receive(self, message):
+        """Queue a message (or exception) for :meth:`recv`."""
+        if isinstance(message, dict):
+            message = json.dumps(message)
+        self.incoming.put_nowait(message)
+
+    def emit(self, method, params=None, session_id=None):
+        """Send an event."""
+        event = {"method": method, "params": params or {}}
+        if session_id is not None:
+            event["sessionId"] = session_id
+        self.receive(event)
+
+    def drop(self):
+        """Drop the connection."""
+        self.receive(ConnectionError("connection dropped"))
+
+    async def recv(self):
+        message = await self.incoming.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def scripted_transport():
+    """:class:`ScriptedTransport`, to create one or more per test."""
+    return ScriptedTransport
@@ -9,6 +9,8 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 
 from cdp import dom, page, runtime
+from cdp.connection import CDPCommandError
+from cdp.event_bus import EventBus
 from cdp.browser_control import (
     navigate,
     reload,
@@ -44,6 +46,7 @@ def _make_conn(*side_effects):
     """Build a mock CDPConnection whose execute() returns values in order."""
     conn = MagicMock()
     conn.execute = AsyncMock(side_effect=list(side_effects))
+    conn.execute_many = AsyncMock(side_effect=lambda cmds: [None] * len(cmds))
     # listen() is an async generator – mock it properly when needed per test.
     return conn
 
@@ -209,20 +212,23 @@ async def test_click_dispatches_mouse_events():
     target_node = dom.NodeId(42)
     box = _make_box_model(10, 20, 100, 50)
     # Calls: get_document, query_selector, scroll_into_view, get_box_model,
-    # dispatch_mouse_event x3
-    conn = _make_conn(doc_node, target_node, None, box, None, None, None)
+    # then one batch of dispatch_mouse_event x3
+    conn = _make_conn(doc_node, target_node, None, box)
     await click(conn, "button")
-    assert conn.execute.await_count == 7
+    assert conn.execute.await_count == 4
+    conn.execute_many.assert_awaited_once()
+    assert len(conn.execute_many.await_args.args[0]) == 3
 
 
 @pytest.mark.asyncio
 async def test_click_with_node_id_skips_selector():
     node = dom.NodeId(42)
     box = _make_box_model()
-    # Calls: scroll_into_view, get_box_model, dispatch_mouse_event x3
-    conn = _make_conn(None, box, None, None, None)
+    # Calls: scroll_into_view, get_box_model, then one batch of 3 mouse events
+    conn = _make_conn(None, box)
     await click(conn, node)
-    assert conn.execute.await_count == 5
+    assert conn.execute.await_count == 2
+    conn.execute_many.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -236,9 +242,10 @@ async def test_hover_dispatches_mousemoved():
 
 @pytest.mark.asyncio
 async def test_press_key_sends_keydown_and_keyup():
-    conn = _make_conn(None, None)
+    conn = _make_conn()
     await press_key(conn, "Enter")
-    assert conn.execute.await_count == 2
+    conn.execute_many.assert_awaited_once()
+    assert len(conn.execute_many.await_args.args[0]) == 2
 
 
 @pytest.mark.asyncio
@@ -254,11 +261,21 @@ async def test_type_text_sends_events_per_character():
     target_node = dom.NodeId(5)
     text = "hi"
     # focus: get_document, query_selector, dom.focus
-    # then 2 chars * 2 events = 4
-    conn = _make_conn(doc_node, target_node, None, None, None, None, None)
+    # then one batch of 2 chars * 2 events = 4
+    conn = _make_conn(doc_node, target_node, None)
     await type_text(conn, "input", text)
-    # 3 (focus) + 4 (2 chars * 2 key events) = 7
-    assert conn.execute.await_count == 7
+    assert conn.execute.await_count == 3
+    conn.execute_many.assert_awaited_once()
+    assert len(conn.execute_many.await_args.args[0]) == 4
+
+
+@pytest.mark.asyncio
+async def test_input_batch_raises_first_error():
+    conn = _make_conn()
+    error = CDPCommandError(-32000, "No target")
+    conn.execute_many = AsyncMock(return_value=[None, error])
+    with pytest.raises(CDPCommandError, match="No target"):
+        await press_key(conn, "Enter")
 
 
 # ---------------------------------------------------------------------------
@@ -419,35 +436,47 @@ async def test_wait_for_selector_timeout():
 # wait_for_event tests
 # ---------------------------------------------------------------------------
 
+def _make_event_conn():
+    """Build a mock CDPConnection whose waiters are backed by a real EventBus."""
+    bus = EventBus()
+    conn = MagicMock()
+    conn.wait_for_event = bus.wait_for
+    return conn, bus
+
+
 @pytest.mark.asyncio
 async def test_wait_for_event_receives_correct_type():
     """wait_for_event should return the first matching event."""
-    target_event = page.LoadEventFired(timestamp=123.0)
-    other_event = page.FrameStoppedLoading(frame_id=page.FrameId("f1"))
+    conn, bus = _make_event_conn()
+    task = asyncio.create_task(wait_for_event(conn, page.LoadEventFired, timeout=2.0))
+    await asyncio.sleep(0)
 
-    async def _fake_listen():
-        yield other_event
-        yield target_event
+    await bus.dispatch({"method": "Page.frameStoppedLoading", "params": {"frameId": "f1"}})
+    await bus.dispatch({"method": "Page.loadEventFired", "params": {"timestamp": 123.0}})
 
-    conn = MagicMock()
-    conn.listen = _fake_listen
-    conn._closed = False
-
-    result = await wait_for_event(conn, page.LoadEventFired, timeout=2.0)
+    result = await task
     assert isinstance(result, page.LoadEventFired)
     assert result.timestamp == 123.0
 
 
 @pytest.mark.asyncio
-async def test_wait_for_event_timeout():
-    async def _never_match():
-        for _ in range(100):
-            yield page.FrameStoppedLoading(frame_id=page.FrameId("f1"))
-            await asyncio.sleep(0.02)
+async def test_wait_for_event_predicate():
+    conn, bus = _make_event_conn()
+    task = asyncio.create_task(wait_for_event(
+        conn, page.FrameStoppedLoading, predicate=lambda e: e.frame_id == "f2"))
+    await asyncio.sleep(0)
 
-    conn = MagicMock()
-    conn.listen = _never_match
-    conn._closed = False
+    await bus.dispatch({"method": "Page.frameStoppedLoading", "params": {"frameId": "f1"}})
+    await bus.dispatch({"method": "Page.frameStoppedLoading", "params": {"frameId": "f2"}})
 
-    with pytest.raises(asyncio.TimeoutError):
+    result = await task
+    assert result.frame_id == page.FrameId("f2")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_timeout():
+    conn, bus = _make_event_conn()
+
+    with pytest.raises(asyncio.TimeoutError, match="LoadEventFired"):
         await wait_for_event(conn, page.LoadEventFired, timeout=0.1)
+    assert bus.listener_count(page.LoadEventFired) == 0
@@ -0,0 +1,114 @@
+"""
+Tests for the cdp.cache module.
+"""
+import collections
+
+import pytest
+
+from cdp import browser, dom, page, target
+from cdp.cache import CacheRule, ResultCache
+from cdp.connection import CDPConnection
+
+
+@pytest.fixture
+def browser_transport(scripted_transport):
+    """Answers every command with a result that counts the requests per method."""
+    counts = collections.Counter()
+
+    def respond(request):
+        method = request["method"]
+        counts[method] += 1
+        if method == "Target.attachToTarget":
+            result = {"sessionId": "session-1"}
+        elif method == "DOM.getDocument":
+            result = {"root": {"nodeId": counts[method], "backendNodeId": 1,
+                "nodeType": 9, "nodeName": "#document", "localName": "", "nodeValue": ""}}
+        elif method == "Browser.getVersion":
+            result = dict.fromkeys(
+                ["protocolVersion", "product", "revision", "userAgent", "jsVersion"],
+                str(counts[method]),
+            )
+        else:
+            result = {}
+        return [{"result": result}]
+
+    return scripted_transport(respond)
+
+
+def test_lru_eviction_and_invalidation():
+    cache = ResultCache({
+        "A.get": CacheRule(frozenset({"A.changed"})),
+        "B.get": CacheRule(frozenset({"B.changed"}), requires="B"),
+    }, max_entries=2)
+    for n in range(3):
+        cache.command_completed("A.get", {"n": n}, {"n": n}, cache.command_sent("A.get"))
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get("A.get", {"n": 0}) is None
+    assert cache.get("A.get", {"n": 1}) == {"n": 1}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Not cached until B is enabled, and dropped when it is disabled.
+    cache.command_completed("B.get", None, {}, cache.command_sent("B.get"))
+    assert cache.get("B.get", None) is None
+    cache.command_completed("B.enable", None, {}, cache.command_sent("B.enable"))
+    cache.command_completed("B.get", None, {}, cache.command_sent("B.get"))
+    assert cache.get("B.get", None) == {}
+    cache.command_sent("B.disable")
+    assert cache.get("B.get", None) is None
+
+    # A result invalidated while in flight is not stored.
+    generation = cache.command_sent("A.get")
+    cache.event_received("A.changed")
+    assert len(cache) == 0
+    assert (cache.evictions, cache.invalidations) == (2, 2)
+    cache.command_completed("A.get", {"n": 3}, {"n": 3}, generation)
+    assert cache.get("A.get", {"n": 3}) is None
+
+
+@pytest.mark.asyncio
+async def test_get_document_invalidates_node_ids(browser_transport):
+    transport = browser_transport
+    async with CDPConnection(transport=transport, cache=True) as conn:
+        assert (await conn.execute(dom.get_document(depth=0))).node_id == 1
+        assert (await conn.execute(dom.get_document(depth=-1))).node_id == 2
+        # The first result's node IDs died with the second request.
+        assert (await conn.execute(dom.get_document(depth=0))).node_id == 3
+        await conn.execute_raw("DOM.getFlattenedDocument", {"depth": -1})
+        assert (await conn.execute(dom.get_document(depth=0))).node_id == 4
+        assert transport.methods.count("DOM.getDocument") == 4
+
+
+@pytest.mark.asyncio
+async def test_connection_cache(browser_transport):
+    transport = browser_transport
+    async with CDPConnection(transport=transport, cache=True) as conn:
+        first = await conn.execute(dom.get_document(depth=0))
+        second = await conn.execute(dom.get_document(depth=0))
+        assert first.node_id == second.node_id == 1
+        assert first is not second
+        # Requests built by command descriptors share the entry.
+        assert (await conn.execute(dom.get_document_command(depth=0))).node_id == 1
+        await conn.execute(dom.get_document(depth=1))
+        assert transport.methods.count("DOM.getDocument") == 2
+
+        transport.emit("DOM.documentUpdated")
+        await conn.wait_for_event("DOM.documentUpdated", timeout=1)
+        assert (await conn.execute(dom.get_document(depth=0))).node_id == 3
+
+        # Uncached commands and batches still go out.
+        await conn.execute_many([page.reload(), page.reload()])
+        assert transport.methods.count("Page.reload") == 2
+        assert (conn.cache.hits, conn.cache.misses) == (2, 3)
+
+        # Sessions have their own cache and only see their own events.
+        session = await conn.attach(target.TargetID("t1"))
+        assert (await session.execute(browser.get_version()))[1] == "1"
+        assert (await conn.execute(browser.get_version()))[1] == "2"
+        assert (await session.execute(browser.get_version()))[1] == "1"
+        await session.execute(dom.get_document(depth=0))
+        transport.emit("DOM.documentUpdated", session_id="session-1")
+        await session.wait_for_event("DOM.documentUpdated", timeout=1)
+        await conn.execute(dom.get_document(depth=0))
+        assert session.cache.invalidations == 1
+        assert conn.cache.invalidations == 2
+        assert transport.methods.count("DOM.getDocument") == 4
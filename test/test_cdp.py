@@ -1,6 +1,17 @@
 '''
 Some basic tests for the generated CDP modules.
 '''
+import dataclasses
+import pathlib
+import pickle
+import subprocess
+import sys
+from textwrap import dedent
+import typing
+
+import pytest
+
+import cdp
 from cdp import dom, io, page, tracing, util
 
 
@@ -17,6 +28,15 @@ def test_enum_type():
     assert tran_type.value == 'address_bar'
     assert tran_type.to_json() == 'address_bar'
     assert page.TransitionType.from_json('address_bar') == tran_type
+    assert page.TransitionType.from_json('address_bar') is tran_type
+
+    unknown = page.TransitionType.from_json('teleport')
+    assert unknown == util.UnknownEnumValue(page.TransitionType, 'teleport')
+    assert unknown.to_json() == 'teleport'
+    assert repr(unknown) == "UnknownEnumValue(TransitionType, 'teleport')"
+    entry = page.NavigationEntry.from_json({'id': 1, 'url': 'u', 'userTypedURL': 'u',
+        'title': 't', 'transitionType': 'teleport'})
+    assert entry.to_json()['transitionType'] == 'teleport'
 
 
 def test_class_type():
@@ -31,6 +51,31 @@ def test_class_type():
     assert dom.RGBA.from_json({'r': 51, 'g': 153, 'b': 255, 'a':0.8}) == trans_violet
 
 
+def test_classes_are_slotted():
+    blue = dom.RGBA(51, 153, 255)
+    event = page.LoadEventFired.from_json({'timestamp': 1.0})
+    assert pickle.loads(pickle.dumps(blue)) == blue
+    if isinstance(blue, util.LazyObject):
+        pytest.skip("lazy classes (generate.py --lazy) cache decoded fields in "
+            "__dict__ and are not dataclasses")
+    for obj in (blue, event):
+        assert not hasattr(obj, '__dict__')
+    assert dataclasses.replace(blue, a=0.5).a == 0.5
+
+
+def test_add_slots_fallback():
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int = 2
+
+    SlottedPoint = util._add_slots(Point)
+    point = SlottedPoint(1)
+    assert SlottedPoint.__slots__ == ('x', 'y')
+    assert (point.x, point.y) == (1, 2)
+    assert not hasattr(point, '__dict__')
+
+
 def test_event_type():
     event = page.WindowOpen.from_json({
         'url': 'https://foo.com',
@@ -71,3 +116,50 @@ def test_event_dispatch():
     assert event.window_name == 'Window 1'
     assert event.window_features == ['feature1', 'feature2']
     assert not event.user_gesture
+
+
+def test_lazy_domain_imports():
+    ''' Domains are imported when first used, in a fresh interpreter. '''
+    script = dedent('''
+        import sys
+        import cdp
+        assert not any(name.startswith('cdp.') for name in sys.modules)
+
+        from cdp import tracing
+        assert 'cdp.io' not in sys.modules
+        event = tracing.TracingComplete.from_json({'dataLossOccurred': False, 'stream': 's'})
+        assert type(event.stream).__module__ == 'cdp.io'
+        assert tracing.io is sys.modules['cdp.io'] is cdp.io
+
+        assert 'cdp.page' not in sys.modules
+        event = cdp.util.parse_json_event({
+            'method': 'Page.domContentEventFired', 'params': {'timestamp': 1.0}})
+        assert type(event).__module__ == 'cdp.page'
+    ''')
+    subprocess.run([sys.executable, '-c', script], check=True,
+        cwd=pathlib.Path(cdp.__file__).parent.parent)
+
+
+def test_unknown_event():
+    event = util.parse_json_event({'method': 'Page.notInTheSchema', 'params': {'a': 1}})
+    assert event == util.UnknownEvent('Page.notInTheSchema', {'a': 1})
+
+
+def test_lazy_object():
+    class Point(util.LazyObject):
+        x: float = util.lazy_field('x', float)
+        label: typing.Optional[str] = util.lazy_field('label')
+
+        def __init__(self, x: float, label: typing.Optional[str] = None) -> None:
+            self.x = x
+            self.label = label
+
+    raw = {'x': 1}
+    point = Point.from_json(raw)
+    assert Point._fields == ('x', 'label')
+    assert 'x' not in vars(point)
+    assert point.x == 1.0 and isinstance(point.x, float)
+    assert vars(point)['x'] == 1.0
+    assert point.label is None
+    assert point == Point(1.0)
+    assert repr(point) == "test_lazy_object.<locals>.Point(x=1.0, label=None)"
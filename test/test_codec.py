@@ -0,0 +1,48 @@
+"""
+Tests for the cdp.codec module.
+"""
+import pytest
+
+from cdp.codec import Codec, JsonCodec, available_codecs, get_codec
+
+
+MESSAGE = {'id': 1, 'method': 'Page.navigate', 'params': {'url': 'https://example.com/ü'}}
+
+
+def test_json_codec_always_available():
+    assert 'json' in available_codecs()
+    assert available_codecs()[-1] == 'json'
+
+
+@pytest.mark.parametrize('name', available_codecs())
+def test_codec_round_trip(name):
+    """Every installed codec round-trips text and bytes frames."""
+    codec = get_codec(name)
+    assert codec.name == name
+    frame = codec.encode(MESSAGE)
+    assert isinstance(frame, (str, bytes))
+    assert codec.decode(frame) == MESSAGE
+    if isinstance(frame, str):
+        frame = frame.encode('utf-8')
+    assert codec.decode(frame) == MESSAGE
+
+
+@pytest.mark.parametrize('name', available_codecs())
+def test_codec_decode_error_is_value_error(name):
+    with pytest.raises(ValueError):
+        get_codec(name).decode('{"id": 1,')
+
+
+def test_get_codec_auto_detects_fastest():
+    codec = get_codec()
+    assert isinstance(codec, Codec)
+    assert codec.name == available_codecs()[0]
+
+
+def test_get_codec_unknown_name():
+    with pytest.raises(ValueError, match="Unknown codec"):
+        get_codec('yaml')
+
+
+def test_json_codec_is_compact():
+    assert JsonCodec().encode({'a': [1, 2]}) == '{"a":[1,2]}'
@@ -7,9 +7,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from cdp.connection import (
     CDPConnection, CDPError, CDPConnectionError, CDPCommandError,
-    PendingCommand
+    CDPSession, PendingCommand
 )
-from cdp import page, runtime
+from cdp import page, runtime, target
+from cdp.codec import JsonCodec
+from cdp.event_bus import EventQueue, OverflowPolicy, COALESCED, DROPPED, QUEUED
+from cdp.util import parse_json_event
 
 
 # Mock WebSocket for testing
@@ -54,7 +57,7 @@ async def test_connection_lifecycle():
     """Test basic connection lifecycle."""
     mock_ws = MockWebSocket()
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         conn = CDPConnection("ws://localhost:9222/test")
@@ -74,7 +77,7 @@ async def test_context_manager():
     """Test async context manager."""
     mock_ws = MockWebSocket()
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -98,7 +101,7 @@ async def test_execute_command_success():
     }
     mock_ws.queue_message(response)
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -135,7 +138,7 @@ async def test_execute_command_error():
     }
     mock_ws.queue_message(response)
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -152,7 +155,7 @@ async def test_execute_multiple_commands_multiplexing():
     """Test executing multiple commands concurrently (multiplexing)."""
     mock_ws = MockWebSocket()
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -217,7 +220,7 @@ async def test_command_timeout():
     mock_ws = MockWebSocket()
     # Don't queue any response - command will timeout
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test", timeout=0.1) as conn:
@@ -226,6 +229,35 @@ async def test_command_timeout():
                 await conn.execute(page.navigate(url="https://example.com"))
 
 
+@pytest.mark.asyncio
+async def test_command_deadlines_share_one_timer():
+    """Deadlines expire in order from a single timer, with the elapsed time."""
+    mock_ws = MockWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test", timeout=0.2) as conn:
+            slow = asyncio.create_task(conn.execute(page.reload()))
+            fast = asyncio.create_task(conn.execute(page.stop_loading(), timeout=0.05))
+            answered = asyncio.create_task(conn.execute(page.bring_to_front(), timeout=0.05))
+            await asyncio.sleep(0.01)
+            assert len(conn._deadlines) == 3
+            assert conn._deadline_timer is not None
+            mock_ws.queue_message({"id": 3, "result": {}})
+            await answered
+            
+            with pytest.raises(asyncio.TimeoutError, match=r"Page.stopLoading timed out after 0\.0[5-9]"):
+                await fast
+            assert not slow.done()
+            assert conn.pending_command_count == 1
+            with pytest.raises(asyncio.TimeoutError, match="Page.reload timed out after 0.2"):
+                await slow
+            assert conn.pending_command_count == 0
+            assert conn._deadlines == []
+            assert conn._deadline_timer is None
+
+
 @pytest.mark.asyncio
 async def test_event_handling():
     """Test receiving and parsing events."""
@@ -240,7 +272,7 @@ async def test_event_handling():
     }
     mock_ws.queue_message(event)
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -271,7 +303,7 @@ async def test_get_event_nowait():
     }
     mock_ws.queue_message(event)
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -292,7 +324,7 @@ async def test_pending_command_count():
     """Test tracking pending command count."""
     mock_ws = MockWebSocket()
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         async with CDPConnection("ws://localhost:9222/test") as conn:
@@ -324,7 +356,7 @@ async def test_pending_command_count():
 @pytest.mark.asyncio
 async def test_connection_error_handling():
     """Test handling connection errors."""
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.side_effect = Exception("Connection failed")
         
         conn = CDPConnection("ws://localhost:9222/test")
@@ -339,7 +371,7 @@ async def test_close_cancels_pending_commands():
     mock_ws = MockWebSocket()
     # Don't queue any response
     
-    with patch('cdp.connection.websockets.connect', new_callable=AsyncMock) as mock_connect:
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_ws
         
         conn = CDPConnection("ws://localhost:9222/test", timeout=10.0)
@@ -362,6 +394,539 @@ async def test_close_cancels_pending_commands():
             await task
 
 
+@pytest.mark.asyncio
+async def test_subscribed_events_only():
+    """Events without a subscriber are counted and never parsed."""
+    mock_ws = MockWebSocket()
+    mock_ws.queue_message({
+        "method": "Network.dataReceived",
+        "params": {"requestId": "1", "timestamp": 1.0, "dataLength": 10, "encodedDataLength": 10}
+    })
+    mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": 2.0}})
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        conn = CDPConnection("ws://localhost:9222/test")
+        conn.subscribe(page.LoadEventFired)
+        assert conn.subscriptions == frozenset({"Page.loadEventFired"})
+        
+        with patch('cdp.event_bus.parse_json_event', wraps=parse_json_event) as parse:
+            async with conn:
+                await asyncio.sleep(0.1)
+                event = conn.get_event_nowait()
+                assert isinstance(event, page.LoadEventFired)
+                assert conn.get_event_nowait() is None
+                assert parse.call_count == 1
+        
+        assert conn.skipped_event_counts == {"Network.dataReceived": 1}
+
+
+def test_subscribe_reference_counting():
+    conn = CDPConnection("ws://localhost:9222/test")
+    conn.subscribe("Page.loadEventFired", page.LoadEventFired)
+    conn.unsubscribe(page.LoadEventFired)
+    assert conn.subscriptions == frozenset({"Page.loadEventFired"})
+    conn.unsubscribe("Page.loadEventFired")
+    assert conn.subscriptions == frozenset()
+    
+    with pytest.raises(ValueError, match="Not subscribed"):
+        conn.unsubscribe("Page.loadEventFired")
+    with pytest.raises(ValueError, match="not a CDP event class"):
+        conn.subscribe(page.FrameId)
+
+
+@pytest.mark.asyncio
+async def test_typed_listeners_are_independent():
+    """Every typed listener receives every matching event."""
+    mock_ws = MockWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            async def collect(*event_types):
+                events = []
+                async for event in conn.listen(*event_types):
+                    events.append(event)
+                    if len(events) == 2:
+                        return events
+            
+            loads = asyncio.create_task(collect(page.LoadEventFired))
+            loads2 = asyncio.create_task(collect("Page.loadEventFired"))
+            mixed = asyncio.create_task(collect(page.LoadEventFired, page.FrameStoppedLoading))
+            await asyncio.sleep(0.05)
+            
+            mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": 1.0}})
+            mock_ws.queue_message({"method": "Page.frameStoppedLoading", "params": {"frameId": "f1"}})
+            mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": 2.0}})
+            
+            results = await asyncio.wait_for(asyncio.gather(loads, loads2, mixed), timeout=1.0)
+            assert [e.timestamp for e in results[0]] == [1.0, 2.0]
+            assert [e.timestamp for e in results[1]] == [1.0, 2.0]
+            assert isinstance(results[2][1], page.FrameStoppedLoading)
+            
+            # Finished listeners unregister themselves.
+            await asyncio.sleep(0)
+            assert conn._events.listener_count(page.LoadEventFired) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters():
+    """Concurrent waiters don't steal events from each other or the queue."""
+    mock_ws = MockWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            first = conn.expect_event(page.LoadEventFired)
+            second = asyncio.create_task(conn.wait_for_event(page.LoadEventFired, timeout=1.0))
+            late = conn.expect_event(page.LoadEventFired, lambda e: e.timestamp > 1.5)
+            await asyncio.sleep(0)
+            
+            mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": 1.0}})
+            mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": 2.0}})
+            
+            assert (await asyncio.wait_for(first, 1.0)).timestamp == 1.0
+            assert (await second).timestamp == 1.0
+            assert (await asyncio.wait_for(late, 1.0)).timestamp == 2.0
+            
+            # The shared queue still gets both events.
+            await asyncio.sleep(0.05)
+            assert conn.get_event_nowait().timestamp == 1.0
+            assert conn.get_event_nowait().timestamp == 2.0
+
+
+@pytest.mark.asyncio
+async def test_close_fails_waiters():
+    mock_ws = MockWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        conn = CDPConnection("ws://localhost:9222/test")
+        await conn.connect()
+        waiter = conn.expect_event(page.LoadEventFired)
+        await conn.close()
+        
+        with pytest.raises(CDPConnectionError, match="closed"):
+            await waiter
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy, outcome, expected", [
+    (OverflowPolicy.DROP_OLDEST, DROPPED, ["b1", "a2", "a3"]),
+    (OverflowPolicy.DROP_NEWEST, DROPPED, ["a1", "b1", "a2"]),
+    (OverflowPolicy.COALESCE, COALESCED, ["a1", "b1", "a3"]),
+])
+async def test_event_queue_overflow_policies(policy, outcome, expected):
+    queue = EventQueue(3, policy)
+    for method, event in [("A", "a1"), ("B", "b1"), ("A", "a2")]:
+        assert await queue.offer(method, event) == QUEUED
+    assert await queue.offer("A", "a3") == outcome
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == expected
+
+
+@pytest.mark.asyncio
+async def test_event_queue_coalesce_falls_back_to_drop_oldest():
+    queue = EventQueue(2, OverflowPolicy.COALESCE)
+    await queue.offer("A", "a1")
+    await queue.offer("B", "b1")
+    assert await queue.offer("C", "c1") == DROPPED
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == ["b1", "c1"]
+
+
+@pytest.mark.asyncio
+async def test_event_queue_block_waits_for_room():
+    queue = EventQueue(1, OverflowPolicy.BLOCK)
+    await queue.offer("A", "a1")
+    put = asyncio.create_task(queue.offer("A", "a2"))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+    assert queue.get_nowait() == "a1"
+    assert await asyncio.wait_for(put, timeout=1.0) == QUEUED
+    assert queue.get_nowait() == "a2"
+
+
+@pytest.mark.asyncio
+async def test_bounded_event_queue_counters():
+    """A full shared queue drops or coalesces events instead of growing."""
+    mock_ws = MockWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        conn = CDPConnection(
+            "ws://localhost:9222/test", max_queue_size=2, overflow_policy="coalesce"
+        )
+        await conn.connect()
+        for i in range(3):
+            mock_ws.queue_message({"method": "Page.loadEventFired", "params": {"timestamp": float(i)}})
+        mock_ws.queue_message({"method": "Page.frameStoppedLoading", "params": {"frameId": "f1"}})
+        await asyncio.sleep(0.1)
+        
+        assert conn.coalesced_event_count == 1
+        assert conn.dropped_event_count == 1
+        assert conn.get_event_nowait().timestamp == 2.0
+        assert isinstance(conn.get_event_nowait(), page.FrameStoppedLoading)
+        assert conn.get_event_nowait() is None
+        await conn.close()
+
+
+class BytesCodec(JsonCodec):
+    """A codec that produces bytes frames, like orjson or msgspec."""
+
+    name = 'bytes'
+
+    def encode(self, message):
+        return super().encode(message).encode('utf-8')
+
+
+@pytest.mark.asyncio
+async def test_codec_bytes_sent_as_text_by_default():
+    """Bytes from the codec are sent as text frames unless binary_frames is set."""
+    mock_ws = MockWebSocket()
+    mock_ws.queue_message({"id": 1, "result": {"frameId": "frame-1"}})
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test", codec=BytesCodec()) as conn:
+            await conn.execute(page.navigate(url="https://example.com"))
+            assert isinstance(mock_ws.sent_messages[0], str)
+
+
+@pytest.mark.asyncio
+async def test_codec_binary_frames():
+    """With binary_frames, bytes from the codec are sent without conversion."""
+    mock_ws = MockWebSocket()
+    mock_ws.messages_to_receive.append(b'{"id": 1, "result": {"frameId": "frame-1"}}')
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection(
+            "ws://localhost:9222/test", codec=BytesCodec(), binary_frames=True
+        ) as conn:
+            frame_id, *_ = await conn.execute(page.navigate(url="https://example.com"))
+            assert frame_id == page.FrameId('frame-1')
+            assert isinstance(mock_ws.sent_messages[0], bytes)
+            assert json.loads(mock_ws.sent_messages[0])['method'] == 'Page.navigate'
+
+
+def test_codec_by_name():
+    conn = CDPConnection("ws://localhost:9222/test", codec='json')
+    assert isinstance(conn.codec, JsonCodec)
+
+
+class BrowserWebSocket(MockWebSocket):
+    """A mock browser endpoint that answers flattened Target commands."""
+    
+    def __init__(self):
+        super().__init__()
+        self.next_session = 1
+        self.unanswered = set()
+    
+    async def send(self, message):
+        await super().send(message)
+        request = json.loads(message)
+        if request["method"] in self.unanswered:
+            return
+        response = {"id": request["id"], "result": {}}
+        if "sessionId" in request:
+            response["sessionId"] = request["sessionId"]
+        if request["method"] == "Target.attachToTarget":
+            response["result"] = {"sessionId": f"session-{self.next_session}"}
+            self.next_session += 1
+        elif request["method"] == "Page.navigate":
+            response["result"] = {"frameId": request.get("sessionId", "main")}
+        elif request["method"] == "Page.stopLoading":
+            response = {"id": request["id"], "error": {"code": -32000, "message": "Not allowed"}}
+        self.queue_message(response)
+
+
+@pytest.mark.asyncio
+async def test_session_routing():
+    """Sessions tag their commands and only receive their own events."""
+    mock_ws = BrowserWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            first = await conn.attach(target.TargetID("t1"))
+            second = await conn.attach(target.TargetID("t2"))
+            assert isinstance(first, CDPSession)
+            assert first.session_id == "session-1"
+            assert set(conn.sessions) == {"session-1", "session-2"}
+            
+            attach = json.loads(mock_ws.sent_messages[0])
+            assert attach["params"] == {"targetId": "t1", "flatten": True}
+            assert "sessionId" not in attach
+            
+            frame_id, *_ = await second.execute(page.navigate(url="https://example.com"))
+            assert frame_id == "session-2"
+            assert json.loads(mock_ws.sent_messages[-1])["sessionId"] == "session-2"
+            
+            loaded = first.expect_event(page.LoadEventFired)
+            mock_ws.queue_message({"method": "Page.loadEventFired",
+                "params": {"timestamp": 2.0}, "sessionId": "session-2"})
+            mock_ws.queue_message({"method": "Page.loadEventFired",
+                "params": {"timestamp": 1.0}, "sessionId": "session-1"})
+            mock_ws.queue_message({"method": "Page.loadEventFired",
+                "params": {"timestamp": 3.0}, "sessionId": "unknown"})
+            assert (await asyncio.wait_for(loaded, timeout=1.0)).timestamp == 1.0
+            
+            assert second.get_event_nowait().timestamp == 2.0
+            assert second.get_event_nowait() is None
+            assert first.get_event_nowait().timestamp == 1.0
+            assert conn.get_event_nowait() is None
+
+
+@pytest.mark.asyncio
+async def test_session_detach():
+    mock_ws = BrowserWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            session = await conn.attach(target.TargetID("t1"))
+            waiter = session.expect_event(page.LoadEventFired)
+            await session.detach()
+            
+            assert not session.is_attached
+            assert conn.sessions == {}
+            assert json.loads(mock_ws.sent_messages[-1])["params"] == {"sessionId": "session-1"}
+            with pytest.raises(CDPConnectionError, match="detached"):
+                await waiter
+            with pytest.raises(CDPConnectionError, match="detached"):
+                await session.execute(page.reload())
+
+
+@pytest.mark.asyncio
+async def test_session_detached_by_browser():
+    """Target.detachedFromTarget fails the session's pending commands."""
+    mock_ws = MockWebSocket()
+    mock_ws.queue_message({"id": 1, "result": {"sessionId": "session-1"}})
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            session = await conn.attach(target.TargetID("t1"))
+            reload = asyncio.create_task(session.execute(page.reload()))
+            await asyncio.sleep(0.02)
+            mock_ws.queue_message({"method": "Target.detachedFromTarget",
+                "params": {"sessionId": "session-1", "targetId": "t1"}})
+            
+            with pytest.raises(CDPConnectionError, match="detached"):
+                await asyncio.wait_for(reload, timeout=1.0)
+            assert conn.pending_command_count == 0
+            assert isinstance(conn.get_event_nowait(), target.DetachedFromTarget)
+
+
+@pytest.mark.asyncio
+async def test_execute_many():
+    """Batches are written before any response is awaited; errors are per command."""
+    mock_ws = BrowserWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            results = await conn.execute_many([
+                page.navigate(url="https://example.com"),
+                page.stop_loading(),
+                page.reload(),
+            ])
+            assert [json.loads(m)["id"] for m in mock_ws.sent_messages] == [1, 2, 3]
+            assert results[0][0] == "main"
+            assert isinstance(results[1], CDPCommandError)
+            assert results[1].message == "Not allowed"
+            assert results[2] is None
+            assert conn.pending_command_count == 0
+            
+            assert await conn.execute_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_execute_many_timeout_and_completion_order():
+    mock_ws = BrowserWebSocket()
+    mock_ws.unanswered.add("Page.bringToFront")
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            results = await conn.execute_many(
+                [page.bring_to_front(), page.reload(), page.stop_loading()],
+                timeout=0.1,
+                ordered=False,
+            )
+            assert [index for index, _ in results] == [1, 2, 0]
+            assert isinstance(results[2][1], asyncio.TimeoutError)
+            assert "Page.bringToFront" in str(results[2][1])
+            assert conn.pending_command_count == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_many_send_error_after_timeout(scripted_transport):
+    """A write that fails after the batch timed out doesn't fail twice."""
+    transport = scripted_transport(send_delay=0.1, send_error=ConnectionError("write failed"))
+    async with CDPConnection(transport=transport) as conn:
+        results = await conn.execute_many([page.reload(), page.reload()], timeout=0.01)
+        assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_execute_many_start_error(scripted_transport):
+    """Commands registered before one that fails to start are cleaned up."""
+    def broken():
+        raise ValueError("bad parameters")
+        yield {}
+
+    transport = scripted_transport(respond=lambda request: None)
+    async with CDPConnection(transport=transport) as conn:
+        with pytest.raises(ValueError, match="bad parameters"):
+            await conn.execute_many([page.reload(), broken()], timeout=60)
+        assert conn.pending_command_count == 0
+
+
+@pytest.mark.asyncio
+async def test_session_execute_many():
+    mock_ws = BrowserWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            session = await conn.attach(target.TargetID("t1"))
+            results = await session.execute_many([page.navigate(url="https://example.com")])
+            assert results[0][0] == "session-1"
+
+
+@pytest.mark.asyncio
+async def test_command_descriptors():
+    """Requests built by command descriptors execute like generators, repeatedly."""
+    mock_ws = BrowserWebSocket()
+    request = page.navigate_command(url="https://example.com")
+    assert page.navigate_command.method == "Page.navigate"
+    assert page.navigate_command.function is page.navigate
+    assert request.method == "Page.navigate"
+    assert request.params == {"url": "https://example.com"}
+    with pytest.raises(TypeError):
+        page.stop_loading_command(True)
+    with pytest.warns(DeprecationWarning, match="Page.clearDeviceMetricsOverride"):
+        page.clear_device_metrics_override_command()
+
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            first = await conn.execute(request)
+            assert first == await conn.execute(request)
+            assert first[0] == page.FrameId("main")
+            sent = [json.loads(m) for m in mock_ws.sent_messages]
+            assert [m["id"] for m in sent] == [1, 2]
+            assert all(m["params"] == {"url": "https://example.com"} for m in sent)
+            assert await conn.execute(request, raw=True) == {"frameId": "main"}
+
+            results = await conn.execute_many([
+                request, page.stop_loading_command(), page.reload_command(),
+            ])
+            assert results[0] == first
+            assert isinstance(results[1], CDPCommandError)
+            assert results[2] is None
+            assert "params" not in json.loads(mock_ws.sent_messages[-2])
+
+            session = await conn.attach(target.TargetID("t1"))
+            assert (await session.execute(request))[0] == "session-1"
+            assert conn.pending_command_count == 0
+
+
+@pytest.mark.asyncio
+async def test_raw_execute_and_listen():
+    """Raw mode returns decoded JSON and skips from_json()."""
+    mock_ws = BrowserWebSocket()
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            result = await conn.execute(page.navigate(url="https://example.com"), raw=True)
+            assert result == {"frameId": "main"}
+            assert await conn.execute_raw("Page.navigate", {"url": "u"}) == {"frameId": "main"}
+            assert json.loads(mock_ws.sent_messages[-1])["params"] == {"url": "u"}
+            assert await conn.execute_raw("Browser.notInTheSchema") == {}
+            assert "params" not in json.loads(mock_ws.sent_messages[-1])
+            with pytest.raises(CDPCommandError, match="Not allowed"):
+                await conn.execute_raw("Page.stopLoading")
+            
+            session = await conn.attach(target.TargetID("t1"))
+            assert await session.execute_raw("Page.navigate", {"url": "u"}) == {"frameId": "session-1"}
+            assert await session.execute(page.navigate(url="u"), raw=True) == {"frameId": "session-1"}
+            
+            conn.subscribe(page.LoadEventFired)
+            with patch('cdp.event_bus.parse_json_event', wraps=parse_json_event) as parse:
+                every = conn.listen(raw=True)
+                loads = conn.listen(page.FrameStoppedLoading, raw=True)
+                receive_every = asyncio.ensure_future(every.__anext__())
+                receive_load = asyncio.ensure_future(loads.__anext__())
+                await asyncio.sleep(0)
+                message = {"method": "Page.frameStoppedLoading", "params": {"frameId": "f"}}
+                mock_ws.queue_message(message)
+                assert await asyncio.wait_for(receive_every, timeout=1.0) == message
+                assert await asyncio.wait_for(receive_load, timeout=1.0) == message
+                assert parse.call_count == 0
+                assert conn.skipped_event_counts == {}
+                await every.aclose()
+                await loads.aclose()
+            assert conn._events.listener_count(page.FrameStoppedLoading) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_identical_commands():
+    """Identical side-effect-free commands in flight share one request."""
+    mock_ws = MockWebSocket()
+    history = {"currentIndex": 0, "entries": [{"id": 1, "url": "https://example.com",
+        "userTypedURL": "https://example.com", "title": "", "transitionType": "typed"}]}
+    
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_ws
+        
+        async with CDPConnection("ws://localhost:9222/test", coalesce=True) as conn:
+            calls = [asyncio.create_task(conn.execute(page.get_navigation_history()))
+                for _ in range(3)]
+            reloads = [asyncio.create_task(conn.execute(page.reload())) for _ in range(2)]
+            await asyncio.sleep(0.02)
+            # The leader is cancelled; the others still get the shared result.
+            calls[0].cancel()
+            sent = [json.loads(m) for m in mock_ws.sent_messages]
+            assert [m["method"] for m in sent] == [
+                "Page.getNavigationHistory", "Page.reload", "Page.reload"
+            ]
+            for message in sent:
+                mock_ws.queue_message({"id": message["id"], "result": history
+                    if message["method"] == "Page.getNavigationHistory" else {}})
+            
+            first, second = await asyncio.gather(*calls[1:])
+            assert first == second
+            assert first[1][0].url == "https://example.com"
+            assert first[1] is not second[1]
+            await asyncio.gather(*reloads)
+            with pytest.raises(asyncio.CancelledError):
+                await calls[0]
+            assert conn.coalesced_command_count == 2
+            assert conn.pending_command_count == 0
+            
+            # Only requests in flight are shared.
+            mock_ws.queue_message({"id": 4, "result": history})
+            await conn.execute(page.get_navigation_history())
+            assert len(mock_ws.sent_messages) == 4
+
+
 def test_import_without_websockets():
     """Test that the module can be imported without websockets."""
     # This test verifies that importing the module doesn't fail
@@ -373,6 +938,6 @@ def test_import_without_websockets():
 
 def test_connection_without_websockets_raises_error():
     """Test that creating a connection without websockets raises an error."""
-    with patch('cdp.connection.WEBSOCKETS_AVAILABLE', False):
+    with patch('cdp.transport.WEBSOCKETS_AVAILABLE', False):
         with pytest.raises(ImportError, match="websockets library is required"):
             CDPConnection("ws://localhost:9222/test")
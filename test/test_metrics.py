@@ -0,0 +1,90 @@
+"""
+Tests for the cdp.metrics module.
+"""
+import asyncio
+
+import pytest
+
+from cdp import page
+from cdp.connection import CDPCommandError, CDPConnection
+from cdp.metrics import ConnectionMetrics, Histogram, MetricsHook
+
+
+class RecordingHook(MetricsHook):
+    def __init__(self):
+        self.calls = []
+
+    def command_completed(self, method, latency, size, deserialize_time, error):
+        self.calls.append(('command_completed', method, error))
+
+    def event_parsed(self, method, parse_time):
+        self.calls.append(('event_parsed', method))
+
+
+class BrokenHook(MetricsHook):
+    def command_sent(self, method, size, serialize_time):
+        raise RuntimeError("boom")
+
+
+def test_histogram_buckets():
+    histogram = Histogram([0.01, 0.1])
+    for value in (0.005, 0.01, 0.05, 1.0):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 4
+    assert snapshot['sum'] == pytest.approx(1.065)
+    assert snapshot['buckets'] == [(0.01, 2), (0.1, 3), (float('inf'), 4)]
+
+
+@pytest.mark.asyncio
+async def test_connection_metrics(scripted_transport):
+    load = {"method": "Page.loadEventFired", "params": {"timestamp": 1.0}}
+    responses = {
+        "Page.reload": [load, {"result": {}}],
+        "Page.stopLoading": [{"error": {"code": -32000, "message": "No"}}],
+        "Page.bringToFront": [],
+    }
+    transport = scripted_transport(lambda request: responses[request["method"]])
+    hook = RecordingHook()
+    metrics = ConnectionMetrics(hooks=[hook, BrokenHook()])
+
+    async with CDPConnection(transport=transport, metrics=metrics, timeout=0.05) as conn:
+        assert conn.metrics is metrics
+        conn.subscribe("Page.frameStoppedLoading")
+        await conn.execute(page.reload())
+        with pytest.raises(CDPCommandError):
+            await conn.execute(page.stop_loading())
+        with pytest.raises(asyncio.TimeoutError):
+            await conn.execute(page.bring_to_front())
+
+        loaded = conn.expect_event(page.LoadEventFired)
+        await conn.execute(page.reload())
+        await loaded
+
+    snapshot = metrics.snapshot()
+    reload = snapshot['commands']['Page.reload']
+    assert reload['count'] == 2
+    assert reload['errors'] == 0
+    assert reload['bytes_sent'] > 0
+    assert reload['bytes_received'] > 0
+    assert reload['latency']['count'] == 2
+    assert snapshot['commands']['Page.stopLoading']['errors'] == 1
+    timed_out = snapshot['commands']['Page.bringToFront']
+    assert (timed_out['count'], timed_out['errors'], timed_out['timeouts']) == (1, 1, 1)
+    assert timed_out['latency']['count'] == 0
+
+    # Both events arrived, but only the awaited one was parsed.
+    events = snapshot['events']['Page.loadEventFired']
+    assert events['count'] == 2
+    assert events['parsed'] == 1
+    assert events['parse_time'] > 0
+
+    assert ('command_completed', 'Page.stopLoading', True) in hook.calls
+    assert ('event_parsed', 'Page.loadEventFired') in hook.calls
+
+
+def test_metrics_disabled_by_default(scripted_transport):
+    conn = CDPConnection(transport=scripted_transport())
+    assert conn.metrics is None
+    assert isinstance(CDPConnection(transport=scripted_transport(), metrics=True).metrics,
+        ConnectionMetrics)
@@ -0,0 +1,118 @@
+"""
+Tests for the cdp.mock_server module.
+"""
+import asyncio
+
+import pytest
+
+from cdp import dom, network, page, runtime, target
+from cdp.connection import CDPCommandError, CDPConnection
+from cdp.mock_server import MockCDPServer, SchemaValues
+from cdp.util import UnknownEvent, parse_json_event
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return SchemaValues.load()
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("include_optional", [False, True])
+def test_synthetic_events_parse(include_optional):
+    schema = SchemaValues.load(include_optional=include_optional)
+    for method in schema.events:
+        params = schema.event_params(method)
+        event = parse_json_event({"method": method, "params": params})
+        assert not isinstance(event, UnknownEvent), method
+
+
+def test_missing_schema(tmp_path):
+    missing = tmp_path / "browser_protocol.json"
+    with pytest.raises(FileNotFoundError, match="browser_protocol.json"):
+        SchemaValues.load([missing])
+
+
+def test_recursive_types_are_bounded():
+    schema = SchemaValues.load(include_optional=True, max_depth=3)
+    node = schema.command_result("DOM.getDocument")["root"]
+    assert node["nodeName"] == "nodeName"
+    # Optional properties stop at max_depth
+    assert "children" not in node["children"][0]
+    assert node["children"][0]["nodeName"] == "nodeName"
+
+
+def unknown_command():
+    return (yield {"method": "Browser.doesNotExist", "params": {}})
+
+
+@pytest.mark.asyncio
+async def test_synthetic_results(schema):
+    async with MockCDPServer(schema=schema) as server:
+        async with CDPConnection(server.url) as conn:
+            root = await conn.execute(dom.get_document())
+            assert isinstance(root, dom.Node)
+            targets = await conn.execute(target.get_targets())
+            assert isinstance(targets[0], target.TargetInfo)
+            frame_id, *_ = await conn.execute(page.navigate("https://example.com"))
+            assert frame_id == "FrameId"
+            remote, _ = await conn.execute(runtime.evaluate("1 + 1"))
+            assert isinstance(remote, runtime.RemoteObject)
+            with pytest.raises(CDPCommandError, match="wasn't found"):
+                await conn.execute(unknown_command())
+        assert server.requests["DOM.getDocument"] == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_handler_and_latency(schema):
+    async with MockCDPServer(latency=0.05, schema=schema) as server:
+        server.handle("Target.createTarget", lambda params: {"targetId": params["url"]})
+
+        async def fail(params):
+            raise RuntimeError("Not allowed")
+        server.handle("Page.reload", fail)
+
+        async with CDPConnection(server.url) as conn:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            assert await conn.execute(target.create_target("about:blank")) == "about:blank"
+            assert loop.time() - start >= 0.05
+            with pytest.raises(CDPCommandError, match="Not allowed"):
+                await conn.execute(page.reload())
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_delayed_responses(schema):
+    async with MockCDPServer(latency=10, schema=schema) as server:
+        async with CDPConnection(server.url) as conn:
+            pending = asyncio.create_task(conn.execute(page.reload()))
+            while not server._delayed:
+                await asyncio.sleep(0.01)
+            delayed = set(server._delayed)
+            await server.stop()
+            await asyncio.sleep(0)
+            assert all(task.cancelled() for task in delayed)
+            assert not server._delayed
+            pending.cancel()
+
+
+@pytest.mark.asyncio
+async def test_event_storm(schema):
+    async with MockCDPServer(schema=schema) as server:
+        async with CDPConnection(server.url, max_queue_size=0) as conn:
+            conn.subscribe(network.RequestWillBeSent)
+            await server.emit("Page.loadEventFired", {"timestamp": 5.0})
+            event = await conn.wait_for_event(page.LoadEventFired, timeout=1)
+            assert event.timestamp == 5.0
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            sent = await server.storm("Network.requestWillBeSent", rate=5_000, duration=0.2)
+            assert sent == 1_000
+            assert loop.time() - start >= 0.19
+
+            received = 0
+            async for event in conn.listen():
+                assert isinstance(event, network.RequestWillBeSent)
+                received += 1
+                if received == sent:
+                    break
@@ -0,0 +1,179 @@
+"""
+Tests for reconnecting connections (cdp.reconnect).
+"""
+import asyncio
+
+import pytest
+
+from cdp import dom, network, page, target
+from cdp.connection import CDPConnection, CDPConnectionError, CDPMessageTooBigError
+from cdp.reconnect import ReconnectPolicy, is_idempotent
+from cdp.transport import MessageTooBigError
+
+
+class FakeBrowser:
+    """Answers requests; its state outlives the transport's connections."""
+
+    def __init__(self):
+        self.counter = 0
+        # Methods that are never answered
+        self.hold = set()
+        # Methods whose responses exceed max_size
+        self.too_big = set()
+
+    def __call__(self, request):
+        if request['method'] in self.too_big:
+            return [MessageTooBigError("message too big")]
+        if request['method'] in self.hold:
+            return None
+        self.counter += 1
+        result = {}
+        if request['method'] == 'Target.attachToTarget':
+            result = {'sessionId': f'session-{self.counter}'}
+        elif request['method'] == 'Page.addScriptToEvaluateOnNewDocument':
+            result = {'identifier': f'script-{self.counter}'}
+        elif request['method'] == 'DOM.querySelector':
+            result = {'nodeId': 5}
+        return [{'result': result}]
+
+
+def sent_after_reconnect(transport):
+    return [
+        (request['method'], request.get('sessionId'))
+        for opens, request in transport.requests
+        if opens == 2
+    ]
+
+
+async def wait_offline(conn):
+    while conn._online.is_set():
+        await asyncio.sleep(0)
+
+
+def fast_policy(**kwargs):
+    return ReconnectPolicy(initial_delay=0.001, jitter=0, **kwargs)
+
+
+def test_is_idempotent():
+    assert is_idempotent('DOM.getDocument')
+    assert is_idempotent('Network.enable')
+    assert is_idempotent('Emulation.canEmulate')
+    # Named like a getter, but forces garbage collection
+    assert not is_idempotent('Memory.getDOMCountersForLeakDetection')
+    assert not is_idempotent('Page.navigate')
+    assert not is_idempotent('Input.dispatchKeyEvent')
+
+
+def test_policy_delays():
+    policy = ReconnectPolicy(max_attempts=5, initial_delay=1, max_delay=5, jitter=0)
+    assert list(policy.delays()) == [1, 2, 4, 5, 5]
+    assert list(policy.delays(2)) == [4, 5, 5]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_restores_state(scripted_transport):
+    browser = FakeBrowser()
+    transport = scripted_transport(browser)
+    async with CDPConnection(transport=transport, reconnect=fast_policy()) as conn:
+        await conn.execute(page.enable())
+        await conn.execute(network.enable())
+        await conn.execute(network.disable())
+        script = await conn.execute(page.add_script_to_evaluate_on_new_document("1"))
+        session = await conn.attach(target.TargetID("target-1"))
+        await session.execute(page.enable())
+
+        browser.hold = {'DOM.querySelector', 'Page.navigate'}
+        query = asyncio.ensure_future(session.execute(dom.query_selector(dom.NodeId(1), "a")))
+        navigate = asyncio.ensure_future(conn.execute(page.navigate("https://example.com")))
+        await asyncio.sleep(0)
+        browser.hold = set()
+        transport.drop()
+
+        # Not idempotent: failed. Idempotent: resent and answered.
+        with pytest.raises(CDPConnectionError, match="Page.navigate"):
+            await navigate
+        assert await query == 5
+        assert conn.reconnect_count == 1
+        assert session.is_attached
+        assert session.session_id == "session-9"
+        assert sent_after_reconnect(transport) == [
+            ('Page.enable', None),
+            ('Page.addScriptToEvaluateOnNewDocument', None),
+            ('Target.attachToTarget', None),
+            ('Page.enable', 'session-9'),
+            ('DOM.querySelector', 'session-9'),
+        ]
+
+        # The original script identifier still works.
+        await conn.execute(page.remove_script_to_evaluate_on_new_document(script))
+        assert transport.requests[-1][1]['params'] == {'identifier': 'script-8'}
+
+
+@pytest.mark.asyncio
+async def test_commands_wait_for_reconnect(scripted_transport):
+    browser = FakeBrowser()
+    transport = scripted_transport(browser)
+    async with CDPConnection(transport=transport, reconnect=fast_policy()) as conn:
+        transport.refuse = 2
+        transport.drop()
+        await wait_offline(conn)
+        assert conn.is_connected
+        await conn.execute(page.reload())
+        assert transport.opens == 2
+        assert sent_after_reconnect(transport) == [('Page.reload', None)]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up(scripted_transport):
+    browser = FakeBrowser()
+    transport = scripted_transport(browser)
+    async with CDPConnection(transport=transport, reconnect=fast_policy(max_attempts=2)) as conn:
+        browser.hold = {'DOM.querySelector'}
+        query = asyncio.ensure_future(conn.execute(dom.query_selector(dom.NodeId(1), "a")))
+        await asyncio.sleep(0)
+        transport.refuse = 10
+        transport.drop()
+        with pytest.raises(CDPConnectionError, match="reconnect failed after 2 attempts"):
+            await query
+        with pytest.raises(CDPConnectionError, match="Not connected"):
+            await conn.execute(page.reload())
+        assert not conn.is_connected
+
+
+@pytest.mark.asyncio
+async def test_message_too_big_is_not_retried(scripted_transport):
+    browser = FakeBrowser()
+    transport = scripted_transport(browser)
+    async with CDPConnection(transport=transport, reconnect=fast_policy()) as conn:
+        browser.too_big = {'DOM.getDocument'}
+        with pytest.raises(CDPMessageTooBigError, match="message too big"):
+            await conn.execute(dom.get_document(), timeout=1)
+        assert transport.opens == 1
+        assert conn.reconnect_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stable_after", [0, 60])
+async def test_backoff_continues_while_flapping(scripted_transport, stable_after):
+    browser = FakeBrowser()
+    transport = scripted_transport(browser)
+    policy = fast_policy(max_attempts=3, stable_after=stable_after)
+    async with CDPConnection(transport=transport, reconnect=policy) as conn:
+        for _ in range(3):
+            transport.drop()
+            await wait_offline(conn)
+            await conn.execute(page.reload())
+        assert conn.reconnect_count == 3
+
+        browser.hold = {'DOM.querySelector'}
+        query = asyncio.ensure_future(conn.execute(dom.query_selector(dom.NodeId(1), "a")))
+        await asyncio.sleep(0)
+        browser.hold = set()
+        transport.drop()
+        if stable_after:
+            # Every reconnect dropped right away and used up an attempt.
+            with pytest.raises(CDPConnectionError, match="reconnect failed after 3 attempts"):
+                await query
+        else:
+            assert await query == 5
+            assert conn.reconnect_count == 4
@@ -0,0 +1,92 @@
+"""
+Tests for the cdp.recording module.
+"""
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from cdp import page
+from cdp.connection import CDPConnection
+from cdp.recording import RecordingTransport, ReplayTransport, load_recording
+
+
+def echo(request):
+    """Answers every request with its method, preceded by an event. Responses
+    are received as bytes, events as str."""
+    event = {"method": "Page.frameStoppedLoading", "params": {"frameId": request["method"]}}
+    response = {"id": request["id"], "result": {"frameId": request["method"]}}
+    return [event, json.dumps(response).encode()]
+
+
+async def record_session(path, browser):
+    transport = RecordingTransport(browser, path)
+    async with CDPConnection(transport=transport) as conn:
+        await conn.execute(page.reload())
+        await conn.execute(page.navigate("https://example.com"))
+        await asyncio.sleep(0.05)
+        await conn.execute(page.stop_loading())
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_recording_format(tmp_path, scripted_transport):
+    path = tmp_path / "session.jsonl.gz"
+    transport = await record_session(path, scripted_transport(echo))
+    assert transport.frame_count == 9
+
+    with gzip.open(path, "rt") as f:
+        header = json.loads(f.readline())
+    assert header["format"] == "cdp-recording"
+    assert header["transport"].startswith("<")
+
+    entries = load_recording(path)
+    assert [e["dir"] for e in entries] == ["send", "recv", "recv"] * 3
+    assert json.loads(entries[0]["frame"])["method"] == "Page.reload"
+    assert isinstance(entries[1]["frame"], str)
+    assert isinstance(entries[2]["frame"], bytes)
+    assert entries[-1]["t"] - entries[0]["t"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_replay_follows_sends(tmp_path, scripted_transport):
+    path = tmp_path / "session.jsonl.gz"
+    await record_session(path, scripted_transport(echo))
+
+    transport = ReplayTransport(path, speed=None)
+    async with CDPConnection(transport=transport) as conn:
+        loaded = conn.expect_event(page.FrameStoppedLoading,
+            lambda e: e.frame_id == "Page.navigate")
+        await conn.execute(page.reload())
+        frame_id, *_ = await conn.execute(page.navigate("https://example.com"))
+        assert frame_id == "Page.navigate"
+        await loaded
+        await conn.execute(page.bring_to_front())
+        assert transport.mismatches == [("Page.stopLoading", "Page.bringToFront")]
+        await asyncio.wait_for(transport.finished.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_replay_speed(tmp_path, scripted_transport):
+    path = tmp_path / "session.jsonl.gz"
+    await record_session(path, scripted_transport(echo))
+
+    loop = asyncio.get_running_loop()
+    for speed, minimum, maximum in ((1.0, 0.05, None), (None, 0, 0.05)):
+        transport = ReplayTransport(path, speed=speed, follow_sends=False)
+        async with CDPConnection(transport=transport) as conn:
+            start = loop.time()
+            await transport.finished.wait()
+            elapsed = loop.time() - start
+            assert isinstance(conn.get_event_nowait(), page.FrameStoppedLoading)
+        assert elapsed >= minimum
+        assert maximum is None or elapsed < maximum
+
+
+def test_load_recording_rejects_other_files(tmp_path):
+    path = tmp_path / "other.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"hello": "world"}\n')
+    with pytest.raises(ValueError, match="not a CDP recording"):
+        load_recording(path)
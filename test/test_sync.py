@@ -0,0 +1,91 @@
+"""
+Tests for the cdp.sync module.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cdp import page
+from cdp.connection import CDPCommandError
+from cdp.sync import SyncCDPConnection, background_loop, run_sync
+
+
+def echo(request):
+    """Answers requests with their method as frameId; Page.reload also fires an event."""
+    messages = []
+    if request["method"] == "Page.reload":
+        messages.append({"method": "Page.loadEventFired", "params": {"timestamp": request["id"]}})
+    if request["method"] == "Page.stopLoading":
+        messages.append({"error": {"code": -32000, "message": "No"}})
+    else:
+        messages.append({"result": {"frameId": request["method"]}})
+    return messages
+
+
+def test_execute_from_many_threads(scripted_transport):
+    with SyncCDPConnection(transport=scripted_transport(echo)) as conn, \
+            SyncCDPConnection(transport=scripted_transport(echo)) as other:
+        def work(i):
+            target = conn if i % 2 else other
+            frame_id, *_ = target.execute(page.navigate(f"https://example.com/{i}"))
+            return frame_id
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, range(200)))
+        assert results == ["Page.navigate"] * 200
+        assert conn.connection.pending_command_count == 0
+
+        with pytest.raises(CDPCommandError):
+            conn.execute(page.stop_loading())
+        results = conn.execute_many([page.bring_to_front(), page.stop_loading()])
+        assert results[0] is None
+        assert isinstance(results[1], CDPCommandError)
+        assert conn.execute(page.navigate("u"), raw=True) == {"frameId": "Page.navigate"}
+        assert conn.execute_raw("Page.reload") == {"frameId": "Page.reload"}
+    assert not conn.is_connected
+
+
+def test_listen_and_wait_for_event(scripted_transport):
+    with SyncCDPConnection(transport=scripted_transport(echo)) as conn:
+        conn.subscribe(page.FrameNavigated)
+        with conn.listen(page.LoadEventFired) as events:
+            conn.execute(page.reload())
+            conn.execute(page.reload())
+            assert next(events).timestamp == 1
+            assert next(events).timestamp == 2
+        assert list(events) == []
+        assert conn.connection._events.listener_count(page.LoadEventFired) == 0
+
+        def reload_later():
+            conn.execute(page.reload())
+        thread = threading.Timer(0.05, reload_later)
+        thread.start()
+        event = conn.wait_for_event(page.LoadEventFired, timeout=5)
+        assert event.timestamp == 3
+        thread.join()
+
+
+def test_close_stops_blocked_listener(scripted_transport):
+    conn = SyncCDPConnection(transport=scripted_transport(echo))
+    conn.connect()
+    events = conn.listen(page.LoadEventFired)
+    received = []
+    thread = threading.Thread(target=lambda: received.extend(events))
+    thread.start()
+    conn.execute(page.reload())
+    conn.close()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(received) == 1
+
+
+def test_one_loop_per_process():
+    assert background_loop() is background_loop()
+
+    async def blocking_call_on_loop():
+        run_sync(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="background event loop"):
+        run_sync(blocking_call_on_loop())
@@ -0,0 +1,186 @@
+"""
+Tests for the cdp.transport module.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import websockets
+
+from cdp import page
+from cdp.connection import CDPConnection, CDPConnectionError, CDPMessageTooBigError
+from cdp.transport import PipeTransport, WebSocketTransport
+
+
+# A stand-in for ``chrome --remote-debugging-pipe``: reads NUL-terminated
+# requests from fd 3 and answers each one on fd 4, preceded by an event.
+ECHO_BROWSER = r'''
+import json, os
+buffer = b''
+while True:
+    chunk = os.read(3, 65536)
+    if not chunk:
+        break
+    buffer += chunk
+    while b'\0' in buffer:
+        message, buffer = buffer.split(b'\0', 1)
+        request = json.loads(message)
+        event = {"method": "Page.frameStoppedLoading", "params": {"frameId": request["method"]}}
+        response = {"id": request["id"], "result": {"frameId": request["method"], "large": "x" * 100000}}
+        os.write(4, json.dumps(event).encode() + b'\0' + json.dumps(response).encode() + b'\0')
+'''
+
+
+def launch_echo_browser(**kwargs):
+    return PipeTransport.launch([sys.executable, '-c', ECHO_BROWSER], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_pipe_transport_round_trip():
+    transport = launch_echo_browser()
+    async with CDPConnection(transport=transport) as conn:
+        frame_id, *_ = await conn.execute(page.navigate(url="https://example.com"))
+        assert frame_id == "Page.navigate"
+
+        results = await conn.execute_many([page.reload(), page.navigate(url="about:blank")])
+        assert results[0] is None
+        assert results[1][0] == "Page.navigate"
+
+        event = conn.get_event_nowait()
+        assert isinstance(event, page.FrameStoppedLoading)
+        assert event.frame_id == "Page.navigate"
+
+    # The transport owns the process and stops it on close.
+    assert transport.process.poll() is not None
+
+
+@pytest.mark.asyncio
+async def test_pipe_transport_remote_exit():
+    transport = launch_echo_browser()
+    async with CDPConnection(transport=transport, timeout=5.0) as conn:
+        await conn.execute(page.reload())
+        transport.process.kill()
+        transport.process.wait()
+        with pytest.raises(CDPConnectionError):
+            await conn.execute(page.reload())
+
+
+@pytest.mark.asyncio
+async def test_pipe_transport_max_size():
+    transport = launch_echo_browser(max_size=1000)
+    async with CDPConnection(transport=transport, timeout=5.0) as conn:
+        with pytest.raises(CDPMessageTooBigError, match="max_size"):
+            await conn.execute(page.reload())
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc")
+def test_pipe_transport_child_fds():
+    """The child gets the pipe on 3 and 4 and no other inherited descriptors."""
+    inheritable_r, inheritable_w = os.pipe()
+    os.set_inheritable(inheritable_r, True)
+    os.set_inheritable(inheritable_w, True)
+    list_fds = (
+        "import os, stat; print(sorted("
+        "(fd, stat.S_ISFIFO(os.fstat(fd).st_mode)) for fd in range(64) "
+        "if os.path.exists(f'/proc/self/fd/{fd}')))"
+    )
+    try:
+        transport = PipeTransport.launch(
+            [sys.executable, '-c', list_fds], stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+        )
+        output, _ = transport.process.communicate(timeout=10)
+        os.close(transport.read_fd)
+        os.close(transport.write_fd)
+    finally:
+        os.close(inheritable_r)
+        os.close(inheritable_w)
+    fds = dict(ast.literal_eval(output.decode()))
+    assert sorted(fds) == [0, 1, 2, 3, 4]
+    assert fds[3] and fds[4]
+
+
+@pytest.mark.asyncio
+async def test_pipe_transport_adopts_fds():
+    """An existing pair of pipes can be used without launching a process."""
+    to_browser_r, to_browser_w = os.pipe()
+    from_browser_r, from_browser_w = os.pipe()
+    transport = PipeTransport(from_browser_r, to_browser_w)
+    await transport.open()
+    try:
+        await transport.send('{"id":1}')
+        assert os.read(to_browser_r, 100) == b'{"id":1}\0'
+        os.write(from_browser_w, b'{"id":1,"result":{}}\0{"id":2')
+        assert await transport.recv() == b'{"id":1,"result":{}}'
+    finally:
+        await transport.close()
+        os.close(to_browser_r)
+        os.close(from_browser_w)
+
+
+def test_connection_requires_url_or_transport():
+    with pytest.raises(ValueError, match="url or transport"):
+        CDPConnection()
+
+
+@pytest.mark.asyncio
+async def test_custom_transport_open_error(scripted_transport):
+    conn = CDPConnection(transport=scripted_transport(refuse=1))
+    with pytest.raises(CDPConnectionError, match="connection refused"):
+        await conn.connect()
+
+
+@pytest.mark.asyncio
+async def test_websocket_options():
+    with patch('cdp.transport.websockets.connect', new_callable=AsyncMock) as connect:
+        conn = CDPConnection("ws://localhost:9222", max_size=None, ping_interval=None,
+            compression=True)
+        await conn.transport.open()
+    connect.assert_called_once_with(
+        "ws://localhost:9222", max_size=None, read_limit=2**20, write_limit=2**16,
+        ping_interval=None, ping_timeout=20.0, compression='deflate',
+    )
+    assert WebSocketTransport("ws://localhost:9222").max_size == 256 * 2**20
+
+
+@pytest.mark.asyncio
+async def test_websocket_message_too_big():
+    async def handler(ws, *_):
+        async for message in ws:
+            request = json.loads(message)
+            await ws.send(json.dumps({"id": request["id"], "result": {"data": "x" * 5000}}))
+
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        async with CDPConnection(url, max_size=4096, reconnect=True) as conn:
+            with pytest.raises(CDPMessageTooBigError, match=r"larger than max_size \(4096 bytes\)"):
+                await conn.execute(page.reload())
+        async with CDPConnection(url, max_size=8192) as conn:
+            await conn.execute(page.reload())
+
+
+@pytest.mark.asyncio
+async def test_websocket_closed_raises_connection_error():
+    async def handler(ws, *_):
+        await ws.close()
+
+    async with websockets.serve(handler, "127.0.0.1", 0) as server:
+        url = f"ws://127.0.0.1:{next(iter(server.sockets)).getsockname()[1]}"
+        transport = WebSocketTransport(url)
+        await transport.open()
+        with pytest.raises(ConnectionError, match="WebSocket closed"):
+            await transport.recv()
+        with pytest.raises(ConnectionError, match="WebSocket closed"):
+            await transport.send("{}")
+        await transport.close()
+
+        async with CDPConnection(url) as conn:
+            # Wait for the receive loop to see the close, so that the
+            # command fails when it is written.
+            await conn._recv_task
+            with pytest.raises(CDPConnectionError, match="Failed to send Page.reload"):
+                await conn.execute(page.reload())